@@ -56,8 +56,13 @@ from .epf_hazard_forecast import (
     MIN_CALIBRATION_SAMPLES,
 )
 from .epf_hazard_features import FeatureSpec, FeatureScalersArtifactV0
+from .epf_hazard_log_store import SegmentPolicy, append_entry
+from ..tools.jsonl_append_v0 import JsonlAppender
 from .epf_hazard_field_spec import (
     FieldSpecArtifactV0,
+    PolicyCursor,
+    SnapshotPolicy,
+    compile_snapshot_policy,
     maybe_load_field_spec,
     DEFAULT_FIELD_SPEC_PATH,
 )
@@ -100,18 +105,27 @@ def _current_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _append_jsonl(path: Path, payload: Dict[str, Any]) -> None:
+def _append_jsonl(
+    path: Path,
+    payload: Dict[str, Any],
+    policy: Optional[SegmentPolicy] = None,
+    sink: Optional[JsonlAppender] = None,
+) -> None:
     """
     Append a single JSON object as one line to the given path.
 
-    If the directory does not exist, it will be created. Errors during
+    If the directory does not exist, it will be created. When the file is
+    past the segment policy bounds it is first sealed into a compressed
+    segment (see epf_hazard_log_store). With a sink the entry is buffered
+    there instead (and written with the sink's next batch). Errors during
     writing are logged but not raised, to avoid breaking the main EPF
     experiment flow due to logging issues.
     """
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, sort_keys=True) + "\n")
+        if sink is not None:
+            sink.append(payload)
+        else:
+            append_entry(path, payload, policy=policy)
     except OSError as exc:  # pragma: no cover - defensive logging
         LOG.warning("Failed to append hazard log entry to %s: %s", path, exc)
 
@@ -164,19 +178,6 @@ def _maybe_load_field_spec(
     return maybe_load_field_spec(p)
 
 
-def _merge_deny_keys(a: Optional[List[str]], b: Optional[List[str]]) -> Optional[List[str]]:
-    """
-    Merge deny key prefix lists deterministically.
-    None means "no deny list provided".
-    """
-    if a is None and b is None:
-        return None
-    xs = [str(x).strip() for x in (a or []) if str(x).strip()]
-    ys = [str(y).strip() for y in (b or []) if str(y).strip()]
-    merged = sorted(set(xs) | set(ys))
-    return merged or None
-
-
 def _intersect_keys_if_both_provided(
     a: Optional[List[str]],
     b: Optional[List[str]],
@@ -201,86 +202,6 @@ def _intersect_keys_if_both_provided(
 # Snapshot sanitization + policy
 # ---------------------------------------------------------------------------
 
-def _normalize_path_list(xs: Optional[List[str]]) -> Optional[List[str]]:
-    """
-    Normalize dotted-path lists deterministically.
-    - strip whitespace
-    - drop empties
-    - drop trailing dots
-    - sort unique for determinism
-
-    Returns None if empty / not provided (meaning: "no allowlist/denylist").
-    """
-    if xs is None:
-        return None
-    out: List[str] = []
-    for x in xs:
-        if x is None:
-            continue
-        s = str(x).strip()
-        if not s:
-            continue
-        if s.endswith("."):
-            s = s[:-1]
-        if s:
-            out.append(s)
-    if not out:
-        return None
-    return sorted(set(out))
-
-
-def _join_path(prefix: str, key: str) -> str:
-    return f"{prefix}.{key}" if prefix else key
-
-
-def _matches_prefix(path: str, prefix: str) -> bool:
-    """
-    Prefix match for dotted paths.
-    - exact match: path == prefix
-    - subtree match: path startswith prefix + "."
-    """
-    return path == prefix or path.startswith(prefix + ".")
-
-
-def _is_denied(path: str, deny: Optional[List[str]]) -> bool:
-    if deny is None:
-        return False
-    return any(_matches_prefix(path, d) for d in deny)
-
-
-def _is_allowed_leaf(path: str, allowed: Optional[List[str]]) -> bool:
-    """
-    If allowed is None -> everything allowed.
-    Else leaf allowed if it matches any allowed prefix.
-    """
-    if allowed is None:
-        return True
-    return any(_matches_prefix(path, a) for a in allowed)
-
-
-def _should_traverse(path: str, allowed: Optional[List[str]]) -> bool:
-    """
-    Decide whether to traverse into a subtree at 'path' given allowed prefixes.
-
-    We traverse if:
-      - no allowlist is set (allowed is None), OR
-      - some allowed prefix is:
-          * equal to path, OR
-          * deeper under path (allowed startswith path + "."), OR
-          * shallower than path (path startswith allowed + ".")
-    """
-    if allowed is None:
-        return True
-    for a in allowed:
-        if a == path:
-            return True
-        if a.startswith(path + "."):
-            return True
-        if path.startswith(a + "."):
-            return True
-    return False
-
-
 def sanitize_snapshot_for_log(
     snapshot: Mapping[str, Any],
     *,
@@ -288,6 +209,7 @@ def sanitize_snapshot_for_log(
     max_items: int = DEFAULT_SNAPSHOT_MAX_ITEMS,
     allowed_prefixes: Optional[List[str]] = None,
     deny_keys: Optional[List[str]] = None,
+    policy: Optional[SnapshotPolicy] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Sanitize a snapshot for safe JSONL logging (numeric-only), with optional policy.
@@ -307,12 +229,18 @@ def sanitize_snapshot_for_log(
         deny_keys:
             Always drop keys/subtrees matching these prefixes.
             Example: ["pii", "secrets.api_key", "raw_prompt"]
+        policy:
+            Precompiled SnapshotPolicy (e.g. FieldSpecArtifactV0.snapshot_policy());
+            replaces allowed_prefixes/deny_keys. Without it the lists are
+            compiled (and memoized) via compile_snapshot_policy.
 
     Returns:
         (sanitized_snapshot, meta)
     """
-    allowed_n = _normalize_path_list(allowed_prefixes)
-    deny_n = _normalize_path_list(deny_keys)
+    if policy is None:
+        policy = compile_snapshot_policy(allowed_prefixes, deny_keys)
+    allowed_n = policy.allowed_prefixes
+    deny_n = policy.deny_keys
 
     meta_base: Dict[str, Any] = {
         "schema": HAZARD_SNAPSHOT_SCHEMA_V0,
@@ -340,9 +268,8 @@ def sanitize_snapshot_for_log(
         depth=int(max_depth),
         budget=budget,
         stats=stats,
-        path_prefix="",
-        allowed_prefixes=allowed_n,
-        deny_keys=deny_n,
+        policy=policy,
+        cursor=policy.root(),
     )
 
     meta_base["kept"] = int(stats["kept"])
@@ -357,9 +284,8 @@ def _sanitize_mapping(
     depth: int,
     budget: List[int],
     stats: Dict[str, Any],
-    path_prefix: str,
-    allowed_prefixes: Optional[List[str]],
-    deny_keys: Optional[List[str]],
+    policy: SnapshotPolicy,
+    cursor: PolicyCursor,
 ) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
 
@@ -370,10 +296,10 @@ def _sanitize_mapping(
             break
 
         key_str = str(k)
-        path = _join_path(path_prefix, key_str)
+        child_cursor = policy.descend(cursor, key_str)
 
         # Deny overrides everything.
-        if _is_denied(path, deny_keys):
+        if child_cursor.denied:
             stats["dropped"] += 1
             continue
 
@@ -385,7 +311,7 @@ def _sanitize_mapping(
                 continue
 
             # If allowlist is present, only traverse subtrees that can contain allowed keys.
-            if not _should_traverse(path, allowed_prefixes):
+            if not policy.traversable(child_cursor):
                 stats["dropped"] += 1
                 continue
 
@@ -394,9 +320,8 @@ def _sanitize_mapping(
                 depth=depth - 1,
                 budget=budget,
                 stats=stats,
-                path_prefix=path,
-                allowed_prefixes=allowed_prefixes,
-                deny_keys=deny_keys,
+                policy=policy,
+                cursor=child_cursor,
             )
             if child:
                 out[key_str] = child
@@ -410,7 +335,7 @@ def _sanitize_mapping(
             continue
 
         # Apply allowlist at leaf-level.
-        if not _is_allowed_leaf(path, allowed_prefixes):
+        if not child_cursor.covered:
             stats["dropped"] += 1
             continue
 
@@ -662,6 +587,8 @@ def probe_hazard_and_append_log(
     snapshot_deny_keys: Optional[List[str]] = None,
     feature_allowlist: Optional[List[str]] = None,
     field_spec_path: Optional[Union[str, Path]] = None,
+    log_segment_policy: Optional[SegmentPolicy] = None,
+    log_sink: Optional[JsonlAppender] = None,
 ) -> HazardState:
     """
     Run the EPF hazard forecasting probe and append the result to a JSONL log.
@@ -683,21 +610,29 @@ def probe_hazard_and_append_log(
         - feature_allowlist: optional list of feature keys to allow
           (also bounded by calibration recommended_features when present)
 
+    Log segments:
+        - log_segment_policy bounds the active log file by size/age; past it,
+          the file is sealed into a compressed segment before appending
+          (default: SegmentPolicy(), 32 MiB, gzip).
+        - log_sink (e.g. epf_hazard_log_store.open_appender(...)) buffers the
+          entry in a group-commit writer instead of appending it right away;
+          the sink's own path and policy apply, log_dir/log_segment_policy
+          are not used for writing.
+
     Defaults preserve baseline behavior:
         - no FieldSpec -> snapshot logs all numeric keys by default
         - no calibration artifact -> no feature-mode autowire
     """
     field_spec = _maybe_load_field_spec(field_spec_path)
 
-    # Apply field-first defaults for snapshot policy (only if caller did not specify).
-    if log_snapshots and field_spec is not None:
-        if snapshot_allowed_prefixes is None and getattr(field_spec, "features", None):
-            snapshot_allowed_prefixes = list(field_spec.features)
-        # deny keys are safe to merge additively
-        snapshot_deny_keys = _merge_deny_keys(
-            snapshot_deny_keys,
-            getattr(field_spec, "deny_keys", []) or [],
-        )
+    # Apply field-first defaults for snapshot policy (only if caller did not specify;
+    # deny keys are merged additively). Compiled once and cached on the FieldSpec.
+    snapshot_policy: Optional[SnapshotPolicy] = None
+    if log_snapshots:
+        if field_spec is not None:
+            snapshot_policy = field_spec.snapshot_policy(snapshot_allowed_prefixes, snapshot_deny_keys)
+        else:
+            snapshot_policy = compile_snapshot_policy(snapshot_allowed_prefixes, snapshot_deny_keys)
 
     # Apply field-first defaults for feature allowlist (only affects autowire path).
     effective_feature_allowlist = feature_allowlist
@@ -776,16 +711,8 @@ def probe_hazard_and_append_log(
         )
 
     if log_snapshots:
-        snap_cur, meta_cur = sanitize_snapshot_for_log(
-            current_snapshot,
-            allowed_prefixes=snapshot_allowed_prefixes,
-            deny_keys=snapshot_deny_keys,
-        )
-        snap_ref, meta_ref = sanitize_snapshot_for_log(
-            reference_snapshot,
-            allowed_prefixes=snapshot_allowed_prefixes,
-            deny_keys=snapshot_deny_keys,
-        )
+        snap_cur, meta_cur = sanitize_snapshot_for_log(current_snapshot, policy=snapshot_policy)
+        snap_ref, meta_ref = sanitize_snapshot_for_log(reference_snapshot, policy=snapshot_policy)
         entry["snapshot_current"] = snap_cur
         entry["snapshot_reference"] = snap_ref
 
@@ -810,6 +737,6 @@ def probe_hazard_and_append_log(
         entry["meta"] = extra_meta
 
     log_path = Path(log_dir) / LOG_FILENAME_DEFAULT
-    _append_jsonl(log_path, entry)
+    _append_jsonl(log_path, entry, log_segment_policy, log_sink)
 
     return state
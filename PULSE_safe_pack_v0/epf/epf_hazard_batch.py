@@ -0,0 +1,385 @@
+"""
+epf_hazard_batch.py
+
+Batched (multi-gate / multi-snapshot) hazard forecasting with a compiled
+feature plan.
+
+Problem:
+  forecast_hazard runs once per gate: every call resolves dotted feature
+  paths, builds one FeatureContribution per feature and sums T in Python.
+  Probing every gate of a large registry (or replaying many historical
+  snapshots) pays that overhead per row.
+
+Approach:
+  - compile_feature_plan() turns a FeatureSpec list (+ scalers) into
+    pre-split paths and per-feature vectors (weights, transform/missing
+    flags, defaults, clip bounds, scaler median/denominator) once;
+  - evaluate_hazard_batch() extracts all rows into (n, F) arrays and computes
+    T, S, D, E and zone as NumPy arrays; contributor dicts are built only for
+    the top-k features of each row;
+  - forecast_hazard_batch() wraps the result into HazardState objects equal
+    (up to float rounding) to calling forecast_hazard row by row.
+
+Semantics follow FeatureSpec.extract / compute_feature_contributions /
+forecast_hazard exactly (missing policy, transform, clip, scaler eps,
+contributor ordering, reason strings). Legacy mode (no feature_specs) keeps
+compute_T per row and vectorizes S/D/E/zone.
+
+Requires numpy (optional dependency, see requirements-analysis.txt);
+epf_hazard_forecast imports this module lazily.
+"""
+
+from __future__ import annotations
+
+from collections import abc
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .epf_hazard_features import (
+    FeatureSpec,
+    MissingPolicy,
+    RobustScaler,
+    Transform,
+    _to_float,
+)
+from .epf_hazard_forecast import (
+    HazardConfig,
+    HazardState,
+    build_reason,
+    compute_T,
+    estimate_S,
+)
+
+
+SnapshotsArg = Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]
+
+
+@dataclass(frozen=True)
+class CompiledFeaturePlan:
+    """
+    FeatureSpec list compiled into per-feature vectors (length F).
+
+    Build with compile_feature_plan(); reuse across batches as long as the
+    specs and scalers do not change.
+    """
+    keys: Tuple[str, ...]
+    paths: Tuple[Tuple[str, ...], ...]
+    groups: Tuple[Tuple[str, Tuple[Tuple[int, Tuple[str, ...]], ...]], ...]
+    weights: np.ndarray
+    log1p: np.ndarray
+    use_default: np.ndarray
+    defaults: np.ndarray
+    clip_lo: np.ndarray
+    clip_hi: np.ndarray
+    scaled: np.ndarray
+    median: np.ndarray
+    denom: np.ndarray
+    key_rank: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def extract(self, snapshots: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """
+        Extract (n, F) feature values; NaN where FeatureSpec.extract would
+        return None.
+        """
+        n, f = len(snapshots), len(self.keys)
+        nan = float("nan")
+        flat = [nan] * (n * f)
+        for i, snap in enumerate(snapshots):
+            if not isinstance(snap, Mapping):
+                continue
+            base = i * f
+            # Paths sharing a first segment resolve it once per row.
+            for first, members in self.groups:
+                head = snap.get(first)
+                if head is None:
+                    continue
+                for j, rest in members:
+                    cur: Any = head
+                    for part in rest:
+                        if type(cur) is not dict and not isinstance(cur, abc.Mapping):
+                            cur = None
+                            break
+                        cur = cur.get(part)
+                        if cur is None:
+                            break
+                    kind = type(cur)
+                    if kind is float or kind is int:
+                        flat[base + j] = cur
+                    elif cur is not None:
+                        x = _to_float(cur)
+                        if x is not None:
+                            flat[base + j] = x
+        raw = np.array(flat, dtype=float).reshape(n, f)
+        raw[~np.isfinite(raw)] = np.nan
+
+        defaults = np.broadcast_to(self.defaults, raw.shape)
+        dflt = np.broadcast_to(self.use_default, raw.shape)
+
+        x = np.where(np.isnan(raw) & dflt, defaults, raw)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            logged = np.where(x > -1.0, np.log1p(np.where(x > -1.0, x, 0.0)), np.nan)
+        tx = np.where(np.isfinite(x), np.where(self.log1p, logged, x), np.nan)
+        tx = np.where(np.isnan(tx) & dflt, defaults, tx)
+        clipped = np.minimum(np.maximum(tx, self.clip_lo), self.clip_hi)
+        clipped = np.where(np.isnan(tx), np.nan, clipped)
+        return np.where(np.isfinite(clipped), clipped, np.where(dflt, defaults, np.nan))
+
+    def weighted_deltas(self, cur: np.ndarray, ref: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-feature weighted deltas for extracted (n, F) current/reference
+        values (ref may be broadcast). Returns (weighted, delta_z, valid);
+        T is sqrt(sum(weighted**2, axis=1)).
+        """
+        valid = np.isfinite(cur) & np.isfinite(ref)
+        with np.errstate(invalid="ignore"):
+            z_cur = np.where(self.scaled, (cur - self.median) / self.denom, cur)
+            z_ref = np.where(self.scaled, (ref - self.median) / self.denom, ref)
+            delta_z = z_cur - z_ref
+            weighted = np.where(valid, self.weights * delta_z, 0.0)
+        return weighted, delta_z, valid
+
+
+def compile_feature_plan(
+    feature_specs: Sequence[FeatureSpec],
+    scalers: Optional[Mapping[str, RobustScaler]] = None,
+) -> CompiledFeaturePlan:
+    """Compile feature specs (+ optional robust scalers) into a CompiledFeaturePlan."""
+    scalers_map = scalers or {}
+    specs = list(feature_specs)
+    keys = tuple(spec.key for spec in specs)
+
+    median = np.zeros(len(specs))
+    denom = np.ones(len(specs))
+    scaled = np.zeros(len(specs), dtype=bool)
+    for j, spec in enumerate(specs):
+        scaler = scalers_map.get(spec.key)
+        if scaler is None:
+            continue
+        scaled[j] = True
+        median[j] = float(scaler.median)
+        denom[j] = scaler.mad if abs(scaler.mad) > scaler.eps else scaler.eps
+
+    paths = tuple(tuple(key.split(".")) if "." in key else (key,) for key in keys)
+    grouped: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = {}
+    for j, path in enumerate(paths):
+        grouped.setdefault(path[0], []).append((j, path[1:]))
+
+    order = sorted(range(len(keys)), key=lambda j: keys[j])
+    key_rank = np.empty(len(keys), dtype=np.int64)
+    key_rank[order] = np.arange(len(keys))
+
+    return CompiledFeaturePlan(
+        keys=keys,
+        paths=paths,
+        groups=tuple((first, tuple(members)) for first, members in grouped.items()),
+        weights=np.array([float(spec.weight) for spec in specs]),
+        log1p=np.array([spec.transform == Transform.LOG1P for spec in specs], dtype=bool),
+        use_default=np.array([spec.missing == MissingPolicy.DEFAULT for spec in specs], dtype=bool),
+        defaults=np.array([float(spec.default) for spec in specs]),
+        clip_lo=np.array([spec.clip[0] if spec.clip is not None else -np.inf for spec in specs], dtype=float),
+        clip_hi=np.array([spec.clip[1] if spec.clip is not None else np.inf for spec in specs], dtype=float),
+        scaled=scaled,
+        median=median,
+        denom=denom,
+        key_rank=key_rank,
+    )
+
+
+@dataclass
+class HazardBatchResult:
+    """
+    Array form of a batch of hazard forecasts (row i = input i).
+
+    contributors_top / reason_suffix are per-row lists, filled only in
+    feature mode.
+    """
+    T: np.ndarray
+    S: np.ndarray
+    D: np.ndarray
+    E: np.ndarray
+    zone: np.ndarray
+    T_scaled: np.ndarray
+    contributors_top: List[List[Dict[str, Any]]]
+    reason_suffix: List[str]
+
+    def __len__(self) -> int:
+        return int(self.T.shape[0])
+
+    def states(self) -> List[HazardState]:
+        out: List[HazardState] = []
+        for i in range(len(self)):
+            T, S, D, E = float(self.T[i]), float(self.S[i]), float(self.D[i]), float(self.E[i])
+            zone = str(self.zone[i])
+            reason = build_reason(E, zone, T, S, D)
+            if self.reason_suffix[i]:
+                reason = f"{reason} | {self.reason_suffix[i]}"
+            out.append(
+                HazardState(
+                    T=T,
+                    S=S,
+                    D=D,
+                    E=E,
+                    zone=zone,
+                    reason=reason,
+                    contributors_top=self.contributors_top[i],
+                    T_scaled=bool(self.T_scaled[i]),
+                )
+            )
+        return out
+
+
+def _rows(arg: Optional[SnapshotsArg], n: int, name: str) -> List[Any]:
+    """Broadcast a single mapping (or None) to n rows; check sequence lengths."""
+    if arg is None or isinstance(arg, Mapping):
+        return [arg if arg is not None else {}] * n
+    rows = list(arg)
+    if len(rows) != n:
+        raise ValueError(f"{name}: expected {n} rows, got {len(rows)}")
+    return rows
+
+
+def _drift(histories_T: Sequence[Sequence[float]], T: np.ndarray, min_history: int) -> np.ndarray:
+    """
+    Vectorized estimate_D over (history + [T])[-min_history:] per row.
+    """
+    n = T.shape[0]
+    windows = []
+    for hist, t in zip(histories_T, T):
+        ext = list(hist) + [float(t)]
+        if len(ext) > min_history:
+            ext = ext[-min_history:]
+        windows.append(ext)
+    m = max((len(w) for w in windows), default=0)
+    if m < 2:
+        return np.zeros(n)
+    padded = np.full((n, m), np.nan)
+    for i, w in enumerate(windows):
+        if w:
+            padded[i, m - len(w):] = w
+    diffs = np.abs(np.diff(padded, axis=1))
+    counts = np.sum(~np.isnan(diffs), axis=1)
+    sums = np.nansum(diffs, axis=1)
+    return np.where(counts > 0, sums / np.maximum(counts, 1), 0.0)
+
+
+def evaluate_hazard_batch(
+    current_snapshots: Sequence[Mapping[str, Any]],
+    reference_snapshots: SnapshotsArg,
+    stability_metrics: Optional[SnapshotsArg] = None,
+    histories_T: Optional[Sequence[Sequence[float]]] = None,
+    cfg: Optional[HazardConfig] = None,
+    *,
+    plan: Optional[CompiledFeaturePlan] = None,
+) -> HazardBatchResult:
+    """
+    Evaluate forecast_hazard for n rows at once.
+
+    reference_snapshots / stability_metrics may be a single mapping shared by
+    all rows (e.g. many historical snapshots vs one reference) or one per row.
+    histories_T defaults to empty histories. plan defaults to compiling
+    cfg.feature_specs / cfg.feature_scalers; pass a precompiled plan to reuse
+    it across batches.
+    """
+    if cfg is None:
+        cfg = HazardConfig()
+
+    currents = list(current_snapshots)
+    n = len(currents)
+    references = _rows(reference_snapshots, n, "reference_snapshots")
+    stabilities = _rows(stability_metrics, n, "stability_metrics")
+    histories = [list(h) for h in histories_T] if histories_T is not None else [[] for _ in range(n)]
+    if len(histories) != n:
+        raise ValueError(f"histories_T: expected {n} rows, got {len(histories)}")
+
+    if plan is None and cfg.feature_specs:
+        plan = compile_feature_plan(cfg.feature_specs, cfg.feature_scalers)
+
+    contributors_top: List[List[Dict[str, Any]]] = [[] for _ in range(n)]
+    reason_suffix = [""] * n
+
+    if plan is None or len(plan) == 0:
+        # Legacy mode: keep compute_T semantics (arbitrary snapshot keys).
+        T = np.array([compute_T(c, r) for c, r in zip(currents, references)], dtype=float)
+        T_scaled = np.zeros(n, dtype=bool)
+    else:
+        cur = plan.extract(currents)
+        if isinstance(reference_snapshots, Mapping) or reference_snapshots is None:
+            ref = np.broadcast_to(plan.extract([references[0] if n else {}]), cur.shape)
+        else:
+            ref = plan.extract(references)
+
+        weighted, delta_z, valid = plan.weighted_deltas(cur, ref)
+        contrib = np.abs(weighted)
+
+        T = np.sqrt(np.sum(weighted * weighted, axis=1))
+        T_scaled = np.any(valid & plan.scaled, axis=1)
+
+        k = int(cfg.top_k_contributors) if isinstance(cfg.top_k_contributors, int) else 3
+        if k <= 0:
+            k = 3
+
+        # Stable order: contrib desc, key asc; only rows' top-k become dicts.
+        ranked = np.lexsort((np.broadcast_to(plan.key_rank, contrib.shape), -contrib), axis=1)
+        for i in range(n):
+            top = []
+            for j in ranked[i, :k]:
+                if not (valid[i, j] and contrib[i, j] > 0.0):
+                    break
+                top.append(
+                    {
+                        "key": plan.keys[j],
+                        "delta_z": float(delta_z[i, j]),
+                        "weight": float(plan.weights[j]),
+                        "contrib": float(contrib[i, j]),
+                        "scaled": bool(plan.scaled[j]),
+                    }
+                )
+            contributors_top[i] = top
+            if top:
+                reason_suffix[i] = "top: " + ", ".join(f"{c['key']}({c['contrib']:.2f})" for c in top)
+            else:
+                reason_suffix[i] = "top: none"
+
+    S = np.array([estimate_S(s) for s in stabilities], dtype=float)
+    D = _drift(histories, T, cfg.min_history)
+    E = cfg.alpha * D + cfg.beta * (1.0 - S)
+    zone = np.where(E >= cfg.crit_threshold, "RED", np.where(E >= cfg.warn_threshold, "AMBER", "GREEN"))
+
+    return HazardBatchResult(
+        T=T,
+        S=S,
+        D=D,
+        E=E,
+        zone=zone,
+        T_scaled=T_scaled,
+        contributors_top=contributors_top,
+        reason_suffix=reason_suffix,
+    )
+
+
+def forecast_hazard_batch(
+    current_snapshots: Sequence[Mapping[str, Any]],
+    reference_snapshots: SnapshotsArg,
+    stability_metrics: Optional[SnapshotsArg] = None,
+    histories_T: Optional[Sequence[Sequence[float]]] = None,
+    cfg: Optional[HazardConfig] = None,
+    *,
+    plan: Optional[CompiledFeaturePlan] = None,
+) -> List[HazardState]:
+    """
+    Batched forecast_hazard: one HazardState per row of current_snapshots.
+    See evaluate_hazard_batch for argument broadcasting.
+    """
+    return evaluate_hazard_batch(
+        current_snapshots,
+        reference_snapshots,
+        stability_metrics,
+        histories_T,
+        cfg,
+        plan=plan,
+    ).states()
@@ -14,16 +14,30 @@ Design goals:
   - Fail-open loading (invalid/missing files -> None).
   - Additive: defining a FieldSpec does not change gating by itself.
 
+Snapshot policy:
+  SnapshotPolicy compiles allowed prefixes + deny keys into a dotted-path
+  trie once, so allow/deny/traverse decisions cost O(path depth) instead of
+  a scan over every prefix. FieldSpecArtifactV0.snapshot_policy() caches the
+  compiled policy on the artifact, and maybe_load_field_spec() returns the
+  same artifact while the file is unchanged, so probes (and the
+  calibrate/inspect tools) reuse one compiled policy. The reuse follows the
+  digest cache rules (tools/file_digest_v0.py): the full stat key must match,
+  and a file modified within RACY_WINDOW_NS of the load is never cached.
+
 License: Apache-2.0 (same as repository).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 import json
+import time
+
+from ..tools.file_digest_v0 import RACY_WINDOW_NS, StatKey, stat_key
 
 
 FIELD_SPEC_SCHEMA_V0 = "epf_hazard_field_spec_v0"
@@ -64,6 +78,128 @@ def _normalize_dotted_paths(xs: Optional[List[str]]) -> List[str]:
     return sorted(set(out))
 
 
+class _PolicyNode:
+    __slots__ = ("children", "allow", "allow_below", "deny")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_PolicyNode"] = {}
+        self.allow = False        # an allowed prefix ends here
+        self.allow_below = False  # an allowed prefix ends here or deeper
+        self.deny = False         # a deny prefix ends here
+
+
+class PolicyCursor(NamedTuple):
+    """
+    Position of a snapshot path in a SnapshotPolicy trie.
+
+    node:    trie node at the path (None once the path left the trie)
+    covered: path is (under) an allowed prefix, or there is no allowlist
+    denied:  path is (under) a deny prefix
+    """
+    node: Optional[_PolicyNode]
+    covered: bool
+    denied: bool
+
+
+class SnapshotPolicy:
+    """
+    Compiled snapshot logging policy (allowed prefixes + deny keys).
+
+    Same semantics as the historical prefix scans of dotted paths:
+      - denied:   some deny prefix equals the path or is an ancestor of it
+      - allowed:  no allowlist, or some allowed prefix equals / is an ancestor
+      - traverse: allowed, or some allowed prefix lies below the path
+
+    Walk it alongside a nested snapshot with root() / descend(cursor, key)
+    (O(1) per plain key), or query a full dotted path with the is_denied /
+    allows_leaf / should_traverse helpers (O(depth)).
+    """
+
+    __slots__ = ("allowed_prefixes", "deny_keys", "_root")
+
+    def __init__(
+        self,
+        allowed_prefixes: Optional[Sequence[str]] = None,
+        deny_keys: Optional[Sequence[str]] = None,
+    ) -> None:
+        allowed = _normalize_dotted_paths(list(allowed_prefixes)) if allowed_prefixes is not None else []
+        deny = _normalize_dotted_paths(list(deny_keys)) if deny_keys is not None else []
+        # Empty lists mean "no allowlist / denylist" (as in the sanitizer).
+        self.allowed_prefixes: Optional[List[str]] = allowed or None
+        self.deny_keys: Optional[List[str]] = deny or None
+
+        self._root = _PolicyNode()
+        for prefix in allowed:
+            node = self._root
+            node.allow_below = True
+            for part in prefix.split("."):
+                node = node.children.setdefault(part, _PolicyNode())
+                node.allow_below = True
+            node.allow = True
+        for prefix in deny:
+            node = self._root
+            for part in prefix.split("."):
+                node = node.children.setdefault(part, _PolicyNode())
+            node.deny = True
+
+    @property
+    def active(self) -> bool:
+        return self.allowed_prefixes is not None or self.deny_keys is not None
+
+    def root(self) -> PolicyCursor:
+        return PolicyCursor(self._root, self.allowed_prefixes is None, False)
+
+    def descend(self, cursor: PolicyCursor, key: str) -> PolicyCursor:
+        """Cursor for child `key` (a key containing dots spans several levels)."""
+        node, covered, denied = cursor
+        if node is None:
+            return cursor
+        for part in key.split(".") if "." in key else (key,):
+            node = node.children.get(part)
+            if node is None:
+                break
+            covered = covered or node.allow
+            denied = denied or node.deny
+        return PolicyCursor(node, covered, denied)
+
+    @staticmethod
+    def traversable(cursor: PolicyCursor) -> bool:
+        return cursor.covered or (cursor.node is not None and cursor.node.allow_below)
+
+    def _cursor_for(self, path: str) -> PolicyCursor:
+        return self.descend(self.root(), path)
+
+    def is_denied(self, path: str) -> bool:
+        return self._cursor_for(path).denied
+
+    def allows_leaf(self, path: str) -> bool:
+        return self._cursor_for(path).covered
+
+    def should_traverse(self, path: str) -> bool:
+        return self.traversable(self._cursor_for(path))
+
+
+@lru_cache(maxsize=64)
+def _compile_snapshot_policy_cached(
+    allowed: Optional[Tuple[str, ...]],
+    deny: Optional[Tuple[str, ...]],
+) -> SnapshotPolicy:
+    return SnapshotPolicy(allowed, deny)
+
+
+def compile_snapshot_policy(
+    allowed_prefixes: Optional[Sequence[str]] = None,
+    deny_keys: Optional[Sequence[str]] = None,
+) -> SnapshotPolicy:
+    """
+    Compile (and memoize by content) a SnapshotPolicy from caller lists.
+    """
+    return _compile_snapshot_policy_cached(
+        tuple(map(str, allowed_prefixes)) if allowed_prefixes is not None else None,
+        tuple(map(str, deny_keys)) if deny_keys is not None else None,
+    )
+
+
 @dataclass
 class FieldSpecArtifactV0:
     """
@@ -94,6 +230,9 @@ class FieldSpecArtifactV0:
     features: List[str] = None  # type: ignore[assignment]
     deny_keys: List[str] = None  # type: ignore[assignment]
     notes: str = ""
+    _snapshot_policies: Dict[Any, SnapshotPolicy] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not self.created_utc:
@@ -154,6 +293,32 @@ class FieldSpecArtifactV0:
         """
         return (list(self.features), list(self.deny_keys))
 
+    def snapshot_policy(
+        self,
+        allowed_prefixes: Optional[List[str]] = None,
+        deny_keys: Optional[List[str]] = None,
+    ) -> SnapshotPolicy:
+        """
+        Compiled snapshot logging policy with FieldSpec defaults applied:
+        - allowed_prefixes: caller list if given, else features (if any)
+        - deny_keys: caller list merged additively with deny_keys
+
+        Cached per (caller lists) on this artifact.
+        """
+        cache_key = (
+            tuple(allowed_prefixes) if allowed_prefixes is not None else None,
+            tuple(deny_keys) if deny_keys is not None else None,
+        )
+        policy = self._snapshot_policies.get(cache_key)
+        if policy is None:
+            allowed = allowed_prefixes
+            if allowed is None and self.features:
+                allowed = list(self.features)
+            deny = sorted(set(_normalize_dotted_paths(deny_keys)) | set(self.deny_keys))
+            policy = SnapshotPolicy(allowed, deny)
+            self._snapshot_policies[cache_key] = policy
+        return policy
+
     def to_feature_allowlist(self) -> List[str]:
         """
         Interpret FieldSpec as feature-mode allow list (exact keys).
@@ -166,17 +331,40 @@ class FieldSpecArtifactV0:
             json.dump(self.to_dict(), f, indent=2, sort_keys=True)
 
 
+# Loaded artifacts by resolved path, reused while the stat key matches.
+_FIELD_SPEC_CACHE: Dict[str, Tuple[StatKey, FieldSpecArtifactV0]] = {}
+
+
 def maybe_load_field_spec(path: Optional[Path] = None) -> Optional[FieldSpecArtifactV0]:
     """
     Fail-open load:
       - missing file -> None
       - invalid JSON / schema -> None
+
+    While the file is unchanged (same device, inode, size, mtime and ctime)
+    the same artifact object is returned, so its compiled snapshot policies
+    are reused across calls. A file that changed during the load, or whose
+    mtime is within RACY_WINDOW_NS of it, is not cached: it could be
+    rewritten again without a visible stat change.
+    Treat the returned artifact as read-only.
     """
     p = path or DEFAULT_FIELD_SPEC_PATH
     try:
+        before = stat_key(p.stat())
+        cache_key = str(p.resolve())
+        cached = _FIELD_SPEC_CACHE.get(cache_key)
+        if cached is not None and cached[0] == before:
+            return cached[1]
         with p.open("r", encoding="utf-8") as f:
             data = json.load(f)
-        return FieldSpecArtifactV0.from_dict(data)
+        loaded_at = time.time_ns()
+        after = stat_key(p.stat())
+        artifact = FieldSpecArtifactV0.from_dict(data)
+        if before == after and loaded_at - after[3] >= RACY_WINDOW_NS:
+            _FIELD_SPEC_CACHE[cache_key] = (after, artifact)
+        else:
+            _FIELD_SPEC_CACHE.pop(cache_key, None)
+        return artifact
     except FileNotFoundError:
         return None
     except Exception:
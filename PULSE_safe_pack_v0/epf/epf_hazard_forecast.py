@@ -27,13 +27,18 @@ Relational Grail (optional):
       and top-contributor explainability. This is opt-in and does not change
       default behavior.
 
+Batched forecasting:
+    - forecast_hazard_batch evaluates many gates (or many historical
+      snapshots) in one call with a FeatureSpec plan compiled to NumPy
+      vectors (see epf_hazard_batch; requires numpy, imported lazily).
+
 License: same as the PULSE repo (Apache-2.0).
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 import math
 import statistics
 import json
@@ -416,3 +421,37 @@ def forecast_hazard(
         contributors_top=contrib_top,
         T_scaled=used_scaling,
     )
+
+
+def forecast_hazard_batch(
+    current_snapshots: Sequence[Mapping[str, Any]],
+    reference_snapshots: Union[Mapping[str, Any], Sequence[Mapping[str, Any]]],
+    stability_metrics: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+    histories_T: Optional[Sequence[Sequence[float]]] = None,
+    cfg: Optional[HazardConfig] = None,
+    *,
+    plan: Any = None,
+) -> List[HazardState]:
+    """
+    Batched forecast_hazard: one HazardState per row of current_snapshots.
+
+    reference_snapshots / stability_metrics may be a single mapping shared by
+    all rows or one per row; histories_T defaults to empty histories. In
+    feature mode the FeatureSpec list is compiled once (or pass plan=
+    epf_hazard_batch.compile_feature_plan(...) to reuse it across calls) and
+    T/D/E/zone are evaluated as NumPy arrays; contributor dicts are built
+    only for the reported top-k.
+
+    Results match calling forecast_hazard per row (up to float rounding).
+    Requires numpy.
+    """
+    from .epf_hazard_batch import forecast_hazard_batch as _forecast_hazard_batch
+
+    return _forecast_hazard_batch(
+        current_snapshots,
+        reference_snapshots,
+        stability_metrics,
+        histories_T,
+        cfg,
+        plan=plan,
+    )
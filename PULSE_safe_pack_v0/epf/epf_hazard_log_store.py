@@ -0,0 +1,1096 @@
+"""
+epf_hazard_log_store.py
+
+Segmented, indexed storage for the EPF hazard JSONL log.
+
+Problem:
+  Consumers only need the last few entries of one gate_id series, but the
+  historical readers json-parsed every line of epf_hazard_log.jsonl on every
+  call, and every entry carries full snapshot maps, so the single log file
+  (and the cost of reading it) grew without bound.
+
+Layout (next to the log, e.g. artifacts/):
+  epf_hazard_log.jsonl              active segment, plain append-only JSONL
+  epf_hazard_log.jsonl.idx          per-gate offset index of the active file
+  epf_hazard_log.segments/
+      manifest.json                 sealed segments in order + per-gate ranges
+      epf_hazard_log.000001.jsonl.gz
+      ...
+      refs/<sha256>.json            reference snapshots stored by digest
+
+Writing (append_entry / open_appender):
+  - Entries are appended to the active file in the same JSONL format as
+    before. When the active file exceeds a SegmentPolicy bound (size, or age
+    of its first entry), it is sealed first: moved into the segments
+    directory, compressed (gzip; zstd when the stdlib provides it) and
+    recorded in the manifest with its entry count, timestamp range and
+    per-gate counts/ranges.
+  - open_appender() returns a buffered JsonlAppender that writes batches of
+    entries with one locked write each (group commit), for backfills and
+    replays; append_entry() is a batch of one.
+  - compact_segments() rewrites sealed segments so that repeated
+    snapshot_reference maps are stored once under refs/ and replaced by a
+    "snapshot_reference_ref" digest.
+
+Reading:
+  - iter_entries / iter_entries_reverse walk sealed segments and the active
+    file as one sequence and re-inline compacted reference snapshots, so
+    readers see the entries exactly as they were written.
+  - HazardLogStore answers "last N entries of gate X": the active file via a
+    sidecar index (per-gate counts + byte offsets of recent entries, checked
+    against head/tail digests so only appended bytes are parsed and a
+    truncated/rewritten file triggers a rebuild); older entries come from
+    sealed segments, skipping those the manifest says lack the gate.
+  - Reading never writes: HazardLogStore uses an existing index and scans
+    what it does not cover in memory. The index file is written only by the
+    log's writer (run_all, which appends to it) or on explicit request
+    (update_index(), epf_hazard_log_compact.py --index).
+
+Everything is fail-open: unreadable or unwritable indexes, manifests and
+segments degrade to scanning (or to fewer entries), never to an error.
+Invalid JSON lines and non-object lines are skipped, like the historical
+readers did. Appends (and seals) take an exclusive lock on the active file,
+so concurrent writers are safe; compaction expects a single writer.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+
+from ..tools.jsonl_append_v0 import DEFAULT_BATCH_SIZE, JsonlAppender
+
+try:  # Python >= 3.14
+    from compression import zstd as _zstd  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the interpreter
+    _zstd = None
+
+LOG = logging.getLogger(__name__)
+
+HAZARD_LOG_INDEX_SCHEMA_V0 = "epf_hazard_log_index_v0"
+HAZARD_LOG_MANIFEST_SCHEMA_V0 = "epf_hazard_log_manifest_v0"
+INDEX_SUFFIX = ".idx"
+SEGMENTS_SUFFIX = ".segments"
+MANIFEST_FILENAME = "manifest.json"
+REFS_DIRNAME = "refs"
+REFERENCE_REF_KEY = "snapshot_reference_ref"
+DEFAULT_RETAIN = 1024
+DEFAULT_SEGMENT_MAX_BYTES = 32 * 1024 * 1024
+_CHECK_WINDOW = 4096
+_REVERSE_BLOCK = 64 * 1024
+
+
+def index_path_for(log_path: Union[str, Path]) -> Path:
+    """Sidecar index path for a hazard log."""
+    lp = Path(log_path)
+    return lp.with_name(lp.name + INDEX_SUFFIX)
+
+
+def segments_dir_for(log_path: Union[str, Path]) -> Path:
+    """Directory holding the sealed segments, manifest and refs of a log."""
+    lp = Path(log_path)
+    return lp.with_name(lp.stem + SEGMENTS_SUFFIX)
+
+
+def hazard_log_exists(log_path: Union[str, Path]) -> bool:
+    """True if the log has an active file or a segments directory."""
+    return Path(log_path).exists() or segments_dir_for(log_path).is_dir()
+
+
+def _parse_line(raw: bytes) -> Optional[Dict[str, Any]]:
+    s = raw.strip()
+    if not s:
+        return None
+    try:
+        obj = json.loads(s.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _dump_line(payload: Dict[str, Any]) -> str:
+    # Same serialisation the adapter has always used for log lines.
+    return json.dumps(payload, sort_keys=True) + "\n"
+
+
+def _gate_key(obj: Dict[str, Any]) -> str:
+    # Same normalisation as the readers' str(obj.get("gate_id", "")) filter.
+    return str(obj.get("gate_id", ""))
+
+
+def _sha_range(f: Any, start: int, end: int) -> str:
+    f.seek(start)
+    return hashlib.sha256(f.read(max(0, end - start))).hexdigest()
+
+
+def _write_atomic(path: Path, write: Callable[[Any], None], *, mode: str = "wb") -> None:
+    """Write via a temp file in the same directory + os.replace."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, mode) as out:
+            write(out)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Segment codecs
+# ---------------------------------------------------------------------------
+
+_CODEC_SUFFIXES = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+_SEGMENT_READ_ERRORS: Tuple[type, ...] = (OSError, EOFError, ValueError)
+if _zstd is not None:  # pragma: no cover - depends on the interpreter
+    _SEGMENT_READ_ERRORS += (_zstd.ZstdError,)
+
+
+def available_codecs() -> List[str]:
+    """Segment codecs usable with this interpreter."""
+    return ["none", "gzip"] + (["zstd"] if _zstd is not None else [])
+
+
+def _codec_for_name(name: str) -> str:
+    if name.endswith(_CODEC_SUFFIXES["gzip"]):
+        return "gzip"
+    if name.endswith(_CODEC_SUFFIXES["zstd"]):
+        return "zstd"
+    return "none"
+
+
+def _open_segment(path: Path) -> Any:
+    codec = _codec_for_name(path.name)
+    if codec == "gzip":
+        return gzip.open(path, "rb")
+    if codec == "zstd":
+        if _zstd is None:
+            raise OSError(f"zstd is not available in this interpreter to read {path}")
+        return _zstd.open(path, "rb")
+    return path.open("rb")
+
+
+def _write_segment_lines(out: Any, lines: Iterable[bytes], codec: str) -> None:
+    if codec == "gzip":
+        # mtime=0 keeps the compressed bytes a pure function of the content.
+        with gzip.GzipFile(fileobj=out, mode="wb", mtime=0) as z:
+            z.writelines(lines)
+    elif codec == "zstd":
+        with _zstd.ZstdFile(out, "wb") as z:  # type: ignore[union-attr]
+            z.writelines(lines)
+    else:
+        out.writelines(lines)
+
+
+def _iter_segment(path: Path) -> Iterator[Dict[str, Any]]:
+    try:
+        with _open_segment(path) as f:
+            for raw in f:
+                obj = _parse_line(raw)
+                if obj is not None:
+                    yield obj
+    except _SEGMENT_READ_ERRORS as exc:
+        LOG.warning("Failed to read hazard log segment %s: %s", path, exc)
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def _segment_seq(name: str, stem: str) -> Optional[int]:
+    m = re.fullmatch(re.escape(stem) + r"\.(\d+)\.jsonl(?:\.gz|\.zst)?", name)
+    return int(m.group(1)) if m else None
+
+
+def _describe_entries(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Entry count, timestamp range and per-gate ranges of a segment."""
+    count = 0
+    first_ts: Optional[str] = None
+    last_ts: Optional[str] = None
+    gates: Dict[str, Dict[str, Any]] = {}
+
+    for obj in entries:
+        ts = obj.get("timestamp")
+        ts_s = str(ts) if isinstance(ts, (str, int, float)) else None
+        count += 1
+        if first_ts is None:
+            first_ts = ts_s
+        last_ts = ts_s if ts_s is not None else last_ts
+
+        info = gates.get(_gate_key(obj))
+        if info is None:
+            info = gates[_gate_key(obj)] = {"count": 0, "first_timestamp": ts_s, "last_timestamp": ts_s}
+        info["count"] += 1
+        if ts_s is not None:
+            info["last_timestamp"] = ts_s
+
+    return {
+        "entries": count,
+        "first_timestamp": first_ts,
+        "last_timestamp": last_ts,
+        "gates": {gid: gates[gid] for gid in sorted(gates)},
+    }
+
+
+def load_manifest(log_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Sealed segments of a log, oldest first.
+
+    Segment files present on disk but missing from manifest.json (a seal
+    interrupted before the manifest write) are added with ranges derived from
+    their content, so no entry is ever lost to readers.
+    """
+    lp = Path(log_path)
+    segdir = segments_dir_for(lp)
+    segments: List[Dict[str, Any]] = []
+
+    try:
+        data = json.loads((segdir / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+
+    if isinstance(data, dict) and data.get("schema") == HAZARD_LOG_MANIFEST_SCHEMA_V0:
+        for rec in data.get("segments") or []:
+            if (
+                isinstance(rec, dict)
+                and isinstance(rec.get("name"), str)
+                and isinstance(rec.get("seq"), int)
+                and isinstance(rec.get("gates"), dict)
+            ):
+                segments.append(rec)
+
+    known = {rec["seq"] for rec in segments}
+    try:
+        names = sorted(os.listdir(segdir))
+    except OSError:
+        names = []
+
+    orphans: Dict[int, str] = {}
+    for name in names:
+        seq = _segment_seq(name, lp.stem)
+        if seq is None or seq in known:
+            continue
+        # Prefer the compressed copy if a seal stopped before removing the plain file.
+        if seq not in orphans or _codec_for_name(orphans[seq]) == "none":
+            orphans[seq] = name
+
+    for seq in sorted(orphans):
+        name = orphans[seq]
+        rec = {"seq": seq, "name": name, "codec": _codec_for_name(name)}
+        rec.update(_describe_entries(_iter_segment(segdir / name)))
+        segments.append(rec)
+
+    segments.sort(key=lambda rec: rec["seq"])
+    return {"schema": HAZARD_LOG_MANIFEST_SCHEMA_V0, "segments": segments}
+
+
+def _write_manifest(log_path: Path, manifest: Dict[str, Any]) -> None:
+    path = segments_dir_for(log_path) / MANIFEST_FILENAME
+    text = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    _write_atomic(path, lambda out: out.write(text), mode="w")
+
+
+# ---------------------------------------------------------------------------
+# Writing: append, seal, compact
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SegmentPolicy:
+    """
+    When to seal the active file into a compressed segment.
+
+    max_bytes:
+        Seal once the active file reaches this size (None: no size bound).
+    max_age_s:
+        Seal once the first entry of the active file is older than this many
+        seconds, by its "timestamp" field (None: no age bound).
+    codec:
+        "gzip" (default), "zstd" (stdlib, Python >= 3.14) or "none".
+    """
+    max_bytes: Optional[int] = DEFAULT_SEGMENT_MAX_BYTES
+    max_age_s: Optional[float] = None
+    codec: str = "gzip"
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+def _should_seal(lp: Path, policy: SegmentPolicy) -> bool:
+    try:
+        size = lp.stat().st_size
+    except OSError:
+        return False
+    if size == 0:
+        return False
+
+    if policy.max_bytes is not None and size >= int(policy.max_bytes):
+        return True
+
+    if policy.max_age_s is not None:
+        try:
+            with lp.open("rb") as f:
+                first = _parse_line(f.readline())
+        except OSError:
+            return False
+        started = _parse_timestamp(first.get("timestamp")) if first else None
+        if started is not None:
+            age = (datetime.now(timezone.utc) - started).total_seconds()
+            return age >= float(policy.max_age_s)
+
+    return False
+
+
+def seal_active(log_path: Union[str, Path], *, codec: str = "gzip") -> Optional[Dict[str, Any]]:
+    """
+    Move the active file into the next segment, compress it and record it in
+    the manifest. Returns the manifest record, or None if the active file is
+    missing or empty. Raises OSError on I/O failure and ValueError for an
+    unknown/unavailable codec.
+    """
+    if codec not in available_codecs():
+        raise ValueError(f"unsupported segment codec {codec!r}; available: {available_codecs()}")
+
+    lp = Path(log_path)
+    try:
+        if lp.stat().st_size == 0:
+            return None
+    except FileNotFoundError:
+        return None
+
+    segdir = segments_dir_for(lp)
+    segdir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(lp)
+    seq = max((rec["seq"] for rec in manifest["segments"]), default=0) + 1
+
+    raw_path = segdir / f"{lp.stem}.{seq:06d}{_CODEC_SUFFIXES['none']}"
+    os.replace(lp, raw_path)
+    try:
+        index_path_for(lp).unlink()
+    except FileNotFoundError:
+        pass
+
+    record: Dict[str, Any] = {"seq": seq, "codec": codec}
+    record.update(_describe_entries(_iter_segment(raw_path)))
+    record["raw_bytes"] = raw_path.stat().st_size
+    record["sealed_utc"] = datetime.now(timezone.utc).isoformat()
+
+    final_path = raw_path
+    if codec != "none":
+        final_path = segdir / f"{lp.stem}.{seq:06d}{_CODEC_SUFFIXES[codec]}"
+        with raw_path.open("rb") as src:
+            _write_atomic(final_path, lambda out: _write_segment_lines(out, src, codec))
+        raw_path.unlink()
+
+    record["name"] = final_path.name
+    record["stored_bytes"] = final_path.stat().st_size
+    manifest["segments"].append(record)
+    _write_manifest(lp, manifest)
+    return record
+
+
+def _seal_hook(policy: SegmentPolicy) -> Callable[[Path], bool]:
+    def before_write(lp: Path) -> bool:
+        if not _should_seal(lp, policy):
+            return False
+        try:
+            return seal_active(lp, codec=policy.codec) is not None
+        except (OSError, ValueError) as exc:
+            LOG.warning("Failed to seal hazard log segment for %s: %s", lp, exc)
+            return False
+
+    return before_write
+
+
+def open_appender(
+    log_path: Union[str, Path],
+    *,
+    policy: Optional[SegmentPolicy] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    fsync: bool = False,
+) -> JsonlAppender:
+    """
+    Buffered writer for the active file (see tools/jsonl_append_v0.py).
+
+    Entries are written in batches under a file lock, so concurrent writers
+    never interleave lines; before each batch the active file is sealed when
+    it is past the policy bounds (default SegmentPolicy()), so a segment can
+    overshoot its size bound by at most one batch. Use as a context manager,
+    or pass it to probe_hazard_and_append_log(log_sink=...).
+    """
+    pol = policy if policy is not None else SegmentPolicy()
+    return JsonlAppender(
+        log_path,
+        batch_size=batch_size,
+        fsync=fsync,
+        before_write=_seal_hook(pol),
+    )
+
+
+def append_entry(
+    log_path: Union[str, Path],
+    payload: Dict[str, Any],
+    *,
+    policy: Optional[SegmentPolicy] = None,
+) -> None:
+    """
+    Append one entry as a JSON line to the active file, sealing the active
+    file first when it is past the policy bounds (default SegmentPolicy()).
+
+    Raises OSError if the entry cannot be written; a failed seal is only
+    logged and the entry still goes to the active file.
+    """
+    with open_appender(log_path, policy=policy, batch_size=1) as sink:
+        sink.append(payload)
+
+
+def _snapshot_digest(snapshot: Dict[str, Any]) -> Tuple[str, bytes]:
+    encoded = json.dumps(snapshot, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest(), encoded
+
+
+def compact_segments(log_path: Union[str, Path]) -> Dict[str, int]:
+    """
+    Store the snapshot_reference maps of sealed segments once, by digest.
+
+    Each distinct reference snapshot is written to refs/<sha256>.json and
+    entries keep only "snapshot_reference_ref": "<sha256>". Already compacted
+    segments are skipped, so this is safe to re-run. Readers re-inline the
+    snapshots transparently.
+    """
+    lp = Path(log_path)
+    segdir = segments_dir_for(lp)
+    refs_dir = segdir / REFS_DIRNAME
+    stats = {"segments": 0, "entries": 0, "refs_written": 0, "bytes_before": 0, "bytes_after": 0}
+
+    manifest = load_manifest(lp)
+    if not manifest["segments"]:
+        return stats
+
+    refs_dir.mkdir(parents=True, exist_ok=True)
+    changed = False
+
+    for rec in manifest["segments"]:
+        path = segdir / rec["name"]
+        codec = _codec_for_name(rec["name"])
+        if rec.get("compacted") or not path.exists() or codec not in available_codecs():
+            continue
+
+        lines: List[bytes] = []
+        for obj in _iter_segment(path):
+            ref = obj.get("snapshot_reference")
+            if isinstance(ref, dict):
+                digest, encoded = _snapshot_digest(ref)
+                ref_path = refs_dir / f"{digest}.json"
+                if not ref_path.exists():
+                    _write_atomic(ref_path, lambda out: out.write(encoded))
+                    stats["refs_written"] += 1
+                del obj["snapshot_reference"]
+                obj[REFERENCE_REF_KEY] = digest
+                stats["entries"] += 1
+            lines.append(_dump_line(obj).encode("utf-8"))
+
+        stats["bytes_before"] += path.stat().st_size
+        _write_atomic(path, lambda out: _write_segment_lines(out, lines, codec))
+        rec["compacted"] = True
+        rec["stored_bytes"] = path.stat().st_size
+        stats["bytes_after"] += rec["stored_bytes"]
+        stats["segments"] += 1
+        changed = True
+
+    if changed:
+        _write_manifest(lp, manifest)
+    return stats
+
+
+class _RefResolver:
+    """Re-inline compacted reference snapshots (fail-open on missing refs)."""
+
+    def __init__(self, refs_dir: Path) -> None:
+        self.refs_dir = refs_dir
+        self._cache: Dict[str, Optional[bytes]] = {}
+
+    def _load(self, digest: str) -> Optional[bytes]:
+        if digest not in self._cache:
+            data: Optional[bytes] = None
+            try:
+                raw = (self.refs_dir / f"{digest}.json").read_bytes()
+                if hashlib.sha256(raw).hexdigest() == digest:
+                    data = raw
+            except OSError:
+                pass
+            self._cache[digest] = data
+        return self._cache[digest]
+
+    def hydrate(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        digest = obj.get(REFERENCE_REF_KEY)
+        if not isinstance(digest, str) or "snapshot_reference" in obj:
+            return obj
+        raw = self._load(digest)
+        if raw is None:
+            return obj
+        del obj[REFERENCE_REF_KEY]
+        # Parse per entry so callers can never alias one shared dict.
+        obj["snapshot_reference"] = json.loads(raw.decode("utf-8"))
+        return obj
+
+
+def _iter_sealed(
+    log_path: Path,
+    *,
+    reverse: bool = False,
+    gate_id: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    segdir = segments_dir_for(log_path)
+    if not segdir.is_dir():
+        return
+
+    records = load_manifest(log_path)["segments"]
+    resolver = _RefResolver(segdir / REFS_DIRNAME)
+
+    for rec in (reversed(records) if reverse else records):
+        if gate_id is not None and gate_id not in rec["gates"]:
+            continue
+        entries: Iterable[Dict[str, Any]] = _iter_segment(segdir / rec["name"])
+        if gate_id is not None:
+            entries = (obj for obj in entries if _gate_key(obj) == gate_id)
+        if reverse:
+            entries = reversed(list(entries))
+        for obj in entries:
+            yield resolver.hydrate(obj)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class HazardLogStore:
+    """
+    Read-side view of one hazard log (sealed segments + indexed active file).
+
+    Typical use:
+        store = HazardLogStore(log_path)
+        for entry in store.iter_gate_reverse("EPF_field_main"):
+            ...  # newest -> oldest, stop when enough
+
+    The active-file index and the manifest are loaded once, in the
+    constructor. With persist=False (the default) the store never writes:
+    entries the index does not cover are scanned in memory only. Writers
+    pass persist=True (or call update_index()) to save the refreshed index.
+    """
+
+    def __init__(
+        self,
+        log_path: Union[str, Path],
+        *,
+        retain: int = DEFAULT_RETAIN,
+        persist: bool = False,
+    ) -> None:
+        self.log_path = Path(log_path)
+        self.index_path = index_path_for(self.log_path)
+        self.retain = max(1, int(retain))
+        self.persist = bool(persist)
+
+        self._size = 0
+        self._gates: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"rebuilt": False, "indexed_bytes": 0, "indexed_entries": 0}
+
+        self._refresh()
+        self._segments: List[Dict[str, Any]] = (
+            load_manifest(self.log_path)["segments"]
+            if segments_dir_for(self.log_path).is_dir()
+            else []
+        )
+
+    # ------------------------------------------------------------------
+    # index maintenance
+    # ------------------------------------------------------------------
+
+    def _load_index(self, f: Any, log_size: int) -> bool:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(data, dict) or data.get("schema") != HAZARD_LOG_INDEX_SCHEMA_V0:
+            return False
+        if int(data.get("retain", -1)) != self.retain:
+            return False
+
+        log_meta = data.get("log")
+        gates = data.get("gates")
+        if not isinstance(log_meta, dict) or not isinstance(gates, dict):
+            return False
+
+        size = log_meta.get("size")
+        if not isinstance(size, int) or size < 0 or size > log_size:
+            return False
+
+        head_end = min(size, _CHECK_WINDOW)
+        tail_start = max(0, size - _CHECK_WINDOW)
+        if _sha_range(f, 0, head_end) != log_meta.get("head_sha256"):
+            return False
+        if _sha_range(f, tail_start, size) != log_meta.get("tail_sha256"):
+            return False
+
+        parsed: Dict[str, Dict[str, Any]] = {}
+        for gid, info in gates.items():
+            if not isinstance(info, dict):
+                return False
+            offsets = info.get("offsets")
+            count = info.get("count")
+            if not isinstance(offsets, list) or not isinstance(count, int):
+                return False
+            parsed[str(gid)] = {"count": count, "offsets": [int(o) for o in offsets]}
+
+        self._size = size
+        self._gates = parsed
+        return True
+
+    def _scan(self, f: Any, start: int) -> int:
+        """Index complete lines from byte `start`; return the new covered size."""
+        f.seek(start)
+        pos = start
+        added = 0
+
+        while True:
+            raw = f.readline()
+            if not raw or not raw.endswith(b"\n"):
+                break
+
+            obj = _parse_line(raw)
+            if obj is not None:
+                info = self._gates.setdefault(_gate_key(obj), {"count": 0, "offsets": []})
+                info["count"] += 1
+                info["offsets"].append(pos)
+                if len(info["offsets"]) > self.retain:
+                    del info["offsets"][: len(info["offsets"]) - self.retain]
+                added += 1
+
+            pos += len(raw)
+
+        self.stats["indexed_bytes"] += pos - start
+        self.stats["indexed_entries"] += added
+        return pos
+
+    def _write_index(self, f: Any) -> None:
+        size = self._size
+        payload = {
+            "schema": HAZARD_LOG_INDEX_SCHEMA_V0,
+            "retain": self.retain,
+            "log": {
+                "size": size,
+                "head_sha256": _sha_range(f, 0, min(size, _CHECK_WINDOW)),
+                "tail_sha256": _sha_range(f, max(0, size - _CHECK_WINDOW), size),
+            },
+            "gates": {gid: self._gates[gid] for gid in sorted(self._gates)},
+        }
+        text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+        try:
+            _write_atomic(self.index_path, lambda out: out.write(text), mode="w")
+        except OSError as exc:
+            # The index is an optimisation; never fail a reader over it.
+            LOG.debug("Could not write hazard log index %s: %s", self.index_path, exc)
+
+    def _refresh(self) -> None:
+        try:
+            with self.log_path.open("rb") as f:
+                log_size = os.fstat(f.fileno()).st_size
+
+                if not self._load_index(f, log_size):
+                    self._size = 0
+                    self._gates = {}
+                    self.stats["rebuilt"] = True
+
+                if self._size < log_size:
+                    before = self._size
+                    self._size = self._scan(f, self._size)
+                    if self.persist and (self._size != before or self.stats["rebuilt"]):
+                        self._write_index(f)
+        except OSError:
+            self._size = 0
+            self._gates = {}
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+
+    def gate_ids(self) -> List[str]:
+        gids = set(self._gates)
+        for rec in self._segments:
+            gids.update(rec["gates"])
+        return sorted(gids)
+
+    def count(self, gate_id: str) -> int:
+        gid = str(gate_id)
+        info = self._gates.get(gid)
+        n = int(info["count"]) if info else 0
+        for rec in self._segments:
+            seg_info = rec["gates"].get(gid)
+            if isinstance(seg_info, dict):
+                n += int(seg_info.get("count", 0))
+        return n
+
+    def _read_at(self, f: Any, offsets: List[int]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for off in offsets:
+            f.seek(off)
+            obj = _parse_line(f.readline())
+            if obj is not None:
+                yield off, obj
+
+    def _iter_active_gate_reverse(self, gid: str) -> Iterator[Dict[str, Any]]:
+        info = self._gates.get(gid)
+        if not info:
+            return
+
+        offsets: List[int] = info["offsets"]
+        try:
+            with self.log_path.open("rb") as f:
+                for _, obj in self._read_at(f, list(reversed(offsets))):
+                    if _gate_key(obj) == gid:
+                        yield obj
+
+                if info["count"] <= len(offsets):
+                    return
+
+                oldest = offsets[0] if offsets else self._size
+                older: List[Dict[str, Any]] = []
+                f.seek(0)
+                pos = 0
+                while pos < oldest:
+                    raw = f.readline()
+                    if not raw:
+                        break
+                    pos += len(raw)
+                    obj = _parse_line(raw)
+                    if obj is not None and _gate_key(obj) == gid:
+                        older.append(obj)
+        except OSError:
+            return
+
+        yield from reversed(older)
+
+    def iter_gate_reverse(self, gate_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield entries of one gate_id series, newest -> oldest.
+
+        Active-file entries with retained offsets are served by seek + one
+        line parse each; walking past them scans the older part of the active
+        file. Sealed segments are only opened once the caller reads beyond
+        the active file, and only those whose manifest lists the gate.
+        """
+        gid = str(gate_id)
+        yield from self._iter_active_gate_reverse(gid)
+        if self._segments:
+            yield from _iter_sealed(self.log_path, reverse=True, gate_id=gid)
+
+    def tail(self, gate_id: str, n: int) -> List[Dict[str, Any]]:
+        """Last n entries of a gate_id series, oldest -> newest."""
+        out: List[Dict[str, Any]] = []
+        if n <= 0:
+            return out
+        for obj in self.iter_gate_reverse(gate_id):
+            out.append(obj)
+            if len(out) >= n:
+                break
+        out.reverse()
+        return out
+
+    def last(self, gate_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Newest entry of a gate_id series (or of the whole log if None)."""
+        it = iter_entries_reverse(self.log_path) if gate_id is None else self.iter_gate_reverse(gate_id)
+        for obj in it:
+            return obj
+        return None
+
+
+def update_index(log_path: Union[str, Path], *, retain: int = DEFAULT_RETAIN) -> Dict[str, Any]:
+    """
+    Bring the active file's sidecar index up to date (only appended bytes
+    are parsed) and write it. Returns the store's stats; fail-open like the
+    store itself.
+    """
+    return dict(HazardLogStore(log_path, retain=retain, persist=True).stats)
+
+
+def _iter_active_reverse(log_path: Path, block_size: int) -> Iterator[Dict[str, Any]]:
+    try:
+        f = log_path.open("rb")
+    except OSError:
+        return
+
+    with f:
+        pos = os.fstat(f.fileno()).st_size
+        carry = b""
+        # Bytes after the last newline are a line still being written.
+        partial = True
+
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + carry
+            if partial:
+                cut = buf.rfind(b"\n")
+                if cut < 0:
+                    carry = b""
+                    continue
+                buf = buf[: cut + 1]
+                partial = False
+            lines = buf.split(b"\n")
+            # The first piece may be the tail of a line that starts earlier.
+            carry = lines[0]
+            for raw in reversed(lines[1:]):
+                obj = _parse_line(raw)
+                if obj is not None:
+                    yield obj
+
+        obj = _parse_line(carry) if not partial else None
+        if obj is not None:
+            yield obj
+
+
+def iter_entries_reverse(
+    log_path: Union[str, Path],
+    *,
+    block_size: int = _REVERSE_BLOCK,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every valid entry of a hazard log, newest -> oldest. The active
+    file is read backwards in blocks (cost proportional to how far the caller
+    reads); sealed segments are opened only when the caller gets that far.
+    """
+    lp = Path(log_path)
+    yield from _iter_active_reverse(lp, block_size)
+    yield from _iter_sealed(lp, reverse=True)
+
+
+def iter_entries(log_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every valid entry of a hazard log, oldest -> newest: sealed
+    segments in manifest order, then the active file. This is the single
+    iterator every full-log reader goes through.
+
+    Like the offset index and LogTail, it stops at a last active line without
+    its trailing newline (a writer still in progress): an entry counts once
+    its line is complete.
+    """
+    lp = Path(log_path)
+    yield from _iter_sealed(lp)
+
+    try:
+        f = lp.open("rb")
+    except OSError:
+        return
+
+    with f:
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            obj = _parse_line(raw)
+            if obj is not None:
+                yield obj
+
+
+# ---------------------------------------------------------------------------
+# Incremental reads
+# ---------------------------------------------------------------------------
+
+HAZARD_LOG_CURSOR_SCHEMA_V0 = "epf_hazard_log_cursor_v0"
+
+
+def _entry_digest(obj: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class LogTail:
+    """
+    Entries appended to a hazard log since a cursor, and the cursor to resume
+    from next time.
+
+    A cursor records the last sealed segment already consumed, how many
+    entries (and bytes) of the then-active file were consumed, and the digest
+    of that file's first entry. When the active file is later sealed, its
+    segment is recognised by that digest and the consumed entries are
+    skipped; compaction keeps entry counts, so it does not disturb cursors.
+
+    If a cursor cannot be honoured (missing, from another log, log rewritten
+    or truncated) `reset` is True and iteration yields the whole log.
+
+        tail = LogTail(log_path, cursor)
+        for entry in tail: ...
+        cursor = tail.cursor    # only meaningful after full iteration
+    """
+
+    def __init__(self, log_path: Union[str, Path], cursor: Optional[Dict[str, Any]] = None) -> None:
+        self.log_path = Path(log_path)
+        self._segments = (
+            load_manifest(self.log_path)["segments"]
+            if segments_dir_for(self.log_path).is_dir()
+            else []
+        )
+        self._max_seq = max((rec["seq"] for rec in self._segments), default=0)
+
+        self.reset = False
+        self._new_segments: List[Dict[str, Any]] = list(self._segments)
+        self._skip_in_first_segment = 0
+        self._active_entries = 0
+        self._active_offset = 0
+        self._active_first: Optional[str] = None
+
+        if not self._resume(cursor):
+            self.reset = True
+            self._new_segments = list(self._segments)
+            self._skip_in_first_segment = 0
+            self._active_entries = 0
+            self._active_offset = 0
+            self._active_first = None
+
+        self.cursor: Dict[str, Any] = self._make_cursor()
+
+    def _first_entry_digest(self, entries: Iterable[Dict[str, Any]]) -> Optional[str]:
+        for obj in entries:
+            return _entry_digest(obj)
+        return None
+
+    def _resume(self, cursor: Optional[Dict[str, Any]]) -> bool:
+        if not isinstance(cursor, dict) or cursor.get("schema") != HAZARD_LOG_CURSOR_SCHEMA_V0:
+            return False
+
+        sealed_seq = cursor.get("sealed_seq")
+        n_active = cursor.get("active_entries")
+        offset = cursor.get("active_offset")
+        first = cursor.get("active_first_sha256")
+        if not (isinstance(sealed_seq, int) and isinstance(n_active, int) and isinstance(offset, int)):
+            return False
+        if sealed_seq > self._max_seq:
+            return False
+
+        self._new_segments = [rec for rec in self._segments if rec["seq"] > sealed_seq]
+        if n_active == 0:
+            return True
+
+        if self._new_segments:
+            # The previously active file has been sealed since: it must be the
+            # next segment, starting with the same entry.
+            rec = self._new_segments[0]
+            if rec["seq"] != sealed_seq + 1:
+                return False
+            path = segments_dir_for(self.log_path) / rec["name"]
+            resolver = _RefResolver(segments_dir_for(self.log_path) / REFS_DIRNAME)
+            head = (resolver.hydrate(obj) for obj in _iter_segment(path))
+            if self._first_entry_digest(head) != first:
+                return False
+            self._skip_in_first_segment = n_active
+            return True
+
+        try:
+            with self.log_path.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                head_obj = _parse_line(f.readline())
+        except OSError:
+            return False
+        if size < offset or head_obj is None or _entry_digest(head_obj) != first:
+            return False
+
+        self._active_entries = n_active
+        self._active_offset = offset
+        self._active_first = first
+        return True
+
+    def _make_cursor(self) -> Dict[str, Any]:
+        return {
+            "schema": HAZARD_LOG_CURSOR_SCHEMA_V0,
+            "sealed_seq": self._max_seq,
+            "active_entries": self._active_entries,
+            "active_offset": self._active_offset,
+            "active_first_sha256": self._active_first,
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        segdir = segments_dir_for(self.log_path)
+        resolver = _RefResolver(segdir / REFS_DIRNAME)
+
+        for i, rec in enumerate(self._new_segments):
+            skip = self._skip_in_first_segment if i == 0 else 0
+            for j, obj in enumerate(_iter_segment(segdir / rec["name"])):
+                if j >= skip:
+                    yield resolver.hydrate(obj)
+
+        try:
+            f = self.log_path.open("rb")
+        except OSError:
+            self.cursor = self._make_cursor()
+            return
+
+        with f:
+            f.seek(self._active_offset)
+            pos = self._active_offset
+            while True:
+                raw = f.readline()
+                # A partial last line belongs to a writer still in progress.
+                if not raw or not raw.endswith(b"\n"):
+                    break
+                pos += len(raw)
+                obj = _parse_line(raw)
+                if obj is None:
+                    continue
+                if self._active_first is None:
+                    self._active_first = _entry_digest(obj)
+                self._active_entries += 1
+                self._active_offset = pos
+                yield obj
+            self._active_offset = pos
+
+        self.cursor = self._make_cursor()
+
+
+def read_checkpoint(
+    path: Union[str, Path],
+    *,
+    schema: str,
+    params: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """
+    Load an aggregation checkpoint written by write_checkpoint. Returns None
+    (meaning: rebuild from scratch) if it is missing, unreadable, of another
+    schema or was built with different params.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("schema") != schema or data.get("params") != params:
+        return None
+    if not isinstance(data.get("cursor"), dict):
+        return None
+    return data
+
+
+def write_checkpoint(path: Union[str, Path], payload: Dict[str, Any]) -> None:
+    """Atomically write an aggregation checkpoint (fail-open)."""
+    p = Path(path)
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(p, lambda out: out.write(text), mode="w")
+    except OSError as exc:
+        LOG.warning("Could not write checkpoint %s: %s", p, exc)
@@ -0,0 +1,535 @@
+"""
+epf_hazard_replay.py
+
+Replay / backfill of hazard forecasts over a historical hazard log under one
+or more candidate HazardConfigs.
+
+Problem:
+  The only way to see what a new HazardConfig (alpha/beta, thresholds,
+  feature specs, scalers, min_history) would have done was to rerun probes
+  one at a time through probe_hazard_and_append_log, which recomputes and
+  appends every entry and needs the original runtime state.
+
+Approach:
+  - one streaming pass over the log (epf_hazard_log_store.iter_entries, so
+    sealed/compacted segments are included), in chunks of rows;
+  - per chunk, T is recomputed once per distinct (feature specs, scalers)
+    pair: legacy compute_T per row, or the compiled feature plan of
+    epf_hazard_batch as (n, F) arrays;
+  - D is the windowed mean |dT| per gate_id in log order (the history
+    forecast_hazard sees when each probe's T-history is the gate's previous
+    logged T values), vectorized over the chunk with the last min_history-1
+    T values of each gate carried into the next chunk; E and zone follow
+    from alpha/beta and the thresholds;
+  - results are columnar (ReplayResult: one array per column and config,
+    saved with save_npz) and zone_transitions() diffs zones between two
+    configs (or against the logged zones, config name "logged").
+
+Semantics:
+  - S is the logged hazard.S (stability metrics are not logged; 0.5, the
+    estimate_S neutral value, when missing);
+  - entries logged without snapshot_current keep their logged T (column
+    "has_snapshot" is False for them);
+  - snapshots are the sanitized ones from the log, so replayed T can differ
+    from the original probe where the snapshot policy dropped keys;
+  - min_history <= 0 uses the full per-gate history (forecast_hazard's
+    history[-0:] behaviour for 0).
+
+Requires numpy (optional dependency, see requirements-analysis.txt).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .epf_hazard_batch import CompiledFeaturePlan, compile_feature_plan
+from .epf_hazard_features import FeatureScalersArtifactV0, FeatureSpec, MissingPolicy, Transform
+from .epf_hazard_forecast import HazardConfig, _load_calibrated_thresholds, compute_T
+from .epf_hazard_log_store import iter_entries
+
+
+HAZARD_REPLAY_SCHEMA_V0 = "epf_hazard_replay_v0"
+LOGGED = "logged"
+ZONES = ("GREEN", "AMBER", "RED")
+ZONE_UNKNOWN = -1
+DEFAULT_CHUNK_SIZE = 65536
+
+_ZONE_CODES = {z: i for i, z in enumerate(ZONES)}
+
+
+# ---------------------------------------------------------------------------
+# Candidate configs
+# ---------------------------------------------------------------------------
+
+def _feature_spec_from_obj(obj: Any) -> FeatureSpec:
+    if isinstance(obj, str):
+        return FeatureSpec(key=obj)
+    if not isinstance(obj, Mapping):
+        raise ValueError(f"feature spec must be a key or an object, got {obj!r}")
+    clip = obj.get("clip")
+    if clip is not None and (not isinstance(clip, (list, tuple)) or len(clip) != 2):
+        raise ValueError(f"feature clip must be a [lo, hi] pair, got {clip!r}")
+    spec = FeatureSpec(
+        key=str(obj.get("key", "")),
+        transform=Transform(str(obj.get("transform", Transform.IDENTITY.value))),
+        clip=(float(clip[0]), float(clip[1])) if clip is not None else None,
+        weight=float(obj.get("weight", 1.0)),
+        missing=MissingPolicy(str(obj.get("missing", MissingPolicy.SKIP.value))),
+        default=float(obj.get("default", 0.0)),
+    )
+    spec.validate()
+    return spec
+
+
+def hazard_config_from_dict(d: Mapping[str, Any], *, base_dir: Optional[Path] = None) -> HazardConfig:
+    """
+    Build a candidate HazardConfig from a JSON object:
+
+        {
+          "alpha": 1.0, "beta": 1.0, "min_history": 3,
+          "warn_threshold": 0.3, "crit_threshold": 0.7,
+          "features": ["metrics.rdsi", {"key": "metrics.latency", "transform": "log1p"}],
+          "calibration": "epf_hazard_thresholds_v0.json"
+        }
+
+    "calibration" (relative to base_dir) supplies warn/crit thresholds that
+    are not given explicitly and the feature scalers of its feature_scalers
+    block. Without "features" the config replays in legacy mode.
+    """
+    cfg = HazardConfig()
+    for name in ("alpha", "beta", "warn_threshold", "crit_threshold"):
+        if name in d:
+            setattr(cfg, name, float(d[name]))
+    for name in ("min_history", "top_k_contributors"):
+        if name in d:
+            setattr(cfg, name, int(d[name]))
+
+    cal = d.get("calibration")
+    if cal and not isinstance(cal, str):
+        raise ValueError(f"calibration must be a path, got {cal!r}")
+    if cal:
+        cal_path = Path(cal)
+        if base_dir is not None and not cal_path.is_absolute():
+            cal_path = base_dir / cal_path
+        warn, crit = _load_calibrated_thresholds(cal_path)
+        if "warn_threshold" not in d:
+            cfg.warn_threshold = warn
+        if "crit_threshold" not in d:
+            cfg.crit_threshold = crit
+        data = json.loads(cal_path.read_text(encoding="utf-8"))
+        fs = data.get("feature_scalers") if isinstance(data, Mapping) else None
+        if isinstance(fs, Mapping):
+            cfg.feature_scalers = dict(FeatureScalersArtifactV0.from_dict(fs).features)
+
+    features = d.get("features")
+    if features and not isinstance(features, list):
+        raise ValueError(f"features must be a list, got {features!r}")
+    if features:
+        cfg.feature_specs = [_feature_spec_from_obj(obj) for obj in features]
+
+    return cfg
+
+
+# ---------------------------------------------------------------------------
+# Columnar result
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ReplayResult:
+    """
+    Columnar replay output; row i is the i-th replayed log entry.
+
+    Row columns: gate (codes into gate_ids), timestamp, event_id, S,
+    has_snapshot. columns[name] holds T, D, E and zone (codes into ZONES,
+    -1 unknown) per config, plus LOGGED with the logged T/D/E/zone.
+    """
+    gate_ids: List[str]
+    gate: np.ndarray
+    timestamp: np.ndarray
+    event_id: np.ndarray
+    S: np.ndarray
+    has_snapshot: np.ndarray
+    columns: Dict[str, Dict[str, np.ndarray]]
+    configs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.gate.shape[0])
+
+    @property
+    def config_names(self) -> List[str]:
+        return [name for name in self.columns if name != LOGGED]
+
+    def zones(self, name: str) -> np.ndarray:
+        """Zone names ("GREEN"/"AMBER"/"RED"/"UNKNOWN") of a config."""
+        labels = np.array(ZONES + ("UNKNOWN",))
+        return labels[self.columns[name]["zone"]]
+
+    def zone_counts(self, name: str) -> Dict[str, int]:
+        codes = self.columns[name]["zone"]
+        out = {z: int(np.sum(codes == i)) for i, z in enumerate(ZONES)}
+        unknown = int(np.sum(codes == ZONE_UNKNOWN))
+        if unknown:
+            out["UNKNOWN"] = unknown
+        return out
+
+    def zone_transitions(self, base: str, other: str, *, max_events: int = 50) -> Dict[str, Any]:
+        """
+        Diff zones of `other` against `base` row by row.
+
+        Returns the from/to count matrix, changed row counts (total and per
+        gate_id) and the first max_events changed rows.
+        """
+        a = self.columns[base]["zone"]
+        b = self.columns[other]["zone"]
+        labels = ZONES + ("UNKNOWN",)
+
+        pair = (a.astype(np.int64) % 4) * 4 + (b.astype(np.int64) % 4)
+        counts = np.bincount(pair, minlength=16).reshape(4, 4)
+        matrix = {
+            labels[i]: {labels[j]: int(counts[i, j]) for j in range(4) if counts[i, j]}
+            for i in range(4)
+            if counts[i].any()
+        }
+
+        changed = np.flatnonzero(a != b)
+        per_gate = np.bincount(self.gate[changed], minlength=len(self.gate_ids))
+        events = [
+            {
+                "row": int(i),
+                "gate_id": self.gate_ids[int(self.gate[i])],
+                "timestamp": str(self.timestamp[i]),
+                "event_id": str(self.event_id[i]),
+                "from": labels[int(a[i])],
+                "to": labels[int(b[i])],
+                "E_from": float(self.columns[base]["E"][i]),
+                "E_to": float(self.columns[other]["E"][i]),
+            }
+            for i in changed[: max(0, int(max_events))]
+        ]
+
+        return {
+            "base": base,
+            "other": other,
+            "rows": len(self),
+            "changed": int(changed.size),
+            "matrix": matrix,
+            "changed_by_gate": {
+                gid: int(per_gate[g]) for g, gid in enumerate(self.gate_ids) if per_gate[g]
+            },
+            "events": events,
+        }
+
+    def summary(self, *, base: str = LOGGED, max_events: int = 20) -> Dict[str, Any]:
+        return {
+            "schema": HAZARD_REPLAY_SCHEMA_V0,
+            "rows": len(self),
+            "gates": len(self.gate_ids),
+            "rows_without_snapshot": int(np.sum(~self.has_snapshot)),
+            "configs": self.configs,
+            "zone_counts": {name: self.zone_counts(name) for name in self.columns},
+            "transitions": {
+                name: self.zone_transitions(base, name, max_events=max_events)
+                for name in self.columns
+                if name != base
+            },
+        }
+
+    def save_npz(self, path: Union[str, Path]) -> None:
+        """Write all columns to a compressed .npz ("<config>/<column>" keys)."""
+        arrays: Dict[str, np.ndarray] = {
+            "gate_ids": np.array(self.gate_ids, dtype=str),
+            "gate": self.gate,
+            "timestamp": self.timestamp,
+            "event_id": self.event_id,
+            "S": self.S,
+            "has_snapshot": self.has_snapshot,
+            "meta": np.array(
+                json.dumps(
+                    {
+                        "schema": HAZARD_REPLAY_SCHEMA_V0,
+                        "columns": list(self.columns),
+                        "configs": self.configs,
+                    },
+                    sort_keys=True,
+                )
+            ),
+        }
+        for name, cols in self.columns.items():
+            for col, values in cols.items():
+                arrays[f"{name}/{col}"] = values
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with p.open("wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load_npz(cls, path: Union[str, Path]) -> "ReplayResult":
+        with np.load(Path(path), allow_pickle=False) as z:
+            meta = json.loads(str(z["meta"]))
+            if meta.get("schema") != HAZARD_REPLAY_SCHEMA_V0:
+                raise ValueError(f"not a hazard replay file: {path}")
+            return cls(
+                gate_ids=[str(g) for g in z["gate_ids"]],
+                gate=z["gate"],
+                timestamp=z["timestamp"],
+                event_id=z["event_id"],
+                S=z["S"],
+                has_snapshot=z["has_snapshot"],
+                columns={
+                    name: {col: z[f"{name}/{col}"] for col in ("T", "D", "E", "zone")}
+                    for name in meta["columns"]
+                },
+                configs=meta.get("configs", {}),
+            )
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+def _config_meta(cfg: HazardConfig) -> Dict[str, Any]:
+    specs = cfg.feature_specs or []
+    return {
+        "alpha": float(cfg.alpha),
+        "beta": float(cfg.beta),
+        "warn_threshold": float(cfg.warn_threshold),
+        "crit_threshold": float(cfg.crit_threshold),
+        "min_history": int(cfg.min_history),
+        "features": [spec.key for spec in specs],
+        "scaled_features": sorted(k for k in (cfg.feature_scalers or {}) if any(s.key == k for s in specs)),
+    }
+
+
+def _t_key(cfg: HazardConfig) -> Hashable:
+    specs = tuple(cfg.feature_specs or ())
+    if not specs:
+        return ("legacy",)
+    scalers = tuple(sorted((cfg.feature_scalers or {}).items(), key=lambda kv: kv[0]))
+    return ("features", specs, scalers)
+
+
+def _window(cfg: HazardConfig) -> Optional[int]:
+    """Values per drift window (current T included); None = unbounded."""
+    m = int(cfg.min_history)
+    return m if m > 0 else None
+
+
+def _zone_codes(E: np.ndarray, cfg: HazardConfig) -> np.ndarray:
+    zone = np.where(E >= cfg.crit_threshold, 2, np.where(E >= cfg.warn_threshold, 1, 0))
+    return np.where(np.isnan(E), ZONE_UNKNOWN, zone).astype(np.int8)
+
+
+def _float_or_nan(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return math.nan
+    x = float(value)
+    return x if math.isfinite(x) else math.nan
+
+
+class _DriftCarry:
+    """
+    Windowed drift per gate across chunks: keeps the last window-1 T values
+    of every gate (all values when the window is unbounded).
+    """
+
+    def __init__(self, window: Optional[int]) -> None:
+        self.window = window
+        self.tails: Dict[int, np.ndarray] = {}
+
+    def drift(self, gates: np.ndarray, T: np.ndarray) -> np.ndarray:
+        n = gates.shape[0]
+        w = self.window
+        if n == 0:
+            return np.zeros(0)
+        if w is not None and w < 2:
+            return np.zeros(n)
+
+        pre = [(g, self.tails[g]) for g in np.unique(gates).tolist() if g in self.tails]
+        g_all = np.concatenate([np.full(len(v), g, dtype=gates.dtype) for g, v in pre] + [gates])
+        v_all = np.concatenate([v for _, v in pre] + [T])
+        n_pre = g_all.shape[0] - n
+
+        # Stable sort keeps each gate's carried tail before its chunk rows
+        # and the rows in log order.
+        order = np.argsort(g_all, kind="stable")
+        g_s = g_all[order]
+        v_s = v_all[order]
+        idx = np.arange(g_s.shape[0])
+
+        new_group = np.ones(g_s.shape[0], dtype=bool)
+        new_group[1:] = g_s[1:] != g_s[:-1]
+        group_start = np.maximum.accumulate(np.where(new_group, idx, 0))
+
+        d = np.zeros(g_s.shape[0])
+        d[1:] = np.abs(np.diff(v_s))
+        d[new_group] = 0.0
+
+        if w is None:
+            cs = np.cumsum(d)
+            start = group_start
+            total = cs - cs[start]
+        else:
+            start = np.maximum(group_start, idx - w + 1)
+            total = np.zeros(g_s.shape[0])
+            for lag in range(w - 1):
+                j = idx - lag
+                total += np.where(j > start, d[np.maximum(j, 0)], 0.0)
+        count = idx - start
+        D_s = np.where(count > 0, total / np.maximum(count, 1), 0.0)
+
+        is_row = order >= n_pre
+        D = np.empty(n)
+        D[order[is_row] - n_pre] = D_s[is_row]
+
+        # New tails: the last window-1 values of every gate seen so far.
+        group_end = np.empty_like(idx)
+        ends = np.flatnonzero(np.r_[g_s[1:] != g_s[:-1], True])
+        group_end[:] = np.repeat(ends, np.diff(np.r_[-1, ends]))
+        keep = np.ones(g_s.shape[0], dtype=bool) if w is None else (group_end - idx) < (w - 1)
+        kept_g = g_s[keep]
+        kept_v = v_s[keep]
+        bounds = np.flatnonzero(np.r_[True, kept_g[1:] != kept_g[:-1]])
+        for g, vals in zip(kept_g[bounds].tolist(), np.split(kept_v, bounds[1:])):
+            self.tails[g] = vals.copy()
+
+        return D
+
+
+def _legacy_T(currents: Sequence[Optional[Mapping[str, Any]]], references: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    return np.array(
+        [compute_T(c, r) if c is not None else math.nan for c, r in zip(currents, references)],
+        dtype=float,
+    )
+
+
+def _feature_T(
+    plan: CompiledFeaturePlan,
+    currents: Sequence[Optional[Mapping[str, Any]]],
+    references: Sequence[Mapping[str, Any]],
+) -> np.ndarray:
+    cur = plan.extract([c if c is not None else {} for c in currents])
+    ref = plan.extract(references)
+    weighted, _, _ = plan.weighted_deltas(cur, ref)
+    T = np.sqrt(np.sum(weighted * weighted, axis=1))
+    T[np.array([c is None for c in currents], dtype=bool)] = np.nan
+    return T
+
+
+def replay_hazard_log(
+    log_path: Union[str, Path],
+    configs: Mapping[str, HazardConfig],
+    *,
+    gates: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ReplayResult:
+    """
+    Recompute T/D/E/zone for every entry of a hazard log under each config.
+
+    configs maps a name (not "logged") to a candidate HazardConfig; gates
+    optionally restricts the replay to these gate_ids. One streaming pass in
+    chunks of chunk_size entries; configs sharing feature specs + scalers
+    share the T computation, and those also sharing min_history share D.
+    """
+    if LOGGED in configs:
+        raise ValueError(f"config name {LOGGED!r} is reserved for the logged values")
+    names = list(configs)
+    gate_filter = {str(g) for g in gates} if gates is not None else None
+    chunk_size = max(1, int(chunk_size))
+
+    plans: Dict[Hashable, Optional[CompiledFeaturePlan]] = {}
+    for cfg in configs.values():
+        key = _t_key(cfg)
+        if key not in plans:
+            plans[key] = (
+                compile_feature_plan(cfg.feature_specs, cfg.feature_scalers) if cfg.feature_specs else None
+            )
+    carries: Dict[Tuple[Hashable, Optional[int]], _DriftCarry] = {}
+    for cfg in configs.values():
+        carries.setdefault((_t_key(cfg), _window(cfg)), _DriftCarry(_window(cfg)))
+
+    gate_codes: Dict[str, int] = {}
+    row_cols: Dict[str, List[np.ndarray]] = {"gate": [], "timestamp": [], "event_id": [], "S": [], "has_snapshot": []}
+    out_cols: Dict[str, Dict[str, List[np.ndarray]]] = {
+        name: {"T": [], "D": [], "E": [], "zone": []} for name in [LOGGED] + names
+    }
+
+    def process(chunk: List[Dict[str, Any]]) -> None:
+        hazards = [ev.get("hazard") if isinstance(ev.get("hazard"), Mapping) else {} for ev in chunk]
+        currents = [ev.get("snapshot_current") if isinstance(ev.get("snapshot_current"), Mapping) else None for ev in chunk]
+        references = [
+            ev.get("snapshot_reference") if isinstance(ev.get("snapshot_reference"), Mapping) else {}
+            for ev in chunk
+        ]
+        g = np.array([gate_codes.setdefault(str(ev.get("gate_id", "")), len(gate_codes)) for ev in chunk], dtype=np.int32)
+        S = np.array([_float_or_nan(h.get("S")) for h in hazards], dtype=float)
+        S = np.where(np.isnan(S), 0.5, S)
+        has_snapshot = np.array([c is not None for c in currents], dtype=bool)
+
+        logged = {col: np.array([_float_or_nan(h.get(col)) for h in hazards], dtype=float) for col in ("T", "D", "E")}
+        logged["zone"] = np.array([_ZONE_CODES.get(str(h.get("zone", "")), ZONE_UNKNOWN) for h in hazards], dtype=np.int8)
+
+        row_cols["gate"].append(g)
+        row_cols["timestamp"].append(np.array([str(ev.get("timestamp", "")) for ev in chunk], dtype=str))
+        row_cols["event_id"].append(np.array([str(ev.get("event_id", "")) for ev in chunk], dtype=str))
+        row_cols["S"].append(S)
+        row_cols["has_snapshot"].append(has_snapshot)
+        for col, values in logged.items():
+            out_cols[LOGGED][col].append(values)
+
+        T_by_key: Dict[Hashable, np.ndarray] = {}
+        for key, plan in plans.items():
+            T = _legacy_T(currents, references) if plan is None else _feature_T(plan, currents, references)
+            T_by_key[key] = np.where(has_snapshot, T, logged["T"])
+
+        D_by_key: Dict[Tuple[Hashable, Optional[int]], np.ndarray] = {
+            ck: carry.drift(g, T_by_key[ck[0]]) for ck, carry in carries.items()
+        }
+
+        for name in names:
+            cfg = configs[name]
+            tk = _t_key(cfg)
+            T = T_by_key[tk]
+            D = D_by_key[(tk, _window(cfg))]
+            E = cfg.alpha * D + cfg.beta * (1.0 - S)
+            cols = out_cols[name]
+            cols["T"].append(T)
+            cols["D"].append(D)
+            cols["E"].append(E)
+            cols["zone"].append(_zone_codes(E, cfg))
+
+    chunk: List[Dict[str, Any]] = []
+    for ev in iter_entries(log_path):
+        if gate_filter is not None and str(ev.get("gate_id", "")) not in gate_filter:
+            continue
+        chunk.append(ev)
+        if len(chunk) >= chunk_size:
+            process(chunk)
+            chunk = []
+    if chunk:
+        process(chunk)
+
+    def cat(parts: List[np.ndarray], dtype: Any) -> np.ndarray:
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=dtype)
+
+    return ReplayResult(
+        gate_ids=list(gate_codes),
+        gate=cat(row_cols["gate"], np.int32),
+        timestamp=cat(row_cols["timestamp"], str),
+        event_id=cat(row_cols["event_id"], str),
+        S=cat(row_cols["S"], float),
+        has_snapshot=cat(row_cols["has_snapshot"], bool),
+        columns={
+            name: {
+                col: cat(parts, np.int8 if col == "zone" else float)
+                for col, parts in cols.items()
+            }
+            for name, cols in out_cols.items()
+        },
+        configs={name: _config_meta(cfg) for name, cfg in configs.items()},
+    )
@@ -14,6 +14,12 @@ Purpose (Grail-topology oriented):
 
 This is an artifact builder, not a gate.
 Fail-open: parsing errors or missing files should not break CI tooling.
+
+Incremental builds (state_path=...):
+  The per-gate windows (last max_per_gate rows) are checkpointed together
+  with a log cursor, so the next build only folds in entries appended since.
+  The artifact is identical to a full build; full_rebuild=True (or a
+  checkpoint that does not match the log/params) starts from scratch.
 """
 
 from __future__ import annotations
@@ -21,14 +27,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 import json
 import math
 import statistics
 from collections import defaultdict, deque
 
+from .epf_hazard_log_store import LogTail, iter_entries, read_checkpoint, write_checkpoint
+
 
 SCHEMA_STABILITY_MAP_V0 = "epf_hazard_stability_map_v0"
+SCHEMA_STABILITY_MAP_STATE_V0 = "epf_hazard_stability_map_state_v0"
 
 # This module lives under PULSE_safe_pack_v0/epf/
 PACK_ROOT = Path(__file__).resolve().parents[1]
@@ -77,27 +86,6 @@ def _coerce_zone(z: Any) -> str:
     return "UNKNOWN"
 
 
-def _load_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    out: List[Dict[str, Any]] = []
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                s = line.strip()
-                if not s:
-                    continue
-                try:
-                    obj = json.loads(s)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(obj, dict):
-                    out.append(obj)
-    except OSError:
-        return []
-    return out
-
-
 def _regime_from_last(last_zone: str, last_D: Optional[float], last_S: Optional[float]) -> Tuple[str, str]:
     """
     Regime classifier focused on topology, not alerts.
@@ -193,38 +181,69 @@ def _summarize_tail(
     }
 
 
+def _series_row(ev: Mapping[str, Any]) -> Tuple[str, Any, Any, Any, Any, str]:
+    """(timestamp, E, T, S, D, zone) row of one log entry."""
+    hazard = ev.get("hazard", {}) or {}
+
+    ts = ev.get("timestamp")
+    ts_s = str(ts) if isinstance(ts, (str, int, float)) else ""
+
+    zone = hazard.get("zone")
+    if zone is None:
+        zone = hazard.get("hazard_zone")  # defensive (legacy)
+
+    E = hazard.get("E")
+    T = hazard.get("T")
+    S = hazard.get("S")
+    D = hazard.get("D")
+
+    return (ts_s, E, T, S, D, str(zone) if zone is not None else "UNKNOWN")
+
+
 def build_stability_map_from_log(
     log_path: Path,
     *,
     tail: int = 20,
     max_per_gate: int = 1000,
+    state_path: Optional[Union[str, Path]] = None,
+    full_rebuild: bool = False,
 ) -> Dict[str, Any]:
     """
     Build a stability map artifact from a hazard JSONL log.
 
     - tail controls how many recent events per gate to summarize
     - max_per_gate bounds memory if logs are large
+    - state_path enables incremental builds (checkpoint of the per-gate
+      windows + log cursor); full_rebuild ignores an existing checkpoint
     """
     # Keep bounded history per gate_id
     series: Dict[str, deque] = defaultdict(lambda: deque(maxlen=int(max_per_gate)))
-
-    for ev in _load_jsonl(log_path):
-        gate_id = str(ev.get("gate_id", "UNKNOWN"))
-        hazard = ev.get("hazard", {}) or {}
-
-        ts = ev.get("timestamp")
-        ts_s = str(ts) if isinstance(ts, (str, int, float)) else ""
-
-        zone = hazard.get("zone")
-        if zone is None:
-            zone = hazard.get("hazard_zone")  # defensive (legacy)
-
-        E = hazard.get("E")
-        T = hazard.get("T")
-        S = hazard.get("S")
-        D = hazard.get("D")
-
-        series[gate_id].append((ts_s, E, T, S, D, str(zone) if zone is not None else "UNKNOWN"))
+    params = {"max_per_gate": int(max_per_gate), "log_path": str(Path(log_path).resolve())}
+
+    if state_path is None:
+        entries = iter_entries(log_path)
+    else:
+        checkpoint = None
+        if not full_rebuild:
+            checkpoint = read_checkpoint(state_path, schema=SCHEMA_STABILITY_MAP_STATE_V0, params=params)
+        entries = LogTail(log_path, checkpoint["cursor"] if checkpoint else None)
+        if checkpoint is not None and not entries.reset:
+            for gate_id, rows in (checkpoint.get("series") or {}).items():
+                series[str(gate_id)].extend(tuple(row) for row in rows)
+
+    for ev in entries:
+        series[str(ev.get("gate_id", "UNKNOWN"))].append(_series_row(ev))
+
+    if state_path is not None:
+        write_checkpoint(
+            state_path,
+            {
+                "schema": SCHEMA_STABILITY_MAP_STATE_V0,
+                "params": params,
+                "cursor": entries.cursor,
+                "series": {gate_id: [list(row) for row in rows] for gate_id, rows in series.items()},
+            },
+        )
 
     gates_out: Dict[str, Any] = {}
     for gate_id in sorted(series.keys()):
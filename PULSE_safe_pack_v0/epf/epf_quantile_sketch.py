@@ -0,0 +1,257 @@
+"""
+epf_quantile_sketch.py
+
+Mergeable streaming quantile sketch for EPF hazard calibration.
+
+Problem:
+  epf_hazard_calibrate used to keep every E value per gate and every
+  snapshot feature value in memory and sort them for percentiles,
+  medians/MAD and IQR. Memory grew with the length of the hazard history.
+
+QuantileSketch is a deterministic KLL-style compactor stack with a fixed
+capacity k per level:
+  - level h holds values of weight 2**h; when a level reaches k values it is
+    sorted and every other value (alternating offset per level) is promoted
+    to level h+1, so memory is O(k * log2(n / k)) per sketch;
+  - sketches with the same k merge by concatenating levels and compacting,
+    so per-segment / per-run sketches can be combined;
+  - every compaction at level h moves the rank of any query by at most
+    2**h; the sum is tracked, so rank_error_bound() is a hard bound on
+    |rank(sketch quantile) - rank(exact quantile)| / n.
+
+Until a sketch has seen k values nothing is compacted: quantile() returns
+exactly what the sorted-list percentile helper returns (same linear
+interpolation) and median() / mad() return exactly what statistics.median
+returns (midpoint (a + b) / 2), so small logs calibrate identically in both
+modes.
+No randomness is used: the same input order gives the same sketch.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+import math
+
+SKETCH_SCHEMA_V0 = "epf_quantile_sketch_v0"
+
+DEFAULT_SKETCH_K = 1024
+
+
+def _cumulative(pairs: List[Tuple[float, int]]) -> Tuple[List[int], int]:
+    cum: List[int] = []
+    total = 0
+    for _v, w in pairs:
+        total += w
+        cum.append(total)
+    return cum, total
+
+
+def _value_at(pairs: List[Tuple[float, int]], cum: List[int], pos: int) -> float:
+    """Value at 0-based position `pos` of the expanded (weighted) list."""
+    return pairs[min(bisect_right(cum, pos), len(pairs) - 1)][0]
+
+
+def _interpolated(pairs: List[Tuple[float, int]], p: float) -> float:
+    """
+    Percentile over (value, weight) pairs sorted by value, with the same
+    linear interpolation as the exact helpers applied to the expanded list.
+    """
+    if p <= 0.0:
+        return pairs[0][0]
+    if p >= 1.0:
+        return pairs[-1][0]
+
+    cum, total = _cumulative(pairs)
+    k = (total - 1) * p
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return _value_at(pairs, cum, f)
+    lo = _value_at(pairs, cum, f)
+    hi = _value_at(pairs, cum, c)
+    return lo + (hi - lo) * (k - f)
+
+
+def _midpoint(pairs: List[Tuple[float, int]]) -> float:
+    """
+    Median over (value, weight) pairs sorted by value, computed like
+    statistics.median on the expanded list: the middle value, or (a + b) / 2
+    of the two middle values. Kept separate from _interpolated because
+    a + (b - a) * 0.5 can differ from (a + b) / 2 in the last bit.
+    """
+    cum, total = _cumulative(pairs)
+    half = total // 2
+    if total % 2:
+        return _value_at(pairs, cum, half)
+    return (_value_at(pairs, cum, half - 1) + _value_at(pairs, cum, half)) / 2
+
+
+class QuantileSketch:
+    """
+    Streaming, mergeable quantile sketch (see module docstring).
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K) -> None:
+        if int(k) < 2:
+            raise ValueError(f"QuantileSketch requires k >= 2, got {k}")
+        self.k = int(k)
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.total = 0.0
+        self._rank_error = 0
+        self._levels: List[List[float]] = [[]]
+        self._offsets: List[int] = [0]
+
+    # -- updates -------------------------------------------------------------
+
+    def add(self, x: float) -> None:
+        x = float(x)
+        if not math.isfinite(x):
+            return
+        self.n += 1
+        self.total += x
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        self._levels[0].append(x)
+        if len(self._levels[0]) >= self.k:
+            self._compress()
+
+    def update(self, values: Iterable[float]) -> "QuantileSketch":
+        for x in values:
+            self.add(x)
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold another sketch (same k) into this one, in place."""
+        if other.k != self.k:
+            raise ValueError(f"cannot merge sketches with different k ({self.k} != {other.k})")
+        if other.n == 0:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+            self._offsets.append(0)
+        for h, items in enumerate(other._levels):
+            self._levels[h].extend(items)
+        self.n += other.n
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._rank_error += other._rank_error
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self._levels):
+            items = self._levels[h]
+            if len(items) >= self.k:
+                items.sort()
+                keep: List[float] = []
+                if len(items) % 2:
+                    keep = [items.pop()]
+                if h + 1 == len(self._levels):
+                    self._levels.append([])
+                    self._offsets.append(0)
+                off = self._offsets[h]
+                self._levels[h + 1].extend(items[off::2])
+                self._offsets[h] = 1 - off
+                self._levels[h] = keep
+                self._rank_error += 1 << h
+            h += 1
+
+    # -- queries -------------------------------------------------------------
+
+    def _pairs(self, transform=None) -> List[Tuple[float, int]]:
+        pairs = []
+        for h, items in enumerate(self._levels):
+            w = 1 << h
+            for v in items:
+                pairs.append((transform(v) if transform else v, w))
+        pairs.sort(key=lambda t: t[0])
+        return pairs
+
+    def quantile(self, p: float) -> float:
+        if self.n == 0:
+            raise ValueError("cannot compute quantile of empty sketch")
+        if p <= 0.0:
+            return self.min
+        if p >= 1.0:
+            return self.max
+        return _interpolated(self._pairs(), float(p))
+
+    def median(self) -> float:
+        if self.n == 0:
+            raise ValueError("cannot compute median of empty sketch")
+        return _midpoint(self._pairs())
+
+    def mean(self) -> float:
+        if self.n == 0:
+            raise ValueError("cannot compute mean of empty sketch")
+        return self.total / self.n
+
+    def iqr(self) -> float:
+        if self.n == 0:
+            return 0.0
+        return max(0.0, self.quantile(0.75) - self.quantile(0.25))
+
+    def mad(self, center: Optional[float] = None) -> float:
+        """
+        Median absolute deviation around `center` (default: the sketch median),
+        computed over the retained weighted values.
+        """
+        if self.n == 0:
+            raise ValueError("cannot compute MAD of empty sketch")
+        med = self.median() if center is None else float(center)
+        return _midpoint(self._pairs(lambda v: abs(v - med)))
+
+    def rank_error_bound(self) -> float:
+        """Worst-case normalized rank error of quantile() (0.0 while exact)."""
+        if self.n == 0:
+            return 0.0
+        return self._rank_error / float(self.n)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def retained(self) -> int:
+        return sum(len(items) for items in self._levels)
+
+    # -- serialization -------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schema": SKETCH_SCHEMA_V0,
+            "k": self.k,
+            "n": self.n,
+            "min": self.min if self.n else None,
+            "max": self.max if self.n else None,
+            "sum": self.total,
+            "rank_error": self._rank_error,
+            "levels": [list(items) for items in self._levels],
+            "offsets": list(self._offsets),
+        }
+
+    @staticmethod
+    def from_dict(d: Mapping[str, Any]) -> "QuantileSketch":
+        if d.get("schema") != SKETCH_SCHEMA_V0:
+            raise ValueError(f"unsupported sketch schema: {d.get('schema')!r}")
+        sk = QuantileSketch(int(d["k"]))
+        levels = [[float(v) for v in items] for items in d.get("levels") or [[]]]
+        offsets = [int(o) & 1 for o in d.get("offsets") or []]
+        offsets += [0] * (len(levels) - len(offsets))
+        weight = sum(len(items) << h for h, items in enumerate(levels))
+        if weight != int(d["n"]):
+            raise ValueError("sketch levels do not add up to n")
+        sk._levels = levels or [[]]
+        sk._offsets = offsets[: len(sk._levels)] or [0]
+        sk.n = int(d["n"])
+        sk.total = float(d.get("sum", 0.0))
+        sk._rank_error = int(d.get("rank_error", 0))
+        if sk.n:
+            sk.min = float(d["min"])
+            sk.max = float(d["max"])
+        return sk
@@ -15,6 +15,11 @@ Design stance (Grail-hű):
   - This is a MAP (regimes), not an alert system.
   - Fail-open: missing/older logs still produce a valid artifact.
 
+Incremental builds (state_path=...):
+  The window of derived points is checkpointed with a log cursor; the next
+  build only derives points for entries appended since. The payload equals a
+  full build; full_rebuild=True ignores the checkpoint.
+
 Schema:
   {
     "schema": "epf_stability_map_v0",
@@ -35,15 +40,26 @@ Schema:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
 import json
 import logging
 import math
 import statistics
 
+from .epf_hazard_log_store import (
+    HazardLogStore,
+    LogTail,
+    hazard_log_exists,
+    iter_entries,
+    read_checkpoint,
+    write_checkpoint,
+)
+
 LOG = logging.getLogger(__name__)
 
 STABILITY_MAP_SCHEMA_V0 = "epf_stability_map_v0"
+STABILITY_MAP_STATE_SCHEMA_V0 = "epf_stability_map_state_v0"
 DEFAULT_STABILITY_MAP_FILENAME = "epf_stability_map_v0.json"
 DEFAULT_MAX_POINTS = 60
 
@@ -92,33 +108,6 @@ def _coerce_finite_float(x: Any) -> Optional[float]:
     return None
 
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """
-    Read a JSONL file defensively. Invalid lines are skipped.
-    """
-    if not path.exists():
-        return []
-
-    out: List[Dict[str, Any]] = []
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                s = line.strip()
-                if not s:
-                    continue
-                try:
-                    obj = json.loads(s)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(obj, dict):
-                    out.append(obj)
-    except OSError as exc:  # pragma: no cover
-        LOG.warning("Failed to read stability map source log %s: %s", path, exc)
-        return []
-
-    return out
-
-
 def _extract_gate_leaves_from_snapshot(snapshot_current: Any) -> Dict[str, float]:
     """
     Extract gate leaves from snapshot_current.
@@ -193,102 +182,153 @@ def _safe_str(x: Any) -> Optional[str]:
     return s if s else None
 
 
+def _point_from_event(ev: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Map point for one log entry (None if it carries no hazard mapping).
+    """
+    hazard = ev.get("hazard", {}) or {}
+    if not isinstance(hazard, Mapping):
+        return None
+
+    ts = _safe_str(ev.get("timestamp")) or ""
+
+    E = _coerce_finite_float(hazard.get("E"))
+    T = _coerce_finite_float(hazard.get("T"))
+    S = _coerce_finite_float(hazard.get("S"))
+    D = _coerce_finite_float(hazard.get("D"))
+
+    zone = str(hazard.get("zone", "UNKNOWN")).upper().strip() or "UNKNOWN"
+
+    baseline_ok, pass_n, fail_n = _baseline_ok_from_snapshot(ev.get("snapshot_current"))
+    topo = compute_topology_region(baseline_ok, zone)
+
+    fm_active = hazard.get("feature_mode_active")
+    if not isinstance(fm_active, bool):
+        # Fail-open for older logs: infer from feature_keys
+        keys_raw = hazard.get("feature_keys")
+        fm_active = bool(keys_raw) if isinstance(keys_raw, list) else False
+
+    fm_source = hazard.get("feature_mode_source")
+    if not isinstance(fm_source, str) or not fm_source.strip():
+        fm_source = "unknown" if fm_active else "none"
+
+    feature_keys = hazard.get("feature_keys")
+    feature_count = 0
+    if isinstance(feature_keys, list):
+        feature_count = len([1 for k in feature_keys if str(k).strip()])
+
+    # Optional meta provenance
+    meta = ev.get("meta", {}) or {}
+    git_sha = _safe_str(meta.get("git_sha")) if isinstance(meta, Mapping) else None
+    run_key = _safe_str(meta.get("run_key")) if isinstance(meta, Mapping) else None
+
+    pt: Dict[str, Any] = {
+        "timestamp": ts,
+        "zone": zone,
+        "baseline_ok": baseline_ok,
+        "baseline_pass": int(pass_n),
+        "baseline_fail": int(fail_n),
+        "topology_region": topo,
+        "feature_mode_active": bool(fm_active),
+        "feature_mode_source": str(fm_source),
+        "feature_count": int(feature_count),
+    }
+    if E is not None:
+        pt["E"] = float(E)
+    if T is not None:
+        pt["T"] = float(T)
+    if S is not None:
+        pt["S"] = float(S)
+    if D is not None:
+        pt["D"] = float(D)
+
+    if git_sha:
+        pt["git_sha"] = git_sha
+    if run_key:
+        pt["run_key"] = run_key
+
+    return pt
+
+
+def _points_window(
+    lp: Path,
+    gate_id: str,
+    max_points: int,
+    state_path: Union[str, Path],
+    full_rebuild: bool,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Last max_points (all if <= 0) points of the series, folded incrementally
+    from the checkpoint at state_path. None marks entries without hazard.
+    """
+    params = {"gate_id": str(gate_id), "max_points": int(max_points), "log_path": str(lp.resolve())}
+    checkpoint = None
+    if not full_rebuild:
+        checkpoint = read_checkpoint(state_path, schema=STABILITY_MAP_STATE_SCHEMA_V0, params=params)
+
+    window: Deque[Optional[Dict[str, Any]]] = deque(maxlen=int(max_points) if max_points > 0 else None)
+    entries = LogTail(lp, checkpoint["cursor"] if checkpoint else None)
+    if checkpoint is not None and not entries.reset:
+        window.extend(checkpoint.get("window") or [])
+
+    for ev in entries:
+        if str(ev.get("gate_id", "")) == str(gate_id):
+            window.append(_point_from_event(ev))
+
+    write_checkpoint(
+        state_path,
+        {
+            "schema": STABILITY_MAP_STATE_SCHEMA_V0,
+            "params": params,
+            "cursor": entries.cursor,
+            "window": list(window),
+        },
+    )
+    return list(window)
+
+
 def build_stability_map_from_log(
     *,
     log_path: Union[str, Path],
     gate_id: str,
     created_utc: str,
     max_points: int = DEFAULT_MAX_POINTS,
+    state_path: Optional[Union[str, Path]] = None,
+    full_rebuild: bool = False,
 ) -> Dict[str, Any]:
     """
     Build Stability Map payload from hazard log for a single gate_id.
+
+    state_path enables incremental builds; full_rebuild ignores an existing
+    checkpoint.
     """
     lp = Path(log_path)
-    entries = _read_jsonl(lp)
-
-    # Filter to series (gate_id)
-    series: List[Dict[str, Any]] = []
-    for ev in entries:
-        if str(ev.get("gate_id", "")) == str(gate_id):
-            series.append(ev)
 
-    if max_points > 0:
-        series = series[-int(max_points) :]
+    window: List[Optional[Dict[str, Any]]]
+    if state_path is not None:
+        window = _points_window(lp, gate_id, max_points, state_path, full_rebuild)
+    else:
+        # Series (gate_id) tail via the per-gate offset index and the segment
+        # manifest: cost depends on max_points, not on the length of the log.
+        series: List[Dict[str, Any]]
+        if not hazard_log_exists(lp):
+            series = []
+        elif max_points > 0:
+            series = HazardLogStore(lp).tail(str(gate_id), int(max_points))
+        else:
+            series = [ev for ev in iter_entries(lp) if str(ev.get("gate_id", "")) == str(gate_id)]
+        window = [_point_from_event(ev) for ev in series]
 
-    points: List[Dict[str, Any]] = []
+    points: List[Dict[str, Any]] = [pt for pt in window if pt is not None]
     zone_counts: Dict[str, int] = {}
     topo_counts: Dict[str, int] = {}
 
-    Es: List[float] = []
-    Ts: List[float] = []
-
-    for ev in series:
-        hazard = ev.get("hazard", {}) or {}
-        if not isinstance(hazard, Mapping):
-            continue
+    Es: List[float] = [float(pt["E"]) for pt in points if "E" in pt]
+    Ts: List[float] = [float(pt["T"]) for pt in points if "T" in pt]
 
-        ts = _safe_str(ev.get("timestamp")) or ""
-
-        E = _coerce_finite_float(hazard.get("E"))
-        T = _coerce_finite_float(hazard.get("T"))
-        S = _coerce_finite_float(hazard.get("S"))
-        D = _coerce_finite_float(hazard.get("D"))
-
-        zone = str(hazard.get("zone", "UNKNOWN")).upper().strip() or "UNKNOWN"
-
-        baseline_ok, pass_n, fail_n = _baseline_ok_from_snapshot(ev.get("snapshot_current"))
-        topo = compute_topology_region(baseline_ok, zone)
-
-        fm_active = hazard.get("feature_mode_active")
-        if not isinstance(fm_active, bool):
-            # Fail-open for older logs: infer from feature_keys
-            keys_raw = hazard.get("feature_keys")
-            fm_active = bool(keys_raw) if isinstance(keys_raw, list) else False
-
-        fm_source = hazard.get("feature_mode_source")
-        if not isinstance(fm_source, str) or not fm_source.strip():
-            fm_source = "unknown" if fm_active else "none"
-
-        feature_keys = hazard.get("feature_keys")
-        feature_count = 0
-        if isinstance(feature_keys, list):
-            feature_count = len([1 for k in feature_keys if str(k).strip()])
-
-        # Optional meta provenance
-        meta = ev.get("meta", {}) or {}
-        git_sha = _safe_str(meta.get("git_sha")) if isinstance(meta, Mapping) else None
-        run_key = _safe_str(meta.get("run_key")) if isinstance(meta, Mapping) else None
-
-        pt: Dict[str, Any] = {
-            "timestamp": ts,
-            "zone": zone,
-            "baseline_ok": baseline_ok,
-            "baseline_pass": int(pass_n),
-            "baseline_fail": int(fail_n),
-            "topology_region": topo,
-            "feature_mode_active": bool(fm_active),
-            "feature_mode_source": str(fm_source),
-            "feature_count": int(feature_count),
-        }
-        if E is not None:
-            pt["E"] = float(E)
-            Es.append(float(E))
-        if T is not None:
-            pt["T"] = float(T)
-            Ts.append(float(T))
-        if S is not None:
-            pt["S"] = float(S)
-        if D is not None:
-            pt["D"] = float(D)
-
-        if git_sha:
-            pt["git_sha"] = git_sha
-        if run_key:
-            pt["run_key"] = run_key
-
-        points.append(pt)
-
-        zone_counts[zone] = zone_counts.get(zone, 0) + 1
+    for pt in points:
+        zone_counts[pt["zone"]] = zone_counts.get(pt["zone"], 0) + 1
+        topo = pt["topology_region"]
         topo_counts[topo] = topo_counts.get(topo, 0) + 1
 
     stats: Dict[str, Any] = {
@@ -338,6 +378,8 @@ def write_stability_map(
     gate_id: str,
     created_utc: str,
     max_points: int = DEFAULT_MAX_POINTS,
+    state_path: Optional[Union[str, Path]] = None,
+    full_rebuild: bool = False,
 ) -> Dict[str, Any]:
     """
     Build and write Stability Map JSON artifact.
@@ -349,6 +391,8 @@ def write_stability_map(
         gate_id=gate_id,
         created_utc=created_utc,
         max_points=max_points,
+        state_path=state_path,
+        full_rebuild=full_rebuild,
     )
 
     op = Path(out_path)
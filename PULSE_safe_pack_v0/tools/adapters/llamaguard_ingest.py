@@ -39,9 +39,19 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-import yaml
 from jsonschema import Draft202012Validator, FormatChecker
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.strict_load_v0 import (  # noqa: E402
+    StrictLoadError,
+    load_json_file,
+    load_yaml_file,
+    loads_json,
+)
+
 
 TOOL_NAME = "llamaguard"
 ADAPTER_NAME = "llamaguard_ingest"
@@ -90,114 +100,6 @@ class ProducerError(ValueError):
     """Fail-closed producer error."""
 
 
-class UniqueYamlLoader(yaml.SafeLoader):
-    """YAML loader that rejects duplicate mapping keys."""
-
-
-def _yaml_mapping(
-    loader: UniqueYamlLoader,
-    node: Any,
-    deep: bool = False,
-) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-
-    for key_node, value_node in node.value:
-        key = loader.construct_object(
-            key_node,
-            deep=deep,
-        )
-
-        if key in result:
-            raise ProducerError(
-                f"duplicate YAML key {key!r}"
-            )
-
-        result[key] = loader.construct_object(
-            value_node,
-            deep=deep,
-        )
-
-    return result
-
-
-UniqueYamlLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-    _yaml_mapping,
-)
-
-
-def _json_object(
-    pairs: list[tuple[str, Any]],
-) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-
-    for key, value in pairs:
-        if key in result:
-            raise ProducerError(
-                f"duplicate JSON key {key!r}"
-            )
-
-        result[key] = value
-
-    return result
-
-
-def _reject_nonfinite(value: str) -> None:
-    raise ProducerError(
-        f"non-finite JSON constant {value!r}"
-    )
-
-
-def _require_finite_json_tree(
-    value: Any,
-    label: str,
-) -> None:
-    """Reject every non-finite number in a parsed JSON tree."""
-
-    if (
-        value is None
-        or isinstance(
-            value,
-            (
-                str,
-                bool,
-                int,
-            ),
-        )
-    ):
-        return
-
-    if isinstance(value, float):
-        if not math.isfinite(value):
-            raise ProducerError(
-                f"{label} contains a non-finite number"
-            )
-
-        return
-
-    if isinstance(value, list):
-        for index, item in enumerate(value):
-            _require_finite_json_tree(
-                item,
-                f"{label}[{index}]",
-            )
-
-        return
-
-    if isinstance(value, dict):
-        for key, item in value.items():
-            _require_finite_json_tree(
-                item,
-                f"{label}.{key}",
-            )
-
-        return
-
-    raise ProducerError(
-        f"{label} contains an unsupported JSON value"
-    )
-
-
 def _require_text(
     value: Any,
     label: str,
@@ -325,14 +227,10 @@ def _load_json_object(
     _require_regular_file(path, label)
 
     try:
-        payload = json.loads(
-            path.read_text(encoding="utf-8"),
-            object_pairs_hook=_json_object,
-            parse_constant=_reject_nonfinite,
-        )
+        payload = load_json_file(path)
 
-    except ProducerError:
-        raise
+    except StrictLoadError as exc:
+        raise ProducerError(str(exc)) from exc
 
     except Exception as exc:
         raise ProducerError(
@@ -344,11 +242,6 @@ def _load_json_object(
             f"{label} must be a JSON object"
         )
 
-    _require_finite_json_tree(
-        payload,
-        label,
-    )
-
     return payload
 
 
@@ -359,13 +252,10 @@ def _load_yaml_mapping(
     _require_regular_file(path, label)
 
     try:
-        payload = yaml.load(
-            path.read_text(encoding="utf-8"),
-            Loader=UniqueYamlLoader,
-        )
+        payload = load_yaml_file(path)
 
-    except ProducerError:
-        raise
+    except StrictLoadError as exc:
+        raise ProducerError(str(exc)) from exc
 
     except Exception as exc:
         raise ProducerError(
@@ -590,13 +480,9 @@ def _read_llamaguard_jsonl(
                 continue
 
             try:
-                record = json.loads(
-                    text,
-                    object_pairs_hook=_json_object,
-                    parse_constant=_reject_nonfinite,
-                )
+                record = loads_json(text)
 
-            except ProducerError as exc:
+            except StrictLoadError as exc:
                 raise ProducerError(
                     f"LlamaGuard raw evidence line "
                     f"{line_number}: {exc}"
@@ -615,14 +501,6 @@ def _read_llamaguard_jsonl(
                     f"{line_number} must be an object"
                 )
 
-            _require_finite_json_tree(
-                record,
-                (
-                    "LlamaGuard raw evidence line "
-                    f"{line_number}"
-                ),
-            )
-
             if not isinstance(
                 record.get("input"),
                 str,
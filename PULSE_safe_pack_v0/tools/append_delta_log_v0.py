@@ -28,8 +28,16 @@ Each line in delta_log_v0.jsonl is a JSON object with:
 import argparse
 import json
 import os
+import sys
+from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.jsonl_append_v0 import append_jsonl_records  # noqa: E402
+
 Summary = Dict[str, Any]
 DeltaRow = Dict[str, Any]
 
@@ -171,6 +179,11 @@ def _parse_args() -> argparse.Namespace:
         default=os.environ.get("GITHUB_RUN_ID"),
         help="Optional CI/pipeline run identifier to attach as metadata.",
     )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="fsync delta_log_v0.jsonl after appending.",
+    )
     return parser.parse_args()
 
 
@@ -188,10 +201,14 @@ def main() -> None:
     out_dir = os.path.dirname(args.out_path) or "."
     os.makedirs(out_dir, exist_ok=True)
 
-    # append as one line of JSON
-    with open(args.out_path, "a", encoding="utf-8") as f:
-        json.dump(row, f, ensure_ascii=False)
-        f.write("\n")
+    # append as one line of JSON (locked, so concurrent CI shards are safe)
+    append_jsonl_records(
+        args.out_path,
+        [row],
+        ensure_ascii=False,
+        sort_keys=False,
+        fsync=args.fsync,
+    )
 
     print(f"[delta_log_v0] appended run {row.get('run_id')!r} to {args.out_path!r}")
 
@@ -20,7 +20,6 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
 import json
 import os
 import re
@@ -30,6 +29,15 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.file_digest_v0 import (  # noqa: E402
+    sha256_file,
+    sha256_many,
+)
+
 
 SCHEMA_VERSION = "release_grade_reference_package_v0"
 METADATA_SCHEMA_VERSION = "release_grade_reference_package_run_metadata_v0"
@@ -224,13 +232,7 @@ def _require_regular_file(path: Path, label: str) -> None:
 
 def _sha256(path: Path) -> str:
     _require_regular_file(path, f"SHA-256 input {path}")
-    digest = hashlib.sha256()
-
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(65536), b""):
-            digest.update(chunk)
-
-    return digest.hexdigest()
+    return sha256_file(path)
 
 
 def _copy_file(source: Path, destination: Path, label: str) -> None:
@@ -463,18 +465,21 @@ def _write_run_metadata(
 def _write_digest_inventory(path: Path, package_root: Path) -> None:
     files = []
     inventory_rel = path.relative_to(package_root).as_posix()
+    package_files = [
+        file_path
+        for file_path in _iter_regular_files(package_root)
+        if file_path.relative_to(package_root).as_posix() != inventory_rel
+    ]
+    digests = sha256_many(package_files)
 
-    for file_path in _iter_regular_files(package_root):
+    for file_path in package_files:
         relative = file_path.relative_to(package_root).as_posix()
-
-        if relative == inventory_rel:
-            continue
-
         stat = file_path.stat()
         files.append(
             {
                 "path": relative,
-                "sha256": _sha256(file_path),
+                # Files that failed in the batch re-raise through _sha256.
+                "sha256": digests.get(file_path) or _sha256(file_path),
                 "size_bytes": stat.st_size,
             }
         )
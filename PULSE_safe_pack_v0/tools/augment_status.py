@@ -24,8 +24,6 @@ import math
 import os
 from typing import Any, Dict, Optional
 
-import yaml
-
 
 CANONICAL_EXTERNAL_SUMMARY_FILENAMES = (
     "llamaguard_summary.json",
@@ -112,6 +110,8 @@ def jload_json_or_jsonl(
 def yload(path: str) -> Optional[Dict[str, Any]]:
     """Best-effort YAML loader: return a mapping or None."""
 
+    import yaml
+
     try:
         with open(path, encoding="utf-8") as handle:
             value = yaml.safe_load(handle)
@@ -12,8 +12,6 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
-import yaml
-
 SCHEMA_ID = "pulse.artifact_provenance_binding.v0"
 SCHEMA_VERSION = "0.1.0"
 PRODUCER_NAME = "build_artifact_provenance_binding_v0.py"
@@ -65,6 +63,8 @@ def read_json(path: Path) -> Dict[str, Any]:
 
 
 def read_yaml(path: Path) -> Dict[str, Any]:
+    import yaml
+
     if not path.is_file():
         raise BindingBuildError(f"missing required YAML artifact: {path}")
     obj = yaml.safe_load(path.read_text(encoding="utf-8"))
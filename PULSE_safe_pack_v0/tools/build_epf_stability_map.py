@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+build_epf_stability_map.py
+
+CLI to (re)build EPF Stability Map artifacts from the hazard log,
+incrementally by default:
+
+- without --gate-id: the all-gates map (epf_hazard_stability_map_v0.json,
+  epf_hazard_stability_map.build_stability_map_from_log)
+- with --gate-id: the single-gate map (epf_stability_map_v0.json,
+  epf_stability_map.build_stability_map_from_log)
+
+The aggregation state is checkpointed next to the artifact
+(<out stem>.state.json), so a rerun only folds in log entries appended
+since the previous build. A checkpoint is only reused for the same log
+path and parameters. --full-rebuild ignores the checkpoint; the artifact is
+the same either way (both count a log line once its newline is written).
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import pathlib
+import sys
+from typing import List
+
+
+def _ensure_repo_root_on_syspath() -> None:
+    here = pathlib.Path(__file__).resolve()
+    for p in (here,) + tuple(here.parents):
+        if p.name == "PULSE_safe_pack_v0":
+            repo_root = p.parent
+            if str(repo_root) not in sys.path:
+                sys.path.insert(0, str(repo_root))
+            return
+
+
+try:
+    from PULSE_safe_pack_v0.epf import epf_hazard_stability_map, epf_stability_map
+except ModuleNotFoundError:
+    _ensure_repo_root_on_syspath()
+    from PULSE_safe_pack_v0.epf import epf_hazard_stability_map, epf_stability_map
+
+
+def _artifacts_dir() -> pathlib.Path:
+    return pathlib.Path(__file__).resolve().parents[1] / "artifacts"
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Build EPF Stability Map artifacts from the hazard log (incremental by default)."
+    )
+    p.add_argument(
+        "--log",
+        type=pathlib.Path,
+        default=None,
+        help="Path to epf_hazard_log.jsonl (default: PULSE_safe_pack_v0/artifacts/epf_hazard_log.jsonl).",
+    )
+    p.add_argument(
+        "--gate-id",
+        default=None,
+        help="Build the single-gate epf_stability_map_v0 for this gate_id instead of the all-gates map.",
+    )
+    p.add_argument(
+        "--out",
+        type=pathlib.Path,
+        default=None,
+        help="Output artifact path (default: artifacts/epf_hazard_stability_map_v0.json, "
+        "or artifacts/epf_stability_map_v0.json with --gate-id).",
+    )
+    p.add_argument(
+        "--state",
+        type=pathlib.Path,
+        default=None,
+        help="Checkpoint path (default: <out stem>.state.json next to --out).",
+    )
+    p.add_argument("--tail", type=int, default=20, help="All-gates map: events per gate to summarize (default: 20).")
+    p.add_argument("--max-per-gate", type=int, default=1000, help="All-gates map: history kept per gate (default: 1000).")
+    p.add_argument(
+        "--max-points",
+        type=int,
+        default=epf_stability_map.DEFAULT_MAX_POINTS,
+        help=f"Single-gate map: points kept (default: {epf_stability_map.DEFAULT_MAX_POINTS}; <= 0 keeps all).",
+    )
+    p.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Ignore the checkpoint and rebuild from the whole log.",
+    )
+    return p.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+
+    log_path = args.log if args.log is not None else _artifacts_dir() / "epf_hazard_log.jsonl"
+
+    if args.gate_id is None:
+        out_path = args.out or epf_hazard_stability_map.DEFAULT_STABILITY_MAP_PATH
+    else:
+        out_path = args.out or _artifacts_dir() / epf_stability_map.DEFAULT_STABILITY_MAP_FILENAME
+    state_path = args.state or out_path.with_name(out_path.stem + ".state.json")
+
+    if args.gate_id is None:
+        artifact = epf_hazard_stability_map.build_stability_map_from_log(
+            log_path,
+            tail=int(args.tail),
+            max_per_gate=int(args.max_per_gate),
+            state_path=state_path,
+            full_rebuild=bool(args.full_rebuild),
+        )
+        epf_hazard_stability_map.write_stability_map(out_path, artifact)
+        n_gates = len(artifact.get("gates", {}))
+        print(f"Wrote {out_path} ({n_gates} gate(s))")
+    else:
+        payload = epf_stability_map.write_stability_map(
+            log_path=log_path,
+            out_path=out_path,
+            gate_id=str(args.gate_id),
+            created_utc=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            max_points=int(args.max_points),
+            state_path=state_path,
+            full_rebuild=bool(args.full_rebuild),
+        )
+        print(f"Wrote {out_path} ({payload['window']['points']} point(s))")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -37,9 +37,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
-from jsonschema import Draft202012Validator, FormatChecker
-
 if __package__:
     from .check_external_summary_attestation_v1 import (
         verify_external_summary_attestation,
@@ -49,6 +46,22 @@ else:  # pragma: no cover - direct CLI execution
         verify_external_summary_attestation,
     )
 
+    _REPO_ROOT = str(Path(__file__).resolve().parents[2])
+    if _REPO_ROOT not in sys.path:
+        sys.path.insert(0, _REPO_ROOT)
+
+# Always the package modules, so every tool in a process shares one
+# validator cache and one parse cache.
+from PULSE_safe_pack_v0.tools.schema_registry_v0 import (  # noqa: E402
+    schema_errors,
+    schema_errors_many,
+)
+from PULSE_safe_pack_v0.tools.strict_load_v0 import (  # noqa: E402
+    load_json_file,
+    load_yaml_file,
+    loads_json,
+)
+
 
 INDEX_SCHEMA = "recorded_release_candidate_index_v0"
 ENVELOPE_SCHEMA = "recorded_release_candidate_envelope_v0"
@@ -182,64 +195,6 @@ GENERIC_METRIC_KEYS = (
 )
 
 
-class UniqueYamlLoader(yaml.SafeLoader):
-    """YAML loader that rejects duplicate mapping keys."""
-
-
-def _yaml_mapping(
-    loader: UniqueYamlLoader,
-    node: Any,
-    deep: bool = False,
-) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-
-    for key_node, value_node in node.value:
-        key = loader.construct_object(
-            key_node,
-            deep=deep,
-        )
-
-        if key in out:
-            raise ValueError(
-                f"duplicate YAML key {key!r}"
-            )
-
-        out[key] = loader.construct_object(
-            value_node,
-            deep=deep,
-        )
-
-    return out
-
-
-UniqueYamlLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-    _yaml_mapping,
-)
-
-
-def _json_object(
-    pairs: list[tuple[str, Any]],
-) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-
-    for key, value in pairs:
-        if key in out:
-            raise ValueError(
-                f"duplicate JSON key {key!r}"
-            )
-
-        out[key] = value
-
-    return out
-
-
-def _nonfinite(value: str) -> None:
-    raise ValueError(
-        f"non-finite JSON constant {value!r}"
-    )
-
-
 def load_json(
     path: Path,
     label: str,
@@ -253,11 +208,7 @@ def load_json(
             )
             return None
 
-        value = json.loads(
-            path.read_text(encoding="utf-8"),
-            object_pairs_hook=_json_object,
-            parse_constant=_nonfinite,
-        )
+        value = load_json_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(
@@ -311,11 +262,7 @@ def load_json_or_jsonl(
                     continue
 
                 try:
-                    value = json.loads(
-                        text,
-                        object_pairs_hook=_json_object,
-                        parse_constant=_nonfinite,
-                    )
+                    value = loads_json(text)
 
                 except Exception as exc:  # noqa: BLE001
                     errors.append(
@@ -362,10 +309,7 @@ def load_yaml(
             )
             return None
 
-        value = yaml.load(
-            path.read_text(encoding="utf-8"),
-            Loader=UniqueYamlLoader,
-        )
+        value = load_yaml_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(
@@ -488,40 +432,6 @@ def relative(
     )
 
 
-def schema_errors(
-    payload: dict[str, Any],
-    schema: dict[str, Any],
-) -> list[str]:
-    validator = Draft202012Validator(
-        schema,
-        format_checker=FormatChecker(),
-    )
-
-    out: list[str] = []
-
-    for error in sorted(
-        validator.iter_errors(payload),
-        key=lambda item: list(
-            item.absolute_path
-        ),
-    ):
-        location = ".".join(
-            str(part)
-            for part in error.absolute_path
-        )
-
-        out.append(
-            (
-                f"{location}: "
-                if location
-                else ""
-            )
-            + error.message
-        )
-
-    return out
-
-
 def object_section(
     parent: dict[str, Any],
     key: str,
@@ -2884,7 +2794,15 @@ def build_candidates(
         **externals,
     }
 
-    for evidence_id, item in envelopes.items():
+    envelope_errors = schema_errors_many(
+        envelopes.values(),
+        envelope_schema,
+    )
+
+    for (evidence_id, item), item_errors in zip(
+        envelopes.items(),
+        envelope_errors,
+    ):
         if item.get("evidence_id") != evidence_id:
             errors.append(
                 f"candidate {evidence_id!r} "
@@ -2908,10 +2826,7 @@ def build_candidates(
         errors.extend(
             f"candidate {evidence_id} schema "
             f"validation failed: {message}"
-            for message in schema_errors(
-                item,
-                envelope_schema,
-            )
+            for message in item_errors
         )
 
     external_ids = sorted(
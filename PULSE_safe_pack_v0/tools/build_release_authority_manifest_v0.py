@@ -23,7 +23,6 @@ import hashlib
 import json
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any
@@ -76,6 +75,8 @@ def _git_sha(root: Path) -> str:
     if env_sha and re.fullmatch(r"[0-9a-fA-F]{40}", env_sha):
         return env_sha.lower()
 
+    import subprocess
+
     try:
         out = subprocess.check_output(
             ["git", "rev-parse", "HEAD"],
@@ -20,7 +20,6 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
 import json
 import os
 import re
@@ -29,9 +28,18 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
 from jsonschema import Draft202012Validator, FormatChecker
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.file_digest_v0 import sha256_file  # noqa: E402
+from PULSE_safe_pack_v0.tools.strict_load_v0 import (  # noqa: E402
+    load_json_file,
+    load_yaml_file,
+)
+
 
 MANIFEST_SCHEMA_VERSION = "release_evidence_input_manifest_v0"
 MANIFEST_ID = "release_evidence_input_manifest_v0"
@@ -85,52 +93,6 @@ KIND_BY_ENVELOPE_KIND = {
 }
 
 
-class UniqueYamlLoader(yaml.SafeLoader):
-    """YAML loader that rejects duplicate mapping keys."""
-
-
-def _construct_unique_mapping(
-    loader: UniqueYamlLoader,
-    node: Any,
-    deep: bool = False,
-) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-
-    for key_node, value_node in node.value:
-        key = loader.construct_object(key_node, deep=deep)
-
-        if key in out:
-            raise ValueError(f"duplicate YAML key {key!r}")
-
-        out[key] = loader.construct_object(value_node, deep=deep)
-
-    return out
-
-
-UniqueYamlLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-    _construct_unique_mapping,
-)
-
-
-def _unique_json_object(
-    pairs: list[tuple[str, Any]],
-) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-
-    for key, value in pairs:
-        if key in out:
-            raise ValueError(f"duplicate JSON key {key!r}")
-
-        out[key] = value
-
-    return out
-
-
-def _reject_nonfinite(value: str) -> None:
-    raise ValueError(f"non-finite JSON constant {value!r}")
-
-
 def _load_json(
     path: Path,
     label: str,
@@ -143,11 +105,7 @@ def _load_json(
             )
             return None
 
-        payload = json.loads(
-            path.read_text(encoding="utf-8"),
-            object_pairs_hook=_unique_json_object,
-            parse_constant=_reject_nonfinite,
-        )
+        payload = load_json_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(f"{label} is not valid JSON: {exc}")
@@ -172,10 +130,7 @@ def _load_yaml(
             )
             return None
 
-        payload = yaml.load(
-            path.read_text(encoding="utf-8"),
-            Loader=UniqueYamlLoader,
-        )
+        payload = load_yaml_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(f"{label} is not valid YAML: {exc}")
@@ -200,13 +155,7 @@ def _sha256(
             )
             return None
 
-        digest = hashlib.sha256()
-
-        with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(65536), b""):
-                digest.update(chunk)
-
-        return digest.hexdigest()
+        return sha256_file(path)
 
     except OSError as exc:
         errors.append(f"{label} could not be hashed: {exc}")
@@ -31,7 +31,14 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from jsonschema import Draft202012Validator, FormatChecker
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.schema_registry_v0 import (  # noqa: E402
+    schema_errors as _schema_errors,
+)
 
 
 REPORT_SCHEMA_VERSION = (
@@ -365,40 +372,6 @@ def _relative(
     )
 
 
-def _schema_errors(
-    payload: dict[str, Any],
-    schema: dict[str, Any],
-) -> list[str]:
-    validator = Draft202012Validator(
-        schema,
-        format_checker=FormatChecker(),
-    )
-
-    result: list[str] = []
-
-    for error in sorted(
-        validator.iter_errors(payload),
-        key=lambda item: list(
-            item.absolute_path
-        ),
-    ):
-        location = ".".join(
-            str(part)
-            for part in error.absolute_path
-        )
-
-        result.append(
-            (
-                f"{location}: "
-                if location
-                else ""
-            )
-            + error.message
-        )
-
-    return result
-
-
 def _section(
     parent: dict[str, Any],
     key: str,
@@ -20,6 +20,24 @@ NEW (Step 11):
 - emit feature coverage diagnostics:
     * feature_coverage: per-feature present/missing/coverage ratio
     * feature_coverage_top_missing: top-N most-missing features (debug hotspot list)
+
+Streaming mode (--streaming):
+- one pass over the log with a mergeable QuantileSketch per gate E series,
+  for global E and per snapshot feature (epf_quantile_sketch), so peak memory
+  is O(gates x features) instead of O(entries)
+- warn/crit percentiles, feature median/MAD and IQR come from the sketches;
+  the artifact reports the worst-case rank error vs the exact mode under
+  "streaming" (0.0 while every sketch has seen fewer than --sketch-k values,
+  in which case the output equals the exact mode)
+- --sketch-out saves the sketches; --merge-sketches folds in sketches saved
+  from other logs / runs before thresholds are derived. Saved sketches record
+  the snapshot policy they were collected under, and sketches built under a
+  different policy than this run's --field-spec are refused
+
+FieldSpec (--field-spec):
+- only snapshot keys allowed by the FieldSpec snapshot policy (features
+  allowlist + deny_keys, compiled once as a prefix trie) are collected for
+  scalers, recommendations and coverage
 """
 
 from __future__ import annotations
@@ -32,7 +50,7 @@ import math
 import pathlib
 import statistics
 import sys
-from typing import Any, DefaultDict, Dict, Iterable, List, Tuple
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Tuple, Union
 
 # ---------------------------------------------------------------------------
 # Import robust scaler primitives (script-safe import)
@@ -49,10 +67,24 @@ def _ensure_repo_root_on_syspath() -> None:
 
 
 try:
-    from PULSE_safe_pack_v0.epf.epf_hazard_features import RobustScaler, FeatureScalersArtifactV0
+    from PULSE_safe_pack_v0.epf.epf_hazard_features import (
+        DEFAULT_SCALER_EPS,
+        FeatureScalersArtifactV0,
+        RobustScaler,
+    )
+    from PULSE_safe_pack_v0.epf.epf_hazard_field_spec import SnapshotPolicy, maybe_load_field_spec
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists, iter_entries
+    from PULSE_safe_pack_v0.epf.epf_quantile_sketch import DEFAULT_SKETCH_K, QuantileSketch
 except ModuleNotFoundError:
     _ensure_repo_root_on_syspath()
-    from PULSE_safe_pack_v0.epf.epf_hazard_features import RobustScaler, FeatureScalersArtifactV0
+    from PULSE_safe_pack_v0.epf.epf_hazard_features import (
+        DEFAULT_SCALER_EPS,
+        FeatureScalersArtifactV0,
+        RobustScaler,
+    )
+    from PULSE_safe_pack_v0.epf.epf_hazard_field_spec import SnapshotPolicy, maybe_load_field_spec
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists, iter_entries
+    from PULSE_safe_pack_v0.epf.epf_quantile_sketch import DEFAULT_SKETCH_K, QuantileSketch
 
 
 # ---------------------------------------------------------------------------
@@ -126,6 +158,42 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         help="Top-N most-missing snapshot features to report in the artifact (default: 20).",
     )
 
+    parser.add_argument(
+        "--field-spec",
+        type=pathlib.Path,
+        default=None,
+        help="Optional FieldSpec artifact; only snapshot keys allowed by its policy are collected.",
+    )
+
+    # Streaming (sketch) mode
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help=(
+            "One-pass calibration with mergeable quantile sketches "
+            "(memory O(gates x features); reports the rank error bound vs exact mode)."
+        ),
+    )
+    parser.add_argument(
+        "--sketch-k",
+        type=int,
+        default=DEFAULT_SKETCH_K,
+        help=f"Sketch capacity per level (default: {DEFAULT_SKETCH_K}); larger = tighter bound, more memory.",
+    )
+    parser.add_argument(
+        "--sketch-out",
+        type=pathlib.Path,
+        default=None,
+        help="Streaming mode: write the calibration sketches as JSON (mergeable later).",
+    )
+    parser.add_argument(
+        "--merge-sketches",
+        type=pathlib.Path,
+        action="append",
+        default=[],
+        help="Streaming mode: merge sketches saved by --sketch-out (other logs / runs). Repeatable.",
+    )
+
     return parser.parse_args(argv)
 
 
@@ -134,19 +202,8 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
 # ---------------------------------------------------------------------------
 
 def load_entries(path: pathlib.Path) -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(obj, dict):
-                entries.append(obj)
-    return entries
+    # Sealed (compressed) segments + the active file, oldest -> newest.
+    return list(iter_entries(path))
 
 
 def collect_E_by_gate(entries: List[Dict[str, Any]]) -> Dict[str, List[float]]:
@@ -170,6 +227,8 @@ def _flatten_numeric_mapping_dotted(
     m: Mapping[str, object],
     *,
     prefix: str = "",
+    policy: Optional[SnapshotPolicy] = None,
+    cursor: Any = None,
 ) -> Iterable[Tuple[str, float]]:
     """
     Deterministically flatten a nested mapping into (dotted_key, float_value).
@@ -181,13 +240,29 @@ def _flatten_numeric_mapping_dotted(
       - ignore other types / non-finite
 
     Traversal is deterministic: sorted by str(key).
+    With a SnapshotPolicy, denied keys and subtrees outside the allowlist are
+    pruned while walking.
     """
+    if policy is not None and cursor is None:
+        cursor = policy.root()
+
     for k in sorted(m.keys(), key=lambda x: str(x)):
         v = m.get(k)
         key = f"{prefix}.{k}" if prefix else str(k)
 
+        child = None
+        if policy is not None:
+            child = policy.descend(cursor, str(k))
+            if child.denied:
+                continue
+
         if isinstance(v, Mapping):
-            yield from _flatten_numeric_mapping_dotted(v, prefix=key)
+            if policy is not None and not policy.traversable(child):
+                continue
+            yield from _flatten_numeric_mapping_dotted(v, prefix=key, policy=policy, cursor=child)
+            continue
+
+        if policy is not None and not child.covered:
             continue
 
         if isinstance(v, bool):
@@ -212,6 +287,8 @@ def _flatten_numeric_mapping_dotted(
 
 def collect_feature_values_from_entries(
     entries: List[Dict[str, Any]],
+    *,
+    policy: Optional[SnapshotPolicy] = None,
 ) -> Tuple[int, DefaultDict[str, List[float]], Dict[str, int]]:
     """
     Collect numeric feature values from snapshot_current across entries.
@@ -234,7 +311,7 @@ def collect_feature_values_from_entries(
 
         # count each dotted key once per event for presence
         present_keys = set()
-        for dotted_key, val in _flatten_numeric_mapping_dotted(snap_cur):
+        for dotted_key, val in _flatten_numeric_mapping_dotted(snap_cur, policy=policy):
             feature_values[dotted_key].append(val)
             present_keys.add(dotted_key)
 
@@ -285,6 +362,183 @@ def _iqr(values: List[float]) -> float:
     return max(0.0, percentile(values, 0.75) - percentile(values, 0.25))
 
 
+# ---------------------------------------------------------------------------
+# Streaming (sketch) mode
+# ---------------------------------------------------------------------------
+
+SKETCHES_SCHEMA_V0 = "epf_hazard_calibration_sketches_v0"
+
+
+def _policy_record(policy: Optional[SnapshotPolicy]) -> Optional[Dict[str, Any]]:
+    """JSON form of the snapshot policy sketches were built under (None = unfiltered)."""
+    if policy is None or not policy.active:
+        return None
+    return {"allowed_prefixes": policy.allowed_prefixes, "deny_keys": policy.deny_keys}
+
+
+class CalibrationSketches:
+    """
+    One-pass accumulator for streaming calibration.
+
+    Holds one QuantileSketch per gate E series, one for all E values, one per
+    dotted snapshot feature, plus presence counts. Mergeable (same k and
+    snapshot policy) and JSON-serializable, so sketches built from different
+    logs / runs combine.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, *, policy: Optional[SnapshotPolicy] = None) -> None:
+        self.k = int(k)
+        self.policy = policy
+        self.policy_record = _policy_record(policy)
+        self.entry_count = 0
+        self.snapshot_event_count = 0
+        self.global_E = QuantileSketch(self.k)
+        self.gate_E: Dict[str, QuantileSketch] = {}
+        self.features: Dict[str, QuantileSketch] = {}
+        self.feature_present_counts: Dict[str, int] = {}
+
+    def add_entry(self, ev: Mapping[str, Any]) -> None:
+        self.entry_count += 1
+
+        hazard = ev.get("hazard", {})
+        if isinstance(hazard, dict):
+            E = hazard.get("E")
+            if isinstance(E, (int, float)) and math.isfinite(float(E)):
+                gate_id = str(ev.get("gate_id", "UNKNOWN"))
+                sk = self.gate_E.get(gate_id)
+                if sk is None:
+                    sk = self.gate_E[gate_id] = QuantileSketch(self.k)
+                sk.add(float(E))
+                self.global_E.add(float(E))
+
+        snap_cur = ev.get("snapshot_current")
+        if not isinstance(snap_cur, Mapping):
+            return
+
+        self.snapshot_event_count += 1
+        present_keys = set()
+        for dotted_key, val in _flatten_numeric_mapping_dotted(snap_cur, policy=self.policy):
+            sk = self.features.get(dotted_key)
+            if sk is None:
+                sk = self.features[dotted_key] = QuantileSketch(self.k)
+            sk.add(val)
+            present_keys.add(dotted_key)
+        for key in present_keys:
+            self.feature_present_counts[key] = self.feature_present_counts.get(key, 0) + 1
+
+    def merge(self, other: "CalibrationSketches") -> "CalibrationSketches":
+        if other.policy_record != self.policy_record:
+            raise ValueError(
+                "sketches were built under a different snapshot policy "
+                f"({other.policy_record!r} != {self.policy_record!r})"
+            )
+        self.entry_count += other.entry_count
+        self.snapshot_event_count += other.snapshot_event_count
+        self.global_E.merge(other.global_E)
+        for mine, theirs in ((self.gate_E, other.gate_E), (self.features, other.features)):
+            for key, sk in theirs.items():
+                mine.setdefault(key, QuantileSketch(self.k)).merge(sk)
+        for key, n in other.feature_present_counts.items():
+            self.feature_present_counts[key] = self.feature_present_counts.get(key, 0) + int(n)
+        return self
+
+    def max_rank_error(self) -> float:
+        sketches = [self.global_E, *self.gate_E.values(), *self.features.values()]
+        return max(sk.rank_error_bound() for sk in sketches)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schema": SKETCHES_SCHEMA_V0,
+            "k": self.k,
+            "snapshot_policy": self.policy_record,
+            "entry_count": self.entry_count,
+            "snapshot_event_count": self.snapshot_event_count,
+            "global_E": self.global_E.to_dict(),
+            "gate_E": {k: v.to_dict() for k, v in sorted(self.gate_E.items())},
+            "features": {k: v.to_dict() for k, v in sorted(self.features.items())},
+            "feature_present_counts": dict(sorted(self.feature_present_counts.items())),
+        }
+
+    @staticmethod
+    def from_dict(d: Mapping[str, Any]) -> "CalibrationSketches":
+        if d.get("schema") != SKETCHES_SCHEMA_V0:
+            raise ValueError(f"unsupported sketches schema: {d.get('schema')!r}")
+        out = CalibrationSketches(int(d["k"]))
+        record = d.get("snapshot_policy")
+        if record is not None:
+            if not isinstance(record, Mapping):
+                raise ValueError(f"invalid snapshot_policy in sketches: {record!r}")
+            out.policy = SnapshotPolicy(record.get("allowed_prefixes"), record.get("deny_keys"))
+            out.policy_record = _policy_record(out.policy)
+        out.entry_count = int(d.get("entry_count", 0))
+        out.snapshot_event_count = int(d.get("snapshot_event_count", 0))
+        out.global_E = QuantileSketch.from_dict(d["global_E"])
+        out.gate_E = {str(k): QuantileSketch.from_dict(v) for k, v in (d.get("gate_E") or {}).items()}
+        out.features = {str(k): QuantileSketch.from_dict(v) for k, v in (d.get("features") or {}).items()}
+        out.feature_present_counts = {
+            str(k): int(v) for k, v in (d.get("feature_present_counts") or {}).items()
+        }
+        return out
+
+
+def collect_sketches(
+    entries: Iterable[Mapping[str, Any]],
+    *,
+    k: int = DEFAULT_SKETCH_K,
+    policy: Optional[SnapshotPolicy] = None,
+) -> CalibrationSketches:
+    acc = CalibrationSketches(k, policy=policy)
+    for ev in entries:
+        acc.add_entry(ev)
+    return acc
+
+
+def _quantile(series: Union[List[float], QuantileSketch], p: float) -> float:
+    if isinstance(series, QuantileSketch):
+        return series.quantile(p)
+    return percentile(series, p)
+
+
+def _extent(series: Union[List[float], QuantileSketch]) -> Tuple[float, float]:
+    if isinstance(series, QuantileSketch):
+        return series.min, series.max
+    return min(series), max(series)
+
+
+def global_stats_from_sketch(sk: QuantileSketch) -> Dict[str, float]:
+    return {
+        "count": sk.n,
+        "min": sk.min,
+        "max": sk.max,
+        "mean": sk.mean(),
+        "p50": sk.quantile(0.50),
+        "p85": sk.quantile(0.85),
+        "p95": sk.quantile(0.95),
+        "p97": sk.quantile(0.97),
+        "p99": sk.quantile(0.99),
+    }
+
+
+def fit_scaler_from_sketch(sk: QuantileSketch) -> RobustScaler:
+    """
+    Sketch counterpart of RobustScaler.fit: median/MAD with the same
+    IQR -> range -> unit fallback when MAD degenerates.
+    """
+    if sk.n == 0:
+        raise ValueError("fit_scaler_from_sketch requires at least 1 finite sample")
+    eps = DEFAULT_SCALER_EPS
+    med = sk.median()
+    mad = sk.mad(med)
+    if not math.isfinite(mad) or mad <= eps:
+        iqr = sk.iqr()
+        if math.isfinite(iqr) and iqr > eps:
+            mad = iqr
+        else:
+            rng = float(abs(sk.max - sk.min))
+            mad = rng if math.isfinite(rng) and rng > eps else 1.0
+    return RobustScaler(median=med, mad=mad)
+
+
 # ---------------------------------------------------------------------------
 # Recommendation + coverage
 # ---------------------------------------------------------------------------
@@ -297,6 +551,7 @@ def recommend_features(
     snapshot_event_count: int,
     max_features: int,
     min_coverage: float,
+    feature_spreads: Optional[Mapping[str, float]] = None,
 ) -> Tuple[List[str], Dict[str, Any]]:
     """
     Deterministically recommend a bounded feature set for autowire.
@@ -305,6 +560,9 @@ def recommend_features(
       1) filter by coverage >= min_coverage
       2) rank by (coverage desc, IQR desc, key asc)
       3) if empty but scalers exist -> fallback to top by the same ranking without coverage filter
+
+    feature_spreads (streaming mode) supplies precomputed IQRs; features
+    missing from it are skipped like features without values.
     """
     max_features_i = int(max_features)
     if max_features_i <= 0 or snapshot_event_count <= 0:
@@ -319,12 +577,17 @@ def recommend_features(
 
     base = []
     for k in sorted(set(map(str, scaler_keys))):
-        vals = feature_values.get(k)
-        if not isinstance(vals, list) or not vals:
-            continue
+        if feature_spreads is not None:
+            if k not in feature_spreads:
+                continue
+            spread = float(feature_spreads[k])
+        else:
+            vals = feature_values.get(k)
+            if not isinstance(vals, list) or not vals:
+                continue
+            spread = _iqr(vals)
         present = int(feature_present_counts.get(k, 0))
         cov = present / float(snapshot_event_count)
-        spread = _iqr(vals)
         base.append((k, cov, spread, present))
 
     if not base:
@@ -473,33 +736,81 @@ def main(argv: List[str]) -> int:
         pack_root = script_path.parents[1]
         log_path = pack_root / "artifacts" / "epf_hazard_log.jsonl"
 
-    if not log_path.exists():
+    if not hazard_log_exists(log_path):
         print(f"hazard log not found: {log_path}", file=sys.stderr)
         return 1
 
-    entries = load_entries(log_path)
-    if not entries:
-        print(f"no entries found in log: {log_path}", file=sys.stderr)
+    if args.sketch_k < 2:
+        print(f"invalid --sketch-k: {args.sketch_k} (must be >= 2)", file=sys.stderr)
+        return 1
+
+    if (args.sketch_out is not None or args.merge_sketches) and not args.streaming:
+        print("--sketch-out/--merge-sketches require --streaming", file=sys.stderr)
         return 1
 
-    by_gate = collect_E_by_gate(entries)
+    snapshot_policy: Optional[SnapshotPolicy] = None
+    if args.field_spec is not None:
+        field_spec = maybe_load_field_spec(args.field_spec)
+        if field_spec is None:
+            print(f"field spec not found or invalid: {args.field_spec}", file=sys.stderr)
+            return 1
+        snapshot_policy = field_spec.snapshot_policy()
+
+    # Series are lists of values (exact mode) or QuantileSketch (streaming mode).
+    by_gate: Mapping[str, Union[List[float], QuantileSketch]]
+    all_E: Union[List[float], QuantileSketch]
+    feature_values: Mapping[str, Union[List[float], QuantileSketch]]
+    sketches: Optional[CalibrationSketches] = None
+
+    if args.streaming:
+        sketches = collect_sketches(iter_entries(log_path), k=int(args.sketch_k), policy=snapshot_policy)
+        for sketch_path in args.merge_sketches:
+            try:
+                other = CalibrationSketches.from_dict(json.loads(sketch_path.read_text(encoding="utf-8")))
+                sketches.merge(other)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"cannot merge sketches from {sketch_path}: {e}", file=sys.stderr)
+                return 1
+        entry_count = sketches.entry_count
+        by_gate = sketches.gate_E
+        all_E = sketches.global_E
+        snapshot_event_count = sketches.snapshot_event_count
+        feature_values = sketches.features
+        feature_present_counts = sketches.feature_present_counts
+    else:
+        entries = load_entries(log_path)
+        entry_count = len(entries)
+        by_gate = collect_E_by_gate(entries)
+        all_E = [e for values in by_gate.values() for e in values]
+        snapshot_event_count, feature_values, feature_present_counts = collect_feature_values_from_entries(
+            entries, policy=snapshot_policy
+        )
+
+    if not entry_count:
+        print(f"no entries found in log: {log_path}", file=sys.stderr)
+        return 1
 
-    all_E: List[float] = [e for values in by_gate.values() for e in values]
     if not all_E:
         print("no numeric E values found in log", file=sys.stderr)
         return 1
 
-    snapshot_event_count, feature_values, feature_present_counts = collect_feature_values_from_entries(entries)
-
-    print(f"Loaded {len(entries)} log entries from {log_path}")
+    print(f"Loaded {entry_count} log entries from {log_path}")
     print(f"Gates with numeric E: {len(by_gate)}")
     if snapshot_event_count > 0:
         print(f"Entries with snapshot_current: {snapshot_event_count}")
     print()
 
-    gstats = global_stats(all_E)
-    global_warn = percentile(all_E, args.warn_p)
-    global_crit = percentile(all_E, args.crit_p)
+    if sketches is not None:
+        gstats = global_stats_from_sketch(sketches.global_E)
+        print(
+            f"Streaming mode (k={sketches.k}): quantiles within "
+            f"±{sketches.max_rank_error():.4f} rank of exact mode"
+        )
+        print()
+    else:
+        gstats = global_stats(all_E)
+    global_warn = _quantile(all_E, args.warn_p)
+    global_crit = _quantile(all_E, args.crit_p)
 
     print("=== Global E statistics ===")
     for k in ["count", "min", "max", "mean", "p50", "p85", "p95", "p97", "p99"]:
@@ -521,17 +832,20 @@ def main(argv: List[str]) -> int:
     for gate_id, values in sorted(by_gate.items()):
         if len(values) < args.min_samples:
             continue
-        w = percentile(values, args.warn_p)
-        c = percentile(values, args.crit_p)
+        w = _quantile(values, args.warn_p)
+        c = _quantile(values, args.crit_p)
         per_gate_thresholds[gate_id] = {
             "warn_threshold": w,
             "crit_threshold": c,
             "count": len(values),
         }
+        if isinstance(values, QuantileSketch):
+            per_gate_thresholds[gate_id]["rank_error"] = values.rank_error_bound()
+        e_min, e_max = _extent(values)
         print(
             f"[{gate_id}] n={len(values):4d}  "
             f"warn≈{w:.4f}  crit≈{c:.4f}  "
-            f"E_min={min(values):.4f}  E_max={max(values):.4f}"
+            f"E_min={e_min:.4f}  E_max={e_max:.4f}"
         )
 
     feature_scalers_payload: Dict[str, Any] = {}
@@ -546,7 +860,10 @@ def main(argv: List[str]) -> int:
             if len(vals) < args.min_samples:
                 continue
             try:
-                scalers[key] = RobustScaler.fit(vals)
+                if isinstance(vals, QuantileSketch):
+                    scalers[key] = fit_scaler_from_sketch(vals)
+                else:
+                    scalers[key] = RobustScaler.fit(vals)
             except ValueError:
                 continue
 
@@ -570,6 +887,9 @@ def main(argv: List[str]) -> int:
                 snapshot_event_count=snapshot_event_count,
                 max_features=int(args.recommend_max_features),
                 min_coverage=float(args.recommend_min_coverage),
+                feature_spreads=(
+                    {k: sketches.features[k].iqr() for k in scalers} if sketches is not None else None
+                ),
             )
 
     # Step 11: compute coverage always (if we have snapshot-bearing entries)
@@ -602,6 +922,15 @@ def main(argv: List[str]) -> int:
         if feature_scalers_payload:
             payload["feature_scalers"] = feature_scalers_payload
 
+        if sketches is not None:
+            payload["streaming"] = {
+                "mode": "sketch",
+                "k": sketches.k,
+                "merged_sketches": len(args.merge_sketches),
+                "global_rank_error": sketches.global_E.rank_error_bound(),
+                "max_rank_error": sketches.max_rank_error(),
+            }
+
         # Keep coverage independent from scalers (it helps debug snapshot policy even before scalers stabilize)
         if feature_coverage:
             payload["feature_coverage"] = feature_coverage
@@ -647,6 +976,12 @@ def main(argv: List[str]) -> int:
                 f"(max={args.recommend_max_features}, min_coverage={args.recommend_min_coverage:.2f}, fallback_used={fb})"
             )
 
+    if sketches is not None and args.sketch_out is not None:
+        args.sketch_out.parent.mkdir(parents=True, exist_ok=True)
+        with args.sketch_out.open("w", encoding="utf-8") as f:
+            json.dump(sketches.to_dict(), f, sort_keys=True)
+        print(f"Wrote calibration sketches to {args.sketch_out}")
+
     # Also print a quick hotspot section to stdout (useful even without --out-json)
     if feature_coverage_top_missing:
         print()
@@ -14,6 +14,8 @@ NEW (Step 11):
     * unique_features
     * mean/median keys per snapshot
     * coverage_top_missing list
+- --field-spec restricts the coverage summary to the FieldSpec snapshot
+  policy (features allowlist + deny_keys), compiled once as a prefix trie
 
 Read-only and fail-open: skips malformed lines.
 """
@@ -30,6 +32,25 @@ from collections import Counter, defaultdict
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 
+def _ensure_repo_root_on_syspath() -> None:
+    here = pathlib.Path(__file__).resolve()
+    for p in (here,) + tuple(here.parents):
+        if p.name == "PULSE_safe_pack_v0":
+            repo_root = p.parent
+            if str(repo_root) not in sys.path:
+                sys.path.insert(0, str(repo_root))
+            return
+
+
+try:
+    from PULSE_safe_pack_v0.epf.epf_hazard_field_spec import SnapshotPolicy, maybe_load_field_spec
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists, iter_entries
+except ModuleNotFoundError:
+    _ensure_repo_root_on_syspath()
+    from PULSE_safe_pack_v0.epf.epf_hazard_field_spec import SnapshotPolicy, maybe_load_field_spec
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists, iter_entries
+
+
 def _default_log_path() -> pathlib.Path:
     script_path = pathlib.Path(__file__).resolve()
     pack_root = script_path.parents[1]
@@ -75,6 +96,12 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         action="store_true",
         help="Also print a per-gate summary table (can be long).",
     )
+    p.add_argument(
+        "--field-spec",
+        type=pathlib.Path,
+        default=None,
+        help="Optional FieldSpec artifact; only snapshot keys allowed by its policy count for coverage.",
+    )
     p.add_argument(
         "--out-json",
         type=pathlib.Path,
@@ -113,19 +140,8 @@ def _safe_str(x: Any) -> Optional[str]:
 
 
 def load_entries(path: pathlib.Path) -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(obj, dict):
-                entries.append(obj)
-    return entries
+    # Sealed (compressed) segments + the active file, oldest -> newest.
+    return list(iter_entries(path))
 
 
 def filter_entries(entries: List[Dict[str, Any]], gate_ids: Optional[List[str]]) -> List[Dict[str, Any]]:
@@ -225,14 +241,34 @@ def _extract_gate_id(ev: Mapping[str, Any]) -> str:
 # NEW: snapshot coverage collection
 # ---------------------------------------------------------------------------
 
-def _flatten_snapshot_leaf_keys(m: Mapping[str, Any], prefix: str = "") -> List[str]:
+def _flatten_snapshot_leaf_keys(
+    m: Mapping[str, Any],
+    prefix: str = "",
+    *,
+    policy: Optional[SnapshotPolicy] = None,
+    cursor: Any = None,
+) -> List[str]:
+    if policy is not None and cursor is None:
+        cursor = policy.root()
+
     keys: List[str] = []
     for k in sorted(m.keys(), key=lambda x: str(x)):
         v = m.get(k)
         path = f"{prefix}.{k}" if prefix else str(k)
 
+        child = None
+        if policy is not None:
+            child = policy.descend(cursor, str(k))
+            if child.denied:
+                continue
+
         if isinstance(v, Mapping):
-            keys.extend(_flatten_snapshot_leaf_keys(v, prefix=path))
+            if policy is not None and not policy.traversable(child):
+                continue
+            keys.extend(_flatten_snapshot_leaf_keys(v, prefix=path, policy=policy, cursor=child))
+            continue
+
+        if policy is not None and not child.covered:
             continue
 
         if _safe_float(v) is not None:
@@ -242,7 +278,11 @@ def _flatten_snapshot_leaf_keys(m: Mapping[str, Any], prefix: str = "") -> List[
     return keys
 
 
-def collect_snapshot_coverage(entries: List[Dict[str, Any]]) -> Tuple[int, Counter, List[int]]:
+def collect_snapshot_coverage(
+    entries: List[Dict[str, Any]],
+    *,
+    policy: Optional[SnapshotPolicy] = None,
+) -> Tuple[int, Counter, List[int]]:
     snapshot_event_count = 0
     present_counts: Counter = Counter()
     keys_per_event: List[int] = []
@@ -254,7 +294,7 @@ def collect_snapshot_coverage(entries: List[Dict[str, Any]]) -> Tuple[int, Count
 
         snapshot_event_count += 1
 
-        ks = set(_flatten_snapshot_leaf_keys(snap, prefix=""))
+        ks = set(_flatten_snapshot_leaf_keys(snap, prefix="", policy=policy))
         keys_per_event.append(len(ks))
         for k in ks:
             present_counts[k] += 1
@@ -318,7 +358,13 @@ def build_snapshot_coverage_summary(
 # Main summary builder
 # ---------------------------------------------------------------------------
 
-def build_summary(entries: List[Dict[str, Any]], *, top_k: int = 10, coverage_top: int = 15) -> Dict[str, Any]:
+def build_summary(
+    entries: List[Dict[str, Any]],
+    *,
+    top_k: int = 10,
+    coverage_top: int = 15,
+    snapshot_policy: Optional[SnapshotPolicy] = None,
+) -> Dict[str, Any]:
     zones = Counter()
     E_values: List[float] = []
 
@@ -438,7 +484,7 @@ def build_summary(entries: List[Dict[str, Any]], *, top_k: int = 10, coverage_to
         }
 
     # Step 11: snapshot coverage (snapshot_current)
-    snap_n, snap_present_counts, keys_per_event = collect_snapshot_coverage(entries)
+    snap_n, snap_present_counts, keys_per_event = collect_snapshot_coverage(entries, policy=snapshot_policy)
     snapshot_coverage = build_snapshot_coverage_summary(
         snapshot_event_count=snap_n,
         present_counts=snap_present_counts,
@@ -583,14 +629,27 @@ def main(argv: List[str]) -> int:
     args = parse_args(argv)
 
     log_path = args.log if args.log is not None else _default_log_path()
-    if not log_path.exists():
+    if not hazard_log_exists(log_path):
         print(f"hazard log not found: {log_path}", file=sys.stderr)
         return 1
 
+    snapshot_policy = None
+    if args.field_spec is not None:
+        field_spec = maybe_load_field_spec(args.field_spec)
+        if field_spec is None:
+            print(f"field spec not found or invalid: {args.field_spec}", file=sys.stderr)
+            return 1
+        snapshot_policy = field_spec.snapshot_policy()
+
     entries = load_entries(log_path)
     entries = filter_entries(entries, args.gate)
 
-    summary = build_summary(entries, top_k=int(args.top_k), coverage_top=int(args.coverage_top))
+    summary = build_summary(
+        entries,
+        top_k=int(args.top_k),
+        coverage_top=int(args.coverage_top),
+        snapshot_policy=snapshot_policy,
+    )
 
     tail_n = int(args.tail)
     tail_events: List[Dict[str, Any]] = []
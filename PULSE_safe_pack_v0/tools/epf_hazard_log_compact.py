@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+epf_hazard_log_compact.py
+
+CLI to maintain a segmented EPF hazard log (epf_hazard_log.jsonl +
+epf_hazard_log.segments/):
+
+- optionally seal the active file into a compressed segment (--seal-active)
+- compact sealed segments: repeated snapshot_reference maps are stored once
+  under segments/refs/<sha256>.json and entries keep only the digest
+- optionally write the active file's sidecar index (--index), which readers
+  use but never write themselves
+
+Readers (run_all, Stability Map builders, epf_hazard_inspect,
+epf_hazard_calibrate) re-inline compacted snapshots transparently.
+Safe to re-run: already compacted segments are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+from typing import List
+
+
+def _ensure_repo_root_on_syspath() -> None:
+    here = pathlib.Path(__file__).resolve()
+    for p in (here,) + tuple(here.parents):
+        if p.name == "PULSE_safe_pack_v0":
+            repo_root = p.parent
+            if str(repo_root) not in sys.path:
+                sys.path.insert(0, str(repo_root))
+            return
+
+
+try:
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (
+        available_codecs,
+        compact_segments,
+        hazard_log_exists,
+        seal_active,
+        update_index,
+    )
+except ModuleNotFoundError:
+    _ensure_repo_root_on_syspath()
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (
+        available_codecs,
+        compact_segments,
+        hazard_log_exists,
+        seal_active,
+        update_index,
+    )
+
+
+def _default_log_path() -> pathlib.Path:
+    script_path = pathlib.Path(__file__).resolve()
+    pack_root = script_path.parents[1]
+    return pack_root / "artifacts" / "epf_hazard_log.jsonl"
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Seal and compact a segmented EPF hazard log (dedupe reference snapshots by digest)."
+    )
+    p.add_argument(
+        "--log",
+        type=pathlib.Path,
+        default=None,
+        help="Path to epf_hazard_log.jsonl (default: PULSE_safe_pack_v0/artifacts/epf_hazard_log.jsonl).",
+    )
+    p.add_argument(
+        "--seal-active",
+        action="store_true",
+        help="Seal the active file into a new segment before compacting.",
+    )
+    p.add_argument(
+        "--codec",
+        choices=available_codecs(),
+        default="gzip",
+        help="Codec for a segment sealed with --seal-active (default: gzip).",
+    )
+    p.add_argument(
+        "--index",
+        action="store_true",
+        help="Write the active file's sidecar index (epf_hazard_log.jsonl.idx) after compacting.",
+    )
+    return p.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+
+    log_path = args.log if args.log is not None else _default_log_path()
+    if not hazard_log_exists(log_path):
+        print(f"hazard log not found: {log_path}", file=sys.stderr)
+        return 1
+
+    sealed = None
+    if args.seal_active:
+        sealed = seal_active(log_path, codec=args.codec)
+
+    stats = compact_segments(log_path)
+    report = {
+        "log": str(log_path),
+        "sealed_segment": sealed["name"] if sealed else None,
+        "compaction": stats,
+    }
+    if args.index:
+        report["index"] = update_index(log_path)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -5,8 +5,8 @@ epf_hazard_plot.py
 Small helper to visualise the EPF hazard JSONL log produced by
 epf_hazard_adapter / run_all.py.
 
-It reads epf_hazard_log.jsonl, filters by gate_id, and plots the
-evolution of T(t), S(t), D(t) and E(t) over log index.
+It reads epf_hazard_log.jsonl (sealed segments included), filters by
+gate_id, and plots the evolution of T(t), S(t), D(t) and E(t) over log index.
 
 Usage:
 
@@ -18,12 +18,28 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import pathlib
 import sys
 from typing import Any, Dict, List
 
 
+def _ensure_repo_root_on_syspath() -> None:
+    here = pathlib.Path(__file__).resolve()
+    for p in (here,) + tuple(here.parents):
+        if p.name == "PULSE_safe_pack_v0":
+            repo_root = p.parent
+            if str(repo_root) not in sys.path:
+                sys.path.insert(0, str(repo_root))
+            return
+
+
+try:
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists, iter_entries
+except ModuleNotFoundError:
+    _ensure_repo_root_on_syspath()
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists, iter_entries
+
+
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Plot EPF hazard JSONL log (T, S, D, E over time)."
@@ -50,18 +66,8 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
 
 
 def load_entries(path: pathlib.Path) -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            entries.append(obj)
-    return entries
+    # Sealed (compressed) segments + the active file, oldest -> newest.
+    return list(iter_entries(path))
 
 
 def filter_by_gate(
@@ -134,7 +140,7 @@ def main(argv: List[str]) -> int:
         pack_root = script_path.parents[1]
         log_path = pack_root / "artifacts" / "epf_hazard_log.jsonl"
 
-    if not log_path.exists():
+    if not hazard_log_exists(log_path):
         print(f"hazard log not found: {log_path}", file=sys.stderr)
         return 1
 
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+epf_hazard_replay.py
+
+Replay an EPF hazard log under one or more candidate HazardConfigs and
+report how the zones would have changed.
+
+Each --config NAME=PATH points to a JSON object (see
+epf_hazard_replay.hazard_config_from_dict):
+
+    {"alpha": 1.0, "beta": 1.2, "min_history": 5,
+     "calibration": "epf_hazard_thresholds_v0.json",
+     "features": ["metrics.rdsi", "metrics.latency"]}
+
+The log is streamed once (sealed segments included); T/D/E/zone are
+recomputed per gate_id for every config, vectorized over chunks of entries.
+
+Outputs:
+- --out-npz: columnar result (row columns + "<config>/{T,D,E,zone}", with
+  the logged values under "logged/...")
+- --out-json / stdout: zone counts per config and zone-transition diffs of
+  every config against --baseline (default: the logged zones)
+
+Requires numpy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+from typing import Dict, List
+
+
+def _ensure_repo_root_on_syspath() -> None:
+    here = pathlib.Path(__file__).resolve()
+    for p in (here,) + tuple(here.parents):
+        if p.name == "PULSE_safe_pack_v0":
+            repo_root = p.parent
+            if str(repo_root) not in sys.path:
+                sys.path.insert(0, str(repo_root))
+            return
+
+
+try:
+    from PULSE_safe_pack_v0.epf.epf_hazard_forecast import HazardConfig
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists
+    from PULSE_safe_pack_v0.epf.epf_hazard_replay import (
+        DEFAULT_CHUNK_SIZE,
+        LOGGED,
+        hazard_config_from_dict,
+        replay_hazard_log,
+    )
+except ModuleNotFoundError:
+    _ensure_repo_root_on_syspath()
+    from PULSE_safe_pack_v0.epf.epf_hazard_forecast import HazardConfig
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import hazard_log_exists
+    from PULSE_safe_pack_v0.epf.epf_hazard_replay import (
+        DEFAULT_CHUNK_SIZE,
+        LOGGED,
+        hazard_config_from_dict,
+        replay_hazard_log,
+    )
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Replay epf_hazard_log.jsonl under candidate HazardConfigs and diff the zones."
+    )
+    parser.add_argument(
+        "--log",
+        type=pathlib.Path,
+        default=None,
+        help=(
+            "Path to epf_hazard_log.jsonl. "
+            "Defaults to PULSE_safe_pack_v0/artifacts/epf_hazard_log.jsonl."
+        ),
+    )
+    parser.add_argument(
+        "--config",
+        action="append",
+        default=[],
+        metavar="NAME=PATH",
+        help="Candidate config as NAME=path/to/config.json (repeatable, at least one).",
+    )
+    parser.add_argument(
+        "--gate",
+        action="append",
+        default=None,
+        help="Only replay these gate_ids (repeatable).",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=LOGGED,
+        help=f"Config the zone transitions are diffed against (default: {LOGGED!r}, the logged zones).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Log entries per vectorized chunk (default: {DEFAULT_CHUNK_SIZE}).",
+    )
+    parser.add_argument(
+        "--max-events",
+        type=int,
+        default=20,
+        help="Changed rows listed per transition diff (default: 20).",
+    )
+    parser.add_argument(
+        "--out-npz",
+        type=pathlib.Path,
+        default=None,
+        help="Optional path for the columnar replay result (.npz).",
+    )
+    parser.add_argument(
+        "--out-json",
+        type=pathlib.Path,
+        default=None,
+        help="Optional path for the JSON summary (default: print to stdout).",
+    )
+    return parser.parse_args(argv)
+
+
+def _load_configs(specs: List[str]) -> Dict[str, HazardConfig]:
+    configs: Dict[str, HazardConfig] = {}
+    for spec in specs:
+        name, sep, path_s = spec.partition("=")
+        name = name.strip()
+        if not sep or not name or not path_s:
+            raise ValueError(f"--config expects NAME=PATH, got {spec!r}")
+        if name in configs or name == LOGGED:
+            raise ValueError(f"duplicate or reserved config name: {name!r}")
+        path = pathlib.Path(path_s)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError(f"config {path} must be a JSON object")
+        configs[name] = hazard_config_from_dict(data, base_dir=path.parent)
+    return configs
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+
+    if args.log is not None:
+        log_path = args.log
+    else:
+        pack_dir = pathlib.Path(__file__).resolve().parents[1]
+        log_path = pack_dir / "artifacts" / "epf_hazard_log.jsonl"
+
+    if not hazard_log_exists(log_path):
+        print(f"hazard log not found: {log_path}", file=sys.stderr)
+        return 1
+
+    if not args.config:
+        print("at least one --config NAME=PATH is required", file=sys.stderr)
+        return 1
+
+    try:
+        configs = _load_configs(args.config)
+    except (OSError, TypeError, ValueError) as exc:
+        print(f"invalid config: {exc}", file=sys.stderr)
+        return 1
+
+    if args.baseline != LOGGED and args.baseline not in configs:
+        print(f"unknown --baseline config: {args.baseline}", file=sys.stderr)
+        return 1
+
+    result = replay_hazard_log(log_path, configs, gates=args.gate, chunk_size=int(args.chunk_size))
+    if not len(result):
+        print(f"no entries found in log: {log_path}", file=sys.stderr)
+        return 1
+
+    if args.out_npz is not None:
+        result.save_npz(args.out_npz)
+
+    summary = result.summary(base=args.baseline, max_events=int(args.max_events))
+    summary["log_path"] = str(log_path)
+
+    text = json.dumps(summary, indent=2, sort_keys=True)
+    if args.out_json is not None:
+        args.out_json.parent.mkdir(parents=True, exist_ok=True)
+        args.out_json.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -15,7 +15,6 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
 import json
 import os
 import re
@@ -26,8 +25,16 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
-import yaml
-from jsonschema import Draft202012Validator, FormatChecker
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.file_digest_v0 import sha256_file as _digest_file  # noqa: E402
+from PULSE_safe_pack_v0.tools.schema_registry_v0 import schema_errors  # noqa: E402
+from PULSE_safe_pack_v0.tools.strict_load_v0 import (  # noqa: E402
+    load_json_file,
+    load_yaml_file,
+)
 
 
 RESULT_SCHEMA = "required_gate_evaluation_result_v0"
@@ -57,64 +64,6 @@ GIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
 GATE_ID_RE = re.compile(r"^[a-z][a-z0-9_]*$")
 
 
-class UniqueYamlLoader(yaml.SafeLoader):
-    pass
-
-
-def _unique_yaml_mapping(
-    loader: UniqueYamlLoader,
-    node: Any,
-    deep: bool = False,
-) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-
-    for key_node, value_node in node.value:
-        key = loader.construct_object(
-            key_node,
-            deep=deep,
-        )
-
-        if key in result:
-            raise ValueError(
-                f"duplicate YAML key {key!r}"
-            )
-
-        result[key] = loader.construct_object(
-            value_node,
-            deep=deep,
-        )
-
-    return result
-
-
-UniqueYamlLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-    _unique_yaml_mapping,
-)
-
-
-def _unique_json_object(
-    pairs: list[tuple[str, Any]],
-) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-
-    for key, value in pairs:
-        if key in result:
-            raise ValueError(
-                f"duplicate JSON key {key!r}"
-            )
-
-        result[key] = value
-
-    return result
-
-
-def _reject_nonfinite(value: str) -> None:
-    raise ValueError(
-        f"non-finite JSON constant {value!r}"
-    )
-
-
 def load_json(
     path: Path,
     label: str,
@@ -128,11 +77,7 @@ def load_json(
             )
             return None
 
-        payload = json.loads(
-            path.read_text(encoding="utf-8"),
-            object_pairs_hook=_unique_json_object,
-            parse_constant=_reject_nonfinite,
-        )
+        payload = load_json_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(
@@ -162,10 +107,7 @@ def load_yaml(
             )
             return None
 
-        payload = yaml.load(
-            path.read_text(encoding="utf-8"),
-            Loader=UniqueYamlLoader,
-        )
+        payload = load_yaml_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(
@@ -195,16 +137,7 @@ def sha256_file(
             )
             return None
 
-        digest = hashlib.sha256()
-
-        with path.open("rb") as handle:
-            for chunk in iter(
-                lambda: handle.read(65536),
-                b"",
-            ):
-                digest.update(chunk)
-
-        return digest.hexdigest()
+        return _digest_file(path)
 
     except OSError as exc:
         errors.append(
@@ -637,35 +570,11 @@ def validate_schema(
     payload: dict[str, Any],
     schema: dict[str, Any],
 ) -> list[str]:
-    validator = Draft202012Validator(
+    return schema_errors(
+        payload,
         schema,
-        format_checker=FormatChecker(),
     )
 
-    result: list[str] = []
-
-    for error in sorted(
-        validator.iter_errors(payload),
-        key=lambda item: list(
-            item.absolute_path
-        ),
-    ):
-        location = ".".join(
-            str(part)
-            for part in error.absolute_path
-        )
-
-        result.append(
-            (
-                f"{location}: "
-                if location
-                else ""
-            )
-            + error.message
-        )
-
-    return result
-
 
 def json_pointer(
     payload: Any,
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""Shared SHA-256 file digests with a stat-keyed, content-addressed cache.
+
+One pipeline run hashes the same policy, registry, plan, schema and status
+files many times across tools. This module keeps one digest per file, keyed
+by the file's ``(st_dev, st_ino, st_size, st_mtime_ns, st_ctime_ns)``. A
+cached digest is reused only while every key field still matches; any change
+(rewrite, truncate, rename-over, chmod, touch) forces a re-hash. ``ctime``
+cannot be set from user space, so mtime-preserving rewrites are still caught.
+
+Cache layers:
+
+- per-process memory cache (always on);
+- optional persistent JSON cache shared across tool processes, enabled by
+  pointing ``PULSE_DIGEST_CACHE`` at a file (written atomically at exit).
+
+Racy entries are never stored: a file whose mtime lies within
+``RACY_WINDOW_NS`` of the hash could change again inside the same timestamp
+tick, so its digest is recomputed on the next lookup (the same rule git
+applies to its index).
+
+Strict mode always re-hashes and only refreshes the cache. Release-grade
+verifiers call ``sha256_file(path, strict=True)``; ``PULSE_DIGEST_STRICT=1``
+forces strict mode for every caller.
+
+``sha256_many`` hashes a batch of files on a thread pool (hashlib releases
+the GIL while digesting large buffers). Files of ``MMAP_THRESHOLD`` bytes or
+more are hashed through a read-only memory map; smaller files are read into a
+reused ``CHUNK_SIZE`` buffer. ``prefetch_inventory_digests`` feeds it the
+files listed in a package digest inventory.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+
+CACHE_ENV = "PULSE_DIGEST_CACHE"
+STRICT_ENV = "PULSE_DIGEST_STRICT"
+CACHE_SCHEMA = "pulse_file_digest_cache_v0"
+
+RACY_WINDOW_NS = 2_000_000_000
+CHUNK_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) + 4)
+
+StatKey = tuple[int, int, int, int, int]
+
+_LOCK = threading.Lock()
+_MEMORY: dict[str, tuple[StatKey, str]] = {}
+_PERSISTENT_PATH: Path | None = None
+_PERSISTENT_LOADED = False
+_DIRTY = False
+_STATS = {
+    "calls": 0,
+    "hashed": 0,
+    "cache_hits": 0,
+    "bytes_hashed": 0,
+    "bytes_avoided": 0,
+}
+
+
+def _env_flag(name: str) -> bool:
+    raw = os.getenv(name)
+    if not isinstance(raw, str):
+        return False
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def stat_key(st: os.stat_result) -> StatKey:
+    return (
+        int(st.st_dev),
+        int(st.st_ino),
+        int(st.st_size),
+        int(st.st_mtime_ns),
+        int(st.st_ctime_ns),
+    )
+
+
+def _hash_open_file(path: Path) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    total = 0
+
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                digest.update(view)
+                total = len(view)
+
+            # Anything appended after the map was taken.
+            handle.seek(total)
+
+        buffer = bytearray(CHUNK_SIZE)
+        window = memoryview(buffer)
+
+        while True:
+            count = handle.readinto(buffer)
+            if not count:
+                break
+            digest.update(window[:count])
+            total += count
+
+    return digest.hexdigest(), total
+
+
+def _persistent_path() -> Path | None:
+    raw = os.getenv(CACHE_ENV, "").strip()
+    return Path(raw).expanduser().resolve() if raw else None
+
+
+def _read_persistent(path: Path) -> dict[str, tuple[StatKey, str]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(payload, dict) or payload.get("schema") != CACHE_SCHEMA:
+        return {}
+
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+
+    out: dict[str, tuple[StatKey, str]] = {}
+
+    for name, item in entries.items():
+        if not isinstance(name, str) or not isinstance(item, dict):
+            continue
+
+        key = item.get("key")
+        digest = item.get("sha256")
+
+        if (
+            isinstance(key, list)
+            and len(key) == 5
+            and all(isinstance(v, int) and not isinstance(v, bool) for v in key)
+            and isinstance(digest, str)
+            and len(digest) == 64
+        ):
+            out[name] = (tuple(key), digest)  # type: ignore[arg-type]
+
+    return out
+
+
+def _ensure_persistent_loaded() -> None:
+    global _PERSISTENT_LOADED, _PERSISTENT_PATH
+
+    if _PERSISTENT_LOADED:
+        return
+
+    _PERSISTENT_LOADED = True
+    _PERSISTENT_PATH = _persistent_path()
+
+    if _PERSISTENT_PATH is None:
+        return
+
+    for name, entry in _read_persistent(_PERSISTENT_PATH).items():
+        _MEMORY.setdefault(name, entry)
+
+    atexit.register(flush)
+
+
+def flush() -> None:
+    """Write the persistent cache (if enabled and changed) atomically."""
+    global _DIRTY
+
+    with _LOCK:
+        path = _PERSISTENT_PATH
+
+        if path is None or not _DIRTY:
+            return
+
+        # Merge with entries written by concurrent tool processes; our own
+        # (newer) entries win.
+        merged = _read_persistent(path)
+        merged.update(_MEMORY)
+
+        payload = {
+            "schema": CACHE_SCHEMA,
+            "entries": {
+                name: {"key": list(key), "sha256": digest}
+                for name, (key, digest) in sorted(merged.items())
+            },
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f".{path.name}.",
+                dir=str(path.parent),
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, sort_keys=True)
+            os.replace(tmp_name, path)
+        except OSError:
+            # The cache is an optimisation; never fail a tool over it.
+            return
+
+        _DIRTY = False
+
+
+def clear_cache() -> None:
+    """Drop the in-memory cache and counters (the persistent file is kept)."""
+    global _PERSISTENT_LOADED, _PERSISTENT_PATH, _DIRTY
+
+    with _LOCK:
+        _MEMORY.clear()
+        _PERSISTENT_LOADED = False
+        _PERSISTENT_PATH = None
+        _DIRTY = False
+
+        for name in _STATS:
+            _STATS[name] = 0
+
+
+def digest_stats() -> dict[str, int]:
+    with _LOCK:
+        return dict(_STATS)
+
+
+def sha256_file(path: Path | str, *, strict: bool = False) -> str:
+    """Return the SHA-256 hex digest of a regular file.
+
+    Raises OSError when the file cannot be read, like a plain open().
+    """
+    global _DIRTY
+
+    path = Path(path)
+    strict = strict or _env_flag(STRICT_ENV)
+    name = str(path.resolve())
+
+    before = stat_key(os.stat(path))
+
+    with _LOCK:
+        _ensure_persistent_loaded()
+        _STATS["calls"] += 1
+        cached = _MEMORY.get(name)
+
+        if not strict and cached is not None and cached[0] == before:
+            _STATS["cache_hits"] += 1
+            _STATS["bytes_avoided"] += before[2]
+            return cached[1]
+
+    digest, size = _hash_open_file(path)
+    hashed_at = time.time_ns()
+    after = stat_key(os.stat(path))
+
+    with _LOCK:
+        _STATS["hashed"] += 1
+        _STATS["bytes_hashed"] += size
+
+        stable = before == after and size == after[2]
+        racy = hashed_at - after[3] < RACY_WINDOW_NS
+
+        if stable and not racy:
+            if _MEMORY.get(name) != (after, digest):
+                _MEMORY[name] = (after, digest)
+                _DIRTY = True
+        else:
+            _MEMORY.pop(name, None)
+
+    return digest
+
+
+def cache_info() -> dict[str, Any]:
+    with _LOCK:
+        return {
+            "entries": len(_MEMORY),
+            "persistent_path": (
+                str(_PERSISTENT_PATH) if _PERSISTENT_PATH is not None else None
+            ),
+        }
+
+
+def sha256_many(
+    paths: Iterable[Path | str],
+    *,
+    strict: bool = False,
+    jobs: int | None = None,
+    errors: dict[Path, OSError] | None = None,
+) -> dict[Path, str]:
+    """Hash many files concurrently; return ``{path: hex digest}``.
+
+    Paths that cannot be hashed are left out of the result and, when
+    ``errors`` is given, recorded there with the OSError raised. Each digest
+    is identical to ``sha256_file(path, strict=strict)``.
+    """
+    unique = list(dict.fromkeys(Path(path) for path in paths))
+    workers = DEFAULT_JOBS if jobs is None else jobs
+
+    if workers <= 0:
+        raise ValueError("jobs must be greater than zero")
+
+    def one(path: Path) -> str | OSError:
+        try:
+            return sha256_file(path, strict=strict)
+        except OSError as exc:
+            return exc
+
+    if workers == 1 or len(unique) <= 1:
+        results = [one(path) for path in unique]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as pool:
+            results = list(pool.map(one, unique))
+
+    digests: dict[Path, str] = {}
+
+    for path, result in zip(unique, results):
+        if isinstance(result, OSError):
+            if errors is not None:
+                errors[path] = result
+        else:
+            digests[path] = result
+
+    return digests
+
+
+def prefetch_inventory_digests(
+    root: Path | str,
+    entries: Iterable[Any],
+    *,
+    strict: bool = False,
+    jobs: int | None = None,
+) -> dict[Path, str]:
+    """Hash every regular file named by a digest inventory in one batch.
+
+    ``entries`` are inventory items of the form ``{"path": "<relative>"}``.
+    Entries that are not objects, have no relative string path, resolve
+    outside ``root`` or do not name a regular non-symlink file are skipped,
+    so callers still validate each entry themselves and look its digest up
+    by the normalised absolute path.
+    """
+    base = Path(os.path.abspath(os.path.normpath(str(root))))
+    paths: list[Path] = []
+
+    for item in entries:
+        relative = item.get("path") if isinstance(item, dict) else None
+
+        if not isinstance(relative, str) or not relative or relative.startswith("/"):
+            continue
+
+        path = Path(os.path.abspath(os.path.normpath(str(base / relative))))
+
+        try:
+            path.relative_to(base)
+        except ValueError:
+            continue
+
+        if path.is_file() and not path.is_symlink():
+            paths.append(path)
+
+    return sha256_many(paths, strict=strict, jobs=jobs)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Buffered, lock-safe JSONL appends shared by the PULSE log writers.
+
+The hazard log, the status history and the delta log used to open, append
+and close their file once per record. That is fine for one record per CI
+run, but backfills and replays write thousands of records and the
+per-record open/write/close (and serialisation) dominates.
+
+``JsonlAppender`` is a group-commit writer:
+
+- records are serialised on ``append`` (so later mutation of the caller's
+  dict cannot change what is logged) and buffered;
+- a batch is written with a single ``write`` once ``batch_size`` records or
+  ``max_buffer_bytes`` bytes are pending, on ``flush()`` and on close;
+- each batch is written under an exclusive ``flock`` on the target file, so
+  concurrent CI shards appending to the same file never interleave partial
+  lines. If the file was replaced (rotated / sealed) while waiting for the
+  lock, it is reopened, so no batch lands in a moved file;
+- ``fsync=True`` fsyncs once per batch (group fsync) for durability.
+
+Locking is advisory and only available where ``fcntl`` exists (POSIX); on
+other platforms batches are still written with one ``O_APPEND`` write each.
+
+Use it as a context manager::
+
+    with JsonlAppender(path, batch_size=512) as sink:
+        for record in records:
+            sink.append(record)
+
+``batch_size=1`` reproduces the historical one-write-per-record behaviour.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_MAX_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Called with the target path while the batch lock is held, just before the
+# batch is written. Returns True if it replaced or removed the file.
+BeforeWriteHook = Callable[[Path], bool]
+
+
+class JsonlAppender:
+    """Buffered JSONL appender with per-batch file locking and group fsync."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+        fsync: bool = False,
+        lock: bool = True,
+        sort_keys: bool = True,
+        ensure_ascii: bool = True,
+        before_write: Optional[BeforeWriteHook] = None,
+    ) -> None:
+        if int(batch_size) < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self.path = Path(path)
+        self.batch_size = int(batch_size)
+        self.max_buffer_bytes = int(max_buffer_bytes)
+        self.fsync = bool(fsync)
+        self.lock = bool(lock) and fcntl is not None
+        self.sort_keys = bool(sort_keys)
+        self.ensure_ascii = bool(ensure_ascii)
+        self.before_write = before_write
+
+        self.records_written = 0
+        self.batches_written = 0
+
+        self._buf: List[bytes] = []
+        self._buf_bytes = 0
+        self._closed = False
+
+    # -- buffering ---------------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        """Number of records buffered but not yet written."""
+        return len(self._buf)
+
+    def append(self, record: Any) -> None:
+        """Serialise and buffer one record; flushes when the batch is full."""
+        if self._closed:
+            raise ValueError(f"append to closed JsonlAppender for {self.path}")
+
+        line = (
+            json.dumps(
+                record,
+                sort_keys=self.sort_keys,
+                ensure_ascii=self.ensure_ascii,
+            )
+            + "\n"
+        ).encode("utf-8")
+
+        self._buf.append(line)
+        self._buf_bytes += len(line)
+
+        if len(self._buf) >= self.batch_size or self._buf_bytes >= self.max_buffer_bytes:
+            self.flush()
+
+    def extend(self, records: Iterable[Any]) -> int:
+        """Append every record; returns how many were appended."""
+        n = 0
+        for record in records:
+            self.append(record)
+            n += 1
+        return n
+
+    # -- writing -----------------------------------------------------------
+
+    def _open_locked(self) -> BinaryIO:
+        # Lock the file and make sure it is still the one at self.path; a
+        # writer that rotated it while we waited leaves us holding the old
+        # inode, so reopen.
+        while True:
+            f = self.path.open("ab")
+            if not self.lock:
+                return f
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                if os.path.samestat(os.fstat(f.fileno()), os.stat(self.path)):
+                    return f
+            except FileNotFoundError:
+                pass
+            except BaseException:
+                f.close()
+                raise
+            f.close()
+
+    def flush(self) -> int:
+        """
+        Write all buffered records as one batch; returns how many were
+        written. Raises OSError if the batch cannot be written, in which
+        case the records stay buffered.
+        """
+        if not self._buf:
+            return 0
+
+        data = b"".join(self._buf)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        f = self._open_locked()
+        try:
+            if self.before_write is not None and self.before_write(self.path):
+                f.close()
+                f = self._open_locked()
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        finally:
+            # Closing the descriptor releases the flock.
+            f.close()
+
+        n = len(self._buf)
+        self.records_written += n
+        self.batches_written += 1
+        self._buf = []
+        self._buf_bytes = 0
+        return n
+
+    def close(self) -> None:
+        """Flush pending records and refuse further appends."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+
+    def __enter__(self) -> "JsonlAppender":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def append_jsonl_records(
+    path: Union[str, Path],
+    records: Iterable[Any],
+    **kwargs: Any,
+) -> int:
+    """Append records to ``path`` in batches; returns how many were written."""
+    with JsonlAppender(path, **kwargs) as sink:
+        return sink.extend(records)
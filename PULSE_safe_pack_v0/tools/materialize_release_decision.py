@@ -5,7 +5,6 @@ import argparse
 import datetime as dt
 import hashlib
 import json
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any
@@ -87,6 +86,8 @@ def _read_yaml(path: Path) -> Any:
 
 
 def _git_sha() -> str | None:
+    import subprocess
+
     try:
         proc = subprocess.run(
             ["git", "rev-parse", "HEAD"],
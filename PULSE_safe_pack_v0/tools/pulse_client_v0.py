@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""Thin client for the optional PULSE evaluation daemon (pulse_daemon_v0.py).
+
+The client only imports the standard library, so a request costs one
+interpreter start plus a Unix-socket round trip. The daemon keeps the gate
+policy, registry, schemas and tool modules warm between requests.
+
+When no daemon is listening (no socket, connection refused, or a platform
+without AF_UNIX), requests fall back to in-process execution: tools run via
+tool_runner_v0's in-process runner and schema validations via
+schema_registry_v0, with the same result shape. ``--no-fallback`` turns a
+missing daemon into an error instead.
+
+Trust: the default socket lives in a per-user directory with mode 0700.
+Before sending anything the client checks that the socket directory and the
+socket belong to the current user and are private, and (where the platform
+reports it) that the listening process runs as the same user. A socket that
+fails these checks is an error, not a fallback. Tools see only an allowlisted
+part of the caller's environment (``tool_environment``; ``--pass-env NAME``
+adds variables) unless the caller passes ``env`` explicitly, with or without
+a daemon.
+
+Usage:
+
+  python PULSE_safe_pack_v0/tools/pulse_client_v0.py ping
+  python PULSE_safe_pack_v0/tools/pulse_client_v0.py run <tool.py> [args...]
+  python PULSE_safe_pack_v0/tools/pulse_client_v0.py check-gates --status s.json --require g1 g2
+  python PULSE_safe_pack_v0/tools/pulse_client_v0.py validate --schema s.json --instance doc.json
+
+Protocol: one JSON object per line in each direction, one request per
+connection (see pulse_daemon_v0.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+
+SOCKET_ENV = "PULSE_DAEMON_SOCKET"
+PROTOCOL = "pulse_daemon_v0"
+DEFAULT_TIMEOUT_S = 600.0
+MAX_MESSAGE_BYTES = 256 * 1024 * 1024
+
+TOOLS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = TOOLS_DIR.parents[1]
+
+# Named tool shortcuts served by the daemon (and by the fallback).
+TOOL_ALIASES = {
+    "check_gates": TOOLS_DIR / "check_gates.py",
+    "render_ledger": TOOLS_DIR / "render_quality_ledger.py",
+    "evaluate_required_gate": TOOLS_DIR / "evaluate_required_gate_v0.py",
+}
+
+
+class DaemonUnavailable(ConnectionError):
+    """No daemon is listening on the socket."""
+
+
+class DaemonTimeout(ConnectionError):
+    """The daemon did not answer within the request timeout."""
+
+
+class DaemonUntrusted(ConnectionError):
+    """The socket or its directory is not private to the current user."""
+
+
+# Environment forwarded to tools when the caller passes no ``env``: the
+# variables the safe-pack tools read, never the whole environment.
+ENV_ALLOWLIST = frozenset(
+    {
+        "PATH", "HOME", "TMPDIR", "LANG", "LC_ALL", "LC_CTYPE", "TZ",
+        "PYTHONPATH", "PYTHONHASHSEED", "PYTHONIOENCODING", "SOURCE_DATE_EPOCH",
+        "CI", "CI_COMMIT_SHA", "BUILD_SOURCEVERSION", "GIT_COMMIT", "GIT_BRANCH",
+        "GITHUB_SHA", "GITHUB_REF", "GITHUB_REF_NAME", "GITHUB_REPOSITORY",
+        "GITHUB_WORKFLOW", "GITHUB_WORKFLOW_REF", "GITHUB_RUN_ID", "GITHUB_RUN_ATTEMPT",
+        "GITHUB_EVENT_NAME", "GITHUB_OUTPUT", "GITHUB_STEP_SUMMARY",
+    }
+)
+ENV_PREFIXES = ("PULSE_", "EPF_")
+_SECRET_MARKERS = ("TOKEN", "SECRET", "PASSWORD", "CREDENTIAL")
+
+
+def tool_environment(extra: Sequence[str] = ()) -> dict[str, str]:
+    """The allowlisted part of os.environ, plus the variables named in ``extra``."""
+    env: dict[str, str] = {}
+    for name, value in os.environ.items():
+        if name in extra or name in ENV_ALLOWLIST:
+            env[name] = value
+        elif name.startswith(ENV_PREFIXES) and not any(m in name for m in _SECRET_MARKERS):
+            env[name] = value
+    return env
+
+
+def default_socket_path() -> Path:
+    """Socket path: $PULSE_DAEMON_SOCKET, else a per-user 0700 directory in the runtime/temp dir."""
+    explicit = os.getenv(SOCKET_ENV, "").strip()
+    if explicit:
+        return Path(explicit)
+
+    base = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(base) / f"pulse_daemon_v0-{uid}" / "daemon.sock"
+
+
+def check_private_dir(directory: Path) -> None:
+    """Raise DaemonUntrusted unless ``directory`` is ours and only we can write to it."""
+    if not hasattr(os, "getuid"):
+        return
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o022:
+        raise DaemonUntrusted(
+            f"socket directory {directory} must be a directory owned by uid {os.getuid()} "
+            f"and not writable by others (uid {st.st_uid}, mode {stat.S_IMODE(st.st_mode):o})"
+        )
+
+
+def check_socket(path: Path) -> None:
+    """Raise DaemonUntrusted unless ``path`` is our socket with mode 0600 in a private directory.
+
+    FileNotFoundError when there is no socket.
+    """
+    if not hasattr(os, "getuid"):
+        return
+    st = os.lstat(path)
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise DaemonUntrusted(
+            f"{path} is not a private socket of uid {os.getuid()} "
+            f"(uid {st.st_uid}, mode {stat.S_IMODE(st.st_mode):o})"
+        )
+    check_private_dir(path.parent)
+
+
+def _check_peer(sock: socket.socket, path: Path) -> None:
+    """Raise DaemonUntrusted when the listening process runs as another user."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    if uid != os.getuid():
+        raise DaemonUntrusted(f"the process listening on {path} runs as uid {uid}, not {os.getuid()}")
+
+
+def request(
+    payload: Mapping[str, Any],
+    *,
+    socket_path: Path | None = None,
+    timeout: float | None = DEFAULT_TIMEOUT_S,
+) -> dict[str, Any]:
+    """Send one request to the daemon and return its response.
+
+    Raises DaemonUnavailable when nothing is listening, DaemonUntrusted when
+    the socket is not private to the current user, DaemonTimeout when the
+    daemon does not answer in time, and ConnectionError for a broken or
+    malformed exchange.
+    """
+    path = Path(socket_path or default_socket_path())
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("AF_UNIX sockets are not available on this platform")
+
+    try:
+        check_socket(path)
+    except FileNotFoundError as exc:
+        raise DaemonUnavailable(f"no PULSE daemon at {path}: {exc}") from exc
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+
+    try:
+        try:
+            sock.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise DaemonUnavailable(f"no PULSE daemon at {path}: {exc}") from exc
+        _check_peer(sock, path)
+
+        message = dict(payload)
+        message.setdefault("protocol", PROTOCOL)
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+        chunks: list[bytes] = []
+        size = 0
+        while True:
+            chunk = sock.recv(1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            if chunk.endswith(b"\n") or size > MAX_MESSAGE_BYTES:
+                break
+    except socket.timeout as exc:
+        raise DaemonTimeout(f"PULSE daemon at {path} did not answer within {timeout:g} seconds") from exc
+    finally:
+        sock.close()
+
+    raw = b"".join(chunks)
+    if not raw.endswith(b"\n"):
+        raise ConnectionError(f"incomplete response from PULSE daemon at {path}")
+
+    try:
+        response = json.loads(raw)
+    except ValueError as exc:
+        raise ConnectionError(f"malformed response from PULSE daemon at {path}") from exc
+    if not isinstance(response, dict):
+        raise ConnectionError(f"malformed response from PULSE daemon at {path}")
+    return response
+
+
+def resolve_tool(tool: str, cwd: Path) -> Path:
+    """Resolve an alias or a tool path (relative to cwd) to an absolute path."""
+    alias = TOOL_ALIASES.get(tool.replace("-", "_"))
+    if alias is not None:
+        return alias
+    path = Path(tool)
+    return path if path.is_absolute() else (cwd / path)
+
+
+# ---------------------------------------------------------------------------
+# In-process fallback
+# ---------------------------------------------------------------------------
+
+def _ensure_repo_root_on_syspath() -> None:
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+
+def run_tool_local(
+    tool: Path,
+    argv: Sequence[str],
+    *,
+    cwd: Path,
+    env: Mapping[str, str] | None,
+) -> dict[str, Any]:
+    _ensure_repo_root_on_syspath()
+    from PULSE_safe_pack_v0.tools.tool_runner_v0 import RUNNER_INPROCESS, run_tool
+
+    result = run_tool(
+        [sys.executable, str(tool), *argv],
+        cwd=cwd,
+        env=env,
+        runner=RUNNER_INPROCESS,
+    )
+    return {
+        "ok": True,
+        "returncode": result.returncode,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "runner": result.runner,
+    }
+
+
+def validate_local(schema: Path, instance: Path) -> dict[str, Any]:
+    _ensure_repo_root_on_syspath()
+    from PULSE_safe_pack_v0.tools.schema_registry_v0 import schema_errors
+    from PULSE_safe_pack_v0.tools.strict_load_v0 import load_json_file
+
+    try:
+        schema_doc = load_json_file(schema, copy=False)
+        instance_doc = load_json_file(instance)
+    except (OSError, ValueError) as exc:
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+    errors = schema_errors(instance_doc, schema_doc)
+    return {"ok": True, "valid": not errors, "errors": errors, "runner": "inprocess"}
+
+
+# ---------------------------------------------------------------------------
+# Public helpers
+# ---------------------------------------------------------------------------
+
+def run_tool(
+    tool: str,
+    argv: Sequence[str] = (),
+    *,
+    cwd: Path | None = None,
+    env: Mapping[str, str] | None = None,
+    socket_path: Path | None = None,
+    fallback: bool = True,
+) -> dict[str, Any]:
+    """Run a tool (path or alias) on the daemon, or in-process without one.
+
+    The tool sees ``env`` when given, else ``tool_environment()``. The
+    response carries returncode/stdout/stderr and the tool_runner_v0 runner
+    that executed the tool ("inprocess" or "subprocess").
+    """
+    workdir = Path(cwd) if cwd is not None else Path.cwd()
+    environ = dict(env) if env is not None else tool_environment()
+    tool_path = resolve_tool(tool, workdir)
+
+    try:
+        return request(
+            {
+                "op": "run_tool",
+                "tool": str(tool_path),
+                "argv": [str(a) for a in argv],
+                "cwd": str(workdir),
+                "env": environ,
+            },
+            socket_path=socket_path,
+        )
+    except DaemonUnavailable:
+        if not fallback:
+            raise
+
+    return run_tool_local(tool_path, argv, cwd=workdir, env=environ)
+
+
+def validate(
+    schema: Path,
+    instance: Path,
+    *,
+    socket_path: Path | None = None,
+    fallback: bool = True,
+) -> dict[str, Any]:
+    """Validate a JSON instance against a JSON Schema (daemon or in-process)."""
+    schema_path = Path(schema).resolve()
+    instance_path = Path(instance).resolve()
+
+    try:
+        return request(
+            {"op": "validate", "schema": str(schema_path), "instance": str(instance_path)},
+            socket_path=socket_path,
+        )
+    except DaemonUnavailable:
+        if not fallback:
+            raise
+
+    return validate_local(schema_path, instance_path)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+PASSTHROUGH_COMMANDS = ("run", "check-gates", "render-ledger", "evaluate-required-gate")
+
+
+def _split_tool_args(argv: list[str]) -> tuple[list[str], list[str]]:
+    """Split argv into client arguments and the arguments passed to the tool.
+
+    argparse cannot forward option-like arguments (``--status ...``) through
+    a REMAINDER positional after a subcommand, so they are cut off first.
+    """
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token in ("--socket", "--pass-env"):
+            i += 2
+            continue
+        if token in PASSTHROUGH_COMMANDS:
+            cut = i + (2 if token == "run" else 1)
+            rest = argv[cut:]
+            return argv[:cut], rest[1:] if rest[:1] == ["--"] else rest
+        if not token.startswith("-"):
+            break
+        i += 1
+    return argv, []
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Client for the optional PULSE evaluation daemon.")
+    ap.add_argument("--socket", type=Path, default=None, help=f"Daemon socket (default: ${SOCKET_ENV} or a per-user temp path).")
+    ap.add_argument("--no-fallback", action="store_true", help="Fail instead of running in-process when no daemon is running.")
+    ap.add_argument(
+        "--pass-env",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Also pass this environment variable to the tool (repeatable; default: an allowlist).",
+    )
+
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Run a PULSE tool (path or alias); later arguments go to the tool.")
+    p_run.add_argument("tool")
+
+    for alias in PASSTHROUGH_COMMANDS[1:]:
+        sub.add_parser(alias, help=f"Run the {alias} tool; later arguments go to the tool.")
+
+    p_val = sub.add_parser("validate", help="Validate a JSON document against a JSON Schema.")
+    p_val.add_argument("--schema", type=Path, required=True)
+    p_val.add_argument("--instance", type=Path, required=True)
+
+    for name in ("ping", "stats", "shutdown"):
+        sub.add_parser(name, help=f"Daemon {name}.")
+
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    client_argv, tool_args = _split_tool_args(list(sys.argv[1:] if argv is None else argv))
+    args = parse_args(client_argv)
+    fallback = not args.no_fallback
+
+    try:
+        if args.command in ("ping", "stats", "shutdown"):
+            response = request({"op": args.command}, socket_path=args.socket)
+            print(json.dumps(response, indent=2, sort_keys=True))
+            return 0 if response.get("ok") else 1
+
+        if args.command == "validate":
+            response = validate(args.schema, args.instance, socket_path=args.socket, fallback=fallback)
+            if not response.get("ok"):
+                print(response.get("error", "validation request failed"), file=sys.stderr)
+                return 2
+            for error in response["errors"]:
+                print(error, file=sys.stderr)
+            return 0 if response["valid"] else 1
+
+        tool = args.tool if args.command == "run" else args.command
+        env = tool_environment(args.pass_env)
+        response = run_tool(tool, tool_args, env=env, socket_path=args.socket, fallback=fallback)
+    except ConnectionError as exc:
+        print(f"[pulse_client] {exc}", file=sys.stderr)
+        return 2
+
+    if not response.get("ok"):
+        print(f"[pulse_client] {response.get('error', 'request failed')}", file=sys.stderr)
+        return 2
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("returncode", 1))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,578 @@
+#!/usr/bin/env python3
+"""Optional long-running PULSE evaluation daemon.
+
+Every tool invocation in a local edit/check loop pays interpreter startup,
+the yaml/jsonschema imports, and a fresh parse of the gate policy, registry
+and schemas. The daemon pays those once: it listens on a Unix socket, keeps
+the watched documents parsed (strict_load_v0 cache) and the schemas compiled
+(schema_registry_v0), and runs tools in a warm worker process through
+tool_runner_v0's in-process runner, so each tool module is imported once.
+
+Isolation: tools never run in the daemon process. A request that exceeds its
+``timeout`` (default 300 s) kills the worker, and a tool that exits the
+worker (``os._exit``) or crashes it only loses its own output; the worker is
+replaced for the next request. Global state a tool changes stays in the
+worker, as with tool_runner_v0's in-process runner elsewhere.
+
+Freshness: before every request the watched files are re-digested with
+file_digest_v0 (stat-keyed, so unchanged files cost one ``stat``). A changed
+policy/registry is re-parsed and a changed schema re-compiled. Parse and
+meta-schema errors are listed in ``stats``; while the policy or registry
+fails to load, ``run_tool`` requests are refused rather than served from a
+stale parse. An invalid schema only fails validations against it. Tool entry
+modules are re-imported when their file digest changes. Helper modules
+imported by tools (``*_v0`` libraries) are not reloaded; restart the daemon
+after editing them.
+
+Protocol (one request per connection, one JSON object per line each way):
+
+  {"op": "ping"} | {"op": "stats"} | {"op": "shutdown"}
+  {"op": "run_tool", "tool": "/abs/tool.py" | "check_gates", "argv": [...],
+   "cwd": "/abs/dir", "env": {...}, "timeout": 60}
+  {"op": "validate", "schema": "/abs/schema.json", "instance": "/abs/doc.json"}
+
+Responses always carry ``"ok"``; failed requests carry ``"error"``.
+``run_tool`` responses carry returncode/stdout/stderr/runner exactly like
+tool_runner_v0.ToolRunResult.
+
+The socket is created with mode 0600 and only serves the current user. The
+default socket directory is created with mode 0700; the daemon refuses a
+socket directory that another user owns or can write to. A stale socket file
+(no listener) is replaced; a live daemon on the same path is left alone and
+startup fails.
+
+Usage:
+
+  python PULSE_safe_pack_v0/tools/pulse_daemon_v0.py [--socket PATH] [--idle-timeout 3600]
+
+Clients: pulse_client_v0.py (falls back to in-process execution when no
+daemon is running).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Mapping
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import file_digest_v0  # noqa: E402
+from PULSE_safe_pack_v0.tools import schema_registry_v0  # noqa: E402
+from PULSE_safe_pack_v0.tools import strict_load_v0  # noqa: E402
+from PULSE_safe_pack_v0.tools import tool_runner_v0  # noqa: E402
+from PULSE_safe_pack_v0.tools.pulse_client_v0 import (  # noqa: E402
+    MAX_MESSAGE_BYTES,
+    PROTOCOL,
+    TOOL_ALIASES,
+    DaemonUntrusted,
+    check_private_dir,
+    default_socket_path,
+)
+
+
+DEFAULT_POLICY = REPO_ROOT / "pulse_gate_policy_v0.yml"
+DEFAULT_REGISTRY = REPO_ROOT / "pulse_gate_registry_v0.yml"
+DEFAULT_SCHEMA_DIRS = (REPO_ROOT / "schemas", REPO_ROOT / "PULSE_safe_pack_v0" / "schemas")
+
+# Per-request tool timeout when the request sets none (below the client's
+# socket timeout, so the client gets the daemon's answer).
+DEFAULT_TOOL_TIMEOUT_S = 300.0
+
+
+class WarmState:
+    """Watched documents kept parsed/compiled, refreshed on digest change."""
+
+    def __init__(
+        self,
+        *,
+        yaml_files: tuple[Path, ...] = (DEFAULT_POLICY, DEFAULT_REGISTRY),
+        schema_dirs: tuple[Path, ...] = DEFAULT_SCHEMA_DIRS,
+    ) -> None:
+        self.yaml_files = tuple(Path(p).resolve() for p in yaml_files)
+        self.schema_dirs = tuple(Path(p).resolve() for p in schema_dirs)
+        self._lock = threading.Lock()
+        self._digests: dict[Path, str | None] = {}
+        self._tool_digests: dict[Path, str] = {}
+        self.errors: dict[str, str] = {}
+        self.stats = {"refreshes": 0, "reloads": 0, "tool_reloads": 0}
+
+    def watched(self) -> list[Path]:
+        files = list(self.yaml_files)
+        for directory in self.schema_dirs:
+            if directory.is_dir():
+                files.extend(sorted(directory.glob("*.schema.json")))
+        return files
+
+    def _load(self, path: Path) -> None:
+        if path.suffix in (".yml", ".yaml"):
+            strict_load_v0.load_yaml_file(path, copy=False)
+            return
+
+        schema = strict_load_v0.load_json_file(path, copy=False)
+        if not isinstance(schema, dict):
+            raise ValueError("schema root must be a JSON object")
+        schema_registry_v0.compiled_validator(schema)
+
+    def refresh(self) -> dict[str, str]:
+        """Re-digest watched files, reload changed ones; return current errors."""
+        with self._lock:
+            self.stats["refreshes"] += 1
+            seen: set[Path] = set()
+
+            for path in self.watched():
+                seen.add(path)
+                try:
+                    digest: str | None = file_digest_v0.sha256_file(path)
+                except FileNotFoundError:
+                    digest = None
+
+                if path in self._digests and self._digests[path] == digest:
+                    continue
+
+                self._digests[path] = digest
+                self.stats["reloads"] += 1
+                self.errors.pop(str(path), None)
+
+                if digest is None:
+                    self.errors[str(path)] = "file not found"
+                    continue
+
+                try:
+                    self._load(path)
+                except Exception as exc:  # noqa: BLE001
+                    message = getattr(exc, "message", None) or str(exc)
+                    self.errors[str(path)] = f"{type(exc).__name__}: {message}"
+
+            for path in set(self._digests) - seen:
+                del self._digests[path]
+                self.errors.pop(str(path), None)
+
+            return dict(self.errors)
+
+    def gate_errors(self) -> dict[str, str]:
+        """Refresh, then return the errors of the policy/registry files only."""
+        errors = self.refresh()
+        return {path: errors[path] for path in map(str, self.yaml_files) if path in errors}
+
+    def refresh_tool(self, tool: Path) -> bool:
+        """True when a tool's file changed since its last run (reload it)."""
+        resolved = tool.resolve()
+        try:
+            digest = file_digest_v0.sha256_file(resolved)
+        except OSError:
+            return False
+
+        with self._lock:
+            previous = self._tool_digests.get(resolved)
+            self._tool_digests[resolved] = digest
+
+            if previous is not None and previous != digest:
+                self.stats["tool_reloads"] += 1
+                return True
+            return False
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "watched": len(self._digests),
+                "tools": len(self._tool_digests),
+                "errors": dict(self.errors),
+            }
+
+
+class ToolWorker:
+    """Warm child process that runs the daemon's tool requests one at a time.
+
+    The daemon enforces each request's timeout by killing the worker; a
+    worker that dies (timeout, ``os._exit``, crash) is replaced on the next
+    request, so only that request is affected.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen[bytes] | None = None
+        self.restarts = 0
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        self._proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--tool-worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=str(REPO_ROOT),
+            bufsize=0,
+            start_new_session=hasattr(os, "killpg"),
+        )
+        return self._proc
+
+    def start(self) -> None:
+        """Start the worker now, so its imports overlap the first request."""
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+
+    def _kill(self) -> int:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return 0
+        if hasattr(os, "killpg"):
+            # Also kills subprocesses the current tool started, if any.
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        if proc.poll() is None:
+            proc.kill()
+        code = proc.wait()
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                stream.close()
+        return code
+
+    def close(self) -> None:
+        with self._lock:
+            self._kill()
+
+    def pid(self) -> int | None:
+        proc = self._proc
+        return proc.pid if proc is not None and proc.poll() is None else None
+
+    def run(self, payload: Mapping[str, Any], timeout: float) -> dict[str, Any]:
+        """Send one request; kill the worker when it does not answer in time."""
+        with self._lock:
+            proc = self._proc if self._proc is not None and self._proc.poll() is None else self._start()
+            assert proc.stdin is not None and proc.stdout is not None
+
+            try:
+                proc.stdin.write(json.dumps(payload).encode("utf-8") + b"\n")
+                line = _read_line(proc.stdout.fileno(), timeout)
+            except OSError:
+                line = b""
+
+            if line and line.endswith(b"\n"):
+                return json.loads(line)
+
+            timed_out = line is None
+            if not timed_out:
+                proc.wait()
+            code = self._kill()
+            self.restarts += 1
+
+        if timed_out:
+            return {"ok": False, "error": f"tool timed out after {timeout:g} seconds"}
+        # The tool left the worker process (os._exit) or crashed it.
+        return {
+            "ok": True,
+            "returncode": code,
+            "stdout": "",
+            "stderr": f"[pulse_daemon] tool worker exited with code {code}; tool output was lost\n",
+            "runner": tool_runner_v0.RUNNER_INPROCESS,
+        }
+
+
+def _read_line(fd: int, timeout: float) -> bytes | None:
+    """Read up to and including the first newline; None on timeout."""
+    chunks: list[bytes] = []
+    deadline = time.monotonic() + timeout
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            return None
+        chunk = os.read(fd, 1 << 16)
+        chunks.append(chunk)
+        if not chunk or chunk.endswith(b"\n"):
+            return b"".join(chunks)
+
+
+def _worker_run(request: Mapping[str, Any]) -> dict[str, Any]:
+    tool = Path(str(request["tool"]))
+    if request.get("reload"):
+        tool_runner_v0.forget_tool(tool)
+
+    try:
+        result = tool_runner_v0.run_tool(
+            [sys.executable, str(tool), *request["argv"]],
+            cwd=Path(str(request["cwd"])),
+            env=request.get("env"),
+            runner=tool_runner_v0.RUNNER_INPROCESS,
+        )
+    except Exception as exc:  # noqa: BLE001
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+    return {
+        "ok": True,
+        "returncode": result.returncode,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "runner": result.runner,
+    }
+
+
+def worker_main() -> int:
+    """Tool worker loop: one JSON request per stdin line, one response per line."""
+    # Keep the response stream private: anything a tool writes to fd 1
+    # outside the runner's capture goes to stderr instead.
+    responses = os.fdopen(os.dup(1), "wb", buffering=0)
+    os.dup2(2, 1)
+
+    for line in sys.stdin.buffer:
+        try:
+            response = _worker_run(json.loads(line))
+        except (KeyError, TypeError, ValueError) as exc:
+            response = {"ok": False, "error": f"bad worker request: {exc}"}
+        responses.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    return 0
+
+
+class PulseDaemon:
+    def __init__(
+        self,
+        socket_path: Path,
+        *,
+        state: WarmState | None = None,
+        idle_timeout: float | None = None,
+    ) -> None:
+        self.socket_path = Path(socket_path)
+        self.state = state or WarmState()
+        self.worker = ToolWorker()
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.requests = 0
+        self._last_activity = time.monotonic()
+        self._stop: asyncio.Event | None = None
+
+    # -- request handling ---------------------------------------------------
+
+    def _run_tool(self, request: Mapping[str, Any]) -> dict[str, Any]:
+        errors = self.state.gate_errors()
+        if errors:
+            return {"ok": False, "error": "gate policy/registry failed to load", "errors": errors}
+
+        cwd = Path(str(request.get("cwd") or os.getcwd()))
+        tool_name = str(request.get("tool") or "")
+        tool = TOOL_ALIASES.get(tool_name.replace("-", "_")) or Path(tool_name)
+        if not tool.is_absolute():
+            tool = cwd / tool
+        if not tool_name or not tool.is_file():
+            return {"ok": False, "error": f"tool not found: {tool_name or '<missing>'}"}
+
+        argv = request.get("argv") or []
+        env = request.get("env")
+        if not isinstance(argv, list) or (env is not None and not isinstance(env, dict)):
+            return {"ok": False, "error": "argv must be a list and env an object"}
+
+        try:
+            timeout = float(request.get("timeout") or DEFAULT_TOOL_TIMEOUT_S)
+        except (TypeError, ValueError):
+            timeout = -1.0
+        if not timeout > 0:
+            return {"ok": False, "error": "timeout must be a positive number of seconds"}
+
+        return self.worker.run(
+            {
+                "tool": str(tool),
+                "argv": [str(a) for a in argv],
+                "cwd": str(cwd),
+                "env": {str(k): str(v) for k, v in env.items()} if env is not None else None,
+                "reload": self.state.refresh_tool(tool),
+            },
+            timeout,
+        )
+
+    def _validate(self, request: Mapping[str, Any]) -> dict[str, Any]:
+        self.state.refresh()
+
+        try:
+            schema = strict_load_v0.load_json_file(Path(str(request["schema"])), copy=False)
+            instance = strict_load_v0.load_json_file(Path(str(request["instance"])))
+        except KeyError as exc:
+            return {"ok": False, "error": f"missing field: {exc.args[0]}"}
+        except (OSError, ValueError) as exc:
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+        errors = schema_registry_v0.schema_errors(instance, schema)
+        return {"ok": True, "valid": not errors, "errors": errors, "runner": "daemon"}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_s": round(time.time() - self.started, 3),
+            "requests": self.requests,
+            "state": self.state.snapshot(),
+            "tool_worker": {"pid": self.worker.pid(), "restarts": self.worker.restarts},
+            "strict_load": strict_load_v0.cache_stats(),
+            "schema_registry": schema_registry_v0.registry_stats(),
+            "file_digest": file_digest_v0.digest_stats(),
+        }
+
+    async def dispatch(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+        if request.get("protocol", PROTOCOL) != PROTOCOL:
+            return {"ok": False, "error": f"unsupported protocol: {request.get('protocol')!r}"}
+
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "protocol": PROTOCOL}
+        if op == "stats":
+            return await asyncio.to_thread(self.stats)
+        if op == "shutdown":
+            assert self._stop is not None
+            self._stop.set()
+            return {"ok": True}
+        if op == "run_tool":
+            return await asyncio.to_thread(self._run_tool, request)
+        if op == "validate":
+            return await asyncio.to_thread(self._validate, request)
+        return {"ok": False, "error": f"unknown op: {op!r}"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._last_activity = time.monotonic()
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            self.requests += 1
+            try:
+                response = await self.dispatch(json.loads(line))
+            except json.JSONDecodeError as exc:
+                response = {"ok": False, "error": f"invalid JSON request: {exc}"}
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self._last_activity = time.monotonic()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def _claim_socket(self) -> None:
+        parent = self.socket_path.parent
+        if not parent.exists():
+            parent.mkdir(mode=0o700, parents=True)
+        try:
+            check_private_dir(parent)
+        except DaemonUntrusted as exc:
+            raise RuntimeError(f"refusing to listen: {exc}") from exc
+
+        if not os.path.lexists(self.socket_path):
+            return
+        if hasattr(os, "getuid") and os.lstat(self.socket_path).st_uid != os.getuid():
+            raise RuntimeError(f"refusing to replace {self.socket_path}: owned by another user")
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            self.socket_path.unlink(missing_ok=True)
+        else:
+            raise RuntimeError(f"a PULSE daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    async def _idle_watch(self) -> None:
+        assert self._stop is not None and self.idle_timeout is not None
+        while not self._stop.is_set():
+            await asyncio.sleep(min(self.idle_timeout, 1.0))
+            if time.monotonic() - self._last_activity >= self.idle_timeout:
+                self._stop.set()
+
+    async def serve(self, ready: threading.Event | None = None) -> None:
+        self._stop = asyncio.Event()
+        self._claim_socket()
+        await asyncio.to_thread(self.state.refresh)
+
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._handle, path=str(self.socket_path), limit=MAX_MESSAGE_BYTES
+            )
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+
+        idle = asyncio.create_task(self._idle_watch()) if self.idle_timeout else None
+
+        try:
+            self.worker.start()
+            if ready is not None:
+                ready.set()
+
+            async with server:
+                await self._stop.wait()
+        finally:
+            if idle is not None:
+                idle.cancel()
+            self.socket_path.unlink(missing_ok=True)
+            await asyncio.to_thread(self.worker.close)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Long-running PULSE evaluation daemon (Unix socket).")
+    ap.add_argument("--socket", type=Path, default=None, help="Socket path (default: $PULSE_DAEMON_SOCKET or a per-user temp path).")
+    ap.add_argument("--policy", type=Path, default=DEFAULT_POLICY, help="Gate policy YAML to keep warm.")
+    ap.add_argument("--registry", type=Path, default=DEFAULT_REGISTRY, help="Gate registry YAML to keep warm.")
+    ap.add_argument(
+        "--schema-dir",
+        type=Path,
+        action="append",
+        default=None,
+        help="Directory of *.schema.json files to keep compiled (repeatable; default: schemas/ and PULSE_safe_pack_v0/schemas/).",
+    )
+    ap.add_argument("--idle-timeout", type=float, default=None, help="Exit after this many idle seconds.")
+    ap.add_argument("--tool-worker", action="store_true", help=argparse.SUPPRESS)
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(list(sys.argv[1:] if argv is None else argv))
+
+    if args.tool_worker:
+        return worker_main()
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("[pulse_daemon] AF_UNIX sockets are not available on this platform", file=sys.stderr)
+        return 2
+
+    state = WarmState(
+        yaml_files=(args.policy, args.registry),
+        schema_dirs=tuple(args.schema_dir) if args.schema_dir else DEFAULT_SCHEMA_DIRS,
+    )
+    daemon = PulseDaemon(args.socket or default_socket_path(), state=state, idle_timeout=args.idle_timeout)
+
+    try:
+        asyncio.run(daemon.serve())
+    except RuntimeError as exc:
+        print(f"[pulse_daemon] {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -22,8 +22,6 @@ from html import escape
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
-import yaml
-
 
 def jload(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
@@ -53,6 +51,8 @@ def as_str_list(value: Any) -> List[str]:
 
 
 def yload(path: Path) -> Dict[str, Any]:
+    import yaml
+
     try:
         with path.open("r", encoding="utf-8") as f:
             obj = yaml.safe_load(f)
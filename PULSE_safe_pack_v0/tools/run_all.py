@@ -10,12 +10,10 @@ which are then consumed by CI workflows and reporting tools.
 
 import argparse
 import datetime
-import hashlib
 import json
 import os
 import pathlib
 import shutil
-import subprocess
 import sys
 from typing import Any, Optional, Tuple
 
@@ -25,87 +23,99 @@ REPO_ROOT = ROOT.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from PULSE_safe_pack_v0.tools.render_quality_ledger import (  # noqa: E402
-    write_quality_ledger,
+from PULSE_safe_pack_v0.tools.file_digest_v0 import sha256_file  # noqa: E402
+from PULSE_safe_pack_v0.tools.tool_runner_v0 import (  # noqa: E402
+    SUPPORTED_RUNNERS,
+    default_runner,
+    resolve_runner,
+    run_tool,
 )
 
-# Allow tests / callers to override artifact output directory.
-# Default remains pack_root/artifacts to preserve existing behavior.
-ART_DIR_ENV = os.getenv("PULSE_ARTIFACT_DIR")
-art = pathlib.Path(ART_DIR_ENV) if ART_DIR_ENV else (ROOT / "artifacts")
-art.mkdir(parents=True, exist_ok=True)
-
-now = datetime.datetime.utcnow().isoformat() + "Z"
-
 SUPPORTED_MODES = ("demo", "core", "prod")
 
 
 def _sha256_file(p: pathlib.Path) -> str | None:
     try:
-        h = hashlib.sha256()
-        with p.open("rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        return sha256_file(p)
     except Exception:
         return None
 
 
-parser = argparse.ArgumentParser(add_help=True)
+def _env_flag(name: str) -> bool:
+    raw = os.getenv(name)
+    if not isinstance(raw, str):
+        return False
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
 
-_env_raw = os.getenv("PULSE_RUN_MODE")
-_env_mode = _env_raw.strip().lower() if isinstance(_env_raw, str) and _env_raw.strip() else None
 
-if _env_mode is not None and _env_mode not in SUPPORTED_MODES:
-    parser.error(
-        f"Invalid PULSE_RUN_MODE='{_env_raw}'. Expected one of: {', '.join(SUPPORTED_MODES)}"
-    )
+def resolve_artifact_dir() -> pathlib.Path:
+    # Allow tests / callers to override artifact output directory.
+    # Default remains pack_root/artifacts to preserve existing behavior.
+    art_dir_env = os.getenv("PULSE_ARTIFACT_DIR")
+    return pathlib.Path(art_dir_env) if art_dir_env else (ROOT / "artifacts")
 
-_default_mode = _env_mode or "demo"
 
-parser.add_argument(
-    "--mode",
-    type=str.lower,
-    choices=list(SUPPORTED_MODES),
-    default=_default_mode,
-    help="Run profile: demo|core|prod (default: PULSE_RUN_MODE or demo)",
-)
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse run_all arguments; ``args.tool_runner`` is returned resolved."""
+    parser = argparse.ArgumentParser(add_help=True)
 
-# Accept existing workflow args (may be used for provenance even if pack is self-contained)
-parser.add_argument("--pack_dir", default=str(ROOT))
-parser.add_argument("--gate_policy", default=str(REPO_ROOT / "pulse_gate_policy_v0.yml"))
+    env_raw = os.getenv("PULSE_RUN_MODE")
+    env_mode = env_raw.strip().lower() if isinstance(env_raw, str) and env_raw.strip() else None
 
+    if env_mode is not None and env_mode not in SUPPORTED_MODES:
+        parser.error(
+            f"Invalid PULSE_RUN_MODE='{env_raw}'. Expected one of: {', '.join(SUPPORTED_MODES)}"
+        )
 
-def _env_flag(name: str) -> bool:
-    raw = os.getenv(name)
-    if not isinstance(raw, str):
-        return False
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    parser.add_argument(
+        "--mode",
+        type=str.lower,
+        choices=list(SUPPORTED_MODES),
+        default=env_mode or "demo",
+        help="Run profile: demo|core|prod (default: PULSE_RUN_MODE or demo)",
+    )
 
+    # Accept existing workflow args (may be used for provenance even if pack is self-contained)
+    parser.add_argument("--pack_dir", default=str(ROOT))
+    parser.add_argument("--gate_policy", default=str(REPO_ROOT / "pulse_gate_policy_v0.yml"))
+    parser.add_argument(
+        "--release-grade-materialized",
+        action="store_true",
+        default=_env_flag("PULSE_RELEASE_GRADE_MATERIALIZED"),
+        help=(
+            "Explicit prod-only preparation path for non-stubbed release-grade "
+            "materialization. Without this opt-in, prod fails closed."
+        ),
+    )
+    parser.add_argument(
+        "--tool-runner",
+        default=default_runner(),
+        help=(
+            f"Child tool execution mode: {'|'.join(SUPPORTED_RUNNERS)} "
+            "(default: PULSE_TOOL_RUNNER or subprocess)"
+        ),
+    )
+    args, _unknown = parser.parse_known_args(argv)
 
-parser.add_argument(
-    "--release-grade-materialized",
-    action="store_true",
-    default=_env_flag("PULSE_RELEASE_GRADE_MATERIALIZED"),
-    help=(
-        "Explicit prod-only preparation path for non-stubbed release-grade "
-        "materialization. Without this opt-in, prod fails closed."
-    ),
-)
-args, _unknown = parser.parse_known_args()
+    args.mode = str(args.mode).strip().lower()
+    args.release_grade_materialized = bool(args.release_grade_materialized)
 
+    if args.release_grade_materialized and args.mode != "prod":
+        parser.error("--release-grade-materialized is prod-only")
+    try:
+        args.tool_runner = resolve_runner(args.tool_runner)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    return args
 
-RUN_MODE = str(args.mode).strip().lower()
-RELEASE_GRADE_MATERIALIZED = bool(args.release_grade_materialized)
 
-if RELEASE_GRADE_MATERIALIZED and RUN_MODE != "prod":
-    parser.error("--release-grade-materialized is prod-only")
-if RUN_MODE == "demo":
-    STATUS_VERSION = "1.0.0-demo"
-elif RUN_MODE == "core":
-    STATUS_VERSION = "1.0.0-core"
-else:
-    STATUS_VERSION = "1.0.0"
+def _status_version(run_mode: str) -> str:
+    if run_mode == "demo":
+        return "1.0.0-demo"
+    if run_mode == "core":
+        return "1.0.0-core"
+    return "1.0.0"
 
 
 # Stability Map artefact (additive)
@@ -199,8 +209,14 @@ def materialize_release_grade_inputs(
     )
 
 
-def build_release_authority_manifest(status_path: pathlib.Path) -> pathlib.Path:
-    out_path = art / "release_authority_v0.json"
+def build_release_authority_manifest(
+    status_path: pathlib.Path,
+    *,
+    art_dir: pathlib.Path,
+    gate_policy: pathlib.Path,
+    tool_runner: str,
+) -> pathlib.Path:
+    out_path = art_dir / "release_authority_v0.json"
     builder = ROOT / "tools" / "build_release_authority_manifest_v0.py"
     registry = REPO_ROOT / "pulse_gate_registry_v0.yml"
     evaluator = ROOT / "tools" / "check_gates.py"
@@ -211,7 +227,7 @@ def build_release_authority_manifest(status_path: pathlib.Path) -> pathlib.Path:
         "--status",
         str(status_path),
         "--policy",
-        str(pathlib.Path(str(args.gate_policy))),
+        str(gate_policy),
         "--registry",
         str(registry),
         "--evaluator",
@@ -224,13 +240,7 @@ def build_release_authority_manifest(status_path: pathlib.Path) -> pathlib.Path:
         str(out_path),
     ]
 
-    result = subprocess.run(
-        cmd,
-        cwd=str(REPO_ROOT),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+    result = run_tool(cmd, cwd=REPO_ROOT, runner=tool_runner)
     if result.returncode != 0:
         fail_closed(
             "release authority manifest build failed:\n"
@@ -248,8 +258,9 @@ def write_release_authority_audit_bundle(
     status_path: pathlib.Path,
     report_path: pathlib.Path,
     manifest_path: pathlib.Path,
+    art_dir: pathlib.Path,
 ) -> pathlib.Path:
-    bundle = art / AUDIT_BUNDLE_DIRNAME
+    bundle = art_dir / AUDIT_BUNDLE_DIRNAME
     bundle.mkdir(parents=True, exist_ok=True)
 
     for src in (status_path, report_path, manifest_path):
@@ -260,36 +271,17 @@ def write_release_authority_audit_bundle(
     return bundle
 
 
-from PULSE_safe_pack_v0.epf.epf_hazard_adapter import (  # noqa: E402
-    HazardRuntimeState,
-    probe_hazard_and_append_log,
-)
-from PULSE_safe_pack_v0.epf.epf_hazard_policy import (  # noqa: E402
-    HazardGateConfig,
-    evaluate_hazard_gate,
-)
-from PULSE_safe_pack_v0.epf.epf_hazard_forecast import (  # noqa: E402
-    CALIBRATED_CRIT_THRESHOLD,
-    CALIBRATED_WARN_THRESHOLD,
-    DEFAULT_CRIT_THRESHOLD,
-    DEFAULT_WARN_THRESHOLD,
-    MIN_CALIBRATION_SAMPLES,
-)
+def hazard_calibration_path(art_dir: pathlib.Path) -> pathlib.Path:
+    """Calibration path: prefer same filename inside the selected artifacts dir, if present."""
+    try:
+        from PULSE_safe_pack_v0.epf.epf_hazard_forecast import (
+            CALIBRATION_PATH as default_path,
+        )
+    except Exception:  # pragma: no cover
+        default_path = ROOT / "artifacts" / "epf_hazard_thresholds_v0.json"
 
-# Calibration path: prefer same filename inside the selected artifacts dir, if present.
-try:
-    from PULSE_safe_pack_v0.epf.epf_hazard_forecast import (  # noqa: E402
-        CALIBRATION_PATH as _HAZARD_CALIB_PATH_DEFAULT,
-    )
-except Exception:  # pragma: no cover
-    _HAZARD_CALIB_PATH_DEFAULT = ROOT / "artifacts" / "epf_hazard_thresholds_v0.json"
-
-_hazard_calib_candidate = art / pathlib.Path(_HAZARD_CALIB_PATH_DEFAULT).name
-HAZARD_CALIB_PATH = (
-    _hazard_calib_candidate
-    if _hazard_calib_candidate.exists()
-    else pathlib.Path(_HAZARD_CALIB_PATH_DEFAULT)
-)
+    candidate = art_dir / pathlib.Path(default_path).name
+    return candidate if candidate.exists() else pathlib.Path(default_path)
 
 
 # ---------------------------------------------------------------------------
@@ -304,6 +296,8 @@ def get_git_sha(repo_root: pathlib.Path) -> Optional[str]:
     if isinstance(sha, str) and sha.strip():
         return sha.strip()
 
+    import subprocess
+
     try:
         out = subprocess.check_output(
             ["git", "rev-parse", "HEAD"],
@@ -334,6 +328,8 @@ def get_run_key() -> Optional[str]:
     return "|".join(parts) if parts else None
 
 
+# run_all appends to the hazard log, so its reads also keep the sidecar index
+# current (persist=True); read-only consumers leave the index untouched.
 def load_hazard_T_history(
     log_path: pathlib.Path,
     *,
@@ -344,29 +340,35 @@ def load_hazard_T_history(
     Load recent hazard T history for a given gate_id from epf_hazard_log.jsonl.
     Returns oldest->newest, last max_points items.
     """
-    if not log_path.exists():
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import HazardLogStore, hazard_log_exists
+
+    if not hazard_log_exists(log_path):
         return []
 
-    values: list[float] = []
-    with log_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    return _tail_hazard_values(
+        HazardLogStore(log_path, persist=True).iter_gate_reverse(str(gate_id)),
+        "T",
+        max_points,
+    )
 
-            if str(obj.get("gate_id", "")) != str(gate_id):
-                continue
 
-            hazard = obj.get("hazard", {}) or {}
-            T = hazard.get("T")
-            if isinstance(T, (int, float)):
-                values.append(float(T))
+def _tail_hazard_values(entries, key: str, max_points: int) -> list[float]:
+    """
+    Collect the last max_points numeric hazard[key] values from entries given
+    newest->oldest; returns oldest->newest. max_points <= 0 keeps everything
+    (the historical values[-0:] behaviour).
+    """
+    values: list[float] = []
+    for obj in entries:
+        hazard = obj.get("hazard", {}) or {}
+        v = hazard.get(key)
+        if isinstance(v, (int, float)):
+            values.append(float(v))
+            if 0 < max_points <= len(values):
+                break
 
-    return values[-max_points:]
+    values.reverse()
+    return values
 
 
 def compute_baseline_ok(gates: dict) -> bool:
@@ -478,29 +480,21 @@ def load_hazard_E_history(
 
     If gate_id is provided, only values from that series are returned.
     """
-    if not log_path.exists():
-        return []
-
-    values: list[float] = []
-    with log_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (
+        HazardLogStore,
+        hazard_log_exists,
+        iter_entries_reverse,
+    )
 
-            if gate_id is not None and str(obj.get("gate_id", "")) != str(gate_id):
-                continue
+    if not hazard_log_exists(log_path):
+        return []
 
-            hazard = obj.get("hazard", {}) or {}
-            E = hazard.get("E")
-            if isinstance(E, (int, float)):
-                values.append(float(E))
+    if gate_id is None:
+        entries = iter_entries_reverse(log_path)
+    else:
+        entries = HazardLogStore(log_path, persist=True).iter_gate_reverse(str(gate_id))
 
-    return values[-max_points:] if values else []
+    return _tail_hazard_values(entries, "E", max_points)
 
 
 def load_last_hazard_feature_context(
@@ -515,24 +509,19 @@ def load_last_hazard_feature_context(
     If gate_id is provided, selects the last entry for that series.
     Fail-open for older logs.
     """
-    if not log_path.exists():
-        return ([], "none", False)
-
-    last_obj = None
-    with log_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (
+        HazardLogStore,
+        hazard_log_exists,
+        iter_entries_reverse,
+    )
 
-            if gate_id is not None and str(obj.get("gate_id", "")) != str(gate_id):
-                continue
+    if not hazard_log_exists(log_path):
+        return ([], "none", False)
 
-            last_obj = obj
+    if gate_id is None:
+        last_obj = next(iter_entries_reverse(log_path), None)
+    else:
+        last_obj = HazardLogStore(log_path, persist=True).last(str(gate_id))
 
     if not isinstance(last_obj, dict):
         return ([], "none", False)
@@ -628,303 +617,347 @@ BASE_GATES = {
     "q4_slo_ok": True,
 }
 
-release_grade_metric_overrides: dict[str, Any] = {}
-release_grade_external_section: dict[str, Any] = {}
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
 
-if RUN_MODE in ("demo", "core"):
-    gates = dict(BASE_GATES)  # smoke lanes
-else:
-    if not RELEASE_GRADE_MATERIALIZED:
-        fail_closed(
-            "prod mode is fail-closed without explicit "
-            "--release-grade-materialized / "
-            "PULSE_RELEASE_GRADE_MATERIALIZED=1"
-        )
-    gates = {k: False for k in BASE_GATES.keys()}
-    (
-        release_grade_gate_overrides,
-        release_grade_metric_overrides,
-        release_grade_external_section,
-    ) = materialize_release_grade_inputs(art)
-    gates.update(release_grade_gate_overrides)
-
-metrics = {
-    "RDSI": 0.92 if RUN_MODE in ("demo", "core") else 0.0,
-    "rdsi_note": (
-        "Demo value for CI smoke-run"
-        if RUN_MODE == "demo"
-        else "Core CI smoke-run"
-        if RUN_MODE == "core"
-        else "PROD placeholder: baseline gates are fail-closed until detectors are wired"
-    ),
-    "build_time": now,
-}
+    run_mode = args.mode
+    release_grade_materialized = args.release_grade_materialized
+    status_version = _status_version(run_mode)
+    gate_policy = pathlib.Path(str(args.gate_policy))
 
-if release_grade_metric_overrides:
-    metrics.update(release_grade_metric_overrides)
+    art_dir = resolve_artifact_dir()
+    art_dir.mkdir(parents=True, exist_ok=True)
 
-metrics["run_mode"] = RUN_MODE
+    now = datetime.datetime.utcnow().isoformat() + "Z"
 
-gp = pathlib.Path(str(args.gate_policy))
-metrics["gate_policy_path"] = str(gp)
-h = _sha256_file(gp) if gp.exists() else None
-if h:
-    metrics["gate_policy_sha256"] = h
+    # Heavy imports are deferred until after argument parsing (``--help``
+    # and argument errors stay cheap).
+    from PULSE_safe_pack_v0.epf.epf_hazard_adapter import (
+        HazardRuntimeState,
+        probe_hazard_and_append_log,
+    )
+    from PULSE_safe_pack_v0.epf.epf_hazard_forecast import (
+        CALIBRATED_CRIT_THRESHOLD,
+        CALIBRATED_WARN_THRESHOLD,
+        DEFAULT_CRIT_THRESHOLD,
+        DEFAULT_WARN_THRESHOLD,
+        MIN_CALIBRATION_SAMPLES,
+    )
+    from PULSE_safe_pack_v0.epf.epf_hazard_policy import (
+        HazardGateConfig,
+        evaluate_hazard_gate,
+    )
+    from PULSE_safe_pack_v0.tools.render_quality_ledger import write_quality_ledger
 
+    release_grade_metric_overrides: dict[str, Any] = {}
+    release_grade_external_section: dict[str, Any] = {}
 
-# Baseline gate health excluding hazard shadow gate (topology uses this).
-baseline_ok = compute_baseline_ok(gates)
-metrics["hazard_baseline_ok"] = bool(baseline_ok)
+    if run_mode in ("demo", "core"):
+        gates = dict(BASE_GATES)  # smoke lanes
+    else:
+        if not release_grade_materialized:
+            fail_closed(
+                "prod mode is fail-closed without explicit "
+                "--release-grade-materialized / "
+                "PULSE_RELEASE_GRADE_MATERIALIZED=1"
+            )
+        gates = {k: False for k in BASE_GATES.keys()}
+        (
+            release_grade_gate_overrides,
+            release_grade_metric_overrides,
+            release_grade_external_section,
+        ) = materialize_release_grade_inputs(art_dir)
+        gates.update(release_grade_gate_overrides)
+
+    metrics = {
+        "RDSI": 0.92 if run_mode in ("demo", "core") else 0.0,
+        "rdsi_note": (
+            "Demo value for CI smoke-run"
+            if run_mode == "demo"
+            else "Core CI smoke-run"
+            if run_mode == "core"
+            else "PROD placeholder: baseline gates are fail-closed until detectors are wired"
+        ),
+        "build_time": now,
+    }
 
-# ---------------------------------------------------------------------------
-# EPF hazard probe (field snapshot + cross-run drift seeding)
-# ---------------------------------------------------------------------------
+    if release_grade_metric_overrides:
+        metrics.update(release_grade_metric_overrides)
 
-# Provenance (fail-open)
-run_key = get_run_key()
-git_sha = get_git_sha(REPO_ROOT)
-if run_key:
-    metrics["run_key"] = run_key
-if git_sha:
-    metrics["git_sha"] = git_sha
-
-hazard_log_path = art / "epf_hazard_log.jsonl"
-
-# Stable series id for the field
-hazard_gate_id = "EPF_field_main"
-metrics["hazard_gate_id"] = hazard_gate_id
-
-# Seed drift across runs (history_T)
-seed_T = load_hazard_T_history(hazard_log_path, gate_id=hazard_gate_id, max_points=10)
-metrics["hazard_seed_T_points"] = int(len(seed_T))
-hazard_runtime = HazardRuntimeState(history_T=list(seed_T))
-
-# Build Grail field snapshots (flat dotted keys)
-current_snapshot, reference_snapshot, stability_metrics = build_epf_field_snapshots(metrics, gates)
-
-hazard_state = probe_hazard_and_append_log(
-    gate_id=hazard_gate_id,
-    current_snapshot=current_snapshot,
-    reference_snapshot=reference_snapshot,
-    stability_metrics=stability_metrics,
-    runtime_state=hazard_runtime,
-    log_dir=art,
-    extra_meta={
-        "created_utc": now,
-        "status_version": STATUS_VERSION,
-        "run_key": run_key,
-        "git_sha": git_sha,
-    },
-)
+    metrics["run_mode"] = run_mode
 
-hazard_decision = evaluate_hazard_gate(hazard_state, cfg=HazardGateConfig())
-
-# Surface hazard metrics into status.json metrics.
-metrics["hazard_T"] = hazard_state.T
-metrics["hazard_S"] = hazard_state.S
-metrics["hazard_D"] = hazard_state.D
-metrics["hazard_E"] = hazard_state.E
-metrics["hazard_zone"] = hazard_state.zone
-metrics["hazard_reason"] = hazard_state.reason
-metrics["hazard_ok"] = hazard_decision.ok
-metrics["hazard_severity"] = hazard_decision.severity
-
-# Field topology overlay (diagnostic)
-hazard_topology_region = classify_topology_region(
-    baseline_ok=bool(baseline_ok),
-    hazard_zone=str(hazard_state.zone),
-)
-metrics["hazard_topology_region"] = str(hazard_topology_region)
+    gp = gate_policy
+    metrics["gate_policy_path"] = str(gp)
+    h = _sha256_file(gp) if gp.exists() else None
+    if h:
+        metrics["gate_policy_sha256"] = h
+
+
+    # Baseline gate health excluding hazard shadow gate (topology uses this).
+    baseline_ok = compute_baseline_ok(gates)
+    metrics["hazard_baseline_ok"] = bool(baseline_ok)
+
+    # ---------------------------------------------------------------------------
+    # EPF hazard probe (field snapshot + cross-run drift seeding)
+    # ---------------------------------------------------------------------------
+
+    # Provenance (fail-open)
+    run_key = get_run_key()
+    git_sha = get_git_sha(REPO_ROOT)
+    if run_key:
+        metrics["run_key"] = run_key
+    if git_sha:
+        metrics["git_sha"] = git_sha
+
+    hazard_log_path = art_dir / "epf_hazard_log.jsonl"
 
-hazard_T_scaled = bool(getattr(hazard_state, "T_scaled", False))
-hazard_contributors_top = getattr(hazard_state, "contributors_top", []) or []
-metrics["hazard_T_scaled"] = hazard_T_scaled
-metrics["hazard_contributors_top"] = hazard_contributors_top
+    # Stable series id for the field
+    hazard_gate_id = "EPF_field_main"
+    metrics["hazard_gate_id"] = hazard_gate_id
 
-# Feature-mode context (from the last log event for this gate_id)
-hazard_feature_keys, hazard_feature_mode_source, hazard_feature_mode_active = (
-    load_last_hazard_feature_context(
-        hazard_log_path,
+    # Seed drift across runs (history_T)
+    seed_T = load_hazard_T_history(hazard_log_path, gate_id=hazard_gate_id, max_points=10)
+    metrics["hazard_seed_T_points"] = int(len(seed_T))
+    hazard_runtime = HazardRuntimeState(history_T=list(seed_T))
+
+    # Build Grail field snapshots (flat dotted keys)
+    current_snapshot, reference_snapshot, stability_metrics = build_epf_field_snapshots(metrics, gates)
+
+    hazard_state = probe_hazard_and_append_log(
         gate_id=hazard_gate_id,
+        current_snapshot=current_snapshot,
+        reference_snapshot=reference_snapshot,
+        stability_metrics=stability_metrics,
+        runtime_state=hazard_runtime,
+        log_dir=art_dir,
+        extra_meta={
+            "created_utc": now,
+            "status_version": status_version,
+            "run_key": run_key,
+            "git_sha": git_sha,
+        },
     )
-)
-metrics["hazard_feature_keys"] = hazard_feature_keys
-metrics["hazard_feature_count"] = int(len(hazard_feature_keys))
-metrics["hazard_feature_mode_source"] = str(hazard_feature_mode_source)
-metrics["hazard_feature_mode_active"] = bool(hazard_feature_mode_active)
-feature_mode_label = "ON" if bool(hazard_feature_mode_active) else "OFF"
-
-# Calibration recommendation summary (if present)
-calib_summary = load_calibration_recommendation(pathlib.Path(HAZARD_CALIB_PATH))
-metrics["hazard_recommended_count"] = int(calib_summary.get("recommended_count", 0) or 0)
-metrics["hazard_recommend_min_coverage"] = calib_summary.get("min_coverage")
-metrics["hazard_recommend_max_features"] = calib_summary.get("max_features")
-metrics["hazard_feature_allowlist_count"] = int(
-    calib_summary.get("feature_allowlist_count", 0) or 0
-)
 
-# E-history for Stability Map artefact
-E_history = load_hazard_E_history(hazard_log_path, max_points=20, gate_id=hazard_gate_id)
+    hazard_decision = evaluate_hazard_gate(hazard_state, cfg=HazardGateConfig())
+
+    # Surface hazard metrics into status.json metrics.
+    metrics["hazard_T"] = hazard_state.T
+    metrics["hazard_S"] = hazard_state.S
+    metrics["hazard_D"] = hazard_state.D
+    metrics["hazard_E"] = hazard_state.E
+    metrics["hazard_zone"] = hazard_state.zone
+    metrics["hazard_reason"] = hazard_state.reason
+    metrics["hazard_ok"] = hazard_decision.ok
+    metrics["hazard_severity"] = hazard_decision.severity
+
+    # Field topology overlay (diagnostic)
+    hazard_topology_region = classify_topology_region(
+        baseline_ok=bool(baseline_ok),
+        hazard_zone=str(hazard_state.zone),
+    )
+    metrics["hazard_topology_region"] = str(hazard_topology_region)
+
+    hazard_T_scaled = bool(getattr(hazard_state, "T_scaled", False))
+    hazard_contributors_top = getattr(hazard_state, "contributors_top", []) or []
+    metrics["hazard_T_scaled"] = hazard_T_scaled
+    metrics["hazard_contributors_top"] = hazard_contributors_top
+
+    # Feature-mode context (from the last log event for this gate_id)
+    hazard_feature_keys, hazard_feature_mode_source, hazard_feature_mode_active = (
+        load_last_hazard_feature_context(
+            hazard_log_path,
+            gate_id=hazard_gate_id,
+        )
+    )
+    metrics["hazard_feature_keys"] = hazard_feature_keys
+    metrics["hazard_feature_count"] = int(len(hazard_feature_keys))
+    metrics["hazard_feature_mode_source"] = str(hazard_feature_mode_source)
+    metrics["hazard_feature_mode_active"] = bool(hazard_feature_mode_active)
+    feature_mode_label = "ON" if bool(hazard_feature_mode_active) else "OFF"
+
+    # Calibration recommendation summary (if present)
+    calib_summary = load_calibration_recommendation(hazard_calibration_path(art_dir))
+    metrics["hazard_recommended_count"] = int(calib_summary.get("recommended_count", 0) or 0)
+    metrics["hazard_recommend_min_coverage"] = calib_summary.get("min_coverage")
+    metrics["hazard_recommend_max_features"] = calib_summary.get("max_features")
+    metrics["hazard_feature_allowlist_count"] = int(
+        calib_summary.get("feature_allowlist_count", 0) or 0
+    )
 
-# Threshold regime label (for UI + Stability Map)
-calib_is_effective = (
-    CALIBRATED_WARN_THRESHOLD != DEFAULT_WARN_THRESHOLD
-    or CALIBRATED_CRIT_THRESHOLD != DEFAULT_CRIT_THRESHOLD
-)
-threshold_regime = "CALIBRATED" if calib_is_effective else "BASELINE"
+    # E-history for Stability Map artefact
+    E_history = load_hazard_E_history(hazard_log_path, max_points=20, gate_id=hazard_gate_id)
 
-# ---------------------------------------------------------------------------
-# Stability Map artefact (v0)
-# ---------------------------------------------------------------------------
+    # Threshold regime label (for UI + Stability Map)
+    calib_is_effective = (
+        CALIBRATED_WARN_THRESHOLD != DEFAULT_WARN_THRESHOLD
+        or CALIBRATED_CRIT_THRESHOLD != DEFAULT_CRIT_THRESHOLD
+    )
+    threshold_regime = "CALIBRATED" if calib_is_effective else "BASELINE"
 
-seed_T_points = int(metrics.get("hazard_seed_T_points", 0) or 0)
-features_used_n = int(metrics.get("hazard_feature_count", 0) or 0)
-rec_n = int(metrics.get("hazard_recommended_count", 0) or 0)
-rec_min_cov = metrics.get("hazard_recommend_min_coverage")
-rec_max_feats = metrics.get("hazard_recommend_max_features")
-
-stability_map_payload = {
-    "schema": STABILITY_MAP_SCHEMA_V0,
-    "created_utc": now,
-    "status_version": STATUS_VERSION,
-    "gate_id": str(hazard_gate_id),
-    "baseline_ok": bool(baseline_ok),
-    "topology_region": str(hazard_topology_region),
-    "hazard": {
-        "zone": str(hazard_state.zone),
-        "E": float(hazard_state.E),
-        "T": float(hazard_state.T),
-        "S": float(hazard_state.S),
-        "D": float(hazard_state.D),
-        "reason": str(hazard_state.reason),
-        "ok": bool(hazard_decision.ok),
-        "severity": str(hazard_decision.severity),
-        "T_scaled": bool(hazard_T_scaled),
-        "contributors_top": hazard_contributors_top,
-    },
-    "series": {
-        "seed_T_points": int(seed_T_points),
-        "history_E": list(E_history),
-        # hazard_runtime.history_T already includes seeds + current T (adapter appends).
-        "history_T": list((hazard_runtime.history_T or [])[-20:]),
-    },
-    "feature_mode": {
-        "active": bool(hazard_feature_mode_active),
-        "source": str(hazard_feature_mode_source),
-        "used_feature_count": int(features_used_n),
-        "used_feature_keys": list(hazard_feature_keys),
-        "recommended_count": int(rec_n),
-        "recommend_min_coverage": (
-            float(rec_min_cov) if isinstance(rec_min_cov, (int, float)) else None
-        ),
-        "recommend_max_features": int(rec_max_feats) if isinstance(rec_max_feats, int) else None,
-    },
-    "thresholds": {
-        "regime": str(threshold_regime),
-        "warn": float(CALIBRATED_WARN_THRESHOLD),
-        "crit": float(CALIBRATED_CRIT_THRESHOLD),
-        "baseline_warn": float(DEFAULT_WARN_THRESHOLD),
-        "baseline_crit": float(DEFAULT_CRIT_THRESHOLD),
-        "min_samples": int(MIN_CALIBRATION_SAMPLES),
-    },
-    "provenance": {
-        "run_key": str(run_key) if run_key else None,
-        "git_sha": str(git_sha) if git_sha else None,
-        "artifact_dir": str(art),
-    },
-}
+    # ---------------------------------------------------------------------------
+    # Stability Map artefact (v0)
+    # ---------------------------------------------------------------------------
 
-stability_map_path = art / STABILITY_MAP_FILENAME
-write_json_artifact(stability_map_path, stability_map_payload)
+    seed_T_points = int(metrics.get("hazard_seed_T_points", 0) or 0)
+    features_used_n = int(metrics.get("hazard_feature_count", 0) or 0)
+    rec_n = int(metrics.get("hazard_recommended_count", 0) or 0)
+    rec_min_cov = metrics.get("hazard_recommend_min_coverage")
+    rec_max_feats = metrics.get("hazard_recommend_max_features")
 
-# Keep status metrics additive and safely excluded from field snapshots (hazard_* prefix).
-metrics["hazard_stability_map_written"] = True
-metrics["hazard_stability_map_schema"] = STABILITY_MAP_SCHEMA_V0
-metrics["hazard_stability_map_path"] = str(stability_map_path)
+    stability_map_payload = {
+        "schema": STABILITY_MAP_SCHEMA_V0,
+        "created_utc": now,
+        "status_version": status_version,
+        "gate_id": str(hazard_gate_id),
+        "baseline_ok": bool(baseline_ok),
+        "topology_region": str(hazard_topology_region),
+        "hazard": {
+            "zone": str(hazard_state.zone),
+            "E": float(hazard_state.E),
+            "T": float(hazard_state.T),
+            "S": float(hazard_state.S),
+            "D": float(hazard_state.D),
+            "reason": str(hazard_state.reason),
+            "ok": bool(hazard_decision.ok),
+            "severity": str(hazard_decision.severity),
+            "T_scaled": bool(hazard_T_scaled),
+            "contributors_top": hazard_contributors_top,
+        },
+        "series": {
+            "seed_T_points": int(seed_T_points),
+            "history_E": list(E_history),
+            # hazard_runtime.history_T already includes seeds + current T (adapter appends).
+            "history_T": list((hazard_runtime.history_T or [])[-20:]),
+        },
+        "feature_mode": {
+            "active": bool(hazard_feature_mode_active),
+            "source": str(hazard_feature_mode_source),
+            "used_feature_count": int(features_used_n),
+            "used_feature_keys": list(hazard_feature_keys),
+            "recommended_count": int(rec_n),
+            "recommend_min_coverage": (
+                float(rec_min_cov) if isinstance(rec_min_cov, (int, float)) else None
+            ),
+            "recommend_max_features": int(rec_max_feats) if isinstance(rec_max_feats, int) else None,
+        },
+        "thresholds": {
+            "regime": str(threshold_regime),
+            "warn": float(CALIBRATED_WARN_THRESHOLD),
+            "crit": float(CALIBRATED_CRIT_THRESHOLD),
+            "baseline_warn": float(DEFAULT_WARN_THRESHOLD),
+            "baseline_crit": float(DEFAULT_CRIT_THRESHOLD),
+            "min_samples": int(MIN_CALIBRATION_SAMPLES),
+        },
+        "provenance": {
+            "run_key": str(run_key) if run_key else None,
+            "git_sha": str(git_sha) if git_sha else None,
+            "artifact_dir": str(art_dir),
+        },
+    }
 
-# ---------------------------------------------------------------------------
-# Shadow hazard gate (ENV-flag-enforceable)
-# ---------------------------------------------------------------------------
+    stability_map_path = art_dir / STABILITY_MAP_FILENAME
+    write_json_artifact(stability_map_path, stability_map_payload)
 
-enforce_hazard = os.getenv("EPF_HAZARD_ENFORCE", "0") == "1"
-if enforce_hazard:
-    gates["epf_hazard_ok"] = hazard_decision.ok
-else:
-    gates["epf_hazard_ok"] = True
-
-if RUN_MODE in ("demo", "core"):
-    stub_profile = "all_true_smoke"
-    gates_stubbed = True
-    gates["detectors_materialized_ok"] = False
-    diagnostics = {
-        "scaffold": True,
-        "gates_stubbed": gates_stubbed,
-        "stub_profile": stub_profile,
-    }
-else:
-    stub_profile = "not_stubbed"
-    gates_stubbed = False
-    gates["detectors_materialized_ok"] = gates.get("detectors_materialized_ok") is True
-    diagnostics = {
-        "scaffold": False,
-        "gates_stubbed": False,
-        "stub_profile": stub_profile,
+    # Keep status metrics additive and safely excluded from field snapshots (hazard_* prefix).
+    metrics["hazard_stability_map_written"] = True
+    metrics["hazard_stability_map_schema"] = STABILITY_MAP_SCHEMA_V0
+    metrics["hazard_stability_map_path"] = str(stability_map_path)
+
+    # ---------------------------------------------------------------------------
+    # Shadow hazard gate (ENV-flag-enforceable)
+    # ---------------------------------------------------------------------------
+
+    enforce_hazard = os.getenv("EPF_HAZARD_ENFORCE", "0") == "1"
+    if enforce_hazard:
+        gates["epf_hazard_ok"] = hazard_decision.ok
+    else:
+        gates["epf_hazard_ok"] = True
+
+    if run_mode in ("demo", "core"):
+        stub_profile = "all_true_smoke"
+        gates_stubbed = True
+        gates["detectors_materialized_ok"] = False
+        diagnostics = {
+            "scaffold": True,
+            "gates_stubbed": gates_stubbed,
+            "stub_profile": stub_profile,
+        }
+    else:
+        stub_profile = "not_stubbed"
+        gates_stubbed = False
+        gates["detectors_materialized_ok"] = gates.get("detectors_materialized_ok") is True
+        diagnostics = {
+            "scaffold": False,
+            "gates_stubbed": False,
+            "stub_profile": stub_profile,
+        }
+
+    status = {
+        "version": status_version,
+        "created_utc": now,
+        "gates": gates,
+        "metrics": metrics,
+        "diagnostics": diagnostics,
     }
 
-status = {
-    "version": STATUS_VERSION,
-    "created_utc": now,
-    "gates": gates,
-    "metrics": metrics,
-    "diagnostics": diagnostics,
-}
+    if release_grade_external_section:
+        status["external"] = release_grade_external_section
 
-if release_grade_external_section:
-    status["external"] = release_grade_external_section
+    status_path = art_dir / "status.json"
+    write_json_artifact(status_path, status)
 
-status_path = art / "status.json"
-write_json_artifact(status_path, status)
+    # ---------------------------------------------------------------------------
+    # HTML report card via Quality Ledger renderer
+    # ---------------------------------------------------------------------------
 
-# ---------------------------------------------------------------------------
-# HTML report card via Quality Ledger renderer
-# ---------------------------------------------------------------------------
+    report_card_path = art_dir / "report_card.html"
+    write_quality_ledger(status_path, report_card_path)
 
-report_card_path = art / "report_card.html"
-write_quality_ledger(status_path, report_card_path)
+    release_authority_manifest_path: pathlib.Path | None = None
+    release_authority_bundle_path: pathlib.Path | None = None
 
-release_authority_manifest_path: pathlib.Path | None = None
-release_authority_bundle_path: pathlib.Path | None = None
+    if release_grade_materialized:
+        release_authority_manifest_path = build_release_authority_manifest(
+            status_path,
+            art_dir=art_dir,
+            gate_policy=gate_policy,
+            tool_runner=args.tool_runner,
+        )
+        release_authority_bundle_path = write_release_authority_audit_bundle(
+            status_path=status_path,
+            report_path=report_card_path,
+            manifest_path=release_authority_manifest_path,
+            art_dir=art_dir,
+        )
 
-if RELEASE_GRADE_MATERIALIZED:
-    release_authority_manifest_path = build_release_authority_manifest(status_path)
-    release_authority_bundle_path = write_release_authority_audit_bundle(
-        status_path=status_path,
-        report_path=report_card_path,
-        manifest_path=release_authority_manifest_path,
+    print("Wrote", status_path)
+    print("Wrote", report_card_path)
+    if release_authority_manifest_path is not None:
+        print("Wrote", release_authority_manifest_path)
+    if release_authority_bundle_path is not None:
+        print("Wrote", release_authority_bundle_path)
+    print("Wrote", stability_map_path)
+    print(
+        "Logged EPF hazard probe:",
+        f"gate_id={hazard_gate_id}",
+        f"seedT={seed_T_points}",
+        f"baseline_ok={baseline_ok}",
+        f"topology={hazard_topology_region}",
+        f"zone={hazard_state.zone}",
+        f"E={hazard_state.E:.3f}",
+        f"ok={hazard_decision.ok}",
+        f"severity={hazard_decision.severity}",
+        f"scaled={hazard_T_scaled}",
+        f"feature_mode={feature_mode_label}",
+        f"feature_source={hazard_feature_mode_source}",
+        f"features_used={features_used_n}",
+        f"recommended={rec_n}",
+        f"enforce_hazard={enforce_hazard}",
+        f"epf_hazard_ok_gate={gates['epf_hazard_ok']}",
     )
 
-print("Wrote", status_path)
-print("Wrote", report_card_path)
-if release_authority_manifest_path is not None:
-    print("Wrote", release_authority_manifest_path)
-if release_authority_bundle_path is not None:
-    print("Wrote", release_authority_bundle_path)
-print("Wrote", stability_map_path)
-print(
-    "Logged EPF hazard probe:",
-    f"gate_id={hazard_gate_id}",
-    f"seedT={seed_T_points}",
-    f"baseline_ok={baseline_ok}",
-    f"topology={hazard_topology_region}",
-    f"zone={hazard_state.zone}",
-    f"E={hazard_state.E:.3f}",
-    f"ok={hazard_decision.ok}",
-    f"severity={hazard_decision.severity}",
-    f"scaled={hazard_T_scaled}",
-    f"feature_mode={feature_mode_label}",
-    f"feature_source={hazard_feature_mode_source}",
-    f"features_used={features_used_n}",
-    f"recommended={rec_n}",
-    f"enforce_hazard={enforce_hazard}",
-    f"epf_hazard_ok_gate={gates['epf_hazard_ok']}",
-)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
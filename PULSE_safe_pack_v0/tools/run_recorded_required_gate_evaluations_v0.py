@@ -2,7 +2,9 @@
 """Run current-run required-gate evaluations and record candidate evidence.
 
 The exact gate set comes from ``gates.required`` in the canonical policy.
-Commands come from a checked-in JSON plan and are executed without a shell.
+Commands come from a checked-in JSON plan and are executed without a shell,
+either as subprocesses (default) or in-process through tool_runner_v0
+(``--tool-runner inprocess``).
 Each plan entry names a checked-in Python evaluator and a JSON result pointer
 that must resolve to literal true. Declared outputs are deleted before execution,
 then required to be recreated, hashed, and recorded with stdout/stderr.
@@ -16,18 +18,34 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import yaml
-from jsonschema import Draft202012Validator, FormatChecker
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
+from PULSE_safe_pack_v0.tools.file_digest_v0 import sha256_file  # noqa: E402
+from PULSE_safe_pack_v0.tools.schema_registry_v0 import (  # noqa: E402
+    schema_errors,
+)
+from PULSE_safe_pack_v0.tools.strict_load_v0 import (  # noqa: E402
+    load_json_file,
+    load_yaml_file,
+)
+from PULSE_safe_pack_v0.tools.tool_runner_v0 import (  # noqa: E402
+    RUNNER_SUBPROCESS,
+    SUPPORTED_RUNNERS,
+    default_runner,
+    resolve_runner,
+    run_tool,
+)
 
 OUTPUT_SCHEMA = "required_gate_evidence_v0"
 PLAN_SCHEMA = "required_gate_evaluation_plan_v0"
@@ -62,56 +80,6 @@ GIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
 GATE_ID_RE = re.compile(r"^[a-z][a-z0-9_]*$")
 
 
-def _json_no_duplicates(
-    pairs: list[tuple[str, Any]],
-) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-
-    for key, value in pairs:
-        if key in out:
-            raise ValueError(f"duplicate JSON key {key!r}")
-
-        out[key] = value
-
-    return out
-
-
-class _UniqueYamlLoader(yaml.SafeLoader):
-    pass
-
-
-def _construct_unique_mapping(
-    loader: _UniqueYamlLoader,
-    node: Any,
-    deep: bool = False,
-) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-
-    for key_node, value_node in node.value:
-        key = loader.construct_object(
-            key_node,
-            deep=deep,
-        )
-
-        if key in out:
-            raise ValueError(
-                f"duplicate YAML key {key!r}"
-            )
-
-        out[key] = loader.construct_object(
-            value_node,
-            deep=deep,
-        )
-
-    return out
-
-
-_UniqueYamlLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-    _construct_unique_mapping,
-)
-
-
 def _load_json(
     path: Path,
     label: str,
@@ -124,18 +92,7 @@ def _load_json(
             )
             return None
 
-        payload = json.loads(
-            path.read_text(encoding="utf-8"),
-            object_pairs_hook=_json_no_duplicates,
-            parse_constant=lambda value: (
-                _ for _ in ()
-            ).throw(
-                ValueError(
-                    "non-finite JSON constant "
-                    f"{value!r}"
-                )
-            ),
-        )
+        payload = load_json_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(
@@ -164,10 +121,7 @@ def _load_yaml(
             )
             return None
 
-        payload = yaml.load(
-            path.read_text(encoding="utf-8"),
-            Loader=_UniqueYamlLoader,
-        )
+        payload = load_yaml_file(path)
 
     except Exception as exc:  # noqa: BLE001
         errors.append(
@@ -196,16 +150,7 @@ def _sha256(
             )
             return None
 
-        digest = hashlib.sha256()
-
-        with path.open("rb") as handle:
-            for chunk in iter(
-                lambda: handle.read(65536),
-                b"",
-            ):
-                digest.update(chunk)
-
-        return digest.hexdigest()
+        return sha256_file(path)
 
     except OSError as exc:
         errors.append(
@@ -842,35 +787,353 @@ def _validate_schema(
     if schema is None:
         return errors
 
-    validator = Draft202012Validator(
+    return schema_errors(
+        payload,
         schema,
-        format_checker=FormatChecker(),
     )
 
-    validation_errors = sorted(
-        validator.iter_errors(payload),
-        key=lambda error: list(
-            error.absolute_path
-        ),
+
+def _evaluate_gate(
+    *,
+    repo: Path,
+    gate: str,
+    entry: dict[str, Any],
+    plan_ref: dict[str, Any],
+    input_root: Path,
+    log_root: Path,
+    key: str,
+    sha: str,
+    timeout: int,
+    runner: str,
+) -> dict[str, Any]:
+    """Run one plan entry and return its recorded gate evidence.
+
+    Entries share no state: each writes only its own declared evidence paths
+    (unique across gates) and its own ``<gate>.stdout/stderr.txt`` logs, so
+    this function is safe to run concurrently in worker processes.
+    """
+    diagnostics: list[str] = []
+    prepared: list[
+        tuple[
+            dict[str, Any],
+            Path,
+        ]
+    ] = []
+
+    for index, descriptor in enumerate(
+        entry["evidence_artifacts"]
+    ):
+        path = _output_path(
+            repo,
+            descriptor["path"],
+            input_root,
+            (
+                f"plan.evaluations.{gate}."
+                f"evidence_artifacts[{index}].path"
+            ),
+            diagnostics,
+        )
+
+        if path is None:
+            continue
+
+        try:
+            if path.exists() or path.is_symlink():
+                if (
+                    path.is_dir()
+                    and not path.is_symlink()
+                ):
+                    diagnostics.append(
+                        "declared evidence path is "
+                        "a directory: "
+                        f"{descriptor['path']!r}"
+                    )
+                    continue
+
+                path.unlink()
+
+            path.parent.mkdir(
+                parents=True,
+                exist_ok=True,
+            )
+
+            prepared.append(
+                (
+                    descriptor,
+                    path,
+                )
+            )
+
+        except OSError as exc:
+            diagnostics.append(
+                "could not reset "
+                f"{descriptor['path']!r}: {exc}"
+            )
+
+    evaluator_path = (
+        repo / entry["command"][1]
+    ).resolve()
+
+    try:
+        evaluator_path.relative_to(repo)
+
+    except ValueError:
+        diagnostics.append(
+            "evaluation tool escapes "
+            "repository root"
+        )
+
+    if (
+        evaluator_path.is_symlink()
+        or not evaluator_path.is_file()
+    ):
+        diagnostics.append(
+            "evaluation tool must be a checked-in "
+            "regular file: "
+            f"{entry['command'][1]!r}"
+        )
+
+    stdout_path = (
+        log_root / f"{gate}.stdout.txt"
     )
 
-    for item in validation_errors:
-        location = ".".join(
-            str(part)
-            for part in item.absolute_path
+    stderr_path = (
+        log_root / f"{gate}.stderr.txt"
+    )
+
+    stdout = ""
+    stderr = ""
+    rc: int | None = None
+
+    if not diagnostics:
+        env = os.environ.copy()
+
+        env.update(
+            {
+                "PULSE_REQUIRED_GATE_ID": gate,
+                (
+                    "PULSE_REQUIRED_GATE_"
+                    "EVALUATION_ID"
+                ): entry["evaluation_id"],
+                "PULSE_REPO_ROOT": str(repo),
+                "PULSE_ARTIFACT_DIR": str(
+                    repo
+                    / "PULSE_safe_pack_v0"
+                    / "artifacts"
+                ),
+                "PULSE_RUN_MODE": "prod",
+                "PULSE_RUN_KEY": key,
+                "PULSE_GIT_SHA": sha,
+            }
         )
 
-        prefix = (
-            f"{location}: "
-            if location
-            else ""
+        try:
+            result = run_tool(
+                _expand(
+                    entry["command"],
+                    repo,
+                    gate,
+                ),
+                cwd=repo,
+                env=env,
+                timeout=timeout,
+                runner=runner,
+            )
+
+            rc = result.returncode
+            stdout = result.stdout
+            stderr = result.stderr
+
+        except subprocess.TimeoutExpired as exc:
+            stdout = (
+                exc.stdout.decode(
+                    errors="replace"
+                )
+                if isinstance(
+                    exc.stdout,
+                    bytes,
+                )
+                else str(
+                    exc.stdout or ""
+                )
+            )
+
+            stderr = (
+                exc.stderr.decode(
+                    errors="replace"
+                )
+                if isinstance(
+                    exc.stderr,
+                    bytes,
+                )
+                else str(
+                    exc.stderr or ""
+                )
+            )
+
+            diagnostics.append(
+                "evaluation timed out after "
+                f"{timeout} seconds"
+            )
+
+        except OSError as exc:
+            diagnostics.append(
+                "evaluation command could not run: "
+                f"{exc}"
+            )
+
+    stdout_path.write_text(
+        stdout,
+        encoding="utf-8",
+    )
+
+    stderr_path.write_text(
+        stderr,
+        encoding="utf-8",
+    )
+
+    if rc not in (None, 0):
+        diagnostics.append(
+            "evaluation command exited "
+            f"with code {rc}"
         )
 
-        errors.append(
-            prefix + item.message
+    refs: list[dict[str, Any]] = [
+        dict(plan_ref)
+    ]
+
+    evaluator_ref = _ref(
+        repo,
+        evaluator_path,
+        "evaluation_tool",
+        None,
+        diagnostics,
+    )
+
+    if evaluator_ref:
+        refs.append(evaluator_ref)
+
+    for path, kind in (
+        (
+            stdout_path,
+            "evaluation_stdout",
+        ),
+        (
+            stderr_path,
+            "evaluation_stderr",
+        ),
+    ):
+        item = _ref(
+            repo,
+            path,
+            kind,
+            None,
+            diagnostics,
+        )
+
+        if item:
+            refs.append(item)
+
+    recorded_declared = 0
+
+    for descriptor, path in prepared:
+        if (
+            path.is_symlink()
+            or not path.is_file()
+        ):
+            diagnostics.append(
+                "declared current-run evidence "
+                "was not produced as a regular file: "
+                f"{descriptor['path']!r}"
+            )
+            continue
+
+        item = _ref(
+            repo,
+            path,
+            descriptor["kind"],
+            descriptor["schema_version"],
+            diagnostics,
+        )
+
+        if item:
+            refs.append(item)
+            recorded_declared += 1
+
+    if (
+        recorded_declared != len(prepared)
+        or recorded_declared == 0
+    ):
+        diagnostics.append(
+            "not all declared current-run evidence "
+            "artifacts were recorded"
         )
 
-    return errors
+    result_path = next(
+        (
+            path
+            for descriptor, path in prepared
+            if descriptor["path"]
+            == entry["result"]["artifact"]
+        ),
+        None,
+    )
+
+    result_value: Any = None
+
+    if (
+        result_path is None
+        or not result_path.is_file()
+    ):
+        diagnostics.append(
+            "result artifact was not produced"
+        )
+
+    else:
+        result_payload = _load_json(
+            result_path,
+            f"{gate} result artifact",
+            diagnostics,
+        )
+
+        if result_payload is not None:
+            try:
+                result_value = _json_pointer(
+                    result_payload,
+                    entry["result"]["json_pointer"],
+                )
+
+            except KeyError:
+                diagnostics.append(
+                    "result JSON pointer "
+                    f"{entry['result']['json_pointer']!r} "
+                    "was not found"
+                )
+
+            if result_value is not True:
+                diagnostics.append(
+                    "result JSON pointer "
+                    f"{entry['result']['json_pointer']!r} "
+                    "must be literal true"
+                )
+
+    passed = (
+        rc == 0
+        and result_value is True
+        and not diagnostics
+    )
+
+    return {
+        "value": passed,
+        "status": (
+            "passed"
+            if passed
+            else "failed"
+        ),
+        "evaluation_id": entry["evaluation_id"],
+        "evidence_artifacts": refs,
+        "diagnostics": diagnostics,
+    }
 
 
 def run(
@@ -885,6 +1148,8 @@ def run(
     repository: str,
     release_candidate: str | None,
     timeout: int,
+    runner: str = RUNNER_SUBPROCESS,
+    jobs: int = 1,
 ) -> tuple[
     dict[str, Any] | None,
     list[str],
@@ -1016,6 +1281,17 @@ def run(
             "timeout must be greater than zero"
         )
 
+    if jobs <= 0:
+        errors.append(
+            "jobs must be greater than zero"
+        )
+
+    try:
+        runner = resolve_runner(runner)
+
+    except ValueError as exc:
+        errors.append(str(exc))
+
     policy_sha = _sha256(
         policy_path,
         "policy",
@@ -1077,340 +1353,58 @@ def run(
     }
 
     gates: dict[str, Any] = {}
-    all_passed = True
-
-    for gate in required:
-        entry = entries[gate]
-        diagnostics: list[str] = []
-        prepared: list[
-            tuple[
-                dict[str, Any],
-                Path,
-            ]
-        ] = []
-
-        for index, descriptor in enumerate(
-            entry["evidence_artifacts"]
-        ):
-            path = _output_path(
-                repo,
-                descriptor["path"],
-                input_root,
-                (
-                    f"plan.evaluations.{gate}."
-                    f"evidence_artifacts[{index}].path"
-                ),
-                diagnostics,
-            )
-
-            if path is None:
-                continue
-
-            try:
-                if path.exists() or path.is_symlink():
-                    if (
-                        path.is_dir()
-                        and not path.is_symlink()
-                    ):
-                        diagnostics.append(
-                            "declared evidence path is "
-                            "a directory: "
-                            f"{descriptor['path']!r}"
-                        )
-                        continue
-
-                    path.unlink()
-
-                path.parent.mkdir(
-                    parents=True,
-                    exist_ok=True,
-                )
-
-                prepared.append(
-                    (
-                        descriptor,
-                        path,
-                    )
-                )
-
-            except OSError as exc:
-                diagnostics.append(
-                    "could not reset "
-                    f"{descriptor['path']!r}: {exc}"
-                )
-
-        evaluator_path = (
-            repo / entry["command"][1]
-        ).resolve()
-
-        try:
-            evaluator_path.relative_to(repo)
-
-        except ValueError:
-            diagnostics.append(
-                "evaluation tool escapes "
-                "repository root"
-            )
-
-        if (
-            evaluator_path.is_symlink()
-            or not evaluator_path.is_file()
-        ):
-            diagnostics.append(
-                "evaluation tool must be a checked-in "
-                "regular file: "
-                f"{entry['command'][1]!r}"
-            )
-
-        stdout_path = (
-            log_root / f"{gate}.stdout.txt"
-        )
-
-        stderr_path = (
-            log_root / f"{gate}.stderr.txt"
-        )
-
-        stdout = ""
-        stderr = ""
-        rc: int | None = None
-
-        if not diagnostics:
-            env = os.environ.copy()
-
-            env.update(
-                {
-                    "PULSE_REQUIRED_GATE_ID": gate,
-                    (
-                        "PULSE_REQUIRED_GATE_"
-                        "EVALUATION_ID"
-                    ): entry["evaluation_id"],
-                    "PULSE_REPO_ROOT": str(repo),
-                    "PULSE_ARTIFACT_DIR": str(
-                        repo
-                        / "PULSE_safe_pack_v0"
-                        / "artifacts"
-                    ),
-                    "PULSE_RUN_MODE": "prod",
-                    "PULSE_RUN_KEY": key,
-                    "PULSE_GIT_SHA": sha,
-                }
-            )
-
-            try:
-                result = subprocess.run(
-                    _expand(
-                        entry["command"],
-                        repo,
-                        gate,
-                    ),
-                    cwd=repo,
-                    env=env,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=timeout,
-                    check=False,
-                )
-
-                rc = result.returncode
-                stdout = result.stdout
-                stderr = result.stderr
-
-            except subprocess.TimeoutExpired as exc:
-                stdout = (
-                    exc.stdout.decode(
-                        errors="replace"
-                    )
-                    if isinstance(
-                        exc.stdout,
-                        bytes,
-                    )
-                    else str(
-                        exc.stdout or ""
-                    )
-                )
-
-                stderr = (
-                    exc.stderr.decode(
-                        errors="replace"
-                    )
-                    if isinstance(
-                        exc.stderr,
-                        bytes,
-                    )
-                    else str(
-                        exc.stderr or ""
-                    )
-                )
 
-                diagnostics.append(
-                    "evaluation timed out after "
-                    f"{timeout} seconds"
-                )
-
-            except OSError as exc:
-                diagnostics.append(
-                    "evaluation command could not run: "
-                    f"{exc}"
-                )
-
-        stdout_path.write_text(
-            stdout,
-            encoding="utf-8",
-        )
-
-        stderr_path.write_text(
-            stderr,
-            encoding="utf-8",
-        )
-
-        if rc not in (None, 0):
-            diagnostics.append(
-                "evaluation command exited "
-                f"with code {rc}"
-            )
+    tasks = [
+        {
+            "repo": repo,
+            "gate": gate,
+            "entry": entries[gate],
+            "plan_ref": plan_ref,
+            "input_root": input_root,
+            "log_root": log_root,
+            "key": key,
+            "sha": sha,
+            "timeout": timeout,
+            "runner": runner,
+        }
+        for gate in required
+    ]
 
-        refs: list[dict[str, Any]] = [
-            dict(plan_ref)
+    if jobs <= 1 or len(tasks) <= 1:
+        records = [
+            _evaluate_gate(**task)
+            for task in tasks
         ]
 
-        evaluator_ref = _ref(
-            repo,
-            evaluator_path,
-            "evaluation_tool",
-            None,
-            diagnostics,
-        )
-
-        if evaluator_ref:
-            refs.append(evaluator_ref)
-
-        for path, kind in (
-            (
-                stdout_path,
-                "evaluation_stdout",
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(
+                jobs,
+                len(tasks),
             ),
-            (
-                stderr_path,
-                "evaluation_stderr",
-            ),
-        ):
-            item = _ref(
-                repo,
-                path,
-                kind,
-                None,
-                diagnostics,
-            )
-
-            if item:
-                refs.append(item)
-
-        recorded_declared = 0
-
-        for descriptor, path in prepared:
-            if (
-                path.is_symlink()
-                or not path.is_file()
-            ):
-                diagnostics.append(
-                    "declared current-run evidence "
-                    "was not produced as a regular file: "
-                    f"{descriptor['path']!r}"
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _evaluate_gate,
+                    **task,
                 )
-                continue
-
-            item = _ref(
-                repo,
-                path,
-                descriptor["kind"],
-                descriptor["schema_version"],
-                diagnostics,
-            )
-
-            if item:
-                refs.append(item)
-                recorded_declared += 1
-
-        if (
-            recorded_declared != len(prepared)
-            or recorded_declared == 0
-        ):
-            diagnostics.append(
-                "not all declared current-run evidence "
-                "artifacts were recorded"
-            )
-
-        result_path = next(
-            (
-                path
-                for descriptor, path in prepared
-                if descriptor["path"]
-                == entry["result"]["artifact"]
-            ),
-            None,
-        )
-
-        result_value: Any = None
-
-        if (
-            result_path is None
-            or not result_path.is_file()
-        ):
-            diagnostics.append(
-                "result artifact was not produced"
-            )
-
-        else:
-            result_payload = _load_json(
-                result_path,
-                f"{gate} result artifact",
-                diagnostics,
-            )
-
-            if result_payload is not None:
-                try:
-                    result_value = _json_pointer(
-                        result_payload,
-                        entry["result"]["json_pointer"],
-                    )
-
-                except KeyError:
-                    diagnostics.append(
-                        "result JSON pointer "
-                        f"{entry['result']['json_pointer']!r} "
-                        "was not found"
-                    )
-
-                if result_value is not True:
-                    diagnostics.append(
-                        "result JSON pointer "
-                        f"{entry['result']['json_pointer']!r} "
-                        "must be literal true"
-                    )
+                for task in tasks
+            ]
 
-        passed = (
-            rc == 0
-            and result_value is True
-            and not diagnostics
-        )
+            # Collect in plan order so the result document is identical
+            # to the serial run regardless of completion order.
+            records = [
+                future.result()
+                for future in futures
+            ]
 
-        all_passed = (
-            all_passed
-            and passed
-        )
+    for gate, record in zip(required, records):
+        gates[gate] = record
 
-        gates[gate] = {
-            "value": passed,
-            "status": (
-                "passed"
-                if passed
-                else "failed"
-            ),
-            "evaluation_id": entry["evaluation_id"],
-            "evidence_artifacts": refs,
-            "diagnostics": diagnostics,
-        }
+    all_passed = all(
+        record["value"] is True
+        for record in records
+    )
 
     payload = {
         "schema_version": OUTPUT_SCHEMA,
@@ -1460,18 +1454,18 @@ def run(
         "warnings": [],
     }
 
-    schema_errors = _validate_schema(
+    validation_errors = _validate_schema(
         payload,
         schema_path,
     )
 
-    if schema_errors:
+    if validation_errors:
         return (
             None,
             [
                 "schema validation failed: "
                 + item
-                for item in schema_errors
+                for item in validation_errors
             ],
             False,
         )
@@ -1545,6 +1539,29 @@ def main(
         default=300,
     )
 
+    parser.add_argument(
+        "--tool-runner",
+        default=default_runner(),
+        help=(
+            "Evaluator execution mode: "
+            + "|".join(SUPPORTED_RUNNERS)
+            + " (default: PULSE_TOOL_RUNNER or subprocess). "
+            "inprocess imports each evaluator's main(argv) once; "
+            "evaluators without main still run as subprocesses."
+        ),
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Run up to N independent gate evaluations "
+            "concurrently on a process pool; output order, "
+            "logs and the result document match the serial run"
+        ),
+    )
+
     args = parser.parse_args(argv)
 
     repo = Path(
@@ -1585,6 +1602,8 @@ def main(
             or None
         ),
         timeout=args.timeout_seconds,
+        runner=args.tool_runner,
+        jobs=args.jobs,
     )
 
     if payload is None:
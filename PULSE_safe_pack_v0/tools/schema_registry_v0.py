@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Compiled JSON Schema validators shared across PULSE tools.
+
+Tools used to build a fresh ``Draft202012Validator`` and ``FormatChecker``
+for every document they validated, and never checked the schema itself, so a
+malformed schema surfaced only as an exception or a misleading validation
+error.
+
+This registry keys each schema by the SHA-256 of its canonical JSON form. It
+meta-schema checks each schema once (an invalid schema fails closed) and
+then reuses one compiled validator (with a shared ``FormatChecker``) for
+every instance validated against it.
+
+Warm start: set ``PULSE_SCHEMA_CACHE`` to a JSON file and the checked
+schemas are stored there at exit and reloaded by later processes, which then
+skip the meta-schema check. jsonschema validators themselves cannot be
+serialized, so the file holds the checked schema documents and validators
+are rebuilt from them. The file is plain JSON (nothing in it is executed),
+and every entry is content-addressed: it is used only when its key is the
+digest of the schema document it holds, so an edited entry can never stand
+in for a different schema.
+
+``schema_errors`` returns the ``"<path>: <message>"`` list format the tools
+already use. An invalid schema is reported as a single error rather than
+raised, so callers stay fail-closed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Iterable
+
+from jsonschema import Draft202012Validator, FormatChecker
+from jsonschema.exceptions import SchemaError
+
+
+CACHE_ENV = "PULSE_SCHEMA_CACHE"
+CACHE_SCHEMA = "pulse_schema_registry_cache_v0"
+
+_LOCK = threading.Lock()
+_FORMAT_CHECKER = FormatChecker()
+_VALIDATORS: dict[str, Draft202012Validator] = {}
+_INVALID: dict[str, str] = {}
+# digest -> checked schema document, persisted for warm starts
+_CHECKED: dict[str, dict[str, Any]] = {}
+_PERSISTENT_LOADED = False
+_PERSISTENT_PATH: Path | None = None
+_DIRTY = False
+_STATS = {"compiled": 0, "checked": 0, "cache_hits": 0, "warm_hits": 0}
+
+
+def _jsonschema_version() -> str:
+    try:
+        return metadata.version("jsonschema")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def schema_digest(schema: dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON form of ``schema``."""
+    encoded = json.dumps(
+        schema,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
+
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _ensure_persistent_loaded() -> None:
+    global _PERSISTENT_LOADED, _PERSISTENT_PATH
+
+    if _PERSISTENT_LOADED:
+        return
+
+    _PERSISTENT_LOADED = True
+    raw = os.getenv(CACHE_ENV, "").strip()
+
+    if not raw:
+        return
+
+    _PERSISTENT_PATH = Path(raw).expanduser().resolve()
+    atexit.register(flush)
+
+    try:
+        with _PERSISTENT_PATH.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema") != CACHE_SCHEMA
+        or payload.get("jsonschema") != _jsonschema_version()
+        or not isinstance(payload.get("checked"), dict)
+    ):
+        return
+
+    for digest, schema in payload["checked"].items():
+        # Re-derive the key so a stale or edited entry can never stand in
+        # for a different schema.
+        if isinstance(schema, dict) and schema_digest(schema) == digest:
+            _CHECKED.setdefault(digest, schema)
+
+
+def flush() -> None:
+    """Write checked schemas to ``PULSE_SCHEMA_CACHE`` (if set) atomically."""
+    global _DIRTY
+
+    with _LOCK:
+        path = _PERSISTENT_PATH
+
+        if path is None or not _DIRTY:
+            return
+
+        payload = {
+            "schema": CACHE_SCHEMA,
+            "jsonschema": _jsonschema_version(),
+            "checked": dict(_CHECKED),
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f".{path.name}.",
+                dir=str(path.parent),
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, sort_keys=True, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except OSError:
+            # The cache is an optimisation; never fail a tool over it.
+            return
+
+        _DIRTY = False
+
+
+def compiled_validator(schema: dict[str, Any]) -> Draft202012Validator:
+    """Return the shared validator for ``schema``.
+
+    Raises ``jsonschema.exceptions.SchemaError`` when the schema itself is
+    invalid (the verdict is cached too).
+    """
+    global _DIRTY
+
+    digest = schema_digest(schema)
+
+    with _LOCK:
+        _ensure_persistent_loaded()
+
+        validator = _VALIDATORS.get(digest)
+        if validator is not None:
+            _STATS["cache_hits"] += 1
+            return validator
+
+        if digest in _INVALID:
+            raise SchemaError(_INVALID[digest])
+
+        warm = _CHECKED.get(digest)
+
+    if warm is None:
+        try:
+            Draft202012Validator.check_schema(schema)
+        except SchemaError as exc:
+            with _LOCK:
+                _INVALID[digest] = exc.message
+            raise
+
+        # Private copy: later mutation of the caller's dict must not change
+        # what the cached validator enforces.
+        checked = json.loads(json.dumps(schema))
+    else:
+        checked = warm
+
+    validator = Draft202012Validator(
+        checked,
+        format_checker=_FORMAT_CHECKER,
+    )
+
+    with _LOCK:
+        _STATS["compiled"] += 1
+
+        if warm is None:
+            _STATS["checked"] += 1
+            _CHECKED[digest] = checked
+            _DIRTY = True
+        else:
+            _STATS["warm_hits"] += 1
+
+        return _VALIDATORS.setdefault(digest, validator)
+
+
+def _format_errors(
+    validator: Draft202012Validator,
+    payload: Any,
+) -> list[str]:
+    result: list[str] = []
+
+    for error in sorted(
+        validator.iter_errors(payload),
+        key=lambda item: list(
+            item.absolute_path
+        ),
+    ):
+        location = ".".join(
+            str(part)
+            for part in error.absolute_path
+        )
+
+        result.append(
+            (
+                f"{location}: "
+                if location
+                else ""
+            )
+            + error.message
+        )
+
+    return result
+
+
+def schema_errors(
+    payload: Any,
+    schema: dict[str, Any],
+) -> list[str]:
+    """Validate one instance; return ``"<path>: <message>"`` strings."""
+    return schema_errors_many([payload], schema)[0]
+
+
+def schema_errors_many(
+    payloads: Iterable[Any],
+    schema: dict[str, Any],
+) -> list[list[str]]:
+    """Validate many instances against one compiled validator."""
+    items = list(payloads)
+
+    try:
+        validator = compiled_validator(schema)
+    except SchemaError as exc:
+        return [[f"schema is invalid: {exc.message}"] for _ in items]
+
+    return [_format_errors(validator, payload) for payload in items]
+
+
+def clear_cache() -> None:
+    """Drop in-memory validators and counters (the cache file is kept)."""
+    global _PERSISTENT_LOADED, _PERSISTENT_PATH, _DIRTY
+
+    with _LOCK:
+        _VALIDATORS.clear()
+        _INVALID.clear()
+        _CHECKED.clear()
+        _PERSISTENT_LOADED = False
+        _PERSISTENT_PATH = None
+        _DIRTY = False
+
+        for name in _STATS:
+            _STATS[name] = 0
+
+
+def registry_stats() -> dict[str, int]:
+    with _LOCK:
+        return {**_STATS, "validators": len(_VALIDATORS)}
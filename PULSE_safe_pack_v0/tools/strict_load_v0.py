@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Shared strict JSON/YAML loading with a parsed-document cache.
+
+Every PULSE tool that reads evidence applies the same rules: duplicate
+mapping keys are rejected and non-finite numbers are rejected. This module
+implements them once, in a single parse pass:
+
+- JSON: ``object_pairs_hook`` builds each object with one C-level ``dict()``
+  call and only falls back to a key scan when the length shows a duplicate;
+  ``parse_constant`` rejects ``NaN``/``Infinity`` and ``parse_float`` rejects
+  literals that overflow to ``inf`` (``1e999``). No second tree walk is
+  needed.
+- YAML: ``StrictYamlLoader`` (libyaml-backed when available) rejects
+  duplicate mapping keys and non-finite floats (``.inf``/``.nan``) while
+  constructing nodes.
+
+``load_json_file`` / ``load_yaml_file`` keep a per-process cache of parsed
+documents keyed by the SHA-256 of the file content, so the policy, registry
+and schemas are parsed once per process however many call sites read them.
+Cached documents are stored as pickles and every caller receives a private
+copy; pass ``copy=False`` only when the result is never mutated.
+
+Errors are raised as ``StrictLoadError`` (a ``ValueError``); callers keep
+their own label/prefix handling.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+
+CACHE_MAX_ENTRIES = 256
+
+
+class StrictLoadError(ValueError):
+    """Raised when a document violates the strict JSON/YAML rules."""
+
+
+def strict_json_object(
+    pairs: list[tuple[str, Any]],
+) -> dict[str, Any]:
+    """``object_pairs_hook`` rejecting duplicate keys."""
+    out = dict(pairs)
+
+    if len(out) != len(pairs):
+        seen: set[str] = set()
+
+        for key, _ in pairs:
+            if key in seen:
+                raise StrictLoadError(
+                    f"duplicate JSON key {key!r}"
+                )
+            seen.add(key)
+
+    return out
+
+
+def reject_nonfinite_constant(value: str) -> None:
+    """``parse_constant`` rejecting NaN, Infinity and -Infinity."""
+    raise StrictLoadError(
+        f"non-finite JSON constant {value!r}"
+    )
+
+
+def finite_float(text: str) -> float:
+    """``parse_float`` rejecting literals that overflow to infinity."""
+    value = float(text)
+
+    if not math.isfinite(value):
+        raise StrictLoadError(
+            f"non-finite JSON number {text!r}"
+        )
+
+    return value
+
+
+def loads_json(text: str | bytes) -> Any:
+    """Parse JSON text with duplicate-key and non-finite rejection."""
+    return json.loads(
+        text,
+        object_pairs_hook=strict_json_object,
+        parse_constant=reject_nonfinite_constant,
+        parse_float=finite_float,
+    )
+
+
+_YamlBase = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class StrictYamlLoader(_YamlBase):  # type: ignore[misc, valid-type]
+    """Safe YAML loader that rejects duplicate keys and non-finite floats."""
+
+
+def _yaml_mapping(
+    loader: StrictYamlLoader,
+    node: Any,
+    deep: bool = False,
+) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+
+    for key_node, value_node in node.value:
+        key = loader.construct_object(
+            key_node,
+            deep=deep,
+        )
+
+        if key in out:
+            raise StrictLoadError(
+                f"duplicate YAML key {key!r}"
+            )
+
+        out[key] = loader.construct_object(
+            value_node,
+            deep=deep,
+        )
+
+    return out
+
+
+def _yaml_float(
+    loader: StrictYamlLoader,
+    node: Any,
+) -> float:
+    value = yaml.SafeLoader.construct_yaml_float(loader, node)
+
+    if not math.isfinite(value):
+        raise StrictLoadError(
+            f"non-finite YAML number {node.value!r}"
+        )
+
+    return value
+
+
+StrictYamlLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+    _yaml_mapping,
+)
+StrictYamlLoader.add_constructor(
+    "tag:yaml.org,2002:float",
+    _yaml_float,
+)
+
+
+def loads_yaml(text: str | bytes) -> Any:
+    """Parse one YAML document with duplicate-key and non-finite rejection."""
+    return yaml.load(
+        text,
+        Loader=StrictYamlLoader,
+    )
+
+
+_PARSERS = {
+    "json": loads_json,
+    "yaml": loads_yaml,
+}
+
+_LOCK = threading.Lock()
+# (kind, content sha256) -> (shared parsed document, pickled snapshot)
+_CACHE: OrderedDict[tuple[str, str], tuple[Any, bytes]] = OrderedDict()
+_STATS = {"parsed": 0, "cache_hits": 0}
+
+
+def _load_file(path: Path, kind: str, *, copy: bool) -> Any:
+    raw = Path(path).read_bytes()
+    key = (kind, hashlib.sha256(raw).hexdigest())
+
+    with _LOCK:
+        entry = _CACHE.get(key)
+
+        if entry is not None:
+            _CACHE.move_to_end(key)
+            _STATS["cache_hits"] += 1
+
+    if entry is None:
+        # Decode like Path.read_text(encoding="utf-8") so callers see the
+        # same UnicodeDecodeError for invalid input.
+        document = _PARSERS[kind](raw.decode("utf-8"))
+        entry = (document, pickle.dumps(document, pickle.HIGHEST_PROTOCOL))
+
+        with _LOCK:
+            _STATS["parsed"] += 1
+            _CACHE[key] = entry
+
+            while len(_CACHE) > CACHE_MAX_ENTRIES:
+                _CACHE.popitem(last=False)
+
+    if not copy:
+        return entry[0]
+
+    return pickle.loads(entry[1])
+
+
+def load_json_file(path: Path, *, copy: bool = True) -> Any:
+    """Strictly parse a JSON file, reusing a cached parse of equal content."""
+    return _load_file(path, "json", copy=copy)
+
+
+def load_yaml_file(path: Path, *, copy: bool = True) -> Any:
+    """Strictly parse a YAML file, reusing a cached parse of equal content."""
+    return _load_file(path, "yaml", copy=copy)
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+
+        for name in _STATS:
+            _STATS[name] = 0
+
+
+def cache_stats() -> dict[str, int]:
+    with _LOCK:
+        return {**_STATS, "entries": len(_CACHE)}
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""Run checked-in PULSE Python tools in-process or as subprocesses.
+
+Orchestrators such as run_all.py and
+run_recorded_required_gate_evaluations_v0.py launch tools as
+``[sys.executable, <tool>.py, *args]``. Every launch pays interpreter startup
+plus the tool's own yaml/jsonschema imports.
+
+The in-process runner imports each tool module once per process and calls its
+``main(argv)`` with an isolated environment, working directory, ``sys.argv``
+and captured stdout/stderr. The result has the same shape as
+``subprocess.run`` (return code, stdout, stderr), so callers keep writing the
+same log files and applying the same return-code checks.
+
+Fail-closed fallback: commands that are not a plain
+``python <tool>.py ...`` invocation, tools whose source does not define a
+top-level ``def main`` (checked with ``ast`` before anything is imported) and
+tools that fail to import are executed with ``subprocess.run`` exactly as
+before. Without a timeout, a tool module is imported once, on its first
+run, inside that run's isolated context; later runs reuse it. Import-time
+side effects therefore happen once per process, and module globals persist
+from one run of a tool to the next: tools run this way must not rely on
+fresh module state.
+
+Calls with a timeout run in a forked child of the warm process, which is
+killed when the timeout expires (``subprocess.TimeoutExpired``, as with
+``subprocess.run``). The child also does the tool's import when the warm
+process has not imported it yet, so a tool that hangs at import time is
+killed too, and nothing a timed run does (import included) persists in the
+warm process. Where ``os.fork`` is unavailable or other threads are
+running, such calls use the subprocess runner instead.
+"""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import hashlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Sequence
+
+
+RUNNER_SUBPROCESS = "subprocess"
+RUNNER_INPROCESS = "inprocess"
+SUPPORTED_RUNNERS = (RUNNER_SUBPROCESS, RUNNER_INPROCESS)
+
+# Optional environment default for callers that expose --tool-runner.
+RUNNER_ENV = "PULSE_TOOL_RUNNER"
+
+
+@dataclass(frozen=True)
+class ToolRunResult:
+    returncode: int
+    stdout: str
+    stderr: str
+    runner: str
+
+
+# resolved tool path -> main callable (None when the tool has no usable main)
+_MAIN_CACHE: dict[Path, Callable[..., Any] | None] = {}
+
+# In-process runs swap process-global state (os.environ, cwd, sys.argv,
+# sys.stdout/sys.stderr); serialize them.
+_RUN_LOCK = threading.RLock()
+
+
+def resolve_runner(value: str | None) -> str:
+    """Normalize a runner name; empty means the subprocess default."""
+    raw = (value or "").strip().lower()
+
+    if not raw:
+        return RUNNER_SUBPROCESS
+
+    if raw not in SUPPORTED_RUNNERS:
+        raise ValueError(
+            f"unsupported tool runner {value!r}; "
+            f"expected one of: {', '.join(SUPPORTED_RUNNERS)}"
+        )
+
+    return raw
+
+
+def default_runner() -> str:
+    """Runner selected by PULSE_TOOL_RUNNER (raw value, validated by callers)."""
+    return os.getenv(RUNNER_ENV, "").strip().lower() or RUNNER_SUBPROCESS
+
+
+def _module_name(path: Path) -> str:
+    digest = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:12]
+    return f"_pulse_tool_{path.stem}_{digest}"
+
+
+def _defines_main(path: Path) -> bool:
+    """True when the source defines a top-level ``def main`` (no import)."""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return False
+
+    return any(
+        isinstance(node, ast.FunctionDef) and node.name == "main"
+        for node in tree.body
+    )
+
+
+def _eligible(path: Path) -> bool:
+    return (
+        not path.is_symlink()
+        and path.resolve().is_file()
+        and path.suffix == ".py"
+        and _defines_main(path.resolve())
+    )
+
+
+def load_tool_main(path: Path) -> Callable[..., Any] | None:
+    """Import a tool module once and return its ``main`` (or None).
+
+    Sources without a top-level ``def main`` are never imported.
+    """
+    resolved = path.resolve()
+
+    if resolved in _MAIN_CACHE:
+        return _MAIN_CACHE[resolved]
+
+    main: Callable[..., Any] | None = None
+
+    if _eligible(path):
+        name = _module_name(resolved)
+        spec = importlib.util.spec_from_file_location(name, resolved)
+
+        if spec is not None and spec.loader is not None:
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:  # noqa: BLE001
+                # Import-time failures (including SystemExit) are reproduced
+                # faithfully by the subprocess fallback.
+                sys.modules.pop(name, None)
+            else:
+                candidate = getattr(module, "main", None)
+                if callable(candidate):
+                    main = candidate
+
+    _MAIN_CACHE[resolved] = main
+    return main
+
+
+def forget_tool(path: Path) -> None:
+    """Drop a cached tool ``main`` so the next run re-imports the module."""
+    resolved = path.resolve()
+    _MAIN_CACHE.pop(resolved, None)
+    sys.modules.pop(_module_name(resolved), None)
+
+
+def _is_python(executable: str) -> bool:
+    try:
+        return Path(executable).resolve() == Path(sys.executable).resolve()
+    except OSError:
+        return False
+
+
+def _inprocess_tool(cmd: Sequence[str], cwd: Path) -> Path | None:
+    if len(cmd) < 2 or not _is_python(cmd[0]):
+        return None
+
+    if not cmd[1].endswith(".py") or cmd[1].startswith("-"):
+        return None
+
+    tool = Path(cmd[1])
+    if not tool.is_absolute():
+        tool = cwd / tool
+
+    resolved = tool.resolve()
+    if resolved not in _MAIN_CACHE and not _eligible(tool):
+        _MAIN_CACHE[resolved] = None
+
+    if resolved in _MAIN_CACHE and _MAIN_CACHE[resolved] is None:
+        return None
+
+    return tool
+
+
+def _can_fork() -> bool:
+    # Forking a multi-threaded process can deadlock the child.
+    return hasattr(os, "fork") and threading.active_count() == 1
+
+
+def _accepts_argv(main: Callable[..., Any]) -> bool:
+    try:
+        return bool(inspect.signature(main).parameters)
+    except (TypeError, ValueError):
+        return False
+
+
+def _exit_code(code: Any) -> int:
+    # Mirror the interpreter's handling of SystemExit / main() return values.
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return int(code)
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _call_main(main: Callable[..., Any], argv: list[str]) -> int:
+    try:
+        code = main(argv) if _accepts_argv(main) else main()
+    except SystemExit as exc:
+        code = exc.code
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        return 1
+
+    return _exit_code(code)
+
+
+@contextlib.contextmanager
+def _isolated(
+    tool: Path,
+    argv: list[str],
+    *,
+    cwd: Path,
+    env: Mapping[str, str] | None,
+    stdout: io.StringIO,
+    stderr: io.StringIO,
+) -> Iterator[None]:
+    """Swap in the run's environment, cwd, sys.argv and captured streams."""
+    with _RUN_LOCK:
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        saved_argv = list(sys.argv)
+
+        try:
+            if env is not None:
+                os.environ.clear()
+                os.environ.update(env)
+
+            os.chdir(cwd)
+            sys.argv = [str(tool), *argv]
+
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                yield
+
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+
+
+def _run_forked(
+    cmd: Sequence[str],
+    *,
+    tool: Path,
+    main: Callable[..., Any] | None,
+    argv: list[str],
+    cwd: Path,
+    env: Mapping[str, str] | None,
+    timeout: float,
+    stdout: io.StringIO,
+    stderr: io.StringIO,
+) -> ToolRunResult | None:
+    """Call ``main`` in a forked child; kill it when ``timeout`` expires.
+
+    With ``main=None`` the child imports the tool first (inside the timeout).
+    None when that import fails.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:  # child: run, report through the pipe, never return
+        status = 1
+        try:
+            os.close(read_fd)
+            with _isolated(tool, argv, cwd=cwd, env=env, stdout=stdout, stderr=stderr):
+                if main is None:
+                    main = load_tool_main(tool)
+                returncode = _call_main(main, argv) if main is not None else None
+            payload: dict[str, Any] = {
+                "import_failed": main is None,
+                "returncode": returncode,
+                "stdout": stdout.getvalue(),
+                "stderr": stderr.getvalue(),
+            }
+            with os.fdopen(write_fd, "wb") as pipe:
+                pipe.write(json.dumps(payload).encode("utf-8"))
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    chunks: list[bytes] = []
+    deadline = time.monotonic() + timeout
+
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([read_fd], [], [], remaining)[0]:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                raise subprocess.TimeoutExpired(
+                    list(cmd),
+                    timeout,
+                    output=stdout.getvalue(),
+                    stderr=stderr.getvalue(),
+                )
+
+            chunk = os.read(read_fd, 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+
+    _, wait_status = os.waitpid(pid, 0)
+
+    if not chunks:
+        # main left the process itself (os._exit) or the child was killed.
+        return ToolRunResult(
+            returncode=os.waitstatus_to_exitcode(wait_status),
+            stdout=stdout.getvalue(),
+            stderr=stderr.getvalue(),
+            runner=RUNNER_INPROCESS,
+        )
+
+    payload = json.loads(b"".join(chunks).decode("utf-8"))
+    if payload["import_failed"]:
+        # Remember it, so later runs go straight to the subprocess runner.
+        _MAIN_CACHE[tool.resolve()] = None
+        return None
+
+    return ToolRunResult(
+        returncode=int(payload["returncode"]),
+        stdout=payload["stdout"],
+        stderr=payload["stderr"],
+        runner=RUNNER_INPROCESS,
+    )
+
+
+def _run_inprocess(
+    cmd: Sequence[str],
+    *,
+    tool: Path,
+    cwd: Path,
+    env: Mapping[str, str] | None,
+    timeout: float | None,
+) -> ToolRunResult | None:
+    """Run ``tool``'s ``main``; None when the tool cannot be imported."""
+    argv = [str(token) for token in cmd[2:]]
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    if timeout is not None:
+        # A tool this process has not imported yet is imported in the child,
+        # under the timeout.
+        return _run_forked(
+            cmd,
+            tool=tool,
+            main=_MAIN_CACHE.get(tool.resolve()),
+            argv=argv,
+            cwd=cwd,
+            env=env,
+            timeout=timeout,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    # The first run imports the module here, so import-time output and
+    # environment reads belong to this run too.
+    with _isolated(tool, argv, cwd=cwd, env=env, stdout=stdout, stderr=stderr):
+        main = load_tool_main(tool)
+        if main is not None:
+            returncode = _call_main(main, argv)
+
+    if main is None:
+        return None
+
+    return ToolRunResult(
+        returncode=returncode,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        runner=RUNNER_INPROCESS,
+    )
+
+
+def run_tool(
+    cmd: Sequence[str],
+    *,
+    cwd: Path,
+    env: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+    runner: str = RUNNER_SUBPROCESS,
+) -> ToolRunResult:
+    """Run ``cmd`` and capture text stdout/stderr.
+
+    Raises ``subprocess.TimeoutExpired`` on timeout and ``OSError`` when a
+    subprocess cannot be started, exactly like ``subprocess.run``.
+    """
+    runner = resolve_runner(runner)
+    cwd = Path(cwd)
+
+    if runner == RUNNER_INPROCESS and (timeout is None or _can_fork()):
+        tool = _inprocess_tool(cmd, cwd)
+
+        if tool is not None:
+            result = _run_inprocess(
+                cmd,
+                tool=tool,
+                cwd=cwd,
+                env=env,
+                timeout=timeout,
+            )
+            if result is not None:
+                return result
+
+    result = subprocess.run(
+        list(cmd),
+        cwd=str(cwd),
+        env=dict(env) if env is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=timeout,
+        check=False,
+    )
+
+    return ToolRunResult(
+        returncode=result.returncode,
+        stdout=result.stdout,
+        stderr=result.stderr,
+        runner=RUNNER_SUBPROCESS,
+    )
@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
 import json
 import math
 import os
@@ -27,6 +26,15 @@ import sys
 from pathlib import Path
 from typing import Any
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.file_digest_v0 import (  # noqa: E402
+    prefetch_inventory_digests,
+    sha256_file,
+)
+
 
 REPORT_SCHEMA_VERSION = "release_grade_reference_package_verification_v0"
 TOOL_VERSION = "0.1.0"
@@ -224,13 +232,8 @@ def _require_dir(path: Path, label: str) -> None:
 
 def _sha256(path: Path) -> str:
     _require_file(path, f"SHA-256 input {path}")
-    digest = hashlib.sha256()
-
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(65536), b""):
-            digest.update(chunk)
-
-    return digest.hexdigest()
+    # Release-grade verification never trusts cached digests.
+    return sha256_file(path, strict=True)
 
 
 def _iter_files(package_dir: Path) -> list[Path]:
@@ -463,6 +466,7 @@ def _verify_digest_inventory(
 
     seen: dict[str, dict[str, Any]] = {}
     duplicate = False
+    digests = prefetch_inventory_digests(package_dir, files, strict=True)
 
     for index, item in enumerate(files):
         if not isinstance(item, dict):
@@ -525,7 +529,7 @@ def _verify_digest_inventory(
             )
             continue
 
-        actual_digest = _sha256(path)
+        actual_digest = digests.get(path) or _sha256(path)
         actual_size = path.stat().st_size
         _check(
             checks,
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark: SHA-256 hashes avoided per pipeline run by the digest cache.
+
+Replays the hash calls one recorded required-gate pipeline run makes over
+the canonical policy, registry, evaluator tool and schema files. Each
+pipeline stage is emulated as a separate tool process (fresh in-memory
+cache) sharing one persistent cache file via ``PULSE_DIGEST_CACHE``.
+
+Usage:
+
+  python benchmarks/bench_digest_cache_v0.py [--runs 3] [--gates 8]
+
+Prints a JSON report with calls, hashes computed, hashes avoided and bytes
+avoided per run, plus the uncached and strict baselines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import file_digest_v0 as digest  # noqa: E402
+
+
+POLICY = "pulse_gate_policy_v0.yml"
+REGISTRY = "pulse_gate_registry_v0.yml"
+DISPATCHER = "PULSE_safe_pack_v0/tools/evaluate_required_gate_v0.py"
+PRODUCER = "PULSE_safe_pack_v0/tools/run_recorded_required_gate_evaluations_v0.py"
+MANIFEST_TOOL = "PULSE_safe_pack_v0/tools/build_release_evidence_input_manifest_v0.py"
+SCHEMAS = (
+    "schemas/required_gate_evidence_v0.schema.json",
+    "schemas/required_gate_evaluation_result_v0.schema.json",
+    "schemas/recorded_release_candidate_envelope_v0.schema.json",
+)
+
+
+def _stages(gates: int) -> list[list[str]]:
+    """Hash calls per emulated tool process, in pipeline order."""
+    producer = [POLICY, REGISTRY, PRODUCER, *SCHEMAS]
+    dispatcher = [POLICY, REGISTRY, DISPATCHER, *SCHEMAS]
+    manifest = [POLICY, REGISTRY, MANIFEST_TOOL, DISPATCHER, PRODUCER, *SCHEMAS]
+    run_all = [POLICY]
+
+    return [producer, *([dispatcher] * gates), manifest, run_all]
+
+
+def _run_pipeline(stages: list[list[str]], *, strict: bool) -> dict[str, int]:
+    totals = {"calls": 0, "hashed": 0, "cache_hits": 0, "bytes_hashed": 0, "bytes_avoided": 0}
+
+    for stage in stages:
+        # A new tool process starts with an empty memory cache and loads the
+        # persistent cache lazily.
+        digest.clear_cache()
+
+        for relative in stage:
+            digest.sha256_file(REPO_ROOT / relative, strict=strict)
+
+        digest.flush()
+
+        for key, value in digest.digest_stats().items():
+            totals[key] += value
+
+    return totals
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--gates", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    stages = _stages(args.gates)
+    report: dict[str, object] = {"gates": args.gates, "stages": len(stages)}
+
+    saved = os.environ.get(digest.CACHE_ENV)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ[digest.CACHE_ENV] = str(Path(tmp) / "digests.json")
+
+        try:
+            started = time.perf_counter()
+            strict = _run_pipeline(stages, strict=True)
+            report["strict_baseline"] = {
+                **strict,
+                "seconds": round(time.perf_counter() - started, 6),
+            }
+
+            # Strict hashing refreshed the shared cache; start cold.
+            os.remove(os.environ[digest.CACHE_ENV])
+
+            runs = []
+            for index in range(args.runs):
+                started = time.perf_counter()
+                totals = _run_pipeline(stages, strict=False)
+                runs.append(
+                    {
+                        "run": index + 1,
+                        **totals,
+                        "hashes_avoided": totals["cache_hits"],
+                        "seconds": round(time.perf_counter() - started, 6),
+                    }
+                )
+            report["cached_runs"] = runs
+
+        finally:
+            digest.clear_cache()
+            if saved is None:
+                os.environ.pop(digest.CACHE_ENV, None)
+            else:
+                os.environ[digest.CACHE_ENV] = saved
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Microbenchmark: exact vs streaming (sketch) hazard calibration.
+
+Builds a synthetic epf_hazard_log.jsonl with ``--entries`` lines spread over a
+few gate_ids, each carrying ``--features`` numeric snapshot features, then
+runs ``epf_hazard_calibrate.main`` in both modes and reports:
+
+- wall time and tracemalloc peak per mode;
+- the reported worst-case rank error of streaming mode and the observed
+  rank error of its global warn/crit thresholds against the exact data.
+
+Usage:
+
+  python benchmarks/bench_epf_hazard_calibrate_sketch_v0.py [--entries 50000] [--features 16] [--sketch-k 1024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import epf_hazard_calibrate  # noqa: E402
+
+
+GATES = ("EPF_field_main", "EPF_field_aux", "EPF_field_shadow")
+
+
+def _event(rng: random.Random, i: int, n_features: int) -> dict[str, Any]:
+    return {
+        "gate_id": GATES[i % len(GATES)],
+        "hazard": {"E": rng.betavariate(2.0, 5.0)},
+        "snapshot_current": {f"metrics.m{k}": rng.gauss(float(k), 1.0) for k in range(n_features)},
+    }
+
+
+def _run(argv: list[str]) -> tuple[dict[str, Any], float, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rc = epf_hazard_calibrate.main(argv)
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if rc != 0:
+        raise SystemExit(f"epf_hazard_calibrate failed: {argv}")
+    return json.loads(Path(argv[argv.index("--out-json") + 1]).read_text()), elapsed, peak
+
+
+def _observed_rank_error(sorted_values: list[float], q: float, p: float) -> float:
+    n = len(sorted_values)
+    lo = bisect.bisect_left(sorted_values, q) / n
+    hi = bisect.bisect_right(sorted_values, q) / n
+    return max(0.0, lo - p, p - hi)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--sketch-k", type=int, default=1024)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "epf_hazard_log.jsonl"
+        all_E = []
+        with log_path.open("w", encoding="utf-8") as f:
+            for i in range(args.entries):
+                ev = _event(rng, i, args.features)
+                all_E.append(ev["hazard"]["E"])
+                f.write(json.dumps(ev, sort_keys=True) + "\n")
+        all_E.sort()
+
+        base = ["--log", str(log_path), "--warn-p", "0.85", "--crit-p", "0.97"]
+        exact, exact_s, exact_peak = _run(base + ["--out-json", str(Path(tmp) / "exact.json")])
+        stream, stream_s, stream_peak = _run(
+            base + ["--streaming", "--sketch-k", str(args.sketch_k), "--out-json", str(Path(tmp) / "stream.json")]
+        )
+
+        report = {
+            "entries": args.entries,
+            "features": args.features,
+            "sketch_k": args.sketch_k,
+            "seconds": {"exact": round(exact_s, 3), "streaming": round(stream_s, 3)},
+            "peak_mb": {"exact": round(exact_peak / 2**20, 2), "streaming": round(stream_peak / 2**20, 2)},
+            "rank_error": {
+                "reported_bound": stream["streaming"]["global_rank_error"],
+                "observed_warn": _observed_rank_error(all_E, stream["global"]["warn_threshold"], 0.85),
+                "observed_crit": _observed_rank_error(all_E, stream["global"]["crit_threshold"], 0.97),
+            },
+            "threshold_delta": {
+                k: abs(stream["global"][k] - exact["global"][k]) for k in ("warn_threshold", "crit_threshold")
+            },
+        }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
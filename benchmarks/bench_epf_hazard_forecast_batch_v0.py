@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-gate forecast_hazard vs forecast_hazard_batch.
+
+Builds ``--gates`` synthetic (current, reference) snapshot pairs with
+``--features`` scaled FeatureSpecs (nested dotted keys) and times:
+
+- ``per_gate``: one forecast_hazard call per gate (the run_all pattern);
+- ``batch``: forecast_hazard_batch with the plan compiled per call;
+- ``batch_plan``: forecast_hazard_batch with a precompiled plan.
+
+Usage:
+
+  python benchmarks/bench_epf_hazard_forecast_batch_v0.py [--gates 2000] [--features 64] [--top-k 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_batch import compile_feature_plan  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_features import FeatureSpec, RobustScaler  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_forecast import (  # noqa: E402
+    HazardConfig,
+    forecast_hazard,
+    forecast_hazard_batch,
+)
+
+
+def _snapshot(rng: random.Random, n_features: int) -> dict[str, Any]:
+    return {"metrics": {f"m{k}": rng.gauss(float(k), 1.0) for k in range(n_features)}}
+
+
+def _ms(func: Callable[[], Any]) -> tuple[float, Any]:
+    started = time.perf_counter()
+    out = func()
+    return round((time.perf_counter() - started) * 1e3, 2), out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gates", type=int, default=2000)
+    parser.add_argument("--features", type=int, default=64)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    specs = [FeatureSpec(key=f"metrics.m{k}", weight=1.0 + (k % 3)) for k in range(args.features)]
+    scalers = {s.key: RobustScaler(median=float(k), mad=1.0) for k, s in enumerate(specs)}
+    cfg = HazardConfig(feature_specs=specs, feature_scalers=scalers, top_k_contributors=args.top_k)
+
+    currents = [_snapshot(rng, args.features) for _ in range(args.gates)]
+    references = [_snapshot(rng, args.features) for _ in range(args.gates)]
+    stability = [{"RDSI": rng.random()} for _ in range(args.gates)]
+    histories = [[rng.random(), rng.random()] for _ in range(args.gates)]
+    rows = list(zip(currents, references, stability, histories))
+
+    per_gate_ms, single = _ms(lambda: [forecast_hazard(c, r, s, h, cfg) for c, r, s, h in rows])
+    batch_ms, batch = _ms(lambda: forecast_hazard_batch(currents, references, stability, histories, cfg))
+    plan = compile_feature_plan(specs, scalers)
+    plan_ms, _ = _ms(
+        lambda: forecast_hazard_batch(currents, references, stability, histories, cfg, plan=plan)
+    )
+
+    if [(s.zone, s.reason) for s in single] != [(b.zone, b.reason) for b in batch]:
+        raise SystemExit("batch forecast differs from per-gate forecast")
+
+    report = {
+        "gates": args.gates,
+        "features": args.features,
+        "top_k": args.top_k,
+        "ms": {"per_gate": per_gate_ms, "batch": batch_ms, "batch_plan": plan_ms},
+        "speedup": round(per_gate_ms / max(plan_ms, 1e-9), 2),
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
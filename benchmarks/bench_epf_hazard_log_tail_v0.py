@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Microbenchmark: indexed hazard-log tail reads vs the full-file scan.
+
+Builds a synthetic epf_hazard_log.jsonl with ``--entries`` lines spread over a
+few gate_ids, then times "last N entries for gate X":
+
+- ``full_scan``: json-parse every line and keep the gate's last N (what the
+  run_all loaders did before the index);
+- ``index_cold``: ``HazardLogStore`` with no sidecar (one-off build);
+- ``index_warm``: ``HazardLogStore`` with an up-to-date sidecar;
+- ``index_append``: warm sidecar after one more appended entry.
+
+The index runs use ``persist=True`` like run_all, the log's writer; read-only
+stores scan what the sidecar does not cover without saving it.
+
+Usage:
+
+  python benchmarks/bench_epf_hazard_log_tail_v0.py [--entries 200000] [--tail 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (  # noqa: E402
+    HazardLogStore,
+    index_path_for,
+)
+
+
+GATES = ("EPF_field_main", "EPF_field_aux", "EPF_field_shadow")
+
+
+def _event(i: int) -> dict[str, Any]:
+    return {
+        "gate_id": GATES[i % len(GATES)],
+        "timestamp": f"2026-01-01T00:00:{i % 60:02d}Z",
+        "hazard": {"E": (i % 97) / 97.0, "T": (i % 89) / 89.0, "zone": "GREEN"},
+        "snapshot_current": {f"metrics.m{k}": float(k) for k in range(8)},
+    }
+
+
+def _full_scan(path: Path, gate_id: str, n: int) -> list[dict[str, Any]]:
+    out = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if str(obj.get("gate_id", "")) == gate_id:
+                out.append(obj)
+    return out[-n:]
+
+
+def _ms(func: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    func()
+    return round((time.perf_counter() - started) * 1e3, 2)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--tail", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    gate_id = GATES[0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "epf_hazard_log.jsonl"
+        with log_path.open("w", encoding="utf-8") as f:
+            for i in range(args.entries):
+                f.write(json.dumps(_event(i), sort_keys=True) + "\n")
+
+        expected = _full_scan(log_path, gate_id, args.tail)
+
+        timings = {"full_scan": _ms(lambda: _full_scan(log_path, gate_id, args.tail))}
+        timings["index_cold"] = _ms(lambda: HazardLogStore(log_path, persist=True).tail(gate_id, args.tail))
+        timings["index_warm"] = _ms(lambda: HazardLogStore(log_path, persist=True).tail(gate_id, args.tail))
+
+        if HazardLogStore(log_path).tail(gate_id, args.tail) != expected:
+            raise SystemExit("indexed tail differs from full scan")
+
+        with log_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(_event(args.entries), sort_keys=True) + "\n")
+        timings["index_append"] = _ms(lambda: HazardLogStore(log_path, persist=True).tail(gate_id, args.tail))
+
+        report = {
+            "entries": args.entries,
+            "tail": args.tail,
+            "log_bytes": log_path.stat().st_size,
+            "index_bytes": index_path_for(log_path).stat().st_size,
+            "ms": timings,
+        }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
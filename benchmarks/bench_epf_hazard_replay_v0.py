@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Microbenchmark: vectorized hazard replay vs per-entry forecast_hazard.
+
+Builds a synthetic epf_hazard_log.jsonl with ``--entries`` lines over
+``--gates`` gate_ids, then recomputes T/D/E/zone under ``--configs``
+candidate HazardConfigs (feature mode, differing thresholds and
+min_history):
+
+- ``per_entry``: parse the log once, then call forecast_hazard per entry and
+  config with a per-gate T history (what rerunning the probes amounts to);
+- ``replay``: ``replay_hazard_log`` (one streaming pass, vectorized chunks).
+
+Both are checked to produce the same zones.
+
+Usage:
+
+  python benchmarks/bench_epf_hazard_replay_v0.py [--entries 50000] [--configs 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_features import FeatureSpec, RobustScaler  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_forecast import HazardConfig, forecast_hazard  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import iter_entries  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_replay import replay_hazard_log  # noqa: E402
+
+
+FEATURES = [f"metrics.m{k}" for k in range(16)]
+
+
+def _event(rng: random.Random, i: int, gates: int) -> Dict[str, Any]:
+    return {
+        "gate_id": f"EPF_gate_{rng.randrange(gates)}",
+        "timestamp": f"2026-01-01T00:00:{i % 60:02d}Z",
+        "event_id": f"{i:016x}",
+        "hazard": {"T": 0.0, "S": rng.random(), "D": 0.0, "E": 0.0, "zone": "GREEN"},
+        "snapshot_current": {"metrics": {f"m{k}": rng.gauss(0.0, 1.0) for k in range(16)}},
+        "snapshot_reference": {"metrics": {f"m{k}": 0.0 for k in range(16)}},
+    }
+
+
+def _configs(n: int) -> Dict[str, HazardConfig]:
+    specs = [FeatureSpec(key=k, weight=1.0 + (j % 3)) for j, k in enumerate(FEATURES)]
+    scalers = {k: RobustScaler(median=0.0, mad=0.7) for k in FEATURES[::2]}
+    return {
+        f"cfg{c}": HazardConfig(
+            alpha=0.5 + 0.25 * c,
+            warn_threshold=1.0 + 0.5 * c,
+            crit_threshold=3.0 + c,
+            min_history=3 + (c % 3),
+            feature_specs=specs,
+            feature_scalers=scalers,
+        )
+        for c in range(n)
+    }
+
+
+def _per_entry(entries: List[Dict[str, Any]], configs: Dict[str, HazardConfig]) -> Dict[str, List[str]]:
+    out: Dict[str, List[str]] = {}
+    for name, cfg in configs.items():
+        histories: Dict[str, List[float]] = {}
+        zones = []
+        for ev in entries:
+            hist = histories.setdefault(ev["gate_id"], [])
+            state = forecast_hazard(
+                ev["snapshot_current"], ev["snapshot_reference"], {"RDSI": ev["hazard"]["S"]}, hist, cfg
+            )
+            hist.append(state.T)
+            zones.append(state.zone)
+        out[name] = zones
+    return out
+
+
+def _ms(func: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    func()
+    return round((time.perf_counter() - started) * 1e3, 2)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--gates", type=int, default=50)
+    parser.add_argument("--configs", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    configs = _configs(args.configs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "epf_hazard_log.jsonl"
+        with log_path.open("w", encoding="utf-8") as f:
+            for i in range(args.entries):
+                f.write(json.dumps(_event(rng, i, args.gates), sort_keys=True) + "\n")
+
+        results: Dict[str, Any] = {}
+        timings = {
+            "per_entry": _ms(lambda: results.update(loop=_per_entry(list(iter_entries(log_path)), configs))),
+            "replay": _ms(lambda: results.update(replay=replay_hazard_log(log_path, configs))),
+        }
+
+        for name in configs:
+            if list(results["replay"].zones(name)) != results["loop"][name]:
+                raise SystemExit(f"replay zones differ from forecast_hazard for {name}")
+
+    report = {
+        "entries": args.entries,
+        "gates": args.gates,
+        "configs": args.configs,
+        "ms": timings,
+        "speedup": round(timings["per_entry"] / max(timings["replay"], 1e-3), 1),
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-record hazard-log appends vs the group-commit writer.
+
+Appends ``--entries`` synthetic hazard entries to a fresh log three ways:
+
+- ``per_record``: ``append_entry`` per entry (open/append/close each time,
+  what ``probe_hazard_and_append_log`` did for every probe);
+- ``batched``: one ``open_appender`` sink with ``--batch-size``;
+- ``batched_fsync``: the same sink with one fsync per batch.
+
+All three logs are checked to hold the same entries.
+
+Usage:
+
+  python benchmarks/bench_jsonl_append_v0.py [--entries 20000] [--batch-size 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (  # noqa: E402
+    append_entry,
+    iter_entries,
+    open_appender,
+)
+
+
+def _event(i: int) -> dict[str, Any]:
+    return {
+        "gate_id": f"EPF_field_{i % 3}",
+        "timestamp": f"2026-01-01T00:00:{i % 60:02d}Z",
+        "hazard": {"E": (i % 97) / 97.0, "T": (i % 89) / 89.0, "zone": "GREEN"},
+        "snapshot_current": {f"metrics.m{k}": float(k) for k in range(8)},
+    }
+
+
+def _ms(func: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    func()
+    return round((time.perf_counter() - started) * 1e3, 2)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    events = [_event(i) for i in range(args.entries)]
+
+    def per_record(path: Path) -> None:
+        for ev in events:
+            append_entry(path, ev)
+
+    def batched(path: Path, fsync: bool = False) -> None:
+        with open_appender(path, batch_size=args.batch_size, fsync=fsync) as sink:
+            sink.extend(events)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {name: Path(tmp) / name / "epf_hazard_log.jsonl" for name in ("per_record", "batched", "batched_fsync")}
+
+        timings = {
+            "per_record": _ms(lambda: per_record(paths["per_record"])),
+            "batched": _ms(lambda: batched(paths["batched"])),
+            "batched_fsync": _ms(lambda: batched(paths["batched_fsync"], fsync=True)),
+        }
+
+        for path in paths.values():
+            if list(iter_entries(path)) != events:
+                raise SystemExit(f"log differs from the appended entries: {path}")
+
+        report = {
+            "entries": args.entries,
+            "batch_size": args.batch_size,
+            "ms": timings,
+            "speedup": round(timings["per_record"] / max(timings["batched"], 1e-3), 1),
+        }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
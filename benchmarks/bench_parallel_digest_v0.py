@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark: serial 8 KiB hashing vs the parallel digest engine.
+
+Hashes a synthetic tree (many small files plus a few large ones that take
+the mmap path) three ways:
+
+- ``serial_8k``: the previous ``compute_checksums.py`` loop (8 KiB reads);
+- ``engine_jobs_1``: ``sha256_many(..., jobs=1)`` (large buffers / mmap);
+- ``engine_jobs_N``: ``sha256_many(..., jobs=N)`` on a thread pool.
+
+Every run is strict (no digest cache) so each variant reads every byte.
+
+Usage:
+
+  python benchmarks/bench_parallel_digest_v0.py [--small 400] [--large 4] [--jobs 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import file_digest_v0 as digest  # noqa: E402
+
+
+def _serial_8k(paths: list[Path]) -> dict[Path, str]:
+    out: dict[Path, str] = {}
+
+    for path in paths:
+        h = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(8192), b""):
+                h.update(chunk)
+        out[path] = h.hexdigest()
+
+    return out
+
+
+def _timed(label: str, func, report: dict[str, object], expected=None):
+    started = time.perf_counter()
+    result = func()
+    report[label] = round(time.perf_counter() - started, 6)
+
+    if expected is not None and result != expected:
+        raise SystemExit(f"{label}: digests differ from the serial baseline")
+
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--small", type=int, default=400)
+    parser.add_argument("--small-bytes", type=int, default=256 * 1024)
+    parser.add_argument("--large", type=int, default=4)
+    parser.add_argument("--large-bytes", type=int, default=64 * 1024 * 1024)
+    parser.add_argument("--jobs", type=int, default=digest.DEFAULT_JOBS)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths: list[Path] = []
+
+        for index in range(args.small):
+            path = root / "small" / f"{index:05d}.bin"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(os.urandom(args.small_bytes))
+            paths.append(path)
+
+        for index in range(args.large):
+            path = root / "large" / f"{index:03d}.bin"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(os.urandom(args.large_bytes))
+            paths.append(path)
+
+        total = sum(path.stat().st_size for path in paths)
+        report: dict[str, object] = {
+            "files": len(paths),
+            "bytes": total,
+            "jobs": args.jobs,
+            "cpu_count": os.cpu_count(),
+        }
+
+        expected = _timed("serial_8k_seconds", lambda: _serial_8k(paths), report)
+        _timed(
+            "engine_jobs_1_seconds",
+            lambda: digest.sha256_many(paths, strict=True, jobs=1),
+            report,
+            expected,
+        )
+        _timed(
+            "engine_jobs_n_seconds",
+            lambda: digest.sha256_many(paths, strict=True, jobs=args.jobs),
+            report,
+            expected,
+        )
+
+        baseline = float(report["serial_8k_seconds"])
+        parallel = float(report["engine_jobs_n_seconds"])
+        report["speedup_vs_serial_8k"] = round(baseline / parallel, 2) if parallel else None
+        report["engine_mib_per_second"] = (
+            round(total / parallel / (1024 * 1024), 1) if parallel else None
+        )
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Microbenchmark: pulse_client_v0 CLI with and without a warm daemon.
+
+Runs ``--runs`` client invocations (each a fresh interpreter, as in a local
+edit/check loop) of:
+
+- ``check-gates`` on a synthetic status.json;
+- ``validate`` of a document against a repository schema.
+
+``fallback`` has no daemon, so every invocation imports the tool stack and
+parses/compiles in-process; ``daemon`` sends the same requests to a running
+pulse_daemon_v0.py. Both are checked to return the same exit codes.
+
+Usage:
+
+  python benchmarks/bench_pulse_daemon_v0.py [--runs 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CLIENT = REPO_ROOT / "PULSE_safe_pack_v0" / "tools" / "pulse_client_v0.py"
+DAEMON = REPO_ROOT / "PULSE_safe_pack_v0" / "tools" / "pulse_daemon_v0.py"
+SCHEMA = REPO_ROOT / "schemas" / "gates.schema.json"
+
+
+def _client(sock: Path, args: List[str]) -> int:
+    return subprocess.run(
+        [sys.executable, str(CLIENT), "--socket", str(sock), *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    ).returncode
+
+
+def _time(sock: Path, commands: Dict[str, List[str]], runs: int) -> Dict[str, Dict[str, float]]:
+    out: Dict[str, Dict[str, float]] = {}
+    for name, args in commands.items():
+        codes = set()
+        started = time.perf_counter()
+        for _ in range(runs):
+            codes.add(_client(sock, args))
+        out[name] = {
+            "ms_per_run": round((time.perf_counter() - started) * 1e3 / runs, 2),
+            "returncode": codes.pop() if len(codes) == 1 else -1,
+        }
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        sock = tmp_path / "pulse.sock"
+        status = tmp_path / "status.json"
+        status.write_text(json.dumps({"gates": {f"g{i}": True for i in range(50)}}), encoding="utf-8")
+        registry = tmp_path / "registry.json"
+        registry.write_text(json.dumps({"version": "v0", "gates": {}}), encoding="utf-8")
+
+        commands = {
+            "check_gates": ["check-gates", "--status", str(status), "--require", "g1", "g2", "g3"],
+            "validate": ["validate", "--schema", str(SCHEMA), "--instance", str(registry)],
+        }
+
+        fallback = _time(sock, commands, args.runs)
+
+        proc = subprocess.Popen(
+            [sys.executable, str(DAEMON), "--socket", str(sock)],
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        )
+        try:
+            deadline = time.monotonic() + 120
+            while _client(sock, ["--no-fallback", "ping"]) != 0:
+                if time.monotonic() > deadline or proc.poll() is not None:
+                    raise SystemExit("daemon did not start")
+                time.sleep(0.2)
+            daemon = _time(sock, commands, args.runs)
+        finally:
+            _client(sock, ["shutdown"])
+            proc.wait(30)
+
+    for name in commands:
+        if fallback[name]["returncode"] != daemon[name]["returncode"]:
+            raise SystemExit(f"{name}: daemon and fallback exit codes differ")
+
+    report = {
+        "runs": args.runs,
+        "fallback": fallback,
+        "daemon": daemon,
+        "speedup": {
+            name: round(fallback[name]["ms_per_run"] / max(daemon[name]["ms_per_run"], 1e-3), 1)
+            for name in commands
+        },
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
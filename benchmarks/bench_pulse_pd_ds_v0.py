@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark: per-draw DS loop vs the batched cut DS engine.
+
+Runs DS on a synthetic ``demo_toy``-style Gaussian dataset two ways:
+
+- ``loop``: ``pd.compute_ds`` with ``eps_sampler_cut`` (one theta copy and
+  one ``decision_cut`` pass over X per draw);
+- ``batched``: ``cut_adapter.compute_ds_cuts`` (one (M, n_cuts) draw, only
+  unsettled samples enter the (M, n) decision matrix).
+
+Both use the same seed and the results are checked for exact equality.
+
+Usage:
+
+  python benchmarks/bench_pulse_pd_ds_v0.py [--n 1000000] [--M 24] [--sigma 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from pulse_pd.cut_adapter import compute_ds_cuts, decision_cut, eps_sampler_cut  # noqa: E402
+from pulse_pd.pd import compute_ds  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--M", type=int, default=24)
+    parser.add_argument("--sigma", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    x = np.random.default_rng(args.seed).normal(size=(args.n, 2))
+    theta = {
+        "sigma": args.sigma,
+        "cuts": [
+            {"feat": 0, "op": ">", "thr": 0.0},
+            {"feat": 1, "op": ">", "thr": 0.0},
+        ],
+    }
+
+    started = time.perf_counter()
+    rng = np.random.default_rng(args.seed)
+    loop = compute_ds(
+        decision_fn=decision_cut,
+        X=x,
+        theta=theta,
+        eps_sampler=lambda th: eps_sampler_cut(th, rng=rng),
+        M=args.M,
+    )
+    loop_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batched = compute_ds_cuts(x, theta, args.M, seed=args.seed)
+    batched_s = time.perf_counter() - started
+
+    if not np.array_equal(loop, batched):
+        raise SystemExit("DS results differ")
+
+    report = {
+        "n": args.n,
+        "M": args.M,
+        "sigma": args.sigma,
+        "seconds": {
+            "loop": round(loop_s, 4),
+            "batched": round(batched_s, 4),
+        },
+        "speedup": round(loop_s / batched_s, 2) if batched_s > 0 else None,
+    }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
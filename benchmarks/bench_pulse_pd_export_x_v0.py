@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark: CSV -> X.npz export, per-row DictReader path vs streaming blocks.
+
+Writes a synthetic event dump (run/lumi/event/weight + ``--d`` float features)
+and converts it with:
+
+- ``reference``: the previous ``export_x_npz`` path (``csv.DictReader`` into a
+  list of row dicts, then ``float()`` per cell, then ``np.savez_compressed``);
+- ``streaming``: ``export_x_npz.convert_csv`` to an .npz;
+- ``streaming_npy_dir``: ``convert_csv`` to a directory of .npy files.
+
+Reports rows/s and peak traced Python memory, and checks that all outputs hold
+the same arrays.
+
+Usage:
+
+  python benchmarks/bench_pulse_pd_export_x_v0.py [--n 500000] [--d 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from pulse_pd.export_x_npz import convert_csv  # noqa: E402
+
+
+def _reference(in_csv: str, out: str) -> None:
+    with open(in_csv, "r", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    names = [c for c in rows[0] if c not in ("run", "lumi", "event", "weight")]
+    np.savez_compressed(
+        out,
+        X=np.asarray([[float(r[c].strip()) for c in names] for r in rows], dtype=np.float64),
+        feature_names=np.asarray(names, dtype=str),
+        run=np.asarray([int(float(r["run"])) for r in rows], dtype=np.int64),
+        lumi=np.asarray([int(float(r["lumi"])) for r in rows], dtype=np.int64),
+        event=np.asarray([int(float(r["event"])) for r in rows], dtype=np.int64),
+        weight=np.asarray([float(r["weight"]) for r in rows], dtype=np.float64),
+    )
+
+
+def _measure(fn: Callable[[], Any], n: int) -> Dict[str, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "seconds": round(seconds, 3),
+        "rows_per_s": round(n / seconds),
+        "peak_mib": round(peak / 2**20, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=500_000)
+    parser.add_argument("--d", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        in_csv = os.path.join(tmp, "events.csv")
+        x = np.random.default_rng(args.seed).normal(size=(args.n, args.d))
+        with open(in_csv, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["run", "lumi", "event", "weight"] + [f"f{j}" for j in range(args.d)])
+            for i, row in enumerate(x.tolist()):
+                w.writerow([1, 1 + i // 1000, i, 1.0] + row)
+
+        outs = {
+            "reference": os.path.join(tmp, "ref.npz"),
+            "streaming": os.path.join(tmp, "stream.npz"),
+            "streaming_npy_dir": os.path.join(tmp, "stream_dir"),
+        }
+        runs = {
+            "reference": lambda: _reference(in_csv, outs["reference"]),
+            "streaming": lambda: convert_csv(in_csv, outs["streaming"]),
+            "streaming_npy_dir": lambda: convert_csv(in_csv, outs["streaming_npy_dir"]),
+        }
+        results = {name: _measure(fn, args.n) for name, fn in runs.items()}
+
+        with np.load(outs["reference"]) as ref, np.load(outs["streaming"]) as new:
+            identical = sorted(ref.keys()) == sorted(new.keys()) and all(
+                np.array_equal(ref[k], new[k])
+                and np.array_equal(ref[k], np.load(os.path.join(outs["streaming_npy_dir"], f"{k}.npy")))
+                for k in ref.keys()
+            )
+
+    report = {
+        "n": args.n,
+        "d": args.d,
+        "results": results,
+        "speedup": round(results["reference"]["seconds"] / results["streaming"]["seconds"], 2),
+        "identical": bool(identical),
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
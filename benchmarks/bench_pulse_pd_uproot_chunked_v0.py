@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark: in-memory vs chunked ROOT export (pulse_pd.hep.export_uproot_npz).
+
+Writes a synthetic flat ``Events`` TTree with ``--d`` float features plus
+run/luminosityBlock/event with uproot, then exports it with
+``export_root_to_npz`` (all branches read at once, then stacked) and with
+``export_root_chunked`` (``--chunk-entries`` ranges into memory-mapped .npy
+files). Reports seconds and peak traced memory for each and checks that X is
+identical. Requires uproot (``pip install uproot``).
+
+Usage:
+
+  python benchmarks/bench_pulse_pd_uproot_chunked_v0.py [--n 2000000] [--d 16] [--chunk-entries 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from pulse_pd.hep.export_uproot_npz import export_root_chunked, export_root_to_npz  # noqa: E402
+
+
+def _measure(fn: Callable[[], Any]) -> Dict[str, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": round(seconds, 3), "peak_mib": round(peak / 2**20, 1)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=2_000_000)
+    parser.add_argument("--d", type=int, default=16)
+    parser.add_argument("--chunk-entries", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        import uproot  # type: ignore
+    except Exception:
+        raise SystemExit("uproot is required for this benchmark: pip install uproot")
+
+    rng = np.random.default_rng(args.seed)
+    features = [f"f{j}" for j in range(args.d)]
+    branches = {name: rng.normal(size=args.n).astype(np.float32) for name in features}
+    branches.update(
+        run=np.full(args.n, 1, dtype=np.int32),
+        luminosityBlock=(np.arange(args.n) // 1000).astype(np.int32),
+        event=np.arange(args.n, dtype=np.int64),
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root_path = os.path.join(tmp, "events.root")
+        with uproot.recreate(root_path) as f:
+            # Filled in batches so the TTree has many baskets, like a real file.
+            tree = f.mktree("Events", {k: v.dtype for k, v in branches.items()})
+            for start in range(0, args.n, 100_000):
+                tree.extend({k: v[start : start + 100_000] for k, v in branches.items()})
+        del branches
+
+        common = dict(
+            root_path=root_path,
+            tree="Events",
+            feature_branches=features,
+            run_branch="run",
+            lumi_branch="luminosityBlock",
+            event_branch="event",
+        )
+        results = {
+            "in_memory": _measure(
+                lambda: export_root_to_npz(out_npz=os.path.join(tmp, "mem.npz"), compress=False, **common)
+            ),
+            "chunked": _measure(
+                lambda: export_root_chunked(
+                    out=os.path.join(tmp, "chunked"), chunk_entries=args.chunk_entries, **common
+                )
+            ),
+        }
+
+        with np.load(os.path.join(tmp, "mem.npz")) as z:
+            identical = bool(np.array_equal(z["X"], np.load(os.path.join(tmp, "chunked", "X.npy"), mmap_mode="r")))
+
+    report = {
+        "n": args.n,
+        "d": args.d,
+        "chunk_entries": args.chunk_entries,
+        "x_mib": round(args.n * args.d * 8 / 2**20, 1),
+        "results": results,
+        "identical": identical,
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
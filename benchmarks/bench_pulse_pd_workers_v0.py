@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Scaling benchmark: chunked PULSE–PD over 1..N worker processes.
+
+Generates the ``demo_toy.make_synthetic_data`` two-Gaussian dataset, saves it
+as ``.npy`` (so workers memory-map it) and runs
+``chunked.run_pd_from_cuts_chunked`` with an increasing worker count. Every
+result file is checked for exact equality with the single-worker run.
+
+Usage:
+
+  python benchmarks/bench_pulse_pd_workers_v0.py [--n 2000000] [--max-workers 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from pulse_pd.chunked import run_pd_from_cuts_chunked  # noqa: E402
+from pulse_pd.demo_toy import make_synthetic_data  # noqa: E402
+
+
+THETA = {
+    "k": 8.0,
+    "sigma": 0.05,
+    "cuts": [
+        {"feat": 0, "op": ">", "thr": 0.0},
+        {"feat": 1, "op": ">", "thr": 0.0},
+    ],
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=2_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=131_072)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    X, _ = make_synthetic_data(args.n, args.seed)
+
+    counts = sorted({1, *[w for w in (2, 4, 8, 16, 32) if w < args.max_workers], args.max_workers})
+    seconds: dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory(prefix="pulse-pd-workers-") as tmp:
+        x_path = os.path.join(tmp, "X.npy")
+        np.save(x_path, X)
+        baseline = None
+
+        for workers in counts:
+            out_path = os.path.join(tmp, f"res_{workers}.npy")
+            started = time.perf_counter()
+            res = run_pd_from_cuts_chunked(
+                x_path,
+                THETA,
+                out_path=out_path,
+                chunk_rows=args.chunk_rows,
+                workers=workers,
+                seed=args.seed,
+            )
+            seconds[str(workers)] = round(time.perf_counter() - started, 4)
+
+            current = np.array(res)
+            del res
+            if baseline is None:
+                baseline = current
+            elif not np.array_equal(baseline, current):
+                raise SystemExit(f"results differ at workers={workers}")
+
+    report = {
+        "n": args.n,
+        "chunk_rows": args.chunk_rows,
+        "cpu_count": os.cpu_count(),
+        "seconds": seconds,
+        "speedup": {w: round(seconds["1"] / s, 2) for w, s in seconds.items() if s > 0},
+    }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
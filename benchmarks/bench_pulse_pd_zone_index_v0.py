@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark: per-zone boolean masks vs ZoneIndex membership queries.
+
+Selects the events of ``--zones`` random rectangles over pairs of ``--d``
+columns of a synthetic dataset, once the way export_zone_events did (a full
+boolean mask over all n events per zone) and once with
+``pulse_pd.export_zone_events.ZoneIndex`` (one argsort per column, then
+searchsorted ranges per zone, index build included in the timing), and
+checks that both return the same indices in the same order.
+
+Usage:
+
+  python benchmarks/bench_pulse_pd_zone_index_v0.py [--n 2000000] [--d 6] [--zones 300]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from pulse_pd.export_zone_events import ZoneIndex  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=2_000_000)
+    parser.add_argument("--d", type=int, default=6)
+    parser.add_argument("--zones", type=int, default=300)
+    parser.add_argument("--width", type=float, default=0.1, help="Zone side length (in standard deviations)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    x = rng.normal(size=(args.n, args.d))
+    zones = []
+    for _ in range(args.zones):
+        jx, jy = (int(j) for j in rng.choice(args.d, 2, replace=False))
+        x0, y0 = rng.uniform(-2.0, 2.0, size=2)
+        zones.append((jx, float(x0), float(x0 + args.width), jy, float(y0), float(y0 + args.width)))
+
+    seconds: Dict[str, float] = {}
+    results: Dict[str, List[np.ndarray]] = {"mask": [], "index": []}
+
+    started = time.perf_counter()
+    for jx, x0, x1, jy, y0, y1 in zones:
+        xv, yv = x[:, jx], x[:, jy]
+        results["mask"].append(np.where((xv >= x0) & (xv < x1) & (yv >= y0) & (yv < y1))[0])
+    seconds["mask"] = round(time.perf_counter() - started, 4)
+
+    started = time.perf_counter()
+    index = ZoneIndex(x)
+    for zone in zones:
+        results["index"].append(index.query(*zone))
+    seconds["index"] = round(time.perf_counter() - started, 4)
+
+    report = {
+        "n": args.n,
+        "d": args.d,
+        "zones": args.zones,
+        "seconds": seconds,
+        "speedup": round(seconds["mask"] / seconds["index"], 2),
+        "identical": all(np.array_equal(a, b) for a, b in zip(results["mask"], results["index"])),
+    }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0 if report["identical"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
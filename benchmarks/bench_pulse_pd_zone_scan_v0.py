@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark: per-pair histogram2d heatmaps vs the single-pass zone scan.
+
+Ranks the mean-PI bins of every feature pair of a synthetic dataset, once the
+way run_cut_pd did for one pair (two ``np.histogram2d`` calls per pair, a
+nested loop over all bins and a full sort), and once with
+``pulse_pd.zone_scan.scan_zones`` (each column binned once, ``np.bincount``
+per pair, ``np.argpartition`` top-k), and checks that both return the same
+ranked bins.
+
+Usage:
+
+  python benchmarks/bench_pulse_pd_zone_scan_v0.py [--n 1000000] [--d 8] [--bins 60] [--topk 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from pulse_pd.zone_scan import scan_zones  # noqa: E402
+
+
+def _histogram2d_scan(
+    x: np.ndarray, pi: np.ndarray, bins: int, topk: int, min_count: int
+) -> List[Dict[str, Any]]:
+    ranked: List[Dict[str, Any]] = []
+    for jx, jy in itertools.combinations(range(x.shape[1]), 2):
+        x1, x2 = x[:, jx], x[:, jy]
+        rng = [np.percentile(x1, [1, 99]), np.percentile(x2, [1, 99])]
+        h_sum, xe, ye = np.histogram2d(x1, x2, bins=bins, range=rng, weights=pi)
+        h_cnt, _, _ = np.histogram2d(x1, x2, bins=bins, range=rng)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            h_mean = np.nan_to_num(h_sum / h_cnt, nan=0.0, posinf=0.0, neginf=0.0)
+
+        for ix in range(bins):
+            for iy in range(bins):
+                if int(h_cnt[ix, iy]) >= min_count:
+                    ranked.append(
+                        {
+                            "mean_pi": float(h_mean[ix, iy]),
+                            "count": int(h_cnt[ix, iy]),
+                            "x_bin": ix,
+                            "y_bin": iy,
+                            "x_range": [float(xe[ix]), float(xe[ix + 1])],
+                            "y_range": [float(ye[iy]), float(ye[iy + 1])],
+                            "x_dim": jx,
+                            "y_dim": jy,
+                        }
+                    )
+    ranked.sort(key=lambda b: b["mean_pi"], reverse=True)
+    return ranked[:topk]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--d", type=int, default=8)
+    parser.add_argument("--bins", type=int, default=60)
+    parser.add_argument("--topk", type=int, default=10)
+    parser.add_argument("--min-count", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    x = rng.normal(size=(args.n, args.d))
+    pi = rng.random(args.n)
+
+    seconds: Dict[str, float] = {}
+    results: Dict[str, List[Dict[str, Any]]] = {}
+
+    started = time.perf_counter()
+    results["histogram2d"] = _histogram2d_scan(x, pi, args.bins, args.topk, args.min_count)
+    seconds["histogram2d"] = round(time.perf_counter() - started, 4)
+
+    started = time.perf_counter()
+    results["zone_scan"] = scan_zones(x, pi, bins=args.bins, topk=args.topk, min_count=args.min_count)
+    seconds["zone_scan"] = round(time.perf_counter() - started, 4)
+
+    report = {
+        "n": args.n,
+        "d": args.d,
+        "pairs": args.d * (args.d - 1) // 2,
+        "bins": args.bins,
+        "topk": args.topk,
+        "seconds": seconds,
+        "speedup": round(seconds["histogram2d"] / seconds["zone_scan"], 2),
+        "identical": results["histogram2d"] == results["zone_scan"],
+    }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0 if report["identical"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
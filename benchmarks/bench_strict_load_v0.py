@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Microbenchmark: shared strict loader vs the per-tool loader hooks.
+
+Compares, on the canonical policy, registry and a set of schemas:
+
+- ``legacy_json``: ``json.loads`` with the per-key ``object_pairs_hook`` and
+  ``parse_constant`` used across tools, plus the recursive
+  ``_require_finite_tree`` walk some tools add for overflowed floats;
+- ``strict_json``: ``strict_load_v0.loads_json`` (single pass);
+- ``legacy_yaml``: ``yaml.SafeLoader`` subclass with the duplicate-key
+  mapping constructor;
+- ``strict_yaml``: ``strict_load_v0.loads_yaml`` (libyaml when available);
+- ``cached_*``: ``load_*_file`` after the first parse (content-digest hit).
+
+Usage:
+
+  python benchmarks/bench_strict_load_v0.py [--repeat 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import strict_load_v0 as strict  # noqa: E402
+
+
+YAML_FILES = ("pulse_gate_policy_v0.yml", "pulse_gate_registry_v0.yml")
+
+
+def _legacy_object(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+
+    for key, value in pairs:
+        if key in out:
+            raise ValueError(f"duplicate JSON key {key!r}")
+
+        out[key] = value
+
+    return out
+
+
+def _legacy_constant(value: str) -> None:
+    raise ValueError(f"non-finite JSON constant {value!r}")
+
+
+def _legacy_finite_tree(value: Any) -> None:
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("non-finite number")
+
+    if isinstance(value, list):
+        for item in value:
+            _legacy_finite_tree(item)
+
+    elif isinstance(value, dict):
+        for item in value.values():
+            _legacy_finite_tree(item)
+
+
+def _legacy_json(text: str) -> Any:
+    payload = json.loads(
+        text,
+        object_pairs_hook=_legacy_object,
+        parse_constant=_legacy_constant,
+    )
+    _legacy_finite_tree(payload)
+    return payload
+
+
+class _LegacyYamlLoader(yaml.SafeLoader):
+    pass
+
+
+def _legacy_mapping(loader: _LegacyYamlLoader, node: Any, deep: bool = False) -> dict:
+    out: dict[Any, Any] = {}
+
+    for key_node, value_node in node.value:
+        key = loader.construct_object(key_node, deep=deep)
+
+        if key in out:
+            raise ValueError(f"duplicate YAML key {key!r}")
+
+        out[key] = loader.construct_object(value_node, deep=deep)
+
+    return out
+
+
+_LegacyYamlLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+    _legacy_mapping,
+)
+
+
+def _legacy_yaml(text: str) -> Any:
+    return yaml.load(text, Loader=_LegacyYamlLoader)
+
+
+def _per_call_us(func: Callable[[], Any], repeat: int) -> float:
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        func()
+
+    return round((time.perf_counter() - started) / repeat * 1e6, 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    json_paths = []
+    for path in sorted((REPO_ROOT / "schemas").glob("*.schema.json")):
+        try:
+            json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            continue  # not plain JSON; outside this comparison
+        json_paths.append(path)
+    yaml_paths = [REPO_ROOT / name for name in YAML_FILES]
+    json_texts = [path.read_text(encoding="utf-8") for path in json_paths]
+    yaml_texts = [path.read_text(encoding="utf-8") for path in yaml_paths]
+
+    for text in json_texts:
+        if _legacy_json(text) != strict.loads_json(text):
+            raise SystemExit("JSON parse results differ")
+
+    for text in yaml_texts:
+        if _legacy_yaml(text) != strict.loads_yaml(text):
+            raise SystemExit("YAML parse results differ")
+
+    def cached(loader: Callable[[Path], Any], paths: list[Path]) -> Callable[[], None]:
+        def run() -> None:
+            for path in paths:
+                loader(path)
+
+        return run
+
+    strict.clear_cache()
+    cached(strict.load_json_file, json_paths)()
+    cached(strict.load_yaml_file, yaml_paths)()
+
+    report = {
+        "json_files": len(json_paths),
+        "json_bytes": sum(len(text) for text in json_texts),
+        "yaml_files": len(yaml_paths),
+        "yaml_bytes": sum(len(text) for text in yaml_texts),
+        "libyaml": bool(getattr(yaml, "__with_libyaml__", False)),
+        "us_per_pass": {
+            "legacy_json": _per_call_us(lambda: [_legacy_json(t) for t in json_texts], args.repeat),
+            "strict_json": _per_call_us(lambda: [strict.loads_json(t) for t in json_texts], args.repeat),
+            "cached_json": _per_call_us(cached(strict.load_json_file, json_paths), args.repeat),
+            "legacy_yaml": _per_call_us(lambda: [_legacy_yaml(t) for t in yaml_texts], args.repeat),
+            "strict_yaml": _per_call_us(lambda: [strict.loads_yaml(t) for t in yaml_texts], args.repeat),
+            "cached_yaml": _per_call_us(cached(strict.load_yaml_file, yaml_paths), args.repeat),
+        },
+        "cache": strict.cache_stats(),
+    }
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
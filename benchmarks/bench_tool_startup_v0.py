@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Startup-time budget check for the registered safe-pack CLI tools.
+
+For every tool in ``TOOL_BUDGETS`` the module is loaded (top-level code
+only; ``main`` is not called) in a fresh interpreter under
+``python -X importtime``. The import cost is the summed self time of every
+module the tool pulls in beyond a bare interpreter, as the median of
+``--runs`` launches.
+
+The heavy-module check is deterministic and always enforced: the script
+exits 1 when a tool imports a heavy module (``yaml``, ``jsonschema``,
+``numpy``, ``zipfile``, ``subprocess``) it is not allowed to load at
+startup. Heavy imports belong in the code paths that use them (see run_all.py
+and render_quality_ledger.py); tests/test_tool_startup_imports.py is the
+regression test for them.
+
+Timings vary by machine, so the millisecond budgets are only reported unless
+``--strict`` is given. The static budgets leave generous headroom; for a
+tighter check, save a report from a known-good tree on the same machine and
+pass it as ``--baseline``, which budgets each tool at ``--tolerance`` times
+its baseline time (plus ``SLACK_MS`` for timer noise).
+
+Usage:
+
+  python benchmarks/bench_tool_startup_v0.py [--runs 5] [--tool check_gates.py]
+  python benchmarks/bench_tool_startup_v0.py > base.json   # on main
+  python benchmarks/bench_tool_startup_v0.py --baseline base.json --strict
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TOOLS = REPO_ROOT / "PULSE_safe_pack_v0" / "tools"
+
+# Registered CLIs: import budget (ms of summed -X importtime self time beyond
+# a bare interpreter) and the heavy modules each may import at top level.
+TOOL_BUDGETS: Dict[str, Tuple[float, FrozenSet[str]]] = {
+    "check_gates.py": (150.0, frozenset()),
+    "status_to_summary.py": (150.0, frozenset()),
+    "augment_status.py": (200.0, frozenset()),
+    "refusal_delta.py": (200.0, frozenset()),
+    "render_quality_ledger.py": (200.0, frozenset()),
+    "update_artifacts_for_snapshot.py": (200.0, frozenset()),
+    "materialize_release_decision.py": (200.0, frozenset()),
+    "build_release_authority_manifest_v0.py": (200.0, frozenset()),
+    "build_artifact_provenance_binding_v0.py": (200.0, frozenset()),
+    "pulse_client_v0.py": (200.0, frozenset()),
+    # tool_runner_v0 needs subprocess for its fallback runner.
+    "run_all.py": (400.0, frozenset({"subprocess"})),
+}
+
+# Absolute allowance added to baseline-relative budgets.
+SLACK_MS = 5.0
+
+# Modules that must stay out of a tool's import path unless allowed above.
+HEAVY_MODULES = ("yaml", "jsonschema", "numpy", "zipfile", "subprocess")
+
+LOADER = (
+    "import importlib.util, sys\n"
+    "path = sys.argv[1]\n"
+    "spec = importlib.util.spec_from_file_location('_pulse_startup_probe', path)\n"
+    "module = importlib.util.module_from_spec(spec)\n"
+    "spec.loader.exec_module(module)\n"
+)
+
+
+def _importtime(path: Path) -> Dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOADER, str(path)],
+        cwd=str(REPO_ROOT),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"importing {path} failed:\n{proc.stderr[-2000:]}")
+
+    modules: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        # "import time:  <self us> | <cumulative us> | <indented module name>"
+        left, _cumulative, name = line.split("|", 2)
+        name = name.strip()
+        modules[name] = modules.get(name, 0) + int(left.split(":", 1)[1])
+    return modules
+
+
+def _extra_ms(modules: Dict[str, int], baseline: Set[str]) -> float:
+    return sum(us for name, us in modules.items() if name not in baseline) / 1e3
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--tool", action="append", default=None, help="Only check these tools (repeatable).")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="Earlier JSON report of this script; budgets become --tolerance x its import_ms.",
+    )
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Baseline multiplier (default: 1.5).")
+    parser.add_argument("--strict", action="store_true", help="Also exit 1 when a tool is over its time budget.")
+    args = parser.parse_args(argv)
+
+    baseline_ms: Dict[str, float] = {}
+    if args.baseline is not None:
+        previous = json.loads(args.baseline.read_text(encoding="utf-8"))
+        baseline_ms = {
+            name: float(entry["import_ms"])
+            for name, entry in previous.get("tools", {}).items()
+            if isinstance(entry, dict) and isinstance(entry.get("import_ms"), (int, float))
+        }
+
+    names = args.tool or list(TOOL_BUDGETS)
+    unknown = [n for n in names if n not in TOOL_BUDGETS]
+    if unknown:
+        raise SystemExit(f"unregistered tool(s): {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        empty = Path(tmp) / "empty.py"
+        empty.write_text("", encoding="utf-8")
+        baseline: Set[str] = set()
+        for _ in range(args.runs):
+            baseline.update(_importtime(empty))
+
+    report: Dict[str, Dict[str, object]] = {}
+    over: List[str] = []
+    failed: List[str] = []
+
+    for name in names:
+        samples = []
+        heavy: Set[str] = set()
+        for _ in range(args.runs):
+            modules = _importtime(TOOLS / name)
+            samples.append(_extra_ms(modules, baseline))
+            heavy.update(m for m in HEAVY_MODULES if m in modules)
+
+        ms = round(statistics.median(samples), 2)
+        budget, allowed = TOOL_BUDGETS[name]
+        if name in baseline_ms:
+            budget = round(baseline_ms[name] * args.tolerance + SLACK_MS, 2)
+        disallowed = sorted(heavy - allowed)
+        report[name] = {
+            "import_ms": ms,
+            "budget_ms": budget,
+            "heavy_modules": sorted(heavy),
+            "disallowed_modules": disallowed,
+        }
+        if ms > budget:
+            over.append(name)
+        if disallowed or (args.strict and ms > budget):
+            failed.append(name)
+
+    print(
+        json.dumps(
+            {"runs": args.runs, "strict": args.strict, "tools": report, "over_budget": over, "failed": failed},
+            indent=2,
+            sort_keys=True,
+        )
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
-import argparse, hashlib, os, pathlib, sys
+import argparse, os, pathlib, sys
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.file_digest_v0 import (  # noqa: E402
+    DEFAULT_JOBS,
+    sha256_file,
+    sha256_many,
+)
 
 def sha256sum(p: pathlib.Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return sha256_file(p)
 
-def hash_dir(dirpath: pathlib.Path, recursive: bool) -> int:
+def hash_dir(dirpath: pathlib.Path, recursive: bool, jobs: int = DEFAULT_JOBS) -> int:
     base = pathlib.Path(dirpath)
     if not base.exists():
         print(f"# WARN: {base} does not exist – skipping", file=sys.stderr)
@@ -24,10 +30,16 @@ def hash_dir(dirpath: pathlib.Path, recursive: bool) -> int:
             if p.is_file():
                 files.append(p)
 
+    # Hash concurrently, print in the same sorted order as before.
+    errors = {}
+    digests = sha256_many(files, jobs=jobs, errors=errors)
+
     count = 0
     for f in sorted(files):
         try:
-            print(f"{sha256sum(f)}  {f.relative_to(base.parent)}")
+            if f in errors:
+                raise errors[f]
+            print(f"{digests[f]}  {f.relative_to(base.parent)}")
             count += 1
         except Exception as e:
             print(f"# ERROR on {f}: {e}", file=sys.stderr)
@@ -39,11 +51,15 @@ if __name__ == "__main__":
                     help="One or more directories to hash (default: dist)")
     ap.add_argument("-r", "--recursive", action="store_true",
                     help="Recurse into subdirectories")
+    ap.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                    help=f"Files hashed concurrently (default: {DEFAULT_JOBS})")
     args = ap.parse_args()
+    if args.jobs <= 0:
+        ap.error("--jobs must be greater than zero")
 
     total = 0
     for d in args.directories:
-        total += hash_dir(d, args.recursive)
+        total += hash_dir(d, args.recursive, args.jobs)
 
     # soft‑fail: ne törje el a CI-t, ha épp nincs mit hashelni
     sys.exit(0)
@@ -24,6 +24,7 @@ __all__ = [
     "compute_gf",
     "compute_pi",
     "run_pd_from_cuts",
+    "run_pd_from_cuts_chunked",
 ]
 
 
@@ -33,6 +34,7 @@ _EXPORTS: dict[str, tuple[str, str]] = {
     "compute_gf": ("pulse_pd.pd", "compute_gf"),
     "compute_pi": ("pulse_pd.pd", "compute_pi"),
     "run_pd_from_cuts": ("pulse_pd.cut_adapter", "run_pd_from_cuts"),
+    "run_pd_from_cuts_chunked": ("pulse_pd.chunked", "run_pd_from_cuts_chunked"),
 }
 
 
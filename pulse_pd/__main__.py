@@ -11,6 +11,14 @@ Usage examples:
     --theta pulse_pd/examples/theta_cuts_example.json \
     --dims 0 1 \
     --out pulse_pd/artifacts_run
+
+  # Large X (.npy, memory-mapped), chunked over 4 worker processes
+  python -m pulse_pd.run_cut_pd \
+    --x data/X.npy \
+    --theta pulse_pd/examples/theta_cuts_example.json \
+    --dims 0 1 \
+    --workers 4 \
+    --out pulse_pd/artifacts_run
 """
 
 def main() -> int:
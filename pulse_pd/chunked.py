@@ -0,0 +1,446 @@
+"""
+Chunked / out-of-core PULSE–PD (v0) for X arrays larger than RAM.
+
+The in-memory pipeline (cut_adapter.run_pd_from_cuts) materialises X as a
+float copy and, for SPSA GF, allocates (n, d) direction matrices and two
+perturbed copies of X per iteration. This module runs the same cut-based
+metrics over fixed-size row chunks instead:
+
+- X can be a read-only memory map (open_X_mmap for .npy input);
+- DS / MI / GF / PI_raw are computed per chunk and written straight into a
+  structured .npy result file (np.lib.format.open_memmap), so peak memory is
+  bounded by the chunk size, not by n;
+- PI normalisation needs the 5th/95th percentiles of PI_raw over the *whole*
+  dataset. chunked_percentile computes them exactly without holding PI_raw in
+  memory: a counting pass, then a radix select over the sortable bit patterns
+  of the float64 values (4 passes of 16 bits, one histogram each), then
+  numpy's own 'linear' interpolation. A final pass writes the normalised PI.
+
+Equivalence with the in-memory run (same seed):
+- DS, MI and PI normalisation are bit-identical (cut perturbations and the MI
+  ensemble depend on theta and the seed only, not on the rows).
+- SPSA GF draws random directions per row, so chunked runs draw them per
+  chunk from SeedSequence(seed).spawn-style child streams keyed by the chunk
+  index. The estimate is statistically equivalent but not identical to the
+  in-memory one, and it depends on chunk_rows (not on anything else).
+  finite_diff GF has no randomness and is identical.
+
+Chunks are independent, so workers > 1 runs them on a process pool (see
+run_pd_from_cuts_chunked); results are identical for any worker count.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from pulse_pd.cut_adapter import (
+    CutProbEnsemble,
+    compute_ds_cuts,
+    make_cut_prob_ensemble,
+    prob_cut,
+    with_feature_names,
+)
+from pulse_pd.pd import compute_gf, compute_mi, compute_pi
+
+DEFAULT_CHUNK_ROWS = 262_144
+
+PD_RESULT_DTYPE = np.dtype(
+    [
+        ("ds", "<f8"),
+        ("mi", "<f8"),
+        ("gf", "<f8"),
+        ("pi_raw", "<f8"),
+        ("pi", "<f8"),
+    ]
+)
+
+_SIGN = np.uint64(1 << 63)
+_DIGIT_BITS = 16
+_DIGIT_MASK = np.uint64((1 << _DIGIT_BITS) - 1)
+
+
+def open_X_mmap(path: str) -> np.ndarray:
+    """
+    Memory-map a 2D (or 1D) .npy feature matrix read-only.
+
+    Nothing is read until rows are accessed. A 1D array is viewed as (n, 1).
+    """
+    if os.path.splitext(path)[1].lower() != ".npy":
+        raise ValueError(f"Only .npy input can be memory-mapped; got '{path}'")
+
+    X = np.load(path, mmap_mode="r", allow_pickle=False)
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    if X.ndim != 2:
+        raise ValueError(f"X must be 2D; got {X.shape}")
+    return X
+
+
+def iter_chunks(n: int, chunk_rows: int) -> Iterator[Tuple[int, int]]:
+    """Yield (start, stop) row ranges of at most chunk_rows rows."""
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be >= 1")
+
+    for start in range(0, int(n), int(chunk_rows)):
+        yield start, min(int(n), start + int(chunk_rows))
+
+
+def _sortable_keys(values: np.ndarray) -> np.ndarray:
+    """Map float64 values to uint64 keys whose unsigned order is the float order."""
+    bits = np.ascontiguousarray(values, dtype=np.float64).view(np.uint64)
+    negative = (bits & _SIGN) != 0
+    return np.where(negative, ~bits, bits | _SIGN)
+
+
+def _key_to_float(key: np.uint64) -> float:
+    key = np.uint64(key)
+    bits = key ^ _SIGN if (key & _SIGN) else ~key
+    return float(np.array([bits], dtype=np.uint64).view(np.float64)[0])
+
+
+def _finite_chunks(values: np.ndarray, chunk_rows: int) -> Iterator[np.ndarray]:
+    for start, stop in iter_chunks(values.shape[0], chunk_rows):
+        chunk = np.asarray(values[start:stop], dtype=float)
+        yield chunk[np.isfinite(chunk)]
+
+
+def _order_statistics(
+    values: np.ndarray,
+    ranks: Sequence[int],
+    chunk_rows: int,
+) -> List[float]:
+    """
+    Exact k-th smallest finite values (0-based ranks) by radix select.
+
+    Each pass reads the data once and histograms the next 16-bit digit of
+    the keys that share the already-resolved high digits, so memory stays at
+    one chunk plus 2**16 counters per rank regardless of n.
+    """
+    prefixes = [np.uint64(0)] * len(ranks)
+    remaining = [int(r) for r in ranks]
+
+    for level in range(64 // _DIGIT_BITS):
+        shift = np.uint64(64 - _DIGIT_BITS * (level + 1))
+        hists = [np.zeros(1 << _DIGIT_BITS, dtype=np.int64) for _ in ranks]
+
+        for chunk in _finite_chunks(values, chunk_rows):
+            keys = _sortable_keys(chunk)
+            digits = (keys >> shift) & _DIGIT_MASK
+
+            if level == 0:
+                hist = np.bincount(digits.astype(np.intp), minlength=1 << _DIGIT_BITS)
+                for hist_i in hists:
+                    hist_i += hist
+                continue
+
+            high = keys >> (shift + np.uint64(_DIGIT_BITS))
+            for i, prefix in enumerate(prefixes):
+                match = digits[high == prefix]
+                if match.size:
+                    hists[i] += np.bincount(
+                        match.astype(np.intp), minlength=1 << _DIGIT_BITS
+                    )
+
+        for i, hist in enumerate(hists):
+            cum = np.cumsum(hist)
+            digit = int(np.searchsorted(cum, remaining[i], side="right"))
+            if digit > 0:
+                remaining[i] -= int(cum[digit - 1])
+            prefixes[i] = (prefixes[i] << np.uint64(_DIGIT_BITS)) | np.uint64(digit)
+
+    return [_key_to_float(prefix) for prefix in prefixes]
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    # Same arithmetic as numpy's 'linear' percentile interpolation.
+    a64, b64, t64 = np.float64(a), np.float64(b), np.float64(t)
+    diff = b64 - a64
+    if t64 >= 0.5:
+        return float(b64 - diff * (1 - t64))
+    return float(a64 + diff * t64)
+
+
+def chunked_percentile(
+    values: np.ndarray,
+    q: Sequence[float],
+    *,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Optional[List[float]]:
+    """
+    Exact np.percentile(values[np.isfinite(values)], q) over a 1D array
+    (typically a memmap) read in chunks.
+
+    Returns None if there are no finite values.
+    """
+    count = 0
+    for chunk in _finite_chunks(values, chunk_rows):
+        count += int(chunk.size)
+
+    if count == 0:
+        return None
+
+    plan: List[Tuple[int, int, float]] = []
+    for qq in q:
+        virtual = (count - 1) * np.true_divide(float(qq), 100)
+        previous = int(np.floor(virtual))
+        previous = min(max(previous, 0), count - 1)
+        nxt = min(previous + 1, count - 1)
+        plan.append((previous, nxt, float(virtual - previous)))
+
+    ranks = sorted({r for p in plan for r in p[:2]})
+    stats = dict(zip(ranks, _order_statistics(values, ranks, chunk_rows)))
+
+    return [_lerp(stats[p], stats[n], t) for p, n, t in plan]
+
+
+def robust_minmax_chunked(
+    values: np.ndarray,
+    out: np.ndarray,
+    lo_q: float = 5.0,
+    hi_q: float = 95.0,
+    *,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> None:
+    """
+    Two-pass, bounded-memory equivalent of pd._robust_minmax.
+
+    Pass 1 finds the quantiles over all finite values (chunked_percentile);
+    pass 2 writes the scaled values into `out` chunk by chunk.
+    """
+    bounds = chunked_percentile(values, [lo_q, hi_q], chunk_rows=chunk_rows)
+
+    degenerate = bounds is None
+    if not degenerate:
+        lo, hi = bounds
+        degenerate = not np.isfinite(lo) or not np.isfinite(hi) or hi <= lo
+
+    for start, stop in iter_chunks(values.shape[0], chunk_rows):
+        if degenerate:
+            out[start:stop] = 0.0
+            continue
+        chunk = np.asarray(values[start:stop], dtype=float)
+        out[start:stop] = np.clip((chunk - lo) / (hi - lo), 0.0, 1.0)
+
+
+def chunk_seed(seed: int, chunk_index: int) -> np.random.SeedSequence:
+    """
+    Deterministic per-chunk RNG seed.
+
+    Equal to np.random.SeedSequence(seed).spawn(k)[chunk_index] for any
+    k > chunk_index, without materialising the earlier children.
+    """
+    return np.random.SeedSequence(int(seed), spawn_key=(int(chunk_index),))
+
+
+def _compute_chunk(
+    x: np.ndarray,
+    index: int,
+    theta: Dict[str, Any],
+    prob_fns: CutProbEnsemble,
+    params: Dict[str, Any],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    seed = int(params["seed"])
+
+    # Same seed per chunk: every chunk sees the same M perturbed thetas.
+    ds = compute_ds_cuts(x, theta, M=int(params["ds_M"]), seed=seed)
+    mi = compute_mi(prob_fn_list=prob_fns, X=x, theta=None)
+    gf = compute_gf(
+        prob_fn=prob_cut,
+        X=x,
+        theta=theta,
+        method=str(params["gf_method"]),
+        K=int(params["gf_K"]),
+        delta=float(params["gf_delta"]),
+        seed=chunk_seed(seed, index),
+    )
+    return ds, mi, gf, compute_pi(ds=ds, mi=mi, gf=gf, normalize=False)
+
+
+def _store_chunk(res: np.ndarray, start: int, stop: int, metrics: Tuple[np.ndarray, ...]) -> None:
+    ds, mi, gf, pi_raw = metrics
+    res["ds"][start:stop] = ds
+    res["mi"][start:stop] = mi
+    res["gf"][start:stop] = gf
+    res["pi_raw"][start:stop] = pi_raw
+
+
+def _prob_ensemble(theta: Dict[str, Any], params: Dict[str, Any]) -> CutProbEnsemble:
+    # Thetas of the MI ensemble do not depend on the rows: build them once.
+    return make_cut_prob_ensemble(
+        theta,
+        n_models=int(params["mi_models"]),
+        seed=int(params["seed"]),
+        sigma=params["mi_sigma"],
+    )
+
+
+# Per-process state of a pool worker (set by _init_worker).
+_WORKER: Dict[str, Any] = {}
+
+
+def _attach_shm(name: str) -> shared_memory.SharedMemory:
+    # The parent owns (and unlinks) the segment. Before Python 3.13 an
+    # attach always registers the name, but pool workers share the parent's
+    # resource tracker, so that registration is a no-op.
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(
+    source: Tuple[Any, ...],
+    out_path: str,
+    theta: Dict[str, Any],
+    params: Dict[str, Any],
+) -> None:
+    if source[0] == "npy":
+        X = open_X_mmap(source[1])
+        shm = None
+    else:
+        _, name, shape = source
+        shm = _attach_shm(name)
+        X = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+    _WORKER.update(
+        X=X,
+        shm=shm,
+        res=np.load(out_path, mmap_mode="r+"),
+        theta=theta,
+        prob_fns=_prob_ensemble(theta, params),
+        params=params,
+    )
+
+
+def _run_chunk_task(index: int, start: int, stop: int) -> int:
+    w = _WORKER
+    x = np.asarray(w["X"][start:stop], dtype=float)
+    # Rows go straight into the shared result file; nothing is pickled back.
+    _store_chunk(w["res"], start, stop, _compute_chunk(x, index, w["theta"], w["prob_fns"], w["params"]))
+    return index
+
+
+def _run_chunks_parallel(
+    X: np.ndarray,
+    x_path: Optional[str],
+    out_path: str,
+    chunks: List[Tuple[int, int]],
+    theta: Dict[str, Any],
+    params: Dict[str, Any],
+    workers: int,
+    chunk_rows: int,
+) -> None:
+    shm = None
+    try:
+        if x_path is not None:
+            # Memory-mapped .npy: every worker maps the same file (shared
+            # page cache, no copy).
+            source: Tuple[Any, ...] = ("npy", x_path)
+        else:
+            shape = tuple(int(v) for v in X.shape)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+            shared = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            for start, stop in iter_chunks(shape[0], chunk_rows):
+                shared[start:stop] = X[start:stop]
+            del shared
+            source = ("shm", shm.name, shape)
+
+        with ProcessPoolExecutor(
+            max_workers=min(int(workers), len(chunks)),
+            initializer=_init_worker,
+            initargs=(source, out_path, theta, params),
+        ) as pool:
+            futures = [
+                pool.submit(_run_chunk_task, index, start, stop)
+                for index, (start, stop) in enumerate(chunks)
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def run_pd_from_cuts_chunked(
+    X: Union[np.ndarray, str, "os.PathLike[str]"],
+    theta: Dict[str, Any],
+    *,
+    out_path: str,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    workers: int = 1,
+    feature_names: Optional[Union[List[str], Dict[str, int]]] = None,
+    ds_M: int = 24,
+    mi_models: int = 7,
+    mi_sigma: Optional[float] = None,
+    gf_method: str = "spsa",
+    gf_K: int = 8,
+    gf_delta: float = 0.05,
+    seed: int = 0,
+    normalize_pi: bool = True,
+) -> np.ndarray:
+    """
+    Chunked equivalent of run_pd_from_cuts writing a structured .npy.
+
+    `X` is a path to a .npy file (memory-mapped) or any 2D array-like
+    supporting row slicing; only one chunk of rows is converted to float at a
+    time. Results are written to `out_path` (fields: ds, mi, gf, pi_raw, pi)
+    and the open read-write memmap is returned. With normalize_pi=False the
+    `pi` field equals `pi_raw`.
+
+    workers > 1 spreads the chunks over a process pool. A .npy path is
+    mapped by every worker; an in-memory X is copied once into shared
+    memory. Workers write their rows directly into the result file. All RNG
+    streams are derived from (seed, chunk index), so the results do not
+    depend on the number of workers.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be >= 1")
+
+    x_path: Optional[str] = None
+    if isinstance(X, (str, os.PathLike)):
+        x_path = os.fspath(X)
+        X = open_X_mmap(x_path)
+
+    if X.ndim != 2:
+        raise ValueError(f"X must be 2D; got shape {X.shape}")
+
+    n = int(X.shape[0])
+    theta_eff = with_feature_names(theta, feature_names)
+    params = {
+        "ds_M": int(ds_M),
+        "mi_models": int(mi_models),
+        "mi_sigma": mi_sigma,
+        "gf_method": str(gf_method),
+        "gf_K": int(gf_K),
+        "gf_delta": float(gf_delta),
+        "seed": int(seed),
+    }
+    chunks = list(iter_chunks(n, chunk_rows))
+
+    res = np.lib.format.open_memmap(
+        out_path, mode="w+", dtype=PD_RESULT_DTYPE, shape=(n,)
+    )
+
+    if workers > 1 and len(chunks) > 1:
+        res.flush()
+        _run_chunks_parallel(X, x_path, out_path, chunks, theta_eff, params, workers, chunk_rows)
+    else:
+        prob_fns = _prob_ensemble(theta_eff, params)
+        for index, (start, stop) in enumerate(chunks):
+            x = np.asarray(X[start:stop], dtype=float)
+            _store_chunk(res, start, stop, _compute_chunk(x, index, theta_eff, prob_fns, params))
+
+    if normalize_pi:
+        robust_minmax_chunked(res["pi_raw"], res["pi"], chunk_rows=chunk_rows)
+    else:
+        for start, stop in iter_chunks(n, chunk_rows):
+            res["pi"][start:stop] = res["pi_raw"][start:stop]
+
+    res.flush()
+    return res
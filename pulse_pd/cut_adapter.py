@@ -9,8 +9,11 @@ using a classic selection-cuts style pipeline.
 We define:
 - decision_cut(X, theta): hard pass/fail (0/1)
 - prob_cut(X, theta): a smooth probability proxy derived from "margin-to-fail"
+  (prob_cut.grad_norm gives its exact ||grad_x p|| for compute_gf(method="analytic"))
 - eps_sampler_cut(theta, rng): perturb thresholds for DS
+- compute_ds_cuts(X, theta, M, rng): batched DS for cut thetas (no per-draw loop)
 - make_cut_prob_ensemble(theta, ...): create a set of equally-valid "models" by jittering theta
+  (a CutProbEnsemble: thresholds as one (n_models, n_cuts) array, MI in one vectorized pass)
 - run_pd_from_cuts(X, theta, ...): convenience wrapper to compute DS/MI/GF/PI
 
 theta format (v0)
@@ -36,7 +39,7 @@ from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
 
 import numpy as np
 
-from pulse_pd.pd import compute_ds, compute_gf, compute_mi, compute_pi
+from pulse_pd.pd import compute_gf, compute_mi, compute_pi
 
 ArrayLike = Union[np.ndarray, Sequence[float], Sequence[Sequence[float]]]
 
@@ -128,16 +131,14 @@ def decision_cut(X: ArrayLike, theta: Dict[str, Any]) -> np.ndarray:
     return mask.astype(int)
 
 
-def _min_margin_to_fail(X: np.ndarray, theta: Dict[str, Any]) -> np.ndarray:
+def _cut_margins(X: np.ndarray, theta: Dict[str, Any]) -> tuple:
     """
-    Compute a per-sample "margin" to the nearest failing cut.
-    Positive margin => safely passing; negative => failing.
+    Per-cut signed, scaled margins (n_cuts, n) plus each cut's
+    d(margin)/d(x[:, j]) (+1/scale or -1/scale) and column index j.
 
     For each cut:
-      if op is > or >=: margin = (x - thr)
-      if op is < or <=: margin = (thr - x)
-
-    Then take min over cuts (closest to failing dominates).
+      if op is > or >=: margin = (x - thr) / scale
+      if op is < or <=: margin = (thr - x) / scale
     """
     cuts = theta.get("cuts", None)
     if not cuts:
@@ -145,6 +146,8 @@ def _min_margin_to_fail(X: np.ndarray, theta: Dict[str, Any]) -> np.ndarray:
 
     n, d = X.shape
     margins = np.full((len(cuts), n), np.inf, dtype=float)
+    slopes = np.empty(len(cuts), dtype=float)
+    cols = np.empty(len(cuts), dtype=np.intp)
 
     for i, cut in enumerate(cuts):
         feat = cut.get("feat", None)
@@ -159,13 +162,28 @@ def _min_margin_to_fail(X: np.ndarray, theta: Dict[str, Any]) -> np.ndarray:
 
         if op in (">", ">="):
             m = (col - thr) / scale
+            slopes[i] = 1.0 / scale
         elif op in ("<", "<="):
             m = (thr - col) / scale
+            slopes[i] = -1.0 / scale
         else:
             raise ValueError(f"Unsupported cut op '{op}'. Use >, >=, <, <=")
 
         margins[i, :] = m
+        cols[i] = j
+
+    return margins, slopes, cols
+
+
+def _min_margin_to_fail(X: np.ndarray, theta: Dict[str, Any]) -> np.ndarray:
+    """
+    Compute a per-sample "margin" to the nearest failing cut.
+    Positive margin => safely passing; negative => failing.
 
+    Per-cut margins are computed by _cut_margins; we take the min over cuts
+    (closest to failing dominates).
+    """
+    margins, _, _ = _cut_margins(X, theta)
     return np.min(margins, axis=0)
 
 
@@ -183,6 +201,35 @@ def prob_cut(X: ArrayLike, theta: Dict[str, Any]) -> np.ndarray:
     return _sigmoid(k * margin)
 
 
+def prob_cut_grad_norm(X: ArrayLike, theta: Dict[str, Any]) -> np.ndarray:
+    """
+    Exact ||grad_x prob_cut(X, theta)|| per sample, in one vectorized pass.
+
+    p = sigmoid(k * min_i margin_i) only depends on the argmin cut's column,
+    and d(margin)/dx there is +-1/scale, so
+
+        ||grad p|| = |k| * p * (1 - p) / scale_argmin
+
+    p * (1 - p) is evaluated as e^-|z| / (1 + e^-|z|)^2, which does not
+    overflow or cancel for large |z|. At exact ties between cuts (a kink of
+    the min), the first cut in theta order is used.
+    """
+    x = _as_2d_float(X)
+    k = float(theta.get("k", 8.0))
+    margins, slopes, _ = _cut_margins(x, theta)
+
+    arg = np.argmin(margins, axis=0)
+    z = k * margins[arg, np.arange(x.shape[0])]
+
+    e = np.exp(-np.abs(z))
+    dp_dz = e / ((1.0 + e) * (1.0 + e))
+    return np.abs(k * slopes[arg]) * dp_dz
+
+
+# compute_gf(method="analytic") uses this closed form instead of SPSA.
+prob_cut.grad_norm = prob_cut_grad_norm  # type: ignore[attr-defined]
+
+
 def perturb_theta_thresholds(
     theta: Dict[str, Any],
     rng: np.random.Generator,
@@ -221,33 +268,303 @@ def eps_sampler_cut(theta: Dict[str, Any], rng: np.random.Generator) -> Dict[str
     return perturb_theta_thresholds(theta, rng, sigma=None)
 
 
+DS_BLOCK_ELEMENTS = 1 << 22
+
+
+def _compare(col: np.ndarray, op: str, thr: np.ndarray) -> np.ndarray:
+    if op == ">":
+        return col > thr
+    if op == ">=":
+        return col >= thr
+    if op == "<":
+        return col < thr
+    if op == "<=":
+        return col <= thr
+    raise ValueError(f"Unsupported cut op '{op}'. Use >, >=, <, <=")
+
+
+def compute_ds_cuts(
+    X: ArrayLike,
+    theta: Dict[str, Any],
+    M: int,
+    *,
+    rng: Optional[np.random.Generator] = None,
+    seed: int = 0,
+    sigma: Optional[float] = None,
+    block_elements: int = DS_BLOCK_ELEMENTS,
+) -> np.ndarray:
+    """
+    Batched Decision Stability for cut-based theta.
+
+    Equivalent to
+        compute_ds(decision_cut, X, theta,
+                   eps_sampler=lambda th: perturb_theta_thresholds(th, rng, sigma), M=M)
+    but without the per-draw Python loop: all M x n_cuts threshold
+    perturbations are drawn as one (M, n_cuts) array, and each cut column is
+    compared against its M perturbed thresholds by broadcasting, giving an
+    (M, n) decision matrix.
+
+    Most samples sit far from every threshold and cannot flip: a cut's
+    decision is monotone in its threshold, so comparing the column once
+    against the strictest and the loosest of the M+1 thresholds (base and
+    perturbed) settles it for every draw. Only samples that are unsettled on
+    some cut (and not settled-failing on another) enter the decision matrix.
+
+    The normal draws consume `rng` in the same (draw-major, cut-minor) order as
+    M sequential perturb_theta_thresholds calls, and the comparisons use the
+    same perturbed thresholds, so DS is bit-identical for the same seed.
+
+    Samples are processed in row blocks of about `block_elements / M` rows to
+    bound the size of the decision matrix.
+    """
+    if M <= 0:
+        raise ValueError("M must be >= 1")
+
+    x = _as_2d_float(X)
+    n, d = x.shape
+
+    cuts = theta.get("cuts", None)
+    if not cuts:
+        raise ValueError("theta must contain a non-empty 'cuts' list")
+
+    if sigma is None:
+        sigma = float(theta.get("sigma", 0.02))
+
+    cols: List[int] = []
+    ops: List[str] = []
+    for cut in cuts:
+        op = str(cut.get("op", ">")).strip()
+        if op not in (">", ">=", "<", "<="):
+            raise ValueError(f"Unsupported cut op '{op}'. Use >, >=, <, <=")
+
+        j = _resolve_feat_index(theta, cut.get("feat", None))
+        if j < 0 or j >= d:
+            raise ValueError(f"Cut feature index out of bounds: {j} for X with d={d}")
+
+        cols.append(j)
+        ops.append(op)
+
+    thr = np.array([float(cut.get("thr", 0.0)) for cut in cuts], dtype=float)
+    sigmas = np.array([float(cut.get("sigma", sigma)) for cut in cuts], dtype=float)
+
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    # (M, n_cuts): row k holds the thresholds of the k-th perturbed theta.
+    thr_p = thr + rng.normal(0.0, sigmas, size=(M, len(cuts)))
+
+    all_thr = np.vstack([thr[None, :], thr_p])
+    thr_hi = all_thr.max(axis=0)
+    thr_lo = all_thr.min(axis=0)
+
+    # can_pass: passes the loosest threshold of every cut;
+    # sure_pass: passes the strictest threshold of every cut.
+    can_pass = np.ones(n, dtype=bool)
+    sure_pass = np.ones(n, dtype=bool)
+    for i, (j, op) in enumerate(zip(cols, ops)):
+        strict, loose = (thr_hi[i], thr_lo[i]) if op in (">", ">=") else (thr_lo[i], thr_hi[i])
+        col = x[:, j]
+        can_pass &= _compare(col, op, loose)
+        sure_pass &= _compare(col, op, strict)
+
+    mismatches = np.zeros(n, dtype=np.int64)
+    unsettled = np.flatnonzero(can_pass & ~sure_pass)
+    block = max(1, int(block_elements) // M)
+
+    for start in range(0, unsettled.size, block):
+        idx = unsettled[start:start + block]
+
+        y0 = np.ones(idx.size, dtype=bool)
+        yk = np.ones((M, idx.size), dtype=bool)
+        for i, (j, op) in enumerate(zip(cols, ops)):
+            col = x[idx, j]
+            y0 &= _compare(col, op, thr[i])
+            yk &= _compare(col[None, :], op, thr_p[:, i, None])
+
+        mismatches[idx] = np.count_nonzero(yk != y0[None, :], axis=0)
+
+    return 1.0 - (mismatches / float(M))
+
+
+MI_BLOCK_ELEMENTS = 1 << 22
+
+
+class CutProbEnsemble(Sequence[Callable[..., np.ndarray]]):
+    """
+    MI ensemble of cut selectors that differ only in their thresholds.
+
+    All model thresholds live in one (n_models, n_cuts) array. The ensemble is
+    still a sequence of prob_fn(X, _unused) callables (model i evaluates
+    prob_cut with theta_for(i)), so the generic compute_mi loop keeps working,
+    but compute_mi uses prob_matrix instead: each cut column is read once and
+    compared against all n_models thresholds by broadcasting, with a running
+    min over cuts, giving the (n_models, n) probability matrix in one pass.
+
+    Margins are evaluated with the same expressions as prob_cut, so the
+    probabilities (and MI) are bit-identical to the per-model closures.
+    """
+
+    def __init__(self, theta: Dict[str, Any], thresholds: ArrayLike) -> None:
+        cuts = theta.get("cuts", None)
+        if not cuts:
+            raise ValueError("theta must contain a non-empty 'cuts' list")
+
+        thr = np.asarray(thresholds, dtype=float)
+        if thr.ndim != 2 or thr.shape[0] < 1 or thr.shape[1] != len(cuts):
+            raise ValueError(
+                f"thresholds must have shape (n_models, {len(cuts)}); got {thr.shape}"
+            )
+
+        self.theta = theta
+        self.thresholds = thr
+        self.k = float(theta.get("k", 8.0))
+        self._cols: List[int] = []
+        self._upper: List[bool] = []
+        self._scales: List[float] = []
+
+        for cut in cuts:
+            op = str(cut.get("op", ">")).strip()
+            if op not in (">", ">=", "<", "<="):
+                raise ValueError(f"Unsupported cut op '{op}'. Use >, >=, <, <=")
+            scale = float(cut.get("scale", 1.0))
+
+            self._cols.append(_resolve_feat_index(theta, cut.get("feat", None)))
+            self._upper.append(op in (">", ">="))
+            self._scales.append(scale if scale > 0 else 1.0)
+
+    def __len__(self) -> int:
+        return int(self.thresholds.shape[0])
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        theta_i = self.theta_for(index)
+
+        def _fn(X: np.ndarray, _unused: Any = None, _theta=theta_i) -> np.ndarray:
+            return prob_cut(X, _theta)
+
+        return _fn
+
+    def theta_for(self, index: int) -> Dict[str, Any]:
+        """theta of model `index` (cut dicts with that model's thresholds)."""
+        row = self.thresholds[range(len(self))[index]]
+        new_theta = dict(self.theta)
+        new_theta["cuts"] = [
+            {**cut, "thr": float(t)} for cut, t in zip(self.theta["cuts"], row)
+        ]
+        return new_theta
+
+    def prob_matrix(
+        self,
+        X: ArrayLike,
+        _unused: Any = None,
+        *,
+        block_elements: int = MI_BLOCK_ELEMENTS,
+    ) -> np.ndarray:
+        """
+        (n_models, n) probabilities of every model, vectorized over models.
+
+        Rows are processed in blocks of about `block_elements / n_models`
+        samples to bound the temporary margin arrays.
+        """
+        x = _as_2d_float(X)
+        n, d = x.shape
+        for j in self._cols:
+            if j < 0 or j >= d:
+                raise ValueError(f"Cut feature index out of bounds: {j} for X with d={d}")
+
+        m = len(self)
+        out = np.empty((m, n), dtype=float)
+        block = max(1, int(block_elements) // m)
+
+        for start in range(0, n, block):
+            xb = x[start:start + block]
+            margin = np.full((m, xb.shape[0]), np.inf, dtype=float)
+
+            for i, (j, upper, scale) in enumerate(zip(self._cols, self._upper, self._scales)):
+                col = xb[None, :, j]
+                thr = self.thresholds[:, i, None]
+                np.minimum(margin, ((col - thr) if upper else (thr - col)) / scale, out=margin)
+
+            out[:, start:start + xb.shape[0]] = _sigmoid(self.k * margin)
+
+        return out
+
+    def mi(self, X: ArrayLike) -> np.ndarray:
+        """MI(x) = Var_i(p_i(x)); same as compute_mi(self, X, None)."""
+        return np.var(self.prob_matrix(X), axis=0, ddof=0)
+
+
 def make_cut_prob_ensemble(
     theta: Dict[str, Any],
     n_models: int = 7,
     *,
     seed: int = 0,
     sigma: Optional[float] = None,
-) -> List[Callable[[np.ndarray, Any], np.ndarray]]:
+) -> CutProbEnsemble:
     """
-    Create a list of probability functions representing equally-valid selectors.
+    Create an ensemble of probability functions representing equally-valid selectors.
 
-    We sample n_models perturbed thetas, and return prob_fns that close over each theta_i.
+    We sample n_models perturbed thetas (thresholds jittered as by
+    perturb_theta_thresholds, drawn in the same model-major, cut-minor order)
+    and return them as a CutProbEnsemble: a sequence of prob_fns whose
+    thresholds are stored as one (n_models, n_cuts) array.
     """
     if n_models <= 0:
         raise ValueError("n_models must be >= 1")
 
+    cuts = theta.get("cuts", None)
+    if not cuts:
+        raise ValueError("theta must contain a non-empty 'cuts' list")
+
+    if sigma is None:
+        sigma = float(theta.get("sigma", 0.02))
+
+    thr = np.array([float(cut.get("thr", 0.0)) for cut in cuts], dtype=float)
+    sigmas = np.array([float(cut.get("sigma", sigma)) for cut in cuts], dtype=float)
+
     rng = np.random.default_rng(seed)
-    prob_fns: List[Callable[[np.ndarray, Any], np.ndarray]] = []
+    thresholds = thr + rng.normal(0.0, sigmas, size=(int(n_models), len(cuts)))
+    return CutProbEnsemble(theta, thresholds)
 
-    for _ in range(n_models):
-        theta_i = perturb_theta_thresholds(theta, rng, sigma=sigma)
 
-        def _fn(X: np.ndarray, _unused: Any = None, _theta=theta_i) -> np.ndarray:
-            return prob_cut(X, _theta)
+def with_feature_names(
+    theta: Dict[str, Any],
+    feature_names: Optional[Union[List[str], Dict[str, int]]],
+) -> Dict[str, Any]:
+    """
+    Return theta with dataset feature_names injected (theta is not mutated).
+
+    If theta already provides feature_names explicitly, they are not
+    overwritten (to avoid breaking named-cut configs). Names are only injected
+    when absent, or merged conservatively when theta provides a mapping and
+    the dataset provides a list.
+    """
+    if feature_names is None:
+        return theta
+
+    existing = theta.get("feature_names", None)
+    empty_existing = existing is None or existing == {} or existing == [] or existing == ()
 
-        prob_fns.append(_fn)
+    if empty_existing:
+        theta_eff = dict(theta)
+        theta_eff["feature_names"] = feature_names
+        return theta_eff
 
-    return prob_fns
+    if isinstance(existing, dict) and isinstance(feature_names, (list, tuple)):
+        # Merge: keep explicit name->index mapping, add missing names from dataset list
+        merged = dict(existing)
+        for idx, name in enumerate(feature_names):
+            name = str(name)
+            if name not in merged:
+                merged[name] = idx
+        theta_eff = dict(theta)
+        theta_eff["feature_names"] = merged
+        return theta_eff
+
+    # theta already has feature_names (list or mapping) -> do not override
+    return theta
 
 
 def run_pd_from_cuts(
@@ -277,37 +594,10 @@ def run_pd_from_cuts(
     x = _as_2d_float(X)
     rng = np.random.default_rng(seed)
 
-    # Inject feature_names into theta for name-based feat resolution
-    theta_eff = theta
-    if feature_names is not None:
-        existing = theta.get("feature_names", None)
-        empty_existing = existing is None or existing == {} or existing == [] or existing == ()
-
-        if empty_existing:
-            theta_eff = dict(theta)
-            theta_eff["feature_names"] = feature_names
-
-        elif isinstance(existing, dict) and isinstance(feature_names, (list, tuple)):
-            # Merge: keep explicit name->index mapping, add missing names from dataset list
-            merged = dict(existing)
-            for idx, name in enumerate(feature_names):
-                name = str(name)
-                if name not in merged:
-                    merged[name] = idx
-            theta_eff = dict(theta)
-            theta_eff["feature_names"] = merged
-
-        else:
-            # theta already has feature_names (list or mapping) -> do not override
-            theta_eff = theta
+    theta_eff = with_feature_names(theta, feature_names)
 
-    ds = compute_ds(
-        decision_fn=decision_cut,
-        X=x,
-        theta=theta_eff,
-        eps_sampler=lambda th: eps_sampler_cut(th, rng=rng),
-        M=int(ds_M),
-    )
+    # Batched equivalent of compute_ds(decision_cut, ..., eps_sampler_cut)
+    ds = compute_ds_cuts(x, theta_eff, M=int(ds_M), rng=rng)
 
     # MI ensemble: jitter theta thresholds deterministically (seeded)
     prob_fns = make_cut_prob_ensemble(
@@ -27,17 +27,21 @@ from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
-# Matplotlib is only used here (not required by pd.py).
-try:
-    import matplotlib.pyplot as plt
-except Exception as e:  # pragma: no cover
-    raise RuntimeError(
-        "matplotlib is required for this demo. Install it with: pip install matplotlib"
-    ) from e
-
 from pulse_pd.pd import compute_ds, compute_mi, compute_gf, compute_pi
 
 
+def _pyplot() -> Any:
+    # Matplotlib is only needed for the plots (not by pd.py or the data
+    # helpers), so it is imported on first use.
+    try:
+        import matplotlib.pyplot as plt
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError(
+            "matplotlib is required for this demo. Install it with: pip install matplotlib"
+        ) from e
+    return plt
+
+
 def sigmoid(z: np.ndarray) -> np.ndarray:
     return 1.0 / (1.0 + np.exp(-z))
 
@@ -129,6 +133,7 @@ def save_json(path: str, obj: Any) -> None:
 
 
 def paradox_scatter_plot(ds: np.ndarray, mi: np.ndarray, pi: np.ndarray, out_path: str) -> None:
+    plt = _pyplot()
     plt.figure()
     sc = plt.scatter(ds, mi, c=pi, s=10)
     plt.xlabel("DS (Decision Stability)")
@@ -144,6 +149,7 @@ def pi_heatmap_plot(X: np.ndarray, pi: np.ndarray, out_path: str, bins: int = 60
     """
     Mean PI over 2D feature space bins using histogram2d with weights.
     """
+    plt = _pyplot()
     x1 = X[:, 0]
     x2 = X[:, 1]
 
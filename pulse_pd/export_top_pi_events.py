@@ -232,7 +232,7 @@ def main() -> int:
     ap.add_argument("--ds-M", type=int, default=24, help="DS perturbation samples")
     ap.add_argument("--mi-models", type=int, default=7, help="Theta-ensemble size for MI")
     ap.add_argument("--mi-sigma", type=float, default=None, help="Sigma override for MI theta jitter (optional)")
-    ap.add_argument("--gf-method", default="spsa", choices=["spsa", "finite_diff"], help="GF method")
+    ap.add_argument("--gf-method", default="spsa", choices=["spsa", "finite_diff", "analytic"], help="GF method (analytic: exact closed form for cuts)")
     ap.add_argument("--gf-K", type=int, default=8, help="GF SPSA directions (if spsa)")
     ap.add_argument("--gf-delta", type=float, default=0.05, help="GF delta step size")
     ap.add_argument("--seed", type=int, default=0, help="RNG seed")
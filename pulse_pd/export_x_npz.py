@@ -24,6 +24,18 @@ Input format
 CSV with a header row. By default, all columns except reserved ID/label columns
 are treated as features, unless --feature-cols is provided explicitly.
 
+Streaming
+---------
+The CSV is read in blocks of --block-rows records. Numeric columns of a block
+are parsed in one pass by NumPy's C parser (blocks with empty or malformed
+cells fall back to the per-cell parser, which keeps the old NaN / error
+rules), and every column is appended to its own typed .npy file as it is
+read, so memory stays bounded by the block size.
+
+Output is an .npz (if --out ends with .npz, as before) or, for any other --out,
+a directory of .npy files (X.npy, feature_names.npy, run.npy, ...) that can be
+memory-mapped (run_cut_pd --x <dir> --chunk-size N maps X.npy).
+
 Example
 -------
 python -m pulse_pd.export_x_npz \
@@ -41,11 +53,18 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import os
-from typing import Dict, List, Optional, Sequence, Tuple
+import tempfile
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+DEFAULT_BLOCK_ROWS = 65_536
+
+# Lines csv.reader turns into an empty record (skipped, as by DictReader).
+_BLANK_LINES = frozenset(("", "\n", "\r\n", "\r"))
+
 
 def _parse_float(s: str) -> float:
     s = (s or "").strip()
@@ -112,24 +131,403 @@ def _maybe_present(fieldnames: List[str], col: Optional[str]) -> Optional[str]:
     return col if col in fieldnames else None
 
 
-def _load_csv_rows(path: str, delimiter: str) -> Tuple[List[str], List[Dict[str, str]]]:
+def _read_header(f: IO[str], delimiter: str) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Read the header record; return (fieldnames, name -> column index).
+
+    Names are stripped and empty names are dropped; for duplicated names the
+    last column wins (as with csv.DictReader).
+    """
+    header = next(csv.reader(f, delimiter=delimiter), None)
+    if not header:
+        raise ValueError("CSV has no header row (fieldnames missing). This adapter requires a header.")
+
+    index: Dict[str, int] = {}
+    fieldnames: List[str] = []
+    for j, raw in enumerate(header):
+        name = str(raw).strip()
+        if not name:
+            continue
+        if name not in index:
+            fieldnames.append(name)
+        index[name] = j
+    return fieldnames, index
+
+
+def _read_line_block(f: IO[str], block_rows: int) -> List[str]:
+    """
+    Read up to block_rows non-blank lines.
+
+    A block never ends inside a quoted field: while the block holds an odd
+    number of quote characters the next physical line is joined to it.
+    """
+    lines: List[str] = []
+    while not lines:
+        raw = list(itertools.islice(f, block_rows))
+        if not raw:
+            return []
+        lines = [line for line in raw if line not in _BLANK_LINES]
+
+    quotes = sum(line.count('"') for line in lines)
+    while lines and quotes % 2:
+        nxt = f.readline()
+        if not nxt:
+            break
+        lines[-1] += nxt
+        quotes += nxt.count('"')
+    return lines
+
+
+class _NpyAppender:
+    """
+    Append fixed-dtype rows to a .npy file without knowing n up front.
+
+    The header is written with room for the largest possible row count and
+    rewritten in place on close(), so the data is streamed to disk once and
+    the file can be memory-mapped like any np.save output.
+    """
+
+    _MAGIC = b"\x93NUMPY\x01\x00"
+
+    def __init__(self, path: str, dtype: Any, row_shape: Tuple[int, ...] = ()) -> None:
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.row_shape = tuple(int(v) for v in row_shape)
+        self.n = 0
+        self._header_len = len(self._header(2**63 - 1))
+        self._f = open(path, "wb")
+        self._f.write(b"\0" * self._header_len)
+
+    def _header(self, n: int, pad_to: int = 0) -> bytes:
+        meta = {
+            "descr": np.lib.format.dtype_to_descr(self.dtype),
+            "fortran_order": False,
+            "shape": (int(n),) + self.row_shape,
+        }
+        text = repr(meta).encode("latin1")
+        total = max(pad_to, -(-(len(self._MAGIC) + 2 + len(text) + 1) // 64) * 64)
+        text = text + b" " * (total - len(self._MAGIC) - 2 - len(text) - 1) + b"\n"
+        return self._MAGIC + len(text).to_bytes(2, "little") + text
+
+    def append(self, block: np.ndarray) -> None:
+        arr = np.ascontiguousarray(block, dtype=self.dtype)
+        if arr.shape[1:] != self.row_shape:
+            raise ValueError(f"{self.path}: row shape {arr.shape[1:]} != {self.row_shape}")
+        self._f.write(arr.tobytes())
+        self.n += int(arr.shape[0])
+
+    def close(self) -> None:
+        self._f.seek(0)
+        self._f.write(self._header(self.n, pad_to=self._header_len))
+        self._f.close()
+
+
+def iter_csv_blocks(
+    f: IO[str],
+    *,
+    delimiter: str,
+    float_cols: Sequence[int],
+    int_cols: Sequence[int] = (),
+    str_cols: Sequence[int] = (),
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, List[np.ndarray]]]:
+    """
+    Stream data records of an open CSV (positioned after the header).
+
+    Yields per block (floats (b, len(float_cols)) float64, ints (b, len(int_cols))
+    int64, [str array (b,) per str_col]). Values follow _parse_float /
+    _parse_int / _as_str: empty float cells are NaN, empty or non-finite int
+    cells raise ValueError, ints accept "123.0".
+    """
+    if block_rows <= 0:
+        raise ValueError("block_rows must be >= 1")
+
+    float_cols = [int(j) for j in float_cols]
+    int_cols = [int(j) for j in int_cols]
+    num_cols = float_cols + int_cols
+
+    while True:
+        lines = _read_line_block(f, block_rows)
+        if not lines:
+            return
+
+        try:
+            nums = np.loadtxt(
+                lines,
+                delimiter=delimiter,
+                usecols=num_cols or [0],
+                comments=None,
+                quotechar='"',
+                dtype=np.float64,
+                ndmin=2,
+            )
+            strs = [
+                np.loadtxt(
+                    lines, delimiter=delimiter, usecols=[j], comments=None,
+                    quotechar='"', dtype=str, ndmin=1,
+                )
+                for j in str_cols
+            ]
+            if nums.shape[0] != len(lines) or any(a.shape[0] != len(lines) for a in strs):
+                raise ValueError("record count mismatch")
+            ints_f = nums[:, len(float_cols):]
+            if not np.isfinite(ints_f).all():
+                raise ValueError("non-finite int field")
+            floats = nums[:, : len(float_cols)]
+            ints = ints_f.astype(np.int64)
+        except ValueError:
+            # Empty cells, ragged rows or quoting the C parser rejects: parse
+            # this block cell by cell with the reference rules.
+            rows = [row for row in csv.reader(lines, delimiter=delimiter) if row]
+
+            def _cell(row: List[str], j: int) -> str:
+                return row[j] if j < len(row) else ""
+
+            floats = np.array(
+                [[_parse_float(_cell(row, j)) for j in float_cols] for row in rows],
+                dtype=np.float64,
+            ).reshape(len(rows), len(float_cols))
+            ints = np.array(
+                [[_parse_int(_cell(row, j)) for j in int_cols] for row in rows],
+                dtype=np.int64,
+            ).reshape(len(rows), len(int_cols))
+            strs = [np.asarray([_as_str(_cell(row, j)) for row in rows], dtype=str) for j in str_cols]
+
+        yield floats, ints, strs
+
+
+def read_csv_matrix(
+    path: str,
+    *,
+    delimiter: str = ",",
+    header: bool = True,
+    dtype: Any = np.float64,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> Tuple[np.ndarray, Optional[List[str]]]:
+    """
+    Read an all-numeric CSV into one (n, d) array with a growable buffer.
+
+    Returns (X, column names or None). Capacity doubles as blocks arrive, so
+    no per-row Python objects are kept.
+    """
     with open(path, "r", encoding="utf-8", newline="") as f:
-        r = csv.DictReader(f, delimiter=delimiter)
-        if not r.fieldnames:
-            raise ValueError("CSV has no header row (fieldnames missing). This adapter requires a header.")
-        fieldnames = [str(x).strip() for x in r.fieldnames if str(x).strip()]
-        rows: List[Dict[str, str]] = []
-        for row in r:
-            # DictReader can yield None keys if header is malformed; ignore them
-            clean = {str(k).strip(): (v if v is not None else "") for k, v in row.items() if k is not None}
-            rows.append(clean)
-    return fieldnames, rows
+        first = next(csv.reader(f, delimiter=delimiter), None) or []
+        cols = list(range(len(first)))
+        if header:
+            names: Optional[List[str]] = [str(t).strip() for t in first]
+        else:
+            f.seek(0)
+            names = None
+
+        buf = np.empty((0, len(cols)), dtype=dtype)
+        n = 0
+        for floats, _ints, _strs in iter_csv_blocks(
+            f, delimiter=delimiter, float_cols=cols, block_rows=block_rows
+        ):
+            if n + floats.shape[0] > buf.shape[0]:
+                grown = np.empty((max(2 * buf.shape[0], n + floats.shape[0]), len(cols)), dtype=dtype)
+                grown[:n] = buf[:n]
+                buf = grown
+            buf[n : n + floats.shape[0]] = floats
+            n += floats.shape[0]
+
+    return buf[:n], names
+
+
+def pack_npy_dir(npy_dir: str, out_npz: str, *, compress: bool = True) -> None:
+    """
+    Write every <key>.npy of npy_dir into one .npz.
+
+    The arrays are memory-mapped, and np.savez streams them into the archive in
+    buffered chunks, so packing does not load whole arrays.
+    """
+    arrays = {
+        name[: -len(".npy")]: np.load(os.path.join(npy_dir, name), mmap_mode="r", allow_pickle=False)
+        for name in sorted(os.listdir(npy_dir))
+        if name.endswith(".npy")
+    }
+    if compress:
+        np.savez_compressed(out_npz, **arrays)
+    else:
+        np.savez(out_npz, **arrays)
+
+
+def convert_csv(
+    in_csv: str,
+    out: str,
+    *,
+    delimiter: str = ",",
+    feature_cols: Optional[List[str]] = None,
+    exclude_cols: Sequence[str] = (),
+    run_col: Optional[str] = "run",
+    lumi_col: Optional[str] = "lumi",
+    event_col: Optional[str] = "event",
+    event_id_col: Optional[str] = "event_id",
+    weight_col: Optional[str] = "weight",
+    y_col: Optional[str] = "y",
+    require_ids: bool = False,
+    make_event_id: bool = False,
+    dtype: str = "float64",
+    drop_nan_rows: bool = False,
+    max_rows: int = 0,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Stream a feature CSV into the PULSE–PD X schema (see module docstring).
+
+    `out` ending in .npz writes a compressed NPZ; any other path is created as
+    a directory holding one .npy per key. Returns a summary dict (n, d, keys,
+    feature_cols, id_cols, ...); with dry_run=True nothing is written and the
+    summary reports the number of data rows instead.
+    """
+    float_dtype = np.dtype(dtype)
+
+    with open(in_csv, "r", encoding="utf-8", newline="") as f:
+        fieldnames, index = _read_header(f, delimiter)
+
+        run_col = _maybe_present(fieldnames, run_col)
+        lumi_col = _maybe_present(fieldnames, lumi_col)
+        event_col = _maybe_present(fieldnames, event_col)
+        event_id_col = _maybe_present(fieldnames, event_id_col)
+        weight_col = _maybe_present(fieldnames, weight_col)
+        y_col = _maybe_present(fieldnames, y_col)
+
+        reserved_cols = [c for c in [run_col, lumi_col, event_col, event_id_col, weight_col, y_col] if c]
+
+        feat_cols = _infer_feature_cols(
+            fieldnames,
+            feature_cols=feature_cols,
+            exclude_cols=list(exclude_cols),
+            reserved_cols=reserved_cols,
+        )
+
+        have_triplet = (run_col is not None) and (lumi_col is not None) and (event_col is not None)
+        have_event_id = event_id_col is not None
+        derive_event_id = bool(make_event_id and not have_event_id and have_triplet)
+
+        if require_ids and not (have_event_id or have_triplet):
+            raise ValueError(
+                "IDs required, but neither event_id nor (run,lumi,event) are present in the CSV header."
+            )
+
+        summary: Dict[str, Any] = {
+            "feature_cols": feat_cols,
+            "id_cols": {
+                "run": run_col,
+                "lumi": lumi_col,
+                "event": event_col,
+                "event_id": event_id_col,
+                "weight": weight_col,
+                "y": y_col,
+            },
+            "derived_event_id": derive_event_id,
+        }
+
+        int_names = [c for c in (run_col, lumi_col, event_col, y_col) if c]
+        float_names = feat_cols + ([weight_col] if weight_col else [])
+        str_names = [event_id_col] if event_id_col else []
+
+        blocks = iter_csv_blocks(
+            f,
+            delimiter=delimiter,
+            float_cols=[index[c] for c in float_names],
+            int_cols=[index[c] for c in int_names],
+            str_cols=[index[c] for c in str_names],
+            block_rows=block_rows,
+        )
+
+        if dry_run:
+            rows = sum(floats.shape[0] for floats, _ints, _strs in blocks)
+            summary["rows"] = min(rows, max_rows) if max_rows and max_rows > 0 else rows
+            return summary
+
+        to_npz = out.lower().endswith(".npz")
+        if to_npz:
+            _ensure_parent_dir(out)
+            tmp = tempfile.TemporaryDirectory(dir=os.path.dirname(out) or ".", prefix=".export_x_npz_")
+            npy_dir = tmp.name
+        else:
+            os.makedirs(out, exist_ok=True)
+            tmp = None
+            npy_dir = out
+
+        try:
+            d = len(feat_cols)
+            sinks: Dict[str, _NpyAppender] = {
+                "X": _NpyAppender(os.path.join(npy_dir, "X.npy"), float_dtype, (d,)),
+            }
+            int_keys = {run_col: "run", lumi_col: "lumi", event_col: "event", y_col: "y"}
+            for c in int_names:
+                sinks[int_keys[c]] = _NpyAppender(os.path.join(npy_dir, int_keys[c] + ".npy"), np.int64)
+            if weight_col:
+                sinks["weight"] = _NpyAppender(os.path.join(npy_dir, "weight.npy"), float_dtype)
+            # String ids have no fixed width until the end: kept per block in memory.
+            event_ids: List[np.ndarray] = []
+
+            remaining = int(max_rows) if max_rows and max_rows > 0 else -1
+            try:
+                for floats, ints, strs in blocks:
+                    if remaining >= 0:
+                        floats, ints, strs = floats[:remaining], ints[:remaining], [a[:remaining] for a in strs]
+                        remaining -= floats.shape[0]
+
+                    # Cast before the NaN check so float32 overflow drops rows as before.
+                    X = floats[:, :d].astype(float_dtype)
+                    if drop_nan_rows:
+                        keep = np.isfinite(X).all(axis=1)
+                        X, floats, ints, strs = X[keep], floats[keep], ints[keep], [a[keep] for a in strs]
+
+                    sinks["X"].append(X)
+                    for k, c in enumerate(int_names):
+                        sinks[int_keys[c]].append(ints[:, k])
+                    if weight_col:
+                        sinks["weight"].append(floats[:, d])
+
+                    if event_id_col:
+                        event_ids.append(strs[0])
+                    elif derive_event_id:
+                        run_s, lumi_s, event_s = (
+                            ints[:, int_names.index(c)].astype(str) for c in (run_col, lumi_col, event_col)
+                        )
+                        event_ids.append(
+                            np.char.add(np.char.add(np.char.add(np.char.add(run_s, ":"), lumi_s), ":"), event_s)
+                        )
+
+                    if remaining == 0:
+                        break
+            finally:
+                for sink in sinks.values():
+                    sink.close()
+
+            n = sinks["X"].n
+            np.save(os.path.join(npy_dir, "feature_names.npy"), np.asarray([str(c) for c in feat_cols], dtype=str))
+            if event_id_col or derive_event_id:
+                ids = np.concatenate(event_ids) if event_ids else np.asarray([], dtype=str)
+                if ids.size:
+                    # Same width np.asarray(list_of_str) would pick.
+                    ids = ids.astype(f"<U{max(1, int(np.char.str_len(ids).max()))}")
+                np.save(os.path.join(npy_dir, "event_id.npy"), ids)
+
+            if to_npz:
+                pack_npy_dir(npy_dir, out)
+        finally:
+            if tmp is not None:
+                tmp.cleanup()
+
+    keys = sorted(list(sinks) + ["feature_names"] + (["event_id"] if event_id_col or derive_event_id else []))
+    summary.update({"n": n, "d": d, "keys": keys, "out": out})
+    return summary
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--in-csv", required=True, help="Input CSV with header (features + optional IDs)")
-    ap.add_argument("--out", required=True, help="Output .npz path (PULSE–PD schema)")
+    ap.add_argument(
+        "--out",
+        required=True,
+        help="Output .npz path, or a directory for one .npy per key (PULSE–PD schema)",
+    )
     ap.add_argument("--delimiter", default=",", help="CSV delimiter (default: ,)")
 
     ap.add_argument(
@@ -176,156 +574,49 @@ def main() -> int:
         help="Drop rows that contain NaN in any feature column.",
     )
     ap.add_argument("--max-rows", type=int, default=0, help="Optional cap for rows (0 = no cap)")
+    ap.add_argument(
+        "--block-rows",
+        type=int,
+        default=DEFAULT_BLOCK_ROWS,
+        help=f"CSV records parsed per block (default: {DEFAULT_BLOCK_ROWS}).",
+    )
     ap.add_argument("--dry-run", action="store_true", help="Print detected columns and exit (no write).")
 
     args = ap.parse_args()
 
-    feature_cols = _norm_list(args.feature_cols)
-    exclude_cols = _norm_list(args.exclude_cols) or []
-
-    fieldnames, rows = _load_csv_rows(args.in_csv, delimiter=str(args.delimiter))
-    if args.max_rows and args.max_rows > 0:
-        rows = rows[: int(args.max_rows)]
-
-    run_col = _maybe_present(fieldnames, args.run_col)
-    lumi_col = _maybe_present(fieldnames, args.lumi_col)
-    event_col = _maybe_present(fieldnames, args.event_col)
-    event_id_col = _maybe_present(fieldnames, args.event_id_col)
-    weight_col = _maybe_present(fieldnames, args.weight_col)
-    y_col = _maybe_present(fieldnames, args.y_col)
-
-    reserved_cols = []
-    for c in [run_col, lumi_col, event_col, event_id_col, weight_col, y_col]:
-        if c:
-            reserved_cols.append(c)
-
-    feat_cols = _infer_feature_cols(
-        fieldnames,
-        feature_cols=feature_cols,
-        exclude_cols=exclude_cols,
-        reserved_cols=reserved_cols,
+    summary = convert_csv(
+        args.in_csv,
+        args.out,
+        delimiter=str(args.delimiter),
+        feature_cols=_norm_list(args.feature_cols),
+        exclude_cols=_norm_list(args.exclude_cols) or [],
+        run_col=args.run_col,
+        lumi_col=args.lumi_col,
+        event_col=args.event_col,
+        event_id_col=args.event_id_col,
+        weight_col=args.weight_col,
+        y_col=args.y_col,
+        require_ids=bool(args.require_ids),
+        make_event_id=bool(args.make_event_id),
+        dtype=args.dtype,
+        drop_nan_rows=bool(args.drop_nan_rows),
+        max_rows=int(args.max_rows),
+        block_rows=int(args.block_rows),
+        dry_run=bool(args.dry_run),
     )
 
-    have_triplet = (run_col is not None) and (lumi_col is not None) and (event_col is not None)
-    have_event_id = event_id_col is not None
-
-    if args.require_ids and not (have_event_id or have_triplet):
-        raise ValueError(
-            "IDs required, but neither event_id nor (run,lumi,event) are present in the CSV header."
-        )
-
     if args.dry_run:
         print("Input:", os.path.abspath(args.in_csv))
-        print("Rows:", len(rows))
-        print("Feature cols (d=%d): %s" % (len(feat_cols), feat_cols))
-        print("ID cols present:", {
-            "run": run_col,
-            "lumi": lumi_col,
-            "event": event_col,
-            "event_id": event_id_col,
-            "weight": weight_col,
-            "y": y_col,
-        })
-        print("Derived event_id:", bool(args.make_event_id and (not have_event_id) and have_triplet))
+        print("Rows:", summary["rows"])
+        print("Feature cols (d=%d): %s" % (len(summary["feature_cols"]), summary["feature_cols"]))
+        print("ID cols present:", summary["id_cols"])
+        print("Derived event_id:", summary["derived_event_id"])
         print("Output:", os.path.abspath(args.out))
         return 0
 
-    # Build arrays
-    X_rows: List[List[float]] = []
-    run_v: List[int] = []
-    lumi_v: List[int] = []
-    event_v: List[int] = []
-    event_id_v: List[str] = []
-    weight_v: List[float] = []
-    y_v: List[int] = []
-
-    for r in rows:
-        feats = [_parse_float(r.get(c, "")) for c in feat_cols]
-        X_rows.append(feats)
-
-        if run_col:
-            run_v.append(_parse_int(r.get(run_col, "")))
-        if lumi_col:
-            lumi_v.append(_parse_int(r.get(lumi_col, "")))
-        if event_col:
-            event_v.append(_parse_int(r.get(event_col, "")))
-
-        if event_id_col:
-            event_id_v.append(_as_str(r.get(event_id_col, "")))
-        elif args.make_event_id and have_triplet:
-            # derive from triplet (must exist by here)
-            rr = _parse_int(r.get(run_col or "", ""))
-            ll = _parse_int(r.get(lumi_col or "", ""))
-            ee = _parse_int(r.get(event_col or "", ""))
-            event_id_v.append(f"{rr}:{ll}:{ee}")
-
-        if weight_col:
-            weight_v.append(_parse_float(r.get(weight_col, "")))
-        if y_col:
-            y_v.append(_parse_int(r.get(y_col, "")))
-
-    X = np.asarray(X_rows, dtype=getattr(np, args.dtype))
-    if X.ndim != 2:
-        raise ValueError(f"X must be 2D; got {X.shape}")
-
-    n = X.shape[0]
-
-    # Optional drop of NaN rows (features only)
-    if args.drop_nan_rows:
-        ok = np.isfinite(X).all(axis=1)
-        keep_idx = np.where(ok)[0]
-        X = X[keep_idx, :]
-        n2 = X.shape[0]
-
-        def _filter_list(lst, present: bool):
-            if not present:
-                return lst
-            return [lst[i] for i in keep_idx.tolist()]
-
-        run_v = _filter_list(run_v, bool(run_col))
-        lumi_v = _filter_list(lumi_v, bool(lumi_col))
-        event_v = _filter_list(event_v, bool(event_col))
-        event_id_v = _filter_list(event_id_v, bool(event_id_v))
-        weight_v = _filter_list(weight_v, bool(weight_col))
-        y_v = _filter_list(y_v, bool(y_col))
-        n = n2
-
-    # Length checks (fail-fast on mismatches)
-    def _check_len(name: str, present: bool, lst) -> None:
-        if present and len(lst) != n:
-            raise ValueError(f"Column '{name}' length mismatch: {len(lst)} vs n={n}")
-
-    _check_len("run", bool(run_col), run_v)
-    _check_len("lumi", bool(lumi_col), lumi_v)
-    _check_len("event", bool(event_col), event_v)
-    _check_len("event_id", bool(event_id_v), event_id_v)
-    _check_len("weight", bool(weight_col), weight_v)
-    _check_len("y", bool(y_col), y_v)
-
-    out: Dict[str, np.ndarray] = {
-        "X": X,
-        "feature_names": np.asarray([str(c) for c in feat_cols], dtype=str),
-    }
-
-    if run_col:
-        out["run"] = np.asarray(run_v, dtype=np.int64)
-    if lumi_col:
-        out["lumi"] = np.asarray(lumi_v, dtype=np.int64)
-    if event_col:
-        out["event"] = np.asarray(event_v, dtype=np.int64)
-    if event_id_v:
-        out["event_id"] = np.asarray(event_id_v, dtype=str)
-    if weight_col:
-        out["weight"] = np.asarray(weight_v, dtype=getattr(np, args.dtype))
-    if y_col:
-        out["y"] = np.asarray(y_v, dtype=np.int64)
-
-    _ensure_parent_dir(args.out)
-    np.savez_compressed(args.out, **out)
-
     print("Wrote:", os.path.abspath(args.out))
-    print("n=%d, d=%d" % (X.shape[0], X.shape[1]))
-    print("Keys:", sorted(out.keys()))
+    print("n=%d, d=%d" % (summary["n"], summary["d"]))
+    print("Keys:", summary["keys"])
     return 0
 
 
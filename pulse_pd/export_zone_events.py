@@ -15,6 +15,10 @@ Output:
   - pi_raw, pi_norm, ds, mi, gf
   - (optional) feature columns
 
+Zone membership uses ZoneIndex: each referenced column is sorted once and
+every zone is answered with searchsorted ranges, instead of a full mask over
+all events per zone.
+
 Example:
   python -m pulse_pd.export_zone_events \
     --x pulse_pd/examples/X_toy_ci.npz \
@@ -240,6 +244,48 @@ def _top_indices_subset(indices: np.ndarray, score: np.ndarray, topn: int) -> np
     return indices[order]
 
 
+class ZoneIndex:
+    """
+    Sorted per-column index of X for zone (rectangle) membership queries.
+
+    Each referenced column is argsorted once; a zone [x0, x1) x [y0, y1) is
+    then two searchsorted ranges, and the smaller candidate range is checked
+    against the other column. query returns the same indices, in the same
+    ascending order, as np.where on the full boolean mask.
+    """
+
+    def __init__(self, X: np.ndarray) -> None:
+        self.X = X
+        self._columns: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _column(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        if j not in self._columns:
+            col = np.asarray(self.X[:, j], dtype=float)
+            order = np.argsort(col, kind="stable")  # NaN sorts last, never in range
+            self._columns[j] = (order, col[order])
+        return self._columns[j]
+
+    def _range(self, j: int, lo: float, hi: float) -> np.ndarray:
+        """Indices i with lo <= X[i, j] < hi, in column-sorted order."""
+        if not lo < hi:
+            return np.empty(0, dtype=np.intp)
+        order, values = self._column(j)
+        start, stop = np.searchsorted(values, [lo, hi], side="left")
+        return order[start:stop]
+
+    def query(self, jx: int, x0: float, x1: float, jy: int, y0: float, y1: float) -> np.ndarray:
+        """Sorted indices of events with x0 <= X[:, jx] < x1 and y0 <= X[:, jy] < y1."""
+        cand_x = self._range(jx, x0, x1)
+        cand_y = self._range(jy, y0, y1)
+        # Intersect by checking the smaller range against the other column.
+        if cand_x.shape[0] <= cand_y.shape[0]:
+            cand, j, lo, hi = cand_x, jy, y0, y1
+        else:
+            cand, j, lo, hi = cand_y, jx, x0, x1
+        vals = np.asarray(self.X[cand, j], dtype=float)
+        return np.sort(cand[(vals >= lo) & (vals < hi)])
+
+
 def _read_zones_jsonl(path: str) -> List[Dict[str, Any]]:
     zones: List[Dict[str, Any]] = []
     with open(path, "r", encoding="utf-8") as f:
@@ -326,7 +372,7 @@ def main() -> int:
     ap.add_argument("--ds-M", type=int, default=24, help="DS perturbation samples")
     ap.add_argument("--mi-models", type=int, default=7, help="Theta-ensemble size for MI")
     ap.add_argument("--mi-sigma", type=float, default=None, help="Sigma override for MI theta jitter (optional)")
-    ap.add_argument("--gf-method", default="spsa", choices=["spsa", "finite_diff"], help="GF method")
+    ap.add_argument("--gf-method", default="spsa", choices=["spsa", "finite_diff", "analytic"], help="GF method (analytic: exact closed form for cuts)")
     ap.add_argument("--gf-K", type=int, default=8, help="GF SPSA directions (if spsa)")
     ap.add_argument("--gf-delta", type=float, default=0.05, help="GF delta step size")
     ap.add_argument("--seed", type=int, default=0, help="RNG seed")
@@ -399,6 +445,8 @@ def main() -> int:
     total_rows = 0
     zones_with_rows = 0
 
+    index = ZoneIndex(X)
+
     with open(args.out, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(header)
@@ -411,11 +459,8 @@ def main() -> int:
                     f"Zone dims out of range for d={d}: zone_id={zone_id} dims=({jx},{jy})"
                 )
 
-            # Filter events inside zone (half-open interval to match histogram binning)
-            xv = X[:, jx]
-            yv = X[:, jy]
-            mask = (xv >= x0) & (xv < x1) & (yv >= y0) & (yv < y1)
-            idx_in_zone = np.where(mask)[0]
+            # Events inside zone (half-open interval to match histogram binning)
+            idx_in_zone = index.query(jx, x0, x1, jy, y0, y1)
             zone_count = int(idx_in_zone.shape[0])
             if zone_count == 0:
                 continue
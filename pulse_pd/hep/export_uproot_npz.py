@@ -16,7 +16,16 @@ Optional weights:
 Quick discovery helpers:
 - --list-trees: list TTrees in the ROOT file and exit
 - --list-branches: list branches in a given tree and exit
-- --dry-run: validate branches (exist + 1D + not jagged) without writing NPZ
+- --dry-run: validate branches (exist + 1D + not jagged) without writing NPZ, and
+  report the entry count, estimated output size and chunk plan
+
+Chunked mode (--chunk-entries N):
+- the tree is read in entry ranges of N entries; each chunk is validated (flat,
+  numeric, same dtype as the first chunk) and written into preallocated
+  memory-mapped .npy files of known shape (num_entries, d), so peak memory is
+  about one chunk instead of twice the feature matrix
+- --out <dir> keeps the .npy files (X.npy, feature_names.npy, run.npy, ...);
+  --out <file>.npz packs them into an NPZ afterwards
 
 Examples:
 
@@ -44,6 +53,14 @@ Examples:
     --features-file features.txt \
     --out pulse_pd/artifacts_run/X_from_root.npz
 
+  # Large files: chunked read into memory-mapped .npy files
+  python -m pulse_pd.hep.export_uproot_npz \
+    --root /path/to/file.root \
+    --tree Events \
+    --features-file features.txt \
+    --chunk-entries 500000 \
+    --out pulse_pd/artifacts_run/X_from_root/
+
   # Rename output feature_names (does NOT rename branches; it renames NPZ feature_names)
   python -m pulse_pd.hep.export_uproot_npz \
     --root /path/to/file.root \
@@ -64,10 +81,15 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import Dict, List, Optional, Sequence
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from pulse_pd.export_x_npz import pack_npy_dir
+
+DEFAULT_CHUNK_ENTRIES = 100_000
+
 
 def _split_csv(s: str) -> List[str]:
     return [t.strip() for t in s.split(",") if t.strip()]
@@ -167,14 +189,18 @@ def _apply_rename(feature_branches: Sequence[str], rename_map: Dict[str, str]) -
     return names
 
 
+def _open_tree(root_path: str, tree_name: str) -> Any:
+    uproot = _import_uproot()
+    return uproot.open(root_path)[tree_name]
+
+
 def _load_arrays_np(
     root_path: str,
     tree_name: str,
     branches: Sequence[str],
     entry_stop: Optional[int] = None,
 ) -> Dict[str, np.ndarray]:
-    uproot = _import_uproot()
-    tree = uproot.open(root_path)[tree_name]
+    tree = _open_tree(root_path, tree_name)
     arrays = tree.arrays(list(branches), library="np", entry_stop=entry_stop)
     out: Dict[str, np.ndarray] = {}
     for k in branches:
@@ -221,6 +247,243 @@ def _compute_event_id(run: np.ndarray, lumi: np.ndarray, event: np.ndarray) -> n
     return np.asarray([f"{int(r)}:{int(l)}:{int(e)}" for r, l, e in zip(run, lumi, event)], dtype=str)
 
 
+def plan_chunks(num_entries: int, chunk_entries: int) -> List[Tuple[int, int]]:
+    """[(entry_start, entry_stop), ...] covering num_entries in chunk_entries steps."""
+    if chunk_entries <= 0:
+        raise ValueError("chunk_entries must be >= 1")
+    n = int(num_entries)
+    return [(start, min(n, start + int(chunk_entries))) for start in range(0, n, int(chunk_entries))]
+
+
+def estimate_output_bytes(
+    num_entries: int,
+    d: int,
+    *,
+    n_id_branches: int = 0,
+    weight: bool = False,
+    event_id_itemsize: int = 0,
+) -> int:
+    """
+    Uncompressed size of the exported arrays: X (float64), run/lumi/event
+    (int64), weight (float64) and event_id (event_id_itemsize bytes per entry).
+    """
+    per_entry = 8 * int(d) + 8 * int(n_id_branches) + (8 if weight else 0) + int(event_id_itemsize)
+    return int(num_entries) * per_entry
+
+
+def _check_chunk(
+    a: Any,
+    name: str,
+    start: int,
+    stop: int,
+    dtypes: Dict[str, np.dtype],
+    *,
+    numeric: bool = True,
+) -> np.ndarray:
+    """Validate one branch chunk: flat, entries [start, stop), stable dtype."""
+    a = np.asarray(a)
+    _reject_object_arrays(a, name)
+    a = _as_1d(a, name)
+
+    if int(a.shape[0]) != stop - start:
+        raise ValueError(
+            f"Branch '{name}' returned {a.shape[0]} entries for chunk [{start}, {stop}); "
+            f"expected {stop - start}"
+        )
+    if numeric and a.dtype.kind not in "biuf":
+        raise ValueError(f"Branch '{name}' has non-numeric dtype {a.dtype} in chunk [{start}, {stop})")
+
+    first = dtypes.setdefault(name, a.dtype)
+    if a.dtype != first:
+        raise ValueError(
+            f"Branch '{name}' changed dtype from {first} to {a.dtype} in chunk [{start}, {stop})"
+        )
+    return a
+
+
+_POW10 = 10 ** np.arange(1, 19, dtype=np.int64)
+
+
+def _int_str_len(a: np.ndarray) -> np.ndarray:
+    """len(str(v)) for each int64 v, without formatting strings."""
+    a = np.asarray(a, dtype=np.int64)
+    return np.searchsorted(_POW10, np.abs(a), side="right") + 1 + (a < 0)
+
+
+def _event_id_strings(run: np.ndarray, lumi: np.ndarray, event: np.ndarray) -> np.ndarray:
+    ids = np.char.add(np.char.add(run.astype(str), ":"), lumi.astype(str))
+    return np.char.add(np.char.add(ids, ":"), event.astype(str))
+
+
+def write_chunks_npy_dir(
+    chunks: Iterable[Tuple[int, int, Dict[str, np.ndarray]]],
+    *,
+    num_entries: int,
+    out_dir: str,
+    feature_branches: Sequence[str],
+    feature_names: Optional[Sequence[str]] = None,
+    run_branch: Optional[str] = None,
+    lumi_branch: Optional[str] = None,
+    event_branch: Optional[str] = None,
+    event_id_branch: Optional[str] = None,
+    weight_branch: Optional[str] = None,
+    make_event_id: bool = True,
+) -> Dict[str, Any]:
+    """
+    Write (entry_start, entry_stop, {branch: array}) chunks into out_dir.
+
+    X.npy (num_entries, d) float64 and the run/lumi/event/weight files are
+    preallocated with np.lib.format.open_memmap and filled chunk by chunk;
+    chunks must tile [0, num_entries) in order. A derived event_id
+    ("run:lumi:event") is written in a second pass over the mapped id files
+    once its string width (from the digit counts) is known.
+    Returns {"n", "d", "keys"}.
+    """
+    feature_branches = list(feature_branches)
+    if not feature_branches:
+        raise ValueError("No features provided.")
+    if feature_names is None:
+        feature_names = list(feature_branches)
+    if len(feature_names) != len(feature_branches):
+        raise ValueError(
+            f"feature_names length mismatch: got {len(feature_names)} names for {len(feature_branches)} branches"
+        )
+
+    n, d = int(num_entries), len(feature_branches)
+    os.makedirs(out_dir, exist_ok=True)
+
+    def _mm(key: str, dtype: Any, shape: Tuple[int, ...]) -> np.memmap:
+        path = os.path.join(out_dir, f"{key}.npy")
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+    maps: Dict[str, np.memmap] = {"X": _mm("X", np.float64, (n, d))}
+    ids = {"run": run_branch, "lumi": lumi_branch, "event": event_branch}
+    for key, branch in ids.items():
+        if branch:
+            maps[key] = _mm(key, np.int64, (n,))
+    if weight_branch:
+        maps["weight"] = _mm("weight", np.float64, (n,))
+
+    derive = bool(make_event_id and not event_id_branch and all(ids.values()))
+    id_width = 1
+    dtypes: Dict[str, np.dtype] = {}
+    expected = 0
+
+    for start, stop, arrs in chunks:
+        if start != expected or stop < start or stop > n:
+            raise ValueError(f"Chunk [{start}, {stop}) does not continue at entry {expected} of {n}")
+        expected = stop
+
+        def _get(branch: str) -> Any:
+            if branch not in arrs:
+                raise KeyError(f"Branch '{branch}' not found (requested via CLI).")
+            return arrs[branch]
+
+        # Assemble the chunk's rows first so X.npy is written sequentially.
+        block = np.empty((stop - start, d), dtype=np.float64)
+        for j, b in enumerate(feature_branches):
+            block[:, j] = _check_chunk(_get(b), b, start, stop, dtypes)
+        maps["X"][start:stop] = block
+        for key, branch in ids.items():
+            if branch:
+                maps[key][start:stop] = _check_chunk(_get(branch), key, start, stop, dtypes)
+        if weight_branch:
+            maps["weight"][start:stop] = _check_chunk(_get(weight_branch), "weight", start, stop, dtypes)
+
+        if event_id_branch:
+            a = _check_chunk(_get(event_id_branch), "event_id", start, stop, dtypes, numeric=False)
+            if "event_id" not in maps:
+                maps["event_id"] = _mm("event_id", a.dtype, (n,))
+            maps["event_id"][start:stop] = a
+        elif derive and stop > start:
+            widths = sum(_int_str_len(maps[k][start:stop]) for k in ("run", "lumi", "event")) + 2
+            id_width = max(id_width, int(widths.max()))
+
+    if expected != n:
+        raise ValueError(f"Chunks cover {expected} entries; expected {n}")
+
+    if derive:
+        maps["event_id"] = _mm("event_id", f"<U{id_width}", (n,))
+        for start, stop in plan_chunks(n, DEFAULT_CHUNK_ENTRIES):
+            maps["event_id"][start:stop] = _event_id_strings(
+                *(maps[k][start:stop] for k in ("run", "lumi", "event"))
+            )
+    elif event_id_branch and "event_id" not in maps:
+        maps["event_id"] = _mm("event_id", np.int64, (0,))
+
+    for mm in maps.values():
+        mm.flush()
+    np.save(os.path.join(out_dir, "feature_names.npy"), np.asarray([str(b) for b in feature_names], dtype=str))
+
+    return {"n": n, "d": d, "keys": sorted(list(maps) + ["feature_names"])}
+
+
+def _iter_tree_chunks(
+    tree: Any, branches: Sequence[str], plan: Sequence[Tuple[int, int]]
+) -> Iterator[Tuple[int, int, Dict[str, np.ndarray]]]:
+    for start, stop in plan:
+        # array_cache=None: uproot's per-file cache would otherwise keep up to
+        # ~100 MB of already-written chunks alive.
+        arrays = tree.arrays(
+            list(branches), library="np", entry_start=start, entry_stop=stop, array_cache=None
+        )
+        yield start, stop, {k: arrays[k] for k in branches if k in arrays}
+
+
+def export_root_chunked(
+    *,
+    root_path: str,
+    tree: str,
+    feature_branches: Sequence[str],
+    out: str,
+    feature_names: Optional[Sequence[str]] = None,
+    run_branch: Optional[str] = None,
+    lumi_branch: Optional[str] = None,
+    event_branch: Optional[str] = None,
+    event_id_branch: Optional[str] = None,
+    weight_branch: Optional[str] = None,
+    entry_stop: Optional[int] = None,
+    chunk_entries: int = DEFAULT_CHUNK_ENTRIES,
+    make_event_id: bool = True,
+    compress: bool = True,
+) -> str:
+    """
+    Chunked export: read the tree in entry ranges into memory-mapped .npy
+    files under `out`, or (if `out` ends with .npz) into a temporary
+    directory that is then packed into the NPZ.
+    """
+    t = _open_tree(root_path, tree)
+    n = int(t.num_entries) if entry_stop is None else min(int(t.num_entries), int(entry_stop))
+
+    branches: List[str] = list(feature_branches)
+    for b in [run_branch, lumi_branch, event_branch, event_id_branch, weight_branch]:
+        if b and b not in branches:
+            branches.append(b)
+
+    kwargs = dict(
+        num_entries=n,
+        feature_branches=feature_branches,
+        feature_names=feature_names,
+        run_branch=run_branch,
+        lumi_branch=lumi_branch,
+        event_branch=event_branch,
+        event_id_branch=event_id_branch,
+        weight_branch=weight_branch,
+        make_event_id=make_event_id,
+    )
+    chunks = _iter_tree_chunks(t, branches, plan_chunks(n, chunk_entries))
+
+    if not out.lower().endswith(".npz"):
+        write_chunks_npy_dir(chunks, out_dir=out, **kwargs)
+        return os.path.abspath(out)
+
+    _ensure_parent_dir(out)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(out) or ".", prefix=".export_uproot_npz_") as tmp:
+        write_chunks_npy_dir(chunks, out_dir=tmp, **kwargs)
+        pack_npy_dir(tmp, out, compress=compress)
+    return os.path.abspath(out)
+
+
 def _list_trees(root_path: str) -> List[str]:
     uproot = _import_uproot()
     f = uproot.open(root_path)
@@ -247,8 +510,7 @@ def _list_trees(root_path: str) -> List[str]:
 
 
 def _list_branches(root_path: str, tree_name: str) -> List[str]:
-    uproot = _import_uproot()
-    tree = uproot.open(root_path)[tree_name]
+    tree = _open_tree(root_path, tree_name)
     return [str(k) for k in tree.keys()]
 
 
@@ -335,7 +597,11 @@ def main() -> int:
 
     ap.add_argument("--list-trees", action="store_true", help="List TTrees in the ROOT file and exit")
     ap.add_argument("--list-branches", action="store_true", help="List branches in --tree and exit")
-    ap.add_argument("--dry-run", action="store_true", help="Validate branches (exist + 1D) without writing NPZ")
+    ap.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate branches (exist + 1D) and report entries, estimated output size and chunk plan without writing",
+    )
 
     ap.add_argument("--features", default=None, help="Comma-separated feature branch list (optional if --features-file is used)")
     ap.add_argument(
@@ -350,7 +616,17 @@ def main() -> int:
         help='Optional rename mapping for output feature_names: repeatable "BRANCH:NAME" (e.g. --rename pt_lead:pt).',
     )
 
-    ap.add_argument("--out", default=None, help="Output NPZ path (required for export mode)")
+    ap.add_argument(
+        "--out",
+        default=None,
+        help="Output NPZ path (required for export mode); with --chunk-entries, a non-.npz path is a .npy directory",
+    )
+    ap.add_argument(
+        "--chunk-entries",
+        type=int,
+        default=None,
+        help=f"Read the tree in chunks of N entries into memory-mapped .npy files (e.g. {DEFAULT_CHUNK_ENTRIES})",
+    )
 
     ap.add_argument("--run-branch", default=None, help="Branch name for run (optional)")
     ap.add_argument("--lumi-branch", default=None, help="Branch name for lumi/luminosityBlock (optional)")
@@ -407,10 +683,42 @@ def main() -> int:
             _as_1d(a, b)
 
         X = _build_X(arrs, features)
+
+        num_entries = int(_open_tree(args.root, args.tree).num_entries)
+        if args.entry_stop is not None:
+            num_entries = min(num_entries, int(args.entry_stop))
+        id_branches = [b for b in (args.run_branch, args.lumi_branch, args.event_branch) if b]
+        if args.event_id_branch:
+            event_id_itemsize = np.asarray(arrs[args.event_id_branch]).dtype.itemsize
+        elif len(id_branches) == 3 and not args.no_event_id:
+            # derived "run:lumi:event" strings, estimated from the preview rows
+            widths = sum(_int_str_len(arrs[b]) for b in id_branches) + 2
+            event_id_itemsize = 4 * int(widths.max()) if widths.size else 0
+        else:
+            event_id_itemsize = 0
+        est = estimate_output_bytes(
+            num_entries,
+            len(features),
+            n_id_branches=len(id_branches),
+            weight=bool(args.weight_branch),
+            event_id_itemsize=event_id_itemsize,
+        )
+
         print("OK: dry-run validation passed")
         print("ROOT:", args.root)
         print("TREE:", args.tree)
         print(f"X shape (preview): {X.shape}")
+        print(f"ENTRIES: {num_entries}")
+        print(f"ESTIMATED OUTPUT: {est} bytes ({est / 2**20:.1f} MiB uncompressed)")
+        if args.chunk_entries:
+            plan = plan_chunks(num_entries, args.chunk_entries)
+            print(f"CHUNK PLAN: {len(plan)} chunk(s) of up to {args.chunk_entries} entries")
+            for start, stop in plan[:3]:
+                print(f"  - [{start}, {stop})")
+            if len(plan) > 3:
+                print(f"  - ... last [{plan[-1][0]}, {plan[-1][1]})")
+        else:
+            print("CHUNK PLAN: single in-memory read (use --chunk-entries N for chunked mode)")
         print("FEATURES:")
         for src, outn in zip(features, out_feature_names):
             if src == outn:
@@ -422,6 +730,26 @@ def main() -> int:
     if not args.out:
         raise SystemExit("--out is required for export mode (omit only for --list-trees/--list-branches/--dry-run).")
 
+    if args.chunk_entries:
+        out = export_root_chunked(
+            root_path=args.root,
+            tree=args.tree,
+            feature_branches=features,
+            feature_names=out_feature_names,
+            out=args.out,
+            run_branch=args.run_branch,
+            lumi_branch=args.lumi_branch,
+            event_branch=args.event_branch,
+            event_id_branch=args.event_id_branch,
+            weight_branch=args.weight_branch,
+            entry_stop=args.entry_stop,
+            chunk_entries=int(args.chunk_entries),
+            make_event_id=(not args.no_event_id),
+            compress=(not args.no_compress),
+        )
+        print("Wrote:", out)
+        return 0
+
     out = export_root_to_npz(
         root_path=args.root,
         tree=args.tree,
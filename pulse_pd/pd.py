@@ -191,6 +191,10 @@ def compute_mi(
       the variance is still meaningful (but coarser).
     - Using probability-like outputs typically yields smoother signals.
 
+    - An ensemble that exposes `prob_matrix(X, theta) -> (n_models, n)` (e.g.
+      cut_adapter.CutProbEnsemble) is evaluated in one vectorized call instead
+      of one call per model.
+
     Parameters
     ----------
     prob_fn_list:
@@ -210,6 +214,15 @@ def compute_mi(
     x = _as_2d_float(X)
     n = x.shape[0]
 
+    prob_matrix = getattr(prob_fn_list, "prob_matrix", None)
+    if prob_matrix is not None:
+        stack = np.asarray(prob_matrix(x, theta), dtype=float)
+        if stack.shape != (len(prob_fn_list), n):
+            raise ValueError(
+                f"prob_matrix shape mismatch: expected {(len(prob_fn_list), n)}, got {stack.shape}"
+            )
+        return np.var(stack, axis=0, ddof=0)
+
     preds: List[np.ndarray] = []
     for fn in prob_fn_list:
         p = _to_1d(fn(x, theta), n, dtype=float)
@@ -241,6 +254,9 @@ def compute_gf(
     -------
     - "spsa" (default): black-box gradient norm estimate using random Rademacher directions.
     - "finite_diff": full coordinate finite differences (slow; useful for very low dimension).
+    - "analytic": exact gradient norm in one pass, for prob_fns that expose a
+      closed form as a `grad_norm(X, theta)` attribute (e.g. cut_adapter.prob_cut).
+      Falls back to "spsa" for any other prob_fn.
 
     Parameters
     ----------
@@ -251,11 +267,11 @@ def compute_gf(
     theta:
         Parameters forwarded to prob_fn.
     method:
-        "spsa" or "finite_diff".
+        "spsa", "finite_diff" or "analytic".
     K:
         Number of random directions for SPSA (typical v0: 4..16).
     delta:
-        Step size in feature space for finite differences / SPSA.
+        Step size in feature space for finite differences / SPSA (unused by "analytic").
     seed:
         RNG seed for determinism (SPSA).
     clip_prob:
@@ -271,6 +287,12 @@ def compute_gf(
     x = _as_2d_float(X)
     n, d = x.shape
 
+    if method.lower() == "analytic":
+        grad_norm = getattr(prob_fn, "grad_norm", None)
+        if grad_norm is not None:
+            return _to_1d(grad_norm(x, theta), n, dtype=float)
+        method = "spsa"
+
     def _p(xx: np.ndarray) -> np.ndarray:
         p = _to_1d(prob_fn(xx, theta), n, dtype=float)
         if clip_prob:
@@ -290,7 +312,9 @@ def compute_gf(
         return np.sqrt(gradsq)
 
     if method.lower() != "spsa":
-        raise ValueError(f"Unknown method '{method}'. Use 'spsa' or 'finite_diff'.")
+        raise ValueError(
+            f"Unknown method '{method}'. Use 'spsa', 'finite_diff' or 'analytic'."
+        )
 
     if K <= 0:
         raise ValueError("K must be >= 1 for SPSA")
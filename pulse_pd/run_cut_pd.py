@@ -8,11 +8,12 @@ Inputs
 
 Outputs (in --out directory)
 ----------------------------
-- pd_scatter.png     (DS vs MI, colored by PI)
-- pi_heatmap.png     (mean PI over 2 selected feature dimensions)
+- pd_scatter.png     (DS vs MI, colored by PI; skipped with --no-plots)
+- pi_heatmap.png     (mean PI over 2 selected feature dimensions; skipped with --no-plots)
 - pd_summary.json    (stats + top PI bins)
 - pd_run_meta.json   (run metadata, schema-stable; inputs/params/artifacts/traceback fields)
-- pd_zones_v0.jsonl  (Dropzone v0 zones derived from top PI bins; one JSON object per line)
+- pd_zones_v0.jsonl  (Dropzone v0 zones derived from top PI bins; one JSON object per line;
+                      with --zone-scan, ranked over all feature pairs, see pulse_pd/zone_scan.py)
 - pd_peaks_v0.json   (Dropzone v0 peaks summary derived from top PI bins)
 
 Examples
@@ -30,6 +31,30 @@ Examples
     --theta pulse_pd/examples/theta_cuts_example.json \
     --dims 0 1 \
     --out pulse_pd/artifacts_run
+
+3) Out-of-core (X larger than RAM; .npy input is memory-mapped):
+  python pulse_pd/run_cut_pd.py \
+    --x data/X.npy \
+    --theta pulse_pd/examples/theta_cuts_example.json \
+    --dims 0 1 \
+    --chunk-size 262144 \
+    --out pulse_pd/artifacts_run
+
+   Per-event DS/MI/GF/PI are written incrementally to pd_results.npy
+   (structured: ds, mi, gf, pi_raw, pi); see pulse_pd/chunked.py.
+   Add --workers N to process the chunks on N processes (same results for
+   any N).
+
+4) Paradox-zone scan over every feature pair, without plots (no matplotlib):
+  python pulse_pd/run_cut_pd.py \
+    --x data/X.npz \
+    --theta pulse_pd/examples/theta_cuts_example.json \
+    --dims 0 1 \
+    --zone-scan --no-plots \
+    --out pulse_pd/artifacts_run
+
+   pd_zones_v0.jsonl then holds the top --topk bins over all pairs (or the
+   pairs of --scan-dims) and feeds export_zone_events directly.
 """
 
 from __future__ import annotations
@@ -43,14 +68,28 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-try:
-    import matplotlib.pyplot as plt
-except Exception as e:  # pragma: no cover
-    raise RuntimeError(
-        "matplotlib is required for this runner. Install it with: pip install matplotlib"
-    ) from e
-
+from pulse_pd.chunked import (
+    DEFAULT_CHUNK_ROWS,
+    chunked_percentile,
+    iter_chunks,
+    open_X_mmap,
+    run_pd_from_cuts_chunked,
+)
 from pulse_pd.cut_adapter import run_pd_from_cuts
+from pulse_pd.export_x_npz import read_csv_matrix
+from pulse_pd.zone_scan import (
+    heatmap_stats,
+    scan_zone_records,
+    scan_zones,
+    top_bins as _top_bins,
+    write_zones_jsonl,
+    zone_id as _zone_id,
+    zone_record,
+)
+
+# Chunked mode: at most this many points are drawn in the DS/MI scatter
+# (a deterministic strided subsample); all other outputs use every event.
+SCATTER_MAX_POINTS = 200_000
 
 
 def ensure_dir(path: str) -> None:
@@ -94,9 +133,14 @@ def _looks_like_header(line: str) -> bool:
 
 def load_X(path: str, x_key: Optional[str] = None) -> Tuple[np.ndarray, Optional[List[str]]]:
     """
-    Load X from .npz / .npy / .csv.
+    Load X from .npz / .npy / .csv, or a directory of .npy files as written by
+    export_x_npz (X.npy + feature_names.npy).
     Returns (X, feature_names or None).
     """
+    if os.path.isdir(path):
+        X, feature_names, _ = _open_npy_dir(path, x_key)
+        return np.asarray(X, dtype=float), feature_names
+
     ext = os.path.splitext(path)[1].lower()
 
     if ext == ".npz":
@@ -142,23 +186,46 @@ def load_X(path: str, x_key: Optional[str] = None) -> Tuple[np.ndarray, Optional
         with open(path, "r", encoding="utf-8") as f:
             first = f.readline()
 
-        has_header = _looks_like_header(first)
-        if has_header:
-            names = [t.strip() for t in first.strip().split(",")]
-            X = np.loadtxt(path, delimiter=",", skiprows=1)
-            feature_names = names
-        else:
-            X = np.loadtxt(path, delimiter=",")
-            feature_names = None
-
-        X = np.asarray(X, dtype=float)
-        if X.ndim == 1:
-            X = X.reshape(-1, 1)
-        if X.ndim != 2:
-            raise ValueError(f"X must be 2D; got {X.shape}")
+        # Streamed in blocks into a growable float buffer (export_x_npz).
+        X, feature_names = read_csv_matrix(path, header=_looks_like_header(first))
         return X, feature_names
 
-    raise ValueError(f"Unsupported X file extension '{ext}'. Use .npz / .npy / .csv")
+    raise ValueError(f"Unsupported X file extension '{ext}'. Use .npz / .npy / .csv / npy dir")
+
+
+def load_X_chunked(
+    path: str, x_key: Optional[str] = None
+) -> Tuple[np.ndarray, Optional[List[str]], Optional[str]]:
+    """
+    Load X for chunked mode: .npy (and X.npy of an export_x_npz directory)
+    is memory-mapped (nothing is read up front); other formats fall back to
+    load_X.
+    Returns (X, feature_names or None, mapped .npy path or None).
+    """
+    if os.path.isdir(path):
+        return _open_npy_dir(path, x_key)
+    if os.path.splitext(path)[1].lower() == ".npy":
+        return open_X_mmap(path), None, path
+    X, feature_names = load_X(path, x_key=x_key)
+    return X, feature_names, None
+
+
+def _open_npy_dir(
+    path: str, x_key: Optional[str] = None
+) -> Tuple[np.ndarray, Optional[List[str]], str]:
+    """
+    Memory-map <dir>/<x_key or X>.npy; feature_names.npy is read if present.
+    Returns (X, feature_names or None, path of the mapped .npy).
+    """
+    x_path = os.path.join(path, f"{x_key or 'X'}.npy")
+    if not os.path.isfile(x_path):
+        raise ValueError(f"No {os.path.basename(x_path)} in X directory: {path}")
+
+    names_path = os.path.join(path, "feature_names.npy")
+    feature_names = None
+    if os.path.isfile(names_path):
+        feature_names = [str(v) for v in np.load(names_path, allow_pickle=False).tolist()]
+    return open_X_mmap(x_path), feature_names, x_path
 
 
 def resolve_dim_index(
@@ -205,7 +272,20 @@ def save_json(path: str, obj: Any) -> None:
         json.dump(obj, f, indent=2, sort_keys=True)
 
 
+def _pyplot() -> Any:
+    # Only the plots need matplotlib (--no-plots runs without it).
+    try:
+        import matplotlib.pyplot as plt
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError(
+            "matplotlib is required for plots. Install it with: pip install matplotlib "
+            "(or pass --no-plots)"
+        ) from e
+    return plt
+
+
 def plot_pd_scatter(ds: np.ndarray, mi: np.ndarray, pi: np.ndarray, out_path: str) -> None:
+    plt = _pyplot()
     plt.figure()
     sc = plt.scatter(ds, mi, c=pi, s=10)
     plt.xlabel("DS (Decision Stability)")
@@ -224,27 +304,28 @@ def plot_pi_heatmap(
     jy: int,
     out_path: str,
     bins: int = 60,
+    chunk_rows: Optional[int] = None,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Returns (H_mean, xedges, yedges, H_cnt) for summary extraction.
-    """
-    x1 = X[:, jx]
-    x2 = X[:, jy]
 
-    x1_min, x1_max = np.percentile(x1, [1, 99])
-    x2_min, x2_max = np.percentile(x2, [1, 99])
-
-    H_sum, xedges, yedges = np.histogram2d(
-        x1, x2, bins=bins, range=[[x1_min, x1_max], [x2_min, x2_max]], weights=pi
-    )
-    H_cnt, _, _ = np.histogram2d(
-        x1, x2, bins=bins, range=[[x1_min, x1_max], [x2_min, x2_max]]
-    )
+    The statistics come from zone_scan.heatmap_stats (chunk by chunk with
+    chunk_rows; X and pi may be memmaps); this only adds the plot.
+    """
+    H_mean, xedges, yedges, H_cnt = heatmap_stats(X, pi, jx, jy, bins=bins, chunk_rows=chunk_rows)
+    draw_pi_heatmap(H_mean, xedges, yedges, jx, jy, out_path)
+    return H_mean, xedges, yedges, H_cnt
 
-    with np.errstate(invalid="ignore", divide="ignore"):
-        H_mean = H_sum / H_cnt
-    H_mean = np.nan_to_num(H_mean, nan=0.0, posinf=0.0, neginf=0.0)
 
+def draw_pi_heatmap(
+    H_mean: np.ndarray,
+    xedges: np.ndarray,
+    yedges: np.ndarray,
+    jx: int,
+    jy: int,
+    out_path: str,
+) -> None:
+    plt = _pyplot()
     plt.figure()
     plt.imshow(
         H_mean.T,
@@ -260,8 +341,6 @@ def plot_pi_heatmap(
     plt.savefig(out_path, dpi=180)
     plt.close()
 
-    return H_mean, xedges, yedges, H_cnt
-
 
 def top_pi_bins(
     H_mean: np.ndarray,
@@ -273,33 +352,27 @@ def top_pi_bins(
 ) -> List[Dict[str, Any]]:
     """
     Extract top-K bins by mean PI, with a minimum event count per bin.
-    Returns a list of dicts with bin ranges and stats.
+    Returns a list of dicts with bin ranges and stats (zone_scan.top_bins).
     """
-    bins_x = H_mean.shape[0]
-    bins_y = H_mean.shape[1]
-
-    candidates: List[Tuple[float, int, int]] = []
-    for ix in range(bins_x):
-        for iy in range(bins_y):
-            c = int(H_cnt[ix, iy])
-            if c < min_count:
-                continue
-            candidates.append((float(H_mean[ix, iy]), ix, iy))
-
-    candidates.sort(key=lambda t: t[0], reverse=True)
-    out: List[Dict[str, Any]] = []
-    for val, ix, iy in candidates[:topk]:
-        out.append(
-            {
-                "mean_pi": float(val),
-                "count": int(H_cnt[ix, iy]),
-                "x_bin": int(ix),
-                "y_bin": int(iy),
-                "x_range": [float(xedges[ix]), float(xedges[ix + 1])],
-                "y_range": [float(yedges[iy]), float(yedges[iy + 1])],
-            }
-        )
-    return out
+    return _top_bins(H_mean, H_cnt, xedges, yedges, topk=topk, min_count=min_count)
+
+
+def metric_stats(
+    values: np.ndarray,
+    qs: List[float],
+    chunk_rows: Optional[int] = None,
+) -> Tuple[float, List[float]]:
+    """Return (mean, [percentile(q) for q in qs]), chunked when chunk_rows is set."""
+    if not chunk_rows:
+        return float(np.mean(values)), [float(np.percentile(values, q)) for q in qs]
+
+    total = 0.0
+    for start, stop in iter_chunks(values.shape[0], chunk_rows):
+        total += float(np.sum(values[start:stop], dtype=float))
+    pcts = chunked_percentile(values, qs, chunk_rows=chunk_rows)
+    if pcts is None:
+        pcts = [float("nan")] * len(qs)
+    return total / float(values.shape[0]), [float(v) for v in pcts]
 
 
 def _pd_jsonable(x: Any) -> Any:
@@ -333,10 +406,6 @@ def _traceback_fields_present_npz(x_path: str, n: int) -> Dict[str, bool]:
     return fields
 
 
-def _zone_id(*, rank: int, jx: int, jy: int, x_bin: int, y_bin: int) -> str:
-    return f"zone_{int(rank):02d}_x{int(jx)}_y{int(jy)}_bin{int(x_bin)}_{int(y_bin)}"
-
-
 def write_pd_run_meta(
     *,
     out_dir: str,
@@ -384,6 +453,9 @@ def write_pd_run_meta(
             "topk": int(args.topk),
             "min_count": int(args.min_count),
             "seed": int(args.seed),
+            "chunk_size": int(args.chunk_size),
+            "workers": int(args.workers),
+            "zone_scan": bool(getattr(args, "zone_scan", False)),
         },
         "data": {
             "n": int(n),
@@ -424,39 +496,11 @@ def write_pd_zones_v0_jsonl(
     x_name = fnames[int(jx)]
     y_name = fnames[int(jy)]
 
-    out_path = Path(out_dir) / "pd_zones_v0.jsonl"
-    with out_path.open("w", encoding="utf-8") as f:
-        for rank, b in enumerate(top_bins, start=1):
-            zid = _zone_id(
-                rank=rank,
-                jx=jx,
-                jy=jy,
-                x_bin=int(b["x_bin"]),
-                y_bin=int(b["y_bin"]),
-            )
-            zone = {
-                "schema": "pulse_pd/pd_zone_v0",
-                "rank": int(rank),
-                "zone_id": zid,
-                "dims": {
-                    "x": int(jx),
-                    "y": int(jy),
-                    "x_name": x_name,
-                    "y_name": y_name,
-                },
-                "ranges": {
-                    "x": [float(b["x_range"][0]), float(b["x_range"][1])],
-                    "y": [float(b["y_range"][0]), float(b["y_range"][1])],
-                },
-                "stats": {
-                    "mean_pi": float(b["mean_pi"]),
-                    "count": int(b["count"]),
-                },
-                "source": "top_pi_bins",
-            }
-            f.write(json.dumps(zone, sort_keys=True) + "\n")
-
-    return str(out_path)
+    zones = [
+        zone_record(rank=rank, b=b, jx=jx, jy=jy, x_name=x_name, y_name=y_name, source="top_pi_bins")
+        for rank, b in enumerate(top_bins, start=1)
+    ]
+    return write_zones_jsonl(str(Path(out_dir) / "pd_zones_v0.jsonl"), zones)
 
 
 def write_pd_peaks_v0_json(
@@ -532,7 +576,7 @@ def write_pd_peaks_v0_json(
 
 def main() -> int:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--x", required=True, help="Path to X (.npz/.npy/.csv)")
+    ap.add_argument("--x", required=True, help="Path to X (.npz/.npy/.csv or an export_x_npz .npy directory)")
     ap.add_argument("--x-key", default=None, help="Key name for X inside .npz (optional)")
     ap.add_argument("--theta", required=True, help="Path to theta config (.json/.yaml)")
     ap.add_argument("--dims", nargs=2, required=True, help="Two dims for heatmap: indices or names")
@@ -542,7 +586,7 @@ def main() -> int:
     ap.add_argument("--mi-models", type=int, default=7, help="Number of theta-ensemble models for MI")
     ap.add_argument("--mi-sigma", type=float, default=None, help="Sigma override for theta jitter (optional)")
 
-    ap.add_argument("--gf-method", default="spsa", choices=["spsa", "finite_diff"], help="GF method")
+    ap.add_argument("--gf-method", default="spsa", choices=["spsa", "finite_diff", "analytic"], help="GF method (analytic: exact closed form for cuts)")
     ap.add_argument("--gf-K", type=int, default=8, help="GF SPSA directions (if spsa)")
     ap.add_argument("--gf-delta", type=float, default=0.05, help="GF delta step size")
 
@@ -551,21 +595,64 @@ def main() -> int:
     ap.add_argument("--min-count", type=int, default=10, help="Min events per bin to consider in top bins")
 
     ap.add_argument("--seed", type=int, default=0, help="RNG seed")
+
+    ap.add_argument(
+        "--zone-scan",
+        action="store_true",
+        help="Rank top PI bins over all feature pairs (or --scan-dims) for pd_zones_v0.jsonl",
+    )
+    ap.add_argument(
+        "--scan-dims",
+        nargs="+",
+        default=None,
+        help="Dims (indices or names) whose pairs --zone-scan covers (default: all)",
+    )
+    ap.add_argument("--no-plots", action="store_true", help="Skip the PNG plots (no matplotlib needed)")
+
+    ap.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0,
+        help="Process events in chunks of this size with bounded memory (0 = in-memory)",
+    )
+    ap.add_argument(
+        "--results",
+        default=None,
+        help="Per-event results .npy written in chunked mode (default: <out>/pd_results.npy)",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for chunked mode (implies --chunk-size %d if unset)" % DEFAULT_CHUNK_ROWS,
+    )
     args = ap.parse_args()
 
+    if args.chunk_size < 0:
+        ap.error("--chunk-size must be >= 0")
+    if args.workers < 1:
+        ap.error("--workers must be >= 1")
+    if args.workers > 1 and args.chunk_size == 0:
+        args.chunk_size = DEFAULT_CHUNK_ROWS
+
     ensure_dir(args.out)
 
-    X, feature_names = load_X(args.x, x_key=args.x_key)
+    chunk_rows = int(args.chunk_size) or None
+    x_npy: Optional[str] = None
+    if chunk_rows:
+        X, feature_names, x_npy = load_X_chunked(args.x, x_key=args.x_key)
+    else:
+        X, feature_names = load_X(args.x, x_key=args.x_key)
     theta = load_theta(args.theta)
 
     n, d = X.shape
     jx = resolve_dim_index(str(args.dims[0]), feature_names, theta, d)
     jy = resolve_dim_index(str(args.dims[1]), feature_names, theta, d)
+    scan_dims = None
+    if args.scan_dims:
+        scan_dims = [resolve_dim_index(str(v), feature_names, theta, d) for v in args.scan_dims]
 
-    # Run PD metrics from cut-based theta
-    res = run_pd_from_cuts(
-        X,
-        theta,
+    pd_params = dict(
         ds_M=args.ds_M,
         mi_models=args.mi_models,
         mi_sigma=args.mi_sigma,
@@ -576,6 +663,23 @@ def main() -> int:
         normalize_pi=True,
     )
 
+    # Run PD metrics from cut-based theta
+    results_path = None
+    if chunk_rows:
+        results_path = args.results or os.path.join(args.out, "pd_results.npy")
+        # Pass the mapped .npy path (not the memmap) so pool workers map the
+        # file themselves instead of copying X into shared memory.
+        res = run_pd_from_cuts_chunked(
+            x_npy or X,
+            theta,
+            out_path=results_path,
+            chunk_rows=chunk_rows,
+            workers=int(args.workers),
+            **pd_params,
+        )
+    else:
+        res = run_pd_from_cuts(X, theta, **pd_params)
+
     ds = res["ds"]
     mi = res["mi"]
     gf = res["gf"]
@@ -586,23 +690,47 @@ def main() -> int:
     heatmap_path = os.path.join(args.out, "pi_heatmap.png")
     summary_path = os.path.join(args.out, "pd_summary.json")
 
-    plot_pd_scatter(ds, mi, pi, scatter_path)
-    H_mean, xedges, yedges, H_cnt = plot_pi_heatmap(
-        X, pi, jx, jy, heatmap_path, bins=args.bins
-    )
+    H_mean, xedges, yedges, H_cnt = heatmap_stats(X, pi, jx, jy, bins=args.bins, chunk_rows=chunk_rows)
+
+    if not args.no_plots:
+        step = 1
+        if chunk_rows:
+            step = max(1, -(-n // SCATTER_MAX_POINTS))
+        plot_pd_scatter(
+            np.asarray(ds[::step]), np.asarray(mi[::step]), np.asarray(pi[::step]), scatter_path
+        )
+        draw_pi_heatmap(H_mean, xedges, yedges, jx, jy, heatmap_path)
 
     top_bins = top_pi_bins(
         H_mean, H_cnt, xedges, yedges, topk=args.topk, min_count=args.min_count
     )
 
-    zones_path = write_pd_zones_v0_jsonl(
-        out_dir=str(args.out),
-        top_bins=top_bins,
-        jx=jx,
-        jy=jy,
-        feature_names=feature_names,
-        d=d,
-    )
+    scan_bins = None
+    if args.zone_scan:
+        scan_bins = scan_zones(
+            X,
+            pi,
+            dims=scan_dims,
+            bins=args.bins,
+            topk=args.topk,
+            min_count=args.min_count,
+            chunk_rows=chunk_rows,
+        )
+        fnames = feature_names
+        if fnames is None or len(fnames) != d:
+            fnames = _default_feature_names(d)
+        zones_path = write_zones_jsonl(
+            os.path.join(args.out, "pd_zones_v0.jsonl"), scan_zone_records(scan_bins, fnames)
+        )
+    else:
+        zones_path = write_pd_zones_v0_jsonl(
+            out_dir=str(args.out),
+            top_bins=top_bins,
+            jx=jx,
+            jy=jy,
+            feature_names=feature_names,
+            d=d,
+        )
 
     peaks_path = write_pd_peaks_v0_json(
         out_dir=str(args.out),
@@ -616,6 +744,11 @@ def main() -> int:
         min_count=args.min_count,
     )
 
+    ds_mean, ds_q = metric_stats(ds, [5, 50, 95], chunk_rows)
+    mi_mean, mi_q = metric_stats(mi, [5, 50, 95], chunk_rows)
+    gf_mean, gf_q = metric_stats(gf, [5, 50, 95], chunk_rows)
+    pi_mean, pi_q = metric_stats(pi, [90, 99], chunk_rows)
+
     summary = {
         "input": {
             "x_path": os.path.abspath(args.x),
@@ -634,31 +767,14 @@ def main() -> int:
             "gf_delta": float(args.gf_delta),
             "seed": int(args.seed),
             "bins": int(args.bins),
+            "chunk_size": int(args.chunk_size),
+            "workers": int(args.workers),
         },
         "stats": {
-            "ds": {
-                "mean": float(np.mean(ds)),
-                "p05": float(np.percentile(ds, 5)),
-                "p50": float(np.percentile(ds, 50)),
-                "p95": float(np.percentile(ds, 95)),
-            },
-            "mi": {
-                "mean": float(np.mean(mi)),
-                "p05": float(np.percentile(mi, 5)),
-                "p50": float(np.percentile(mi, 50)),
-                "p95": float(np.percentile(mi, 95)),
-            },
-            "gf": {
-                "mean": float(np.mean(gf)),
-                "p05": float(np.percentile(gf, 5)),
-                "p50": float(np.percentile(gf, 50)),
-                "p95": float(np.percentile(gf, 95)),
-            },
-            "pi": {
-                "mean": float(np.mean(pi)),
-                "p90": float(np.percentile(pi, 90)),
-                "p99": float(np.percentile(pi, 99)),
-            },
+            "ds": {"mean": ds_mean, "p05": ds_q[0], "p50": ds_q[1], "p95": ds_q[2]},
+            "mi": {"mean": mi_mean, "p05": mi_q[0], "p50": mi_q[1], "p95": mi_q[2]},
+            "gf": {"mean": gf_mean, "p05": gf_q[0], "p50": gf_q[1], "p95": gf_q[2]},
+            "pi": {"mean": pi_mean, "p90": pi_q[0], "p99": pi_q[1]},
         },
         "top_pi_bins": top_bins,
         "artifacts": {
@@ -671,6 +787,16 @@ def main() -> int:
         },
     }
 
+    if results_path is not None:
+        summary["artifacts"]["pd_results"] = os.path.basename(results_path)
+    if args.no_plots:
+        del summary["artifacts"]["pd_scatter"], summary["artifacts"]["pi_heatmap"]
+    if scan_bins is not None:
+        summary["zone_scan"] = {
+            "dims": scan_dims if scan_dims is not None else list(range(d)),
+            "zones": len(scan_bins),
+        }
+
     save_json(summary_path, summary)
 
     artifacts_meta = {
@@ -681,6 +807,10 @@ def main() -> int:
         "pd_zones_jsonl": "pd_zones_v0.jsonl",
         "pd_peaks_json": "pd_peaks_v0.json",
     }
+    if results_path is not None:
+        artifacts_meta["pd_results_npy"] = os.path.basename(results_path)
+    if args.no_plots:
+        del artifacts_meta["pd_scatter_png"], artifacts_meta["pi_heatmap_png"]
     meta_path = write_pd_run_meta(
         out_dir=str(args.out),
         args=args,
@@ -692,12 +822,15 @@ def main() -> int:
     )
 
     print("PULSE–PD run complete. Artifacts written to:", os.path.abspath(args.out))
-    print(" -", scatter_path)
-    print(" -", heatmap_path)
+    if not args.no_plots:
+        print(" -", scatter_path)
+        print(" -", heatmap_path)
     print(" -", summary_path)
     print(" -", zones_path)
     print(" -", peaks_path)
     print(" -", meta_path)
+    if results_path is not None:
+        print(" -", results_path)
     if top_bins:
         print("Top PI bin (mean_pi, count, x_range, y_range):")
         b0 = top_bins[0]
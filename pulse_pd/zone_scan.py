@@ -0,0 +1,293 @@
+"""
+Binned PI statistics and paradox-zone scan for PULSE–PD (v0).
+
+The mean-PI heatmap of run_cut_pd used two np.histogram2d calls (weighted
+sum and counts) for one fixed feature pair, and found hotspots with a nested
+loop over all bins plus a full sort. This module computes the same numbers
+without plotting, and for many pairs at once:
+
+- each scanned column is binned once (bin_edges / bin_codes) with the
+  heatmap's rules: uniform edges over the 1st..99th percentile, the last bin
+  closed on the right, values outside the range (and NaN) dropped;
+- per pair, sum and count come from np.bincount over the combined bin index
+  ix * bins + iy (one pass each, no histogram2d);
+- top-k bins are selected with np.argpartition; ties keep the order of the
+  old stable sort (pair order, then x bin, then y bin).
+
+Results are identical to the histogram2d path (heatmap_stats) and to the
+previous top_pi_bins. scan_zones ranks bins over all (or selected) feature
+pairs; write_zones_jsonl writes them as pd_zones_v0.jsonl for
+export_zone_events. Plotting stays in run_cut_pd.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pulse_pd.chunked import chunked_percentile, iter_chunks
+
+ZONE_SCHEMA = "pulse_pd/pd_zone_v0"
+
+
+def bin_edges(x: np.ndarray, bins: int, *, chunk_rows: Optional[int] = None) -> np.ndarray:
+    """
+    Uniform edges over the 1st..99th percentile of x (np.histogram2d range rules).
+
+    With chunk_rows, the percentiles come from chunked_percentile (x may be a
+    memmap column).
+    """
+    if chunk_rows:
+        lo, hi = chunked_percentile(x, [1, 99], chunk_rows=chunk_rows) or [0.0, 1.0]
+    else:
+        lo, hi = np.percentile(x, [1, 99])
+
+    lo, hi = float(lo), float(hi)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return np.linspace(lo, hi, int(bins) + 1)
+
+
+def bin_codes(x: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Bin index of every value of x (int32), -1 outside [edges[0], edges[-1]].
+
+    Same assignment as np.histogramdd: right-open bins except the last one.
+    """
+    x = np.asarray(x, dtype=float)
+    bins = edges.shape[0] - 1
+    codes = np.searchsorted(edges, x, side="right").astype(np.int32) - 1
+    codes[x == edges[-1]] = bins - 1
+    codes[(codes < 0) | (codes >= bins)] = -1
+    return codes
+
+
+def pair_stats(
+    cx: np.ndarray, cy: np.ndarray, weights: np.ndarray, bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(weighted sum, count) per (x bin, y bin) from bin codes, shape (bins, bins)."""
+    ok = (cx >= 0) & (cy >= 0)
+    flat = cx[ok].astype(np.intp) * int(bins) + cy[ok]
+    size = int(bins) * int(bins)
+    h_sum = np.bincount(flat, weights=np.asarray(weights, dtype=float)[ok], minlength=size)
+    h_cnt = np.bincount(flat, minlength=size).astype(float)
+    return h_sum.reshape(bins, bins), h_cnt.reshape(bins, bins)
+
+
+def _mean(h_sum: np.ndarray, h_cnt: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        h_mean = h_sum / h_cnt
+    return np.nan_to_num(h_mean, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def heatmap_stats(
+    X: np.ndarray,
+    pi: np.ndarray,
+    jx: int,
+    jy: int,
+    *,
+    bins: int = 60,
+    chunk_rows: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mean-PI heatmap of one feature pair: (H_mean, xedges, yedges, H_cnt).
+
+    With chunk_rows, X and pi are read chunk by chunk (they may be memmaps).
+    """
+    means, cnts, edges = _scan_sums(X, pi, [int(jx), int(jy)], [(0, 1)], bins=bins, chunk_rows=chunk_rows)
+    return means[0], edges[0], edges[1], cnts[0]
+
+
+def _scan_sums(
+    X: np.ndarray,
+    pi: np.ndarray,
+    dims: Sequence[int],
+    pairs: Sequence[Tuple[int, int]],
+    *,
+    bins: int,
+    chunk_rows: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray]]:
+    """Mean and count arrays (n_pairs, bins, bins) for pairs of positions into dims."""
+    edges = [bin_edges(X[:, j], bins, chunk_rows=chunk_rows) for j in dims]
+
+    sums = np.zeros((len(pairs), bins, bins), dtype=float)
+    cnts = np.zeros((len(pairs), bins, bins), dtype=float)
+    ranges = iter_chunks(X.shape[0], chunk_rows) if chunk_rows else [(0, X.shape[0])]
+
+    for start, stop in ranges:
+        # One binning per column per chunk, shared by every pair using it.
+        codes = [bin_codes(X[start:stop, j], e) for j, e in zip(dims, edges)]
+        w = np.asarray(pi[start:stop], dtype=float)
+        for p, (a, b) in enumerate(pairs):
+            h_sum, h_cnt = pair_stats(codes[a], codes[b], w, bins)
+            sums[p] += h_sum
+            cnts[p] += h_cnt
+
+    return _mean(sums, cnts), cnts, edges
+
+
+def _top_flat(values: np.ndarray, valid: np.ndarray, k: int) -> np.ndarray:
+    """
+    Flat indices of the k largest valid values, sorted by (value desc, index).
+
+    Equivalent to a stable descending sort of the valid entries cut at k.
+    """
+    cand = np.flatnonzero(valid.ravel())
+    if cand.size == 0 or k <= 0:
+        return cand[:0]
+
+    vals = values.ravel()[cand]
+    if k < cand.size:
+        kth = vals[np.argpartition(-vals, k - 1)[k - 1]]
+        above = vals > kth
+        ties = np.flatnonzero(vals == kth)[: k - int(above.sum())]
+        keep = np.flatnonzero(above)
+        sel = np.concatenate([keep, ties])
+        cand, vals = cand[sel], vals[sel]
+
+    return cand[np.lexsort((cand, -vals))]
+
+
+def _bin_record(
+    h_mean: np.ndarray, h_cnt: np.ndarray, xedges: np.ndarray, yedges: np.ndarray, ix: int, iy: int
+) -> Dict[str, Any]:
+    return {
+        "mean_pi": float(h_mean[ix, iy]),
+        "count": int(h_cnt[ix, iy]),
+        "x_bin": int(ix),
+        "y_bin": int(iy),
+        "x_range": [float(xedges[ix]), float(xedges[ix + 1])],
+        "y_range": [float(yedges[iy]), float(yedges[iy + 1])],
+    }
+
+
+def top_bins(
+    H_mean: np.ndarray,
+    H_cnt: np.ndarray,
+    xedges: np.ndarray,
+    yedges: np.ndarray,
+    topk: int = 10,
+    min_count: int = 10,
+) -> List[Dict[str, Any]]:
+    """
+    Top-K bins by mean PI with at least min_count events (argpartition).
+    Returns a list of dicts with bin ranges and stats.
+    """
+    order = _top_flat(H_mean, H_cnt >= min_count, int(topk))
+    ixs, iys = np.unravel_index(order, H_mean.shape)
+    return [_bin_record(H_mean, H_cnt, xedges, yedges, ix, iy) for ix, iy in zip(ixs, iys)]
+
+
+def scan_zones(
+    X: np.ndarray,
+    pi: np.ndarray,
+    *,
+    dims: Optional[Sequence[int]] = None,
+    pairs: Optional[Sequence[Tuple[int, int]]] = None,
+    bins: int = 60,
+    topk: int = 10,
+    min_count: int = 10,
+    chunk_rows: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Rank mean-PI bins over many feature pairs.
+
+    pairs are (jx, jy) column pairs; by default every pair jx < jy of dims
+    (default: all columns). Each column is binned once per chunk and shared
+    by all its pairs. Returns the global top-K bins (same dicts as top_bins
+    plus x_dim / y_dim), best first.
+
+    Accumulators hold 2 * n_pairs * bins^2 floats.
+    """
+    if pairs is None:
+        cols = list(range(X.shape[1])) if dims is None else [int(j) for j in dims]
+        pairs = list(itertools.combinations(cols, 2))
+    pairs = [(int(a), int(b)) for a, b in pairs]
+    for a, b in pairs:
+        if not (0 <= a < X.shape[1] and 0 <= b < X.shape[1]) or a == b:
+            raise ValueError(f"Invalid feature pair ({a}, {b}) for d={X.shape[1]}")
+    if not pairs:
+        return []
+
+    used = sorted({j for p in pairs for j in p})
+    pos = {j: i for i, j in enumerate(used)}
+    means, cnts, edges = _scan_sums(
+        X, pi, used, [(pos[a], pos[b]) for a, b in pairs], bins=bins, chunk_rows=chunk_rows
+    )
+
+    out: List[Dict[str, Any]] = []
+    for flat in _top_flat(means, cnts >= min_count, int(topk)):
+        p, ix, iy = np.unravel_index(flat, means.shape)
+        jx, jy = pairs[p]
+        rec = _bin_record(means[p], cnts[p], edges[pos[jx]], edges[pos[jy]], ix, iy)
+        rec.update({"x_dim": jx, "y_dim": jy})
+        out.append(rec)
+    return out
+
+
+def zone_id(*, rank: int, jx: int, jy: int, x_bin: int, y_bin: int) -> str:
+    return f"zone_{int(rank):02d}_x{int(jx)}_y{int(jy)}_bin{int(x_bin)}_{int(y_bin)}"
+
+
+def zone_record(
+    *,
+    rank: int,
+    b: Dict[str, Any],
+    jx: int,
+    jy: int,
+    x_name: str,
+    y_name: str,
+    source: str,
+) -> Dict[str, Any]:
+    """One pd_zone_v0 object (the schema read by export_zone_events)."""
+    return {
+        "schema": ZONE_SCHEMA,
+        "rank": int(rank),
+        "zone_id": zone_id(rank=rank, jx=jx, jy=jy, x_bin=int(b["x_bin"]), y_bin=int(b["y_bin"])),
+        "dims": {
+            "x": int(jx),
+            "y": int(jy),
+            "x_name": x_name,
+            "y_name": y_name,
+        },
+        "ranges": {
+            "x": [float(b["x_range"][0]), float(b["x_range"][1])],
+            "y": [float(b["y_range"][0]), float(b["y_range"][1])],
+        },
+        "stats": {
+            "mean_pi": float(b["mean_pi"]),
+            "count": int(b["count"]),
+        },
+        "source": source,
+    }
+
+
+def write_zones_jsonl(path: str, zones: Sequence[Dict[str, Any]]) -> str:
+    """Write zone objects as JSONL (one object per line, sort_keys=True)."""
+    out_path = Path(path)
+    with out_path.open("w", encoding="utf-8") as f:
+        for zone in zones:
+            f.write(json.dumps(zone, sort_keys=True) + "\n")
+    return str(out_path)
+
+
+def scan_zone_records(
+    bins_ranked: Sequence[Dict[str, Any]], feature_names: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """pd_zone_v0 objects for scan_zones output (source "zone_scan")."""
+    return [
+        zone_record(
+            rank=rank,
+            b=b,
+            jx=int(b["x_dim"]),
+            jy=int(b["y_dim"]),
+            x_name=str(feature_names[int(b["x_dim"])]),
+            y_name=str(feature_names[int(b["y_dim"])]),
+            source="zone_scan",
+        )
+        for rank, b in enumerate(bins_ranked, start=1)
+    ]
@@ -12,7 +12,9 @@ Each line in the history file is a single JSON object with the shape:
         "status": { ... original status.json content ... }
     }
 
-The script is intentionally small and dependency-free so it can be called
+The script is intentionally small and dependency-free (stdlib plus the
+shared PULSE_safe_pack_v0/tools/jsonl_append_v0.py appender, which locks
+the file so concurrent CI shards can append safely) so it can be called
 from CI at the end of a PULSE run, for example:
 
     python scripts/append_status_history.py \
@@ -30,8 +32,15 @@ import datetime as _dt
 import json
 import os
 import sys
+from pathlib import Path
 from typing import Any, Dict
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.jsonl_append_v0 import append_jsonl_records  # noqa: E402
+
 
 def _default_status_path() -> str:
     """
@@ -88,6 +97,12 @@ def _parse_args(argv: Any = None) -> argparse.Namespace:
         ),
     )
 
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="fsync the history file after appending (durable CI history).",
+    )
+
     return parser.parse_args(argv)
 
 
@@ -153,9 +168,13 @@ def main(argv: Any = None) -> int:
 
     try:
         _ensure_parent_dir(args.output)
-        with open(args.output, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False, sort_keys=True))
-            f.write("\n")
+        append_jsonl_records(
+            args.output,
+            [record],
+            ensure_ascii=False,
+            sort_keys=True,
+            fsync=args.fsync,
+        )
     except Exception as exc:  # noqa: BLE001
         print(f"[append_status_history] ERROR writing to {args.output}: {exc}", file=sys.stderr)
         return 1
@@ -0,0 +1,131 @@
+import pathlib
+import random
+import sys
+
+import pytest
+
+# Ensure repo root is on sys.path (pytest prepends tests/ by default)
+HERE = pathlib.Path(__file__).resolve()
+REPO_ROOT = HERE.parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+np = pytest.importorskip("numpy")
+
+from PULSE_safe_pack_v0.epf.epf_hazard_batch import (  # noqa: E402
+    compile_feature_plan,
+    evaluate_hazard_batch,
+)
+from PULSE_safe_pack_v0.epf.epf_hazard_features import (  # noqa: E402
+    FeatureSpec,
+    MissingPolicy,
+    RobustScaler,
+    Transform,
+)
+from PULSE_safe_pack_v0.epf.epf_hazard_forecast import (  # noqa: E402
+    HazardConfig,
+    forecast_hazard,
+    forecast_hazard_batch,
+)
+
+SPECS = [
+    FeatureSpec(key="metrics.rdsi", weight=2.0),
+    FeatureSpec(key="metrics.latency", transform=Transform.LOG1P, clip=(0.0, 5.0)),
+    FeatureSpec(key="gates.pass", missing=MissingPolicy.DEFAULT, default=1.0),
+    FeatureSpec(key="flat", weight=0.5, missing=MissingPolicy.DEFAULT, default=-3.0, transform=Transform.LOG1P),
+    FeatureSpec(key="metrics.ties_a"),
+    FeatureSpec(key="metrics.ties_b"),
+]
+SCALERS = {
+    "metrics.rdsi": RobustScaler(median=0.8, mad=0.05),
+    "metrics.latency": RobustScaler(median=1.0, mad=0.0),
+}
+
+
+def _snapshot(rng):
+    tie = rng.choice([0.0, 1.0])
+    snap = {"metrics": {"ties_a": tie, "ties_b": tie}, "gates": {}}
+    if rng.random() < 0.9:
+        snap["metrics"]["rdsi"] = rng.choice([rng.random(), "0.75", None, float("nan")])
+    if rng.random() < 0.8:
+        snap["metrics"]["latency"] = rng.choice([rng.uniform(-2.0, 400.0), True])
+    if rng.random() < 0.5:
+        snap["gates"]["pass"] = rng.random() < 0.5
+    if rng.random() < 0.3:
+        snap["flat"] = rng.uniform(-2.0, 3.0)
+    if rng.random() < 0.1:
+        snap["metrics"] = "not a mapping"
+    return snap
+
+
+def _assert_states_equal(batch, single):
+    assert len(batch) == len(single)
+    for b, s in zip(batch, single):
+        for name in ("T", "S", "D", "E"):
+            assert getattr(b, name) == pytest.approx(getattr(s, name), rel=1e-12, abs=1e-12)
+        assert (b.zone, b.reason, b.T_scaled) == (s.zone, s.reason, s.T_scaled)
+        assert len(b.contributors_top) == len(s.contributors_top)
+        for cb, cs in zip(b.contributors_top, s.contributors_top):
+            assert cb["key"] == cs["key"]
+            assert cb["scaled"] == cs["scaled"]
+            assert cb["contrib"] == pytest.approx(cs["contrib"], rel=1e-12, abs=1e-12)
+            assert cb["delta_z"] == pytest.approx(cs["delta_z"], rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("top_k", [1, 3, 10])
+def test_feature_mode_batch_matches_per_gate_forecast(top_k):
+    rng = random.Random(11)
+    cfg = HazardConfig(
+        feature_specs=SPECS,
+        feature_scalers=SCALERS,
+        top_k_contributors=top_k,
+        warn_threshold=0.4,
+        crit_threshold=0.9,
+    )
+    currents = [_snapshot(rng) for _ in range(200)]
+    references = [_snapshot(rng) for _ in range(200)]
+    stability = [{"RDSI": rng.uniform(-0.5, 1.5)} if rng.random() < 0.7 else {} for _ in range(200)]
+    histories = [[rng.random() for _ in range(rng.randint(0, 6))] for _ in range(200)]
+
+    batch = forecast_hazard_batch(currents, references, stability, histories, cfg)
+    single = [
+        forecast_hazard(c, r, s, h, cfg) for c, r, s, h in zip(currents, references, stability, histories)
+    ]
+
+    _assert_states_equal(batch, single)
+    assert {s.zone for s in batch} == {"GREEN", "AMBER", "RED"}
+    assert any(s.reason.endswith("top: none") for s in batch)
+
+
+def test_shared_reference_and_reused_plan_over_historical_snapshots():
+    rng = random.Random(5)
+    cfg = HazardConfig(feature_specs=SPECS, feature_scalers=SCALERS)
+    plan = compile_feature_plan(SPECS, SCALERS)
+    reference = _snapshot(rng)
+    history = [_snapshot(rng) for _ in range(50)]
+
+    result = evaluate_hazard_batch(history, reference, {"RDSI": 0.9}, None, cfg, plan=plan)
+
+    assert result.T.shape == result.E.shape == (50,)
+    _assert_states_equal(
+        result.states(),
+        [forecast_hazard(c, reference, {"RDSI": 0.9}, [], cfg) for c in history],
+    )
+
+
+def test_legacy_mode_batch_matches_per_gate_forecast():
+    rng = random.Random(2)
+    cfg = HazardConfig(min_history=4)
+    currents = [{"a": rng.random(), "b": rng.random(), "c": "x"} for _ in range(30)]
+    reference = {"a": 0.5, "b": float("inf")}
+    histories = [[rng.random() for _ in range(rng.randint(0, 8))] for _ in range(30)]
+
+    batch = forecast_hazard_batch(currents, reference, None, histories, cfg)
+
+    _assert_states_equal(batch, [forecast_hazard(c, reference, {}, h, cfg) for c, h in zip(currents, histories)])
+    assert all(s.contributors_top == [] for s in batch)
+
+
+def test_row_count_mismatch_is_rejected():
+    with pytest.raises(ValueError):
+        forecast_hazard_batch([{}, {}], [{}], None, None, HazardConfig())
@@ -0,0 +1,195 @@
+import bisect
+import json
+import pathlib
+import random
+import statistics
+import sys
+
+import pytest
+
+# Ensure repo root is on sys.path (pytest prepends tests/ by default)
+HERE = pathlib.Path(__file__).resolve()
+REPO_ROOT = HERE.parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_features import RobustScaler  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_field_spec import FieldSpecArtifactV0  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_quantile_sketch import QuantileSketch  # noqa: E402
+from PULSE_safe_pack_v0.tools import epf_hazard_calibrate as calib  # noqa: E402
+
+
+def _write_log(path, n, seed=0):
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            snap = {"metrics": {"a": rng.gauss(0.0, 1.0), "b": float(i % 3)}}
+            if i % 4:
+                snap["gates.g1"] = i % 2 == 0
+            ev = {
+                "gate_id": "A" if i % 3 else "B",
+                "hazard": {"E": rng.random()},
+                "snapshot_current": snap,
+            }
+            f.write(json.dumps(ev, sort_keys=True) + "\n")
+
+
+def _calibrate(tmp_path, name, argv):
+    out = tmp_path / f"{name}.json"
+    assert calib.main(argv + ["--out-json", str(out)]) == 0
+    return json.loads(out.read_text(encoding="utf-8"))
+
+
+def _rank_gap(sorted_values, q, p):
+    """Distance between p and the rank interval occupied by q in the exact data."""
+    n = len(sorted_values)
+    lo = bisect.bisect_left(sorted_values, q) / n
+    hi = bisect.bisect_right(sorted_values, q) / n
+    return max(0.0, lo - p, p - hi)
+
+
+def test_exact_sketch_median_and_mad_match_statistics_median():
+    # a + (b - a) * 0.5 != (a + b) / 2 for this pair; statistics.median
+    # (and so RobustScaler.fit) uses the latter.
+    a, b = 0.3469582034361986, 2.5655718421616815
+    assert a + (b - a) * 0.5 != (a + b) / 2
+
+    for values in ([b, a], [a, b, 5.0, -1.0], [a, b, 0.1]):
+        sk = QuantileSketch(k=64).update(values)
+        med = statistics.median(values)
+        assert sk.median() == med
+        assert sk.mad() == statistics.median([abs(v - med) for v in values])
+        assert calib.fit_scaler_from_sketch(sk) == RobustScaler.fit(values)
+
+
+def test_sketch_is_exact_below_k_and_within_bound_above():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(0.0, 1.0) for _ in range(20000)]
+
+    small = QuantileSketch(k=512).update(values[:300])
+    assert small.rank_error_bound() == 0.0
+    for p in (0.25, 0.5, 0.85, 0.97):
+        assert small.quantile(p) == calib.percentile(values[:300], p)
+    assert calib.fit_scaler_from_sketch(small) == RobustScaler.fit(values[:300])
+
+    whole = QuantileSketch(k=128).update(values)
+    left = QuantileSketch(k=128).update(values[:7000])
+    right = QuantileSketch(k=128).update(values[7000:])
+    merged = left.merge(right)
+    exact = sorted(values)
+
+    for sk in (whole, merged):
+        assert 0.0 < sk.rank_error_bound() < 0.1
+        assert sk.retained() < 2000
+        assert (sk.n, sk.min, sk.max) == (len(values), exact[0], exact[-1])
+        for p in (0.05, 0.25, 0.5, 0.85, 0.97, 0.99):
+            assert _rank_gap(exact, sk.quantile(p), p) <= sk.rank_error_bound()
+
+    restored = QuantileSketch.from_dict(json.loads(json.dumps(merged.to_dict())))
+    assert restored.quantile(0.85) == merged.quantile(0.85)
+    assert restored.rank_error_bound() == merged.rank_error_bound()
+
+    with pytest.raises(ValueError):
+        whole.merge(QuantileSketch(k=64))
+
+
+def test_streaming_mode_matches_exact_mode_below_sketch_capacity(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _write_log(log_path, 90)
+    argv = ["--log", str(log_path), "--min-samples", "20", "--recommend-min-coverage", "0.5"]
+
+    exact = _calibrate(tmp_path, "exact", argv)
+    streaming = _calibrate(tmp_path, "streaming", argv + ["--streaming"])
+
+    assert streaming.pop("streaming")["max_rank_error"] == 0.0
+    for gate in streaming["per_gate"].values():
+        assert gate.pop("rank_error") == 0.0
+    assert streaming["global"]["stats"].pop("mean") == pytest.approx(exact["global"]["stats"].pop("mean"))
+    assert streaming == exact
+    assert streaming["recommended_features"] == ["gates.g1", "metrics.a", "metrics.b"]
+
+
+def test_streaming_mode_reports_error_bound_against_exact_mode(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _write_log(log_path, 3000, seed=5)
+    argv = ["--log", str(log_path), "--warn-p", "0.85", "--crit-p", "0.97"]
+
+    exact = _calibrate(tmp_path, "exact", argv)
+    streaming = _calibrate(tmp_path, "streaming", argv + ["--streaming", "--sketch-k", "64"])
+
+    report = streaming["streaming"]
+    assert report["k"] == 64
+    assert 0.0 < report["global_rank_error"] <= report["max_rank_error"]
+
+    all_E = sorted(
+        json.loads(line)["hazard"]["E"] for line in log_path.read_text(encoding="utf-8").splitlines()
+    )
+    for key, p in (("warn_threshold", 0.85), ("crit_threshold", 0.97)):
+        assert _rank_gap(all_E, streaming["global"][key], p) <= report["global_rank_error"]
+        assert streaming["global"][key] == pytest.approx(exact["global"][key], abs=0.05)
+
+    assert sorted(streaming["feature_scalers"]["features"]) == sorted(exact["feature_scalers"]["features"])
+
+
+def test_saved_sketches_merge_across_logs(tmp_path):
+    first = tmp_path / "first.jsonl"
+    second = tmp_path / "second.jsonl"
+    combined = tmp_path / "combined.jsonl"
+    _write_log(first, 40, seed=1)
+    _write_log(second, 50, seed=2)
+    combined.write_text(first.read_text() + second.read_text())
+
+    sketch_path = tmp_path / "first.sketches.json"
+    _calibrate(tmp_path, "first", ["--log", str(first), "--streaming", "--sketch-out", str(sketch_path)])
+
+    merged = _calibrate(
+        tmp_path,
+        "merged",
+        ["--log", str(second), "--streaming", "--merge-sketches", str(sketch_path)],
+    )
+    together = _calibrate(tmp_path, "together", ["--log", str(combined), "--streaming"])
+
+    assert merged.pop("streaming")["merged_sketches"] == 1
+    together.pop("streaming")
+    merged.pop("log_path")
+    together.pop("log_path")
+    assert merged["global"]["stats"]["count"] == 90
+    assert merged["global"]["stats"].pop("mean") == pytest.approx(together["global"]["stats"].pop("mean"))
+    assert merged == together
+
+
+def test_sketches_from_another_snapshot_policy_are_not_merged(tmp_path, capsys):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _write_log(log_path, 30)
+    spec_a = tmp_path / "a.json"
+    spec_b = tmp_path / "b.json"
+    FieldSpecArtifactV0(features=["metrics.a"]).save_json(spec_a)
+    FieldSpecArtifactV0(features=["metrics.a"], deny_keys=["metrics.b"]).save_json(spec_b)
+
+    sketch_path = tmp_path / "a.sketches.json"
+    _calibrate(
+        tmp_path,
+        "with_spec_a",
+        ["--log", str(log_path), "--streaming", "--field-spec", str(spec_a), "--sketch-out", str(sketch_path)],
+    )
+    assert json.loads(sketch_path.read_text())["snapshot_policy"] == {
+        "allowed_prefixes": ["metrics.a"],
+        "deny_keys": None,
+    }
+
+    base = ["--log", str(log_path), "--streaming", "--merge-sketches", str(sketch_path)]
+    for extra in ([], ["--field-spec", str(spec_b)]):
+        out = tmp_path / "refused.json"
+        assert calib.main(base + extra + ["--out-json", str(out)]) == 1
+        assert "different snapshot policy" in capsys.readouterr().err
+        assert not out.exists()
+
+    merged = _calibrate(tmp_path, "merged", base + ["--field-spec", str(spec_a)])
+    assert merged["streaming"]["merged_sketches"] == 1
+
+
+def test_sketch_flags_require_streaming(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _write_log(log_path, 5)
+
+    assert calib.main(["--log", str(log_path), "--sketch-out", str(tmp_path / "s.json")]) == 1
@@ -0,0 +1,313 @@
+import json
+import pathlib
+import sys
+
+# Ensure repo root is on sys.path (pytest prepends tests/ by default)
+HERE = pathlib.Path(__file__).resolve()
+REPO_ROOT = HERE.parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (  # noqa: E402
+    HazardLogStore,
+    index_path_for,
+    iter_entries,
+    iter_entries_reverse,
+    update_index,
+)
+
+
+def _event(gate_id, i):
+    return {"gate_id": gate_id, "timestamp": f"t{i}", "hazard": {"E": i / 100.0, "T": float(i)}}
+
+
+def _append(path, events, extra_lines=()):
+    with path.open("a", encoding="utf-8") as f:
+        for ev in events:
+            f.write(json.dumps(ev, sort_keys=True) + "\n")
+        for line in extra_lines:
+            f.write(line + "\n")
+
+
+def _full_scan(path, gate_id):
+    out = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(obj, dict) and str(obj.get("gate_id", "")) == gate_id:
+            out.append(obj)
+    return out
+
+
+def test_tail_matches_full_scan_without_writing_an_index(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    events = [_event("A" if i % 3 else "B", i) for i in range(50)]
+    _append(log_path, events, extra_lines=["", "not json", "[1, 2]"])
+
+    store = HazardLogStore(log_path)
+
+    assert store.stats["rebuilt"] is True
+    assert not index_path_for(log_path).exists()
+    assert store.gate_ids() == ["A", "B"]
+    assert store.count("A") == len(_full_scan(log_path, "A"))
+    assert store.tail("A", 7) == _full_scan(log_path, "A")[-7:]
+    assert store.tail("B", 1000) == _full_scan(log_path, "B")
+    assert store.last("B") == _full_scan(log_path, "B")[-1]
+    assert store.tail("missing", 5) == []
+
+
+def test_reopen_only_scans_appended_bytes(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_event("A", i) for i in range(20)])
+    assert update_index(log_path)["rebuilt"] is True
+    assert index_path_for(log_path).exists()
+
+    size_before = log_path.stat().st_size
+    _append(log_path, [_event("A", 100), _event("C", 101)])
+
+    store = HazardLogStore(log_path)
+
+    assert store.stats["rebuilt"] is False
+    assert store.stats["indexed_entries"] == 2
+    assert store.stats["indexed_bytes"] == log_path.stat().st_size - size_before
+    assert store.tail("A", 2) == [_event("A", 19), _event("A", 100)]
+    assert store.last("C") == _event("C", 101)
+
+
+def test_partial_last_line_is_indexed_once_complete(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_event("A", 1)])
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write('{"gate_id": "A", "hazard"')
+
+    assert HazardLogStore(log_path).tail("A", 5) == [_event("A", 1)]
+
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write(': {"T": 2.0}}\n')
+
+    assert HazardLogStore(log_path).tail("A", 5) == [
+        _event("A", 1),
+        {"gate_id": "A", "hazard": {"T": 2.0}},
+    ]
+
+
+def test_rewritten_log_triggers_rebuild(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_event("A", i) for i in range(10)])
+    update_index(log_path)
+
+    # Truncate and rewrite with different content of a similar size.
+    log_path.write_text("", encoding="utf-8")
+    _append(log_path, [_event("B", i) for i in range(10)])
+
+    store = HazardLogStore(log_path)
+
+    assert store.stats["rebuilt"] is True
+    assert store.gate_ids() == ["B"]
+    assert store.tail("A", 3) == []
+
+
+def test_corrupt_index_is_ignored(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_event("A", i) for i in range(5)])
+    index_path_for(log_path).write_text("{not json", encoding="utf-8")
+
+    store = HazardLogStore(log_path)
+
+    assert store.stats["rebuilt"] is True
+    assert store.tail("A", 2) == [_event("A", 3), _event("A", 4)]
+
+
+def test_read_only_store_uses_a_stale_index_without_rewriting_it(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_event("A", i) for i in range(10)])
+    update_index(log_path)
+    index_before = index_path_for(log_path).read_bytes()
+    _append(log_path, [_event("A", 10)])
+
+    store = HazardLogStore(log_path)
+
+    assert store.stats["rebuilt"] is False
+    assert store.stats["indexed_entries"] == 1
+    assert store.last("A") == _event("A", 10)
+    assert index_path_for(log_path).read_bytes() == index_before
+
+
+def test_series_longer_than_retained_offsets_falls_back_to_scan(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_event("A" if i % 2 else "B", i) for i in range(40)])
+
+    store = HazardLogStore(log_path, retain=4)
+
+    assert store.count("A") == 20
+    assert store.tail("A", 9) == _full_scan(log_path, "A")[-9:]
+    assert list(store.iter_gate_reverse("A")) == _full_scan(log_path, "A")[::-1]
+
+
+def test_reverse_and_forward_iteration_agree(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    events = [_event("A", i) for i in range(300)]
+    _append(log_path, events, extra_lines=["garbage"])
+
+    forward = list(iter_entries(log_path))
+
+    assert forward == events
+    assert list(iter_entries_reverse(log_path, block_size=37)) == forward[::-1]
+    assert list(iter_entries_reverse(tmp_path / "missing.jsonl")) == []
+
+
+# ---------------------------------------------------------------------------
+# Segments: rotation, manifest, compaction
+# ---------------------------------------------------------------------------
+
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (  # noqa: E402
+    SegmentPolicy,
+    append_entry,
+    compact_segments,
+    load_manifest,
+    seal_active,
+    segments_dir_for,
+)
+from PULSE_safe_pack_v0.epf.epf_stability_map import (  # noqa: E402
+    build_stability_map_from_log,
+)
+from PULSE_safe_pack_v0.tools import epf_hazard_inspect, epf_hazard_log_compact, epf_hazard_plot  # noqa: E402
+
+
+def _snap_event(gate_id, i):
+    ev = _event(gate_id, i)
+    ev["snapshot_current"] = {"metrics.x": float(i)}
+    ev["snapshot_reference"] = {f"metrics.m{k}": float(k + i % 2) for k in range(40)}
+    return ev
+
+
+def _write_segmented(log_path, events, max_bytes=4000):
+    policy = SegmentPolicy(max_bytes=max_bytes)
+    for ev in events:
+        append_entry(log_path, ev, policy=policy)
+
+
+def test_size_policy_rolls_into_compressed_segments(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    events = [_snap_event("A" if i % 4 else "B", i) for i in range(40)]
+    _write_segmented(log_path, events)
+
+    segments = load_manifest(log_path)["segments"]
+
+    assert len(segments) > 3
+    assert all(rec["name"].endswith(".jsonl.gz") for rec in segments)
+    assert sum(rec["entries"] for rec in segments) + len(log_path.read_text().splitlines()) == 40
+    assert segments[0]["gates"]["A"]["first_timestamp"] == "t1"
+    assert list(iter_entries(log_path)) == events
+    assert list(iter_entries_reverse(log_path)) == events[::-1]
+
+    store = HazardLogStore(log_path)
+    assert store.gate_ids() == ["A", "B"]
+    assert store.count("B") == 10
+    assert store.tail("B", 6) == [ev for ev in events if ev["gate_id"] == "B"][-6:]
+    assert list(store.iter_gate_reverse("A")) == [ev for ev in events if ev["gate_id"] == "A"][::-1]
+
+
+def test_age_policy_seals_old_active_file(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    policy = SegmentPolicy(max_bytes=None, max_age_s=3600)
+
+    append_entry(log_path, {"gate_id": "A", "timestamp": "2020-01-01T00:00:00+00:00"}, policy=policy)
+    append_entry(log_path, {"gate_id": "A", "timestamp": "2020-01-01T00:00:01+00:00"}, policy=policy)
+
+    assert [rec["entries"] for rec in load_manifest(log_path)["segments"]] == [1]
+    assert [ev["timestamp"] for ev in iter_entries(log_path)] == [
+        "2020-01-01T00:00:00+00:00",
+        "2020-01-01T00:00:01+00:00",
+    ]
+
+
+def test_compaction_stores_reference_snapshots_by_digest(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    events = [_snap_event("A", i) for i in range(30)]
+    _write_segmented(log_path, events)
+    seal_active(log_path)
+
+    stats = compact_segments(log_path)
+
+    assert stats["entries"] == 30
+    assert stats["refs_written"] == 2
+    assert stats["bytes_after"] < stats["bytes_before"]
+    assert len(list((segments_dir_for(log_path) / "refs").iterdir())) == 2
+    assert list(iter_entries(log_path)) == events
+    assert HazardLogStore(log_path).tail("A", 3) == events[-3:]
+
+    # Idempotent: compacted segments are skipped.
+    assert compact_segments(log_path)["segments"] == 0
+
+
+def test_segment_missing_from_manifest_is_still_read(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _write_segmented(log_path, [_event("A", i) for i in range(10)], max_bytes=200)
+    (segments_dir_for(log_path) / "manifest.json").unlink()
+
+    assert [ev["timestamp"] for ev in iter_entries(log_path)] == [f"t{i}" for i in range(10)]
+    assert HazardLogStore(log_path).count("A") == 10
+
+
+def test_readers_see_segmented_log_like_a_flat_log(tmp_path):
+    events = [_snap_event("A" if i % 3 else "B", i) for i in range(50)]
+    flat = tmp_path / "flat" / "epf_hazard_log.jsonl"
+    flat.parent.mkdir()
+    _append(flat, events)
+    seg = tmp_path / "seg" / "epf_hazard_log.jsonl"
+    seg.parent.mkdir()
+    _write_segmented(seg, events)
+    compact_segments(seg)
+
+    for max_points in (5, 30, 0):
+        from_seg = build_stability_map_from_log(
+            log_path=seg, gate_id="A", created_utc="now", max_points=max_points
+        )
+        from_flat = build_stability_map_from_log(
+            log_path=flat, gate_id="A", created_utc="now", max_points=max_points
+        )
+        from_seg.pop("source_log")
+        from_flat.pop("source_log")
+        assert from_seg == from_flat
+
+    assert epf_hazard_inspect.load_entries(seg) == epf_hazard_inspect.load_entries(flat)
+    assert epf_hazard_plot.load_entries(seg) == epf_hazard_plot.load_entries(flat) == events
+
+    # Readers leave the tree untouched: no sidecar index appears.
+    assert not index_path_for(flat).exists()
+    assert not index_path_for(seg).exists()
+
+
+def test_compact_cli_seals_and_compacts(tmp_path, capsys):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_snap_event("A", i) for i in range(5)])
+
+    assert epf_hazard_log_compact.main(["--log", str(log_path), "--seal-active"]) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["sealed_segment"] == "epf_hazard_log.000001.jsonl.gz"
+    assert report["compaction"]["refs_written"] == 2
+    assert not log_path.exists()
+    assert [ev["timestamp"] for ev in iter_entries(log_path)] == [f"t{i}" for i in range(5)]
+
+
+def test_compact_cli_writes_the_index_on_request(tmp_path, capsys):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    _append(log_path, [_event("A", i) for i in range(5)])
+
+    assert epf_hazard_log_compact.main(["--log", str(log_path)]) == 0
+    assert "index" not in json.loads(capsys.readouterr().out)
+    assert not index_path_for(log_path).exists()
+
+    assert epf_hazard_log_compact.main(["--log", str(log_path), "--index"]) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["index"]["indexed_entries"] == 5
+    assert HazardLogStore(log_path).stats == {
+        "rebuilt": False,
+        "indexed_bytes": 0,
+        "indexed_entries": 0,
+    }
@@ -0,0 +1,193 @@
+import json
+import pathlib
+import random
+import sys
+
+import pytest
+
+# Ensure repo root is on sys.path (pytest prepends tests/ by default)
+HERE = pathlib.Path(__file__).resolve()
+REPO_ROOT = HERE.parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+np = pytest.importorskip("numpy")
+
+from PULSE_safe_pack_v0.epf.epf_hazard_adapter import (  # noqa: E402
+    HazardRuntimeState,
+    probe_hazard_and_append_log,
+)
+from PULSE_safe_pack_v0.epf.epf_hazard_features import FeatureSpec, RobustScaler, Transform  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_forecast import HazardConfig  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import SegmentPolicy  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_replay import (  # noqa: E402
+    LOGGED,
+    ReplayResult,
+    hazard_config_from_dict,
+    replay_hazard_log,
+)
+from PULSE_safe_pack_v0.tools import epf_hazard_replay as replay_cli  # noqa: E402
+
+GATES = ["G1", "G2", "G3"]
+SPECS = [
+    FeatureSpec(key="metrics.rdsi", weight=2.0),
+    FeatureSpec(key="metrics.latency", transform=Transform.LOG1P, clip=(0.0, 5.0)),
+]
+SCALERS = {"metrics.rdsi": RobustScaler(median=0.8, mad=0.05)}
+
+
+def _write_log(log_dir, cfg, n=90, seed=5, policy=None):
+    """Probe n entries (one runtime state per gate) and return them in order."""
+    rng = random.Random(seed)
+    states = {g: HazardRuntimeState.empty() for g in GATES}
+    for i in range(n):
+        g = rng.choice(GATES)
+        probe_hazard_and_append_log(
+            gate_id=g,
+            current_snapshot={"metrics": {"rdsi": rng.random(), "latency": rng.random() * 50}, "x": rng.random()},
+            reference_snapshot={"metrics": {"rdsi": 0.8, "latency": 10.0}, "x": 0.5},
+            stability_metrics={"RDSI": rng.random()},
+            runtime_state=states[g],
+            log_dir=log_dir,
+            cfg=cfg,
+            timestamp=f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00",
+            log_segment_policy=policy,
+        )
+    return log_dir / "epf_hazard_log.jsonl"
+
+
+def _assert_matches_logged(result, name):
+    cols = result.columns[name]
+    logged = result.columns[LOGGED]
+    for col in ("T", "D", "E"):
+        assert np.allclose(cols[col], logged[col], rtol=1e-12, atol=1e-12), col
+    assert np.array_equal(cols["zone"], logged["zone"])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_replay_reproduces_logged_forecasts(tmp_path, chunk_size):
+    legacy = HazardConfig(warn_threshold=0.3, crit_threshold=0.6, min_history=4)
+    log_path = _write_log(tmp_path / "legacy", legacy)
+
+    result = replay_hazard_log(log_path, {"same": legacy}, chunk_size=chunk_size)
+
+    assert len(result) == 90
+    assert sorted(result.gate_ids) == GATES
+    _assert_matches_logged(result, "same")
+    assert result.zone_transitions(LOGGED, "same")["changed"] == 0
+
+
+def test_replay_feature_mode_across_segments_and_shared_T(tmp_path):
+    feature = HazardConfig(
+        warn_threshold=0.4, crit_threshold=0.8, min_history=3, feature_specs=SPECS, feature_scalers=SCALERS
+    )
+    log_path = _write_log(tmp_path, feature, policy=SegmentPolicy(max_bytes=4000))
+    assert (tmp_path / "epf_hazard_log.segments").is_dir()
+
+    strict = HazardConfig(
+        warn_threshold=3.0, crit_threshold=6.0, min_history=3, feature_specs=list(SPECS), feature_scalers=dict(SCALERS)
+    )
+    long_window = HazardConfig(
+        warn_threshold=0.4, crit_threshold=0.8, min_history=0, feature_specs=SPECS, feature_scalers=SCALERS
+    )
+    result = replay_hazard_log(log_path, {"same": feature, "strict": strict, "long": long_window}, chunk_size=16)
+
+    _assert_matches_logged(result, "same")
+    assert np.array_equal(result.columns["strict"]["T"], result.columns["same"]["T"])
+
+    diff = result.zone_transitions("same", "strict", max_events=5)
+    assert diff["changed"] == int(np.sum(result.zones("same") != result.zones("strict"))) > 5
+    assert sum(diff["changed_by_gate"].values()) == diff["changed"]
+    assert sum(sum(row.values()) for row in diff["matrix"].values()) == len(result)
+    assert len(diff["events"]) == 5
+    assert all(ev["from"] != ev["to"] for ev in diff["events"])
+
+    # Unbounded window: D is the mean |dT| over the gate's whole history.
+    for gi, gid in enumerate(result.gate_ids):
+        rows = np.flatnonzero(result.gate == gi)
+        t = result.columns["long"]["T"][rows]
+        expected = [0.0] + [np.mean(np.abs(np.diff(t[: k + 1]))) for k in range(1, len(t))]
+        assert np.allclose(result.columns["long"]["D"][rows], expected)
+
+
+def test_replay_gate_filter_and_npz_roundtrip(tmp_path):
+    cfg = HazardConfig(warn_threshold=0.3, crit_threshold=0.6)
+    log_path = _write_log(tmp_path, cfg, n=40)
+
+    result = replay_hazard_log(log_path, {"alt": HazardConfig(alpha=2.0, warn_threshold=0.3)}, gates=["G2"])
+    assert result.gate_ids == ["G2"]
+
+    out = tmp_path / "replay.npz"
+    result.save_npz(out)
+    loaded = ReplayResult.load_npz(out)
+
+    assert loaded.gate_ids == result.gate_ids
+    assert list(loaded.timestamp) == list(result.timestamp)
+    assert loaded.configs == result.configs
+    for name in (LOGGED, "alt"):
+        for col in ("T", "D", "E", "zone"):
+            assert np.array_equal(loaded.columns[name][col], result.columns[name][col])
+
+
+def test_hazard_config_from_dict_reads_calibration(tmp_path):
+    cal = {
+        "global": {"warn_threshold": 0.25, "crit_threshold": 0.5, "stats": {"count": 100}},
+        "feature_scalers": {"features": {"metrics.rdsi": {"median": 0.7, "mad": 0.1}}},
+    }
+    (tmp_path / "cal.json").write_text(json.dumps(cal), encoding="utf-8")
+
+    cfg = hazard_config_from_dict(
+        {"alpha": 2, "crit_threshold": 0.9, "calibration": "cal.json", "features": ["metrics.rdsi"]},
+        base_dir=tmp_path,
+    )
+
+    assert (cfg.alpha, cfg.warn_threshold, cfg.crit_threshold) == (2.0, 0.25, 0.9)
+    assert cfg.feature_specs == [FeatureSpec(key="metrics.rdsi")]
+    assert cfg.feature_scalers["metrics.rdsi"].median == 0.7
+
+
+def test_replay_cli_writes_summary_and_npz(tmp_path):
+    cfg = HazardConfig(warn_threshold=0.3, crit_threshold=0.6)
+    log_path = _write_log(tmp_path, cfg, n=30)
+    (tmp_path / "low.json").write_text(json.dumps({"warn_threshold": 0.05, "crit_threshold": 0.6}), encoding="utf-8")
+    (tmp_path / "same.json").write_text(json.dumps({"warn_threshold": 0.3, "crit_threshold": 0.6}), encoding="utf-8")
+
+    out_json = tmp_path / "summary.json"
+    out_npz = tmp_path / "replay.npz"
+    rc = replay_cli.main(
+        [
+            "--log", str(log_path),
+            "--config", f"low={tmp_path / 'low.json'}",
+            "--config", f"same={tmp_path / 'same.json'}",
+            "--out-json", str(out_json),
+            "--out-npz", str(out_npz),
+        ]
+    )
+
+    assert rc == 0
+    summary = json.loads(out_json.read_text(encoding="utf-8"))
+    assert summary["rows"] == 30
+    assert summary["transitions"]["same"]["changed"] == 0
+    assert summary["transitions"]["low"]["changed"] > 0
+    assert ReplayResult.load_npz(out_npz).config_names == ["low", "same"]
+
+    assert replay_cli.main(["--log", str(log_path)]) == 1
+    assert replay_cli.main(["--log", str(log_path), "--config", f"logged={tmp_path / 'low.json'}"]) == 1
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"alpha": [1.0]},
+        {"min_history": {"n": 3}},
+        {"features": 5},
+        {"features": [{"key": "metrics.rdsi", "clip": 1.0}]},
+        {"calibration": 7},
+    ],
+)
+def test_replay_cli_rejects_malformed_configs(tmp_path, capsys, config):
+    log_path = _write_log(tmp_path, HazardConfig(), n=5)
+    (tmp_path / "bad.json").write_text(json.dumps(config), encoding="utf-8")
+
+    assert replay_cli.main(["--log", str(log_path), "--config", f"bad={tmp_path / 'bad.json'}"]) == 1
+    assert capsys.readouterr().err.startswith("invalid config: ")
@@ -0,0 +1,187 @@
+import json
+import os
+import pathlib
+import random
+import sys
+
+# Ensure repo root is on sys.path (pytest prepends tests/ by default)
+HERE = pathlib.Path(__file__).resolve()
+REPO_ROOT = HERE.parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_adapter import sanitize_snapshot_for_log  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_field_spec import (  # noqa: E402
+    FieldSpecArtifactV0,
+    SnapshotPolicy,
+    compile_snapshot_policy,
+    maybe_load_field_spec,
+)
+from PULSE_safe_pack_v0.tools import epf_hazard_calibrate, epf_hazard_inspect  # noqa: E402
+
+
+# Reference semantics: the linear prefix scans the trie replaces.
+def _matches(path, prefix):
+    return path == prefix or path.startswith(prefix + ".")
+
+
+def _ref_denied(path, deny):
+    return any(_matches(path, d) for d in deny or [])
+
+
+def _ref_allowed(path, allowed):
+    return allowed is None or any(_matches(path, a) for a in allowed)
+
+
+def _ref_traverse(path, allowed):
+    if allowed is None:
+        return True
+    return any(a == path or a.startswith(path + ".") or path.startswith(a + ".") for a in allowed)
+
+
+def _ref_sanitize(m, allowed, deny, prefix="", depth=5):
+    out = {}
+    for k in sorted(m, key=str):
+        path = f"{prefix}.{k}" if prefix else str(k)
+        v = m[k]
+        if _ref_denied(path, deny):
+            continue
+        if isinstance(v, dict):
+            if depth <= 0 or not _ref_traverse(path, allowed):
+                continue
+            child = _ref_sanitize(v, allowed, deny, path, depth - 1)
+            if child:
+                out[str(k)] = child
+            continue
+        if _ref_allowed(path, allowed) and isinstance(v, (int, float)):
+            out[str(k)] = float(v)
+    return out
+
+
+PARTS = ["metrics", "gates", "a", "b", "rdsi", "x", ""]
+
+
+def _random_path(rng, depth=3):
+    return ".".join(rng.choice(PARTS) for _ in range(rng.randint(1, depth)))
+
+
+def _random_tree(rng, depth=3):
+    out = {}
+    for _ in range(rng.randint(1, 4)):
+        key = rng.choice(PARTS + ["a.b", "metrics.rdsi"])
+        if depth > 0 and rng.random() < 0.5:
+            out[key] = _random_tree(rng, depth - 1)
+        else:
+            out[key] = rng.random()
+    return out
+
+
+def test_trie_decisions_match_prefix_scans():
+    rng = random.Random(7)
+    for _ in range(300):
+        allowed = [_random_path(rng) for _ in range(rng.randint(1, 5))] if rng.random() < 0.8 else None
+        deny = [_random_path(rng) for _ in range(rng.randint(0, 3))]
+        policy = SnapshotPolicy(allowed, deny)
+        allowed_n = policy.allowed_prefixes
+        for _ in range(20):
+            path = _random_path(rng, depth=4)
+            assert policy.is_denied(path) == _ref_denied(path, policy.deny_keys), (path, deny)
+            assert policy.allows_leaf(path) == _ref_allowed(path, allowed_n), (path, allowed)
+            assert policy.should_traverse(path) == _ref_traverse(path, allowed_n), (path, allowed)
+
+
+def test_sanitizer_with_compiled_policy_matches_prefix_scans():
+    rng = random.Random(3)
+    for _ in range(200):
+        allowed = [_random_path(rng) for _ in range(rng.randint(1, 4))] if rng.random() < 0.8 else None
+        deny = [_random_path(rng) for _ in range(rng.randint(0, 2))]
+        snapshot = _random_tree(rng)
+
+        sanitized, meta = sanitize_snapshot_for_log(snapshot, allowed_prefixes=allowed, deny_keys=deny)
+        policy = compile_snapshot_policy(allowed, deny)
+
+        assert sanitized == _ref_sanitize(snapshot, policy.allowed_prefixes, policy.deny_keys)
+        assert sanitize_snapshot_for_log(snapshot, policy=policy) == (sanitized, meta)
+
+
+def _age(path, seconds=60):
+    """Move mtime out of the racy window so the loader may cache the file."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_field_spec_policy_is_compiled_once_and_reused(tmp_path):
+    path = tmp_path / "epf_hazard_field_spec_v0.json"
+    FieldSpecArtifactV0(features=["metrics.rdsi", "gates.g1"], deny_keys=["metrics.secret"]).save_json(path)
+    _age(path)
+
+    spec = maybe_load_field_spec(path)
+    policy = spec.snapshot_policy()
+
+    assert maybe_load_field_spec(path) is spec
+    assert spec.snapshot_policy() is policy
+    assert policy.allowed_prefixes == ["gates.g1", "metrics.rdsi"]
+    assert spec.snapshot_policy(None, ["pii"]).deny_keys == ["metrics.secret", "pii"]
+    assert spec.snapshot_policy(["metrics"]).allows_leaf("metrics.other")
+    assert spec.snapshot_policy(["metrics"]).is_denied("metrics.secret.k")
+
+    FieldSpecArtifactV0(features=["metrics.x"]).save_json(path)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    reloaded = maybe_load_field_spec(path)
+    assert reloaded is not spec
+    assert reloaded.snapshot_policy().allowed_prefixes == ["metrics.x"]
+
+
+def test_field_spec_written_within_the_racy_window_is_not_cached(tmp_path):
+    path = tmp_path / "epf_hazard_field_spec_v0.json"
+    FieldSpecArtifactV0(features=["metrics.a"]).save_json(path)
+
+    first = maybe_load_field_spec(path)
+    assert maybe_load_field_spec(path) is not first
+
+    # A rewrite inside the window is seen by the next load.
+    FieldSpecArtifactV0(features=["metrics.b"]).save_json(path)
+    assert maybe_load_field_spec(path).features == ["metrics.b"]
+
+    _age(path)
+    aged = maybe_load_field_spec(path)
+    assert maybe_load_field_spec(path) is aged
+
+
+def test_calibrate_and_inspect_honor_field_spec_policy(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    with log_path.open("w", encoding="utf-8") as f:
+        for i in range(25):
+            ev = {
+                "gate_id": "G1",
+                "hazard": {"E": i / 25.0},
+                "snapshot_current": {
+                    "metrics": {"rdsi": float(i), "secret": 1.0, "other": 2.0},
+                    "gates": {"g1": i % 2 == 0},
+                },
+            }
+            f.write(json.dumps(ev) + "\n")
+    spec_path = tmp_path / "field_spec.json"
+    FieldSpecArtifactV0(features=["metrics", "gates.g1"], deny_keys=["metrics.secret"]).save_json(spec_path)
+
+    out = tmp_path / "thresholds.json"
+    argv = ["--log", str(log_path), "--out-json", str(out), "--field-spec", str(spec_path)]
+    assert epf_hazard_calibrate.main(argv) == 0
+    assert sorted(json.loads(out.read_text())["feature_coverage"]) == ["gates.g1", "metrics.other", "metrics.rdsi"]
+
+    assert epf_hazard_calibrate.main(argv + ["--streaming"]) == 0
+    assert sorted(json.loads(out.read_text())["feature_scalers"]["features"]) == [
+        "gates.g1",
+        "metrics.other",
+        "metrics.rdsi",
+    ]
+
+    summary_path = tmp_path / "summary.json"
+    assert epf_hazard_inspect.main(
+        ["--log", str(log_path), "--field-spec", str(spec_path), "--tail", "0", "--out-json", str(summary_path)]
+    ) == 0
+    assert json.loads(summary_path.read_text())["snapshot_coverage"]["unique_features"] == 3
+
+    assert epf_hazard_calibrate.main(["--log", str(log_path), "--field-spec", str(tmp_path / "missing.json")]) == 1
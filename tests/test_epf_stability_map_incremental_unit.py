@@ -0,0 +1,202 @@
+import json
+import pathlib
+import random
+import sys
+
+# Ensure repo root is on sys.path (pytest prepends tests/ by default)
+HERE = pathlib.Path(__file__).resolve()
+REPO_ROOT = HERE.parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf import epf_hazard_stability_map, epf_stability_map  # noqa: E402
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (  # noqa: E402
+    LogTail,
+    SegmentPolicy,
+    append_entry,
+    compact_segments,
+    iter_entries,
+    iter_entries_reverse,
+    seal_active,
+)
+from PULSE_safe_pack_v0.tools import build_epf_stability_map  # noqa: E402
+
+ZONES = ("GREEN", "AMBER", "RED")
+
+
+def _events(n, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        out.append(
+            {
+                "gate_id": rng.choice(["A", "B", "C"]),
+                "timestamp": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00",
+                "hazard": {
+                    "E": rng.random(),
+                    "T": rng.random(),
+                    "S": rng.random(),
+                    "D": rng.random(),
+                    "zone": rng.choice(ZONES),
+                    "feature_keys": ["metrics.x"] if i % 5 == 0 else [],
+                },
+                "snapshot_current": {"gates.g1": float(i % 2), "metrics.x": float(i)},
+                "snapshot_reference": {f"metrics.m{k}": float(k) for k in range(20)},
+                "meta": {"run_key": f"rk{i}"},
+            }
+        )
+    return out
+
+
+def _hazard_map(log_path, **kwargs):
+    artifact = epf_hazard_stability_map.build_stability_map_from_log(
+        log_path, tail=7, max_per_gate=25, **kwargs
+    )
+    artifact.pop("created_utc")
+    return artifact
+
+
+def _gate_map(log_path, max_points, **kwargs):
+    return epf_stability_map.build_stability_map_from_log(
+        log_path=log_path, gate_id="B", created_utc="now", max_points=max_points, **kwargs
+    )
+
+
+def test_incremental_builds_match_full_builds_across_appends_seals_and_compaction(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    policy = SegmentPolicy(max_bytes=6000)
+    events = _events(240)
+    hazard_state = tmp_path / "hazard.state.json"
+    gate_states = {mp: tmp_path / f"gate_{mp}.state.json" for mp in (10, 0)}
+
+    for step, batch_start in enumerate(range(0, len(events), 30)):
+        for ev in events[batch_start : batch_start + 30]:
+            append_entry(log_path, ev, policy=policy)
+        if step == 3:
+            seal_active(log_path)
+        if step == 5:
+            compact_segments(log_path)
+
+        assert _hazard_map(log_path, state_path=hazard_state) == _hazard_map(log_path)
+        for mp, state in gate_states.items():
+            assert _gate_map(log_path, mp, state_path=state) == _gate_map(log_path, mp)
+
+    assert json.loads(hazard_state.read_text())["cursor"]["sealed_seq"] > 1
+
+
+def test_incremental_build_folds_only_new_entries(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    for ev in _events(50):
+        append_entry(log_path, ev)
+
+    state = tmp_path / "state.json"
+    _hazard_map(log_path, state_path=state)
+    cursor = json.loads(state.read_text())["cursor"]
+
+    assert list(LogTail(log_path, cursor)) == []
+
+    for ev in _events(3, seed=1):
+        append_entry(log_path, ev)
+    tail = LogTail(log_path, cursor)
+
+    assert tail.reset is False
+    assert len(list(tail)) == 3
+    assert tail.cursor["active_entries"] == 53
+
+
+def test_rewritten_log_or_changed_params_trigger_full_rebuild(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    for ev in _events(40):
+        append_entry(log_path, ev)
+    state = tmp_path / "state.json"
+    _hazard_map(log_path, state_path=state)
+
+    log_path.unlink()
+    for ev in _events(20, seed=7):
+        append_entry(log_path, ev)
+
+    assert LogTail(log_path, json.loads(state.read_text())["cursor"]).reset is True
+    assert _hazard_map(log_path, state_path=state) == _hazard_map(log_path)
+
+    wider = epf_hazard_stability_map.build_stability_map_from_log(
+        log_path, tail=7, max_per_gate=3, state_path=state
+    )
+    assert all(g["count"] <= 3 for g in wider["gates"].values())
+
+
+def test_cli_full_rebuild_matches_incremental(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    events = _events(60)
+    for ev in events[:40]:
+        append_entry(log_path, ev)
+
+    out = tmp_path / "map.json"
+    argv = ["--log", str(log_path), "--out", str(out), "--tail", "5"]
+
+    assert build_epf_stability_map.main(argv) == 0
+    assert (tmp_path / "map.state.json").exists()
+
+    for ev in events[40:]:
+        append_entry(log_path, ev)
+
+    assert build_epf_stability_map.main(argv) == 0
+    incremental = json.loads(out.read_text())
+    assert build_epf_stability_map.main(argv + ["--full-rebuild"]) == 0
+    full = json.loads(out.read_text())
+
+    incremental.pop("created_utc")
+    full.pop("created_utc")
+    assert incremental == full
+    assert sum(g["count"] for g in full["gates"].values()) == 60
+
+    gate_out = tmp_path / "gate_map.json"
+    assert build_epf_stability_map.main(["--log", str(log_path), "--gate-id", "A", "--out", str(gate_out)]) == 0
+    assert json.loads(gate_out.read_text())["gate_id"] == "A"
+    assert (tmp_path / "gate_map.state.json").exists()
+
+
+def test_unterminated_last_line_is_held_back_by_full_and_incremental_builds(tmp_path):
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+    events = _events(12)
+    for ev in events[:10]:
+        append_entry(log_path, ev)
+    hazard_state = tmp_path / "hazard.state.json"
+    gate_state = tmp_path / "gate.state.json"
+    assert _hazard_map(log_path, state_path=hazard_state) == _hazard_map(log_path)
+
+    # A writer has written the next line but not its newline yet.
+    pending = json.dumps(events[10], sort_keys=True)
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write(pending)
+
+    for kwargs in ({}, {"state_path": hazard_state}, {"state_path": hazard_state, "full_rebuild": True}):
+        assert sum(g["count"] for g in _hazard_map(log_path, **kwargs)["gates"].values()) == 10
+    for mp in (10, 0):
+        assert _gate_map(log_path, mp, state_path=gate_state) == _gate_map(log_path, mp)
+    assert list(iter_entries(log_path)) == events[:10]
+    assert list(iter_entries_reverse(log_path, block_size=64)) == events[:10][::-1]
+
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write("\n")
+    append_entry(log_path, events[11])
+
+    assert _hazard_map(log_path, state_path=hazard_state) == _hazard_map(log_path)
+    assert sum(g["count"] for g in _hazard_map(log_path)["gates"].values()) == 12
+    for mp in (10, 0):
+        assert _gate_map(log_path, mp, state_path=gate_state) == _gate_map(log_path, mp)
+    assert list(iter_entries_reverse(log_path, block_size=64)) == events[::-1]
+
+
+def test_checkpoint_is_not_reused_for_another_log(tmp_path):
+    first, second = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    events = _events(30)
+    # Same first entry, so only the params tell the logs apart.
+    for ev in events:
+        append_entry(first, ev)
+    for ev in events[:1] + _events(40, seed=3)[1:]:
+        append_entry(second, ev)
+
+    state = tmp_path / "state.json"
+    _hazard_map(first, state_path=state)
+    assert _hazard_map(second, state_path=state) == _hazard_map(second)
+    assert json.loads(state.read_text())["params"]["log_path"] == str(second.resolve())
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import file_digest_v0 as digest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(digest.CACHE_ENV, raising=False)
+    monkeypatch.delenv(digest.STRICT_ENV, raising=False)
+    # Test files are written immediately before hashing; disable the
+    # racy-timestamp guard unless a test exercises it explicitly.
+    monkeypatch.setattr(digest, "RACY_WINDOW_NS", 0)
+    digest.clear_cache()
+    yield
+    digest.clear_cache()
+
+
+def _expected(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_digest_matches_hashlib_and_is_cached(tmp_path: Path) -> None:
+    path = tmp_path / "policy.yml"
+    path.write_bytes(b"gates: {}\n" * 1000)
+
+    assert digest.sha256_file(path) == _expected(path)
+    assert digest.sha256_file(path) == _expected(path)
+
+    stats = digest.digest_stats()
+    assert stats["calls"] == 2
+    assert stats["hashed"] == 1
+    assert stats["cache_hits"] == 1
+    assert stats["bytes_avoided"] == path.stat().st_size
+
+
+def test_rewrite_with_preserved_mtime_is_rehashed(tmp_path: Path) -> None:
+    path = tmp_path / "status.json"
+    path.write_bytes(b'{"a": 1}')
+    st = path.stat()
+    first = digest.sha256_file(path)
+
+    # Same size, same mtime: only ctime (and content) differ.
+    path.write_bytes(b'{"a": 2}')
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    second = digest.sha256_file(path)
+
+    assert second != first
+    assert second == _expected(path)
+    assert digest.digest_stats()["hashed"] == 2
+
+
+def test_replaced_file_is_rehashed(tmp_path: Path) -> None:
+    path = tmp_path / "registry.yml"
+    path.write_bytes(b"one\n")
+    digest.sha256_file(path)
+
+    replacement = tmp_path / "registry.yml.new"
+    replacement.write_bytes(b"two\n")
+    os.replace(replacement, path)
+
+    assert digest.sha256_file(path) == _expected(path)
+    assert digest.digest_stats()["cache_hits"] == 0
+
+
+def test_strict_mode_always_rehashes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "plan.json"
+    path.write_bytes(b"{}")
+
+    digest.sha256_file(path)
+    digest.sha256_file(path, strict=True)
+    assert digest.digest_stats()["hashed"] == 2
+
+    monkeypatch.setenv(digest.STRICT_ENV, "1")
+    digest.sha256_file(path)
+    assert digest.digest_stats()["hashed"] == 3
+    assert digest.digest_stats()["cache_hits"] == 0
+
+
+def test_racy_entries_are_not_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(digest, "RACY_WINDOW_NS", 3600 * 1_000_000_000)
+    path = tmp_path / "fresh.json"
+    path.write_bytes(b"{}")
+
+    digest.sha256_file(path)
+    digest.sha256_file(path)
+
+    assert digest.digest_stats()["hashed"] == 2
+
+
+def test_missing_file_raises_oserror(tmp_path: Path) -> None:
+    with pytest.raises(OSError):
+        digest.sha256_file(tmp_path / "missing.json")
+
+
+def test_persistent_cache_is_shared_across_processes(tmp_path: Path) -> None:
+    cache = tmp_path / "cache" / "digests.json"
+    path = tmp_path / "policy.yml"
+    path.write_bytes(b"x" * 4096)
+    old = path.stat().st_mtime_ns - 10 * 1_000_000_000
+    os.utime(path, ns=(old, old))
+
+    script = (
+        "import json, sys\n"
+        f"sys.path.insert(0, {str(REPO_ROOT)!r})\n"
+        "from PULSE_safe_pack_v0.tools import file_digest_v0 as d\n"
+        "d.sha256_file(sys.argv[1])\n"
+        "print(json.dumps(d.digest_stats()))\n"
+    )
+    env = dict(os.environ, **{digest.CACHE_ENV: str(cache)})
+    env.pop(digest.STRICT_ENV, None)
+
+    def run() -> dict[str, int]:
+        proc = subprocess.run(
+            [sys.executable, "-c", script, str(path)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(proc.stdout)
+
+    first = run()
+    second = run()
+
+    assert first["hashed"] == 1
+    assert second["hashed"] == 0
+    assert second["cache_hits"] == 1
+
+    payload = json.loads(cache.read_text(encoding="utf-8"))
+    assert payload["schema"] == digest.CACHE_SCHEMA
+    entry = payload["entries"][str(path.resolve())]
+    assert entry["sha256"] == _expected(path)
+
+
+def test_corrupt_persistent_cache_is_ignored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = tmp_path / "digests.json"
+    cache.write_text("{not json", encoding="utf-8")
+    monkeypatch.setenv(digest.CACHE_ENV, str(cache))
+    digest.clear_cache()
+
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"a")
+
+    assert digest.sha256_file(path) == _expected(path)
+    digest.flush()
+
+    payload = json.loads(cache.read_text(encoding="utf-8"))
+    assert str(path.resolve()) in payload["entries"]
+
+
+def test_forged_persistent_entry_is_not_trusted_in_strict_mode(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "status.json"
+    path.write_bytes(b"{}")
+    key = list(digest.stat_key(path.stat()))
+
+    cache = tmp_path / "digests.json"
+    cache.write_text(
+        json.dumps(
+            {
+                "schema": digest.CACHE_SCHEMA,
+                "entries": {
+                    str(path.resolve()): {"key": key, "sha256": "0" * 64},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv(digest.CACHE_ENV, str(cache))
+    digest.clear_cache()
+
+    assert digest.sha256_file(path, strict=True) == _expected(path)
+    # Strict hashing refreshes the poisoned entry for later callers.
+    assert digest.sha256_file(path) == _expected(path)
+
+
+def test_sha256_many_matches_serial_and_uses_mmap_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(digest, "MMAP_THRESHOLD", 4096)
+    monkeypatch.setattr(digest, "CHUNK_SIZE", 1000)
+
+    paths = []
+    for index, size in enumerate([0, 1, 999, 1000, 4095, 4096, 50_000]):
+        path = tmp_path / f"f{index}.bin"
+        path.write_bytes(os.urandom(size))
+        paths.append(path)
+
+    result = digest.sha256_many(paths + [paths[0]], jobs=4)
+
+    assert list(result) == paths
+    assert result == {path: _expected(path) for path in paths}
+    assert digest.digest_stats()["bytes_hashed"] == sum(p.stat().st_size for p in paths)
+
+
+def test_sha256_many_records_errors(tmp_path: Path) -> None:
+    good = tmp_path / "good.txt"
+    good.write_bytes(b"ok")
+    missing = tmp_path / "missing.txt"
+    errors: dict[Path, OSError] = {}
+
+    result = digest.sha256_many([good, missing], jobs=2, errors=errors)
+
+    assert result == {good: _expected(good)}
+    assert list(errors) == [missing]
+    assert isinstance(errors[missing], FileNotFoundError)
+
+
+def test_sha256_many_rejects_non_positive_jobs(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="jobs must be greater than zero"):
+        digest.sha256_many([tmp_path], jobs=0)
+
+
+def test_prefetch_inventory_digests_hashes_only_safe_regular_files(
+    tmp_path: Path,
+) -> None:
+    package = tmp_path / "package"
+    (package / "sub").mkdir(parents=True)
+    (package / "a.txt").write_bytes(b"a")
+    (package / "sub" / "b.txt").write_bytes(b"b")
+    (tmp_path / "outside.txt").write_bytes(b"outside")
+    (package / "link.txt").symlink_to(package / "a.txt")
+
+    entries = [
+        {"path": "a.txt"},
+        {"path": "sub/./b.txt"},
+        {"path": "a.txt"},
+        {"path": "../outside.txt"},
+        {"path": "/etc/hostname"},
+        {"path": "link.txt"},
+        {"path": "sub"},
+        {"path": "missing.txt"},
+        {"path": ""},
+        {"path": 3},
+        "a.txt",
+    ]
+
+    result = digest.prefetch_inventory_digests(package, entries, strict=True)
+
+    assert result == {
+        package / "a.txt": _expected(package / "a.txt"),
+        package / "sub" / "b.txt": _expected(package / "sub" / "b.txt"),
+    }
+
+
+def test_compute_checksums_output_is_sorted_sha256sum_format(tmp_path: Path) -> None:
+    base = tmp_path / "dist"
+    (base / "sub").mkdir(parents=True)
+    for name in ["b.txt", "a.txt", "sub/c.txt"]:
+        (base / name).write_text(name, encoding="utf-8")
+
+    proc = subprocess.run(
+        [
+            sys.executable,
+            str(REPO_ROOT / "compute_checksums.py"),
+            "-r",
+            "--jobs",
+            "3",
+            "dist",
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    expected = [
+        f"{_expected(base / name)}  dist/{name}"
+        for name in ["a.txt", "b.txt", "sub/c.txt"]
+    ]
+    assert proc.stdout.splitlines() == expected
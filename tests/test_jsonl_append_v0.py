@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.epf.epf_hazard_adapter import (  # noqa: E402
+    HazardConfig,
+    HazardRuntimeState,
+    probe_hazard_and_append_log,
+)
+from PULSE_safe_pack_v0.epf.epf_hazard_log_store import (  # noqa: E402
+    SegmentPolicy,
+    append_entry,
+    iter_entries,
+    load_manifest,
+    open_appender,
+)
+from PULSE_safe_pack_v0.tools.jsonl_append_v0 import (  # noqa: E402
+    JsonlAppender,
+    append_jsonl_records,
+)
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_appender_writes_in_batches_and_flushes_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "log.jsonl"
+
+    with JsonlAppender(path, batch_size=4) as sink:
+        for i in range(10):
+            sink.append({"i": i, "b": "x"})
+        assert sink.batches_written == 2
+        assert sink.pending == 2
+        assert len(_lines(path)) == 8
+
+    assert sink.records_written == 10
+    assert _lines(path) == [{"i": i, "b": "x"} for i in range(10)]
+
+    with pytest.raises(ValueError):
+        sink.append({"i": 10})
+
+
+def test_appender_serializes_like_the_historical_writers(tmp_path: Path) -> None:
+    record = {"z": 1, "a": "é", "m": {"y": 2.5, "b": None}}
+    path = tmp_path / "log.jsonl"
+
+    append_jsonl_records(path, [record])
+    append_jsonl_records(path, [record], ensure_ascii=False, sort_keys=False)
+
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        json.dumps(record, sort_keys=True),
+        json.dumps(record, ensure_ascii=False),
+    ]
+
+
+def test_appender_snapshots_records_on_append(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    record = {"v": 1}
+
+    with JsonlAppender(path, batch_size=10) as sink:
+        sink.append(record)
+        record["v"] = 2
+
+    assert _lines(path) == [{"v": 1}]
+
+
+def test_appender_reopens_a_file_rotated_by_before_write(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    rotated = tmp_path / "log.1.jsonl"
+    path.write_text('{"old": true}\n', encoding="utf-8")
+
+    def rotate(p: Path) -> bool:
+        if rotated.exists():
+            return False
+        os.replace(p, rotated)
+        return True
+
+    with JsonlAppender(path, before_write=rotate) as sink:
+        sink.extend({"i": i} for i in range(3))
+
+    assert _lines(rotated) == [{"old": True}]
+    assert _lines(path) == [{"i": i} for i in range(3)]
+
+
+def _shard(path: str, shard: int, n: int) -> None:
+    with JsonlAppender(path, batch_size=7) as sink:
+        for i in range(n):
+            sink.append({"shard": shard, "i": i, "pad": "x" * 2000})
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="flock is POSIX-only")
+def test_concurrent_shards_never_interleave_lines(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_shard, args=(str(path), s, 50)) for s in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+
+    rows = _lines(path)
+    assert len(rows) == 200
+    for shard in range(4):
+        assert [r["i"] for r in rows if r["shard"] == shard] == list(range(50))
+
+
+def test_hazard_sink_matches_append_entry_and_seals_between_batches(tmp_path: Path) -> None:
+    events = [{"gate_id": f"G{i % 3}", "timestamp": f"t{i}", "hazard": {"E": i / 10.0}} for i in range(60)]
+    policy = SegmentPolicy(max_bytes=400, codec="none")
+
+    one_by_one = tmp_path / "a" / "epf_hazard_log.jsonl"
+    for ev in events:
+        append_entry(one_by_one, ev, policy=SegmentPolicy(max_bytes=None))
+
+    batched = tmp_path / "b" / "epf_hazard_log.jsonl"
+    with open_appender(batched, policy=policy, batch_size=8) as sink:
+        sink.extend(events)
+
+    assert list(iter_entries(batched)) == list(iter_entries(one_by_one)) == events
+    segments = load_manifest(batched)["segments"]
+    assert len(segments) > 1
+    assert all(rec["entries"] <= 16 for rec in segments)
+
+
+def test_probe_hazard_log_sink_buffers_entries(tmp_path: Path) -> None:
+    cfg = HazardConfig()
+    state = HazardRuntimeState.empty()
+    log_path = tmp_path / "epf_hazard_log.jsonl"
+
+    with open_appender(log_path, batch_size=100) as sink:
+        for i in range(5):
+            probe_hazard_and_append_log(
+                gate_id="G1",
+                current_snapshot={"x": float(i)},
+                reference_snapshot={"x": 0.0},
+                stability_metrics={"RDSI": 0.9},
+                runtime_state=state,
+                log_dir=tmp_path / "unused",
+                cfg=cfg,
+                timestamp=f"t{i}",
+                log_sink=sink,
+            )
+        assert not log_path.exists()
+        assert sink.pending == 5
+
+    entries = list(iter_entries(log_path))
+    assert [e["timestamp"] for e in entries] == [f"t{i}" for i in range(5)]
+    assert entries[-1]["snapshot_current"] == {"x": 4.0}
+    assert not (tmp_path / "unused").exists()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import pulse_client_v0 as client  # noqa: E402
+from PULSE_safe_pack_v0.tools import pulse_daemon_v0 as daemon_mod  # noqa: E402
+
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX sockets")
+
+
+TOOL = '''\
+import os
+import sys
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if os.environ.get("PULSE_TEST_MODE") == "hang":
+        import time
+        time.sleep(60)
+    if os.environ.get("PULSE_TEST_MODE") == "exit":
+        os.environ["PULSE_TEST_VALUE"] = "leaked"
+        os._exit(5)
+    print("VERSION " + " ".join(argv) + " " + os.environ.get("PULSE_TEST_VALUE", ""))
+    print("warn", file=sys.stderr)
+    return int(os.environ.get("PULSE_TEST_RC", "0"))
+'''
+
+SCHEMA = {
+    "type": "object",
+    "required": ["gate"],
+    "properties": {"gate": {"type": "string"}},
+}
+
+
+@pytest.fixture()
+def workspace(tmp_path: Path) -> dict[str, Path]:
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    (schemas / "doc.schema.json").write_text(json.dumps(SCHEMA), encoding="utf-8")
+
+    policy = tmp_path / "policy.yml"
+    policy.write_text("gates:\n  required: [a, b]\n", encoding="utf-8")
+    registry = tmp_path / "registry.yml"
+    registry.write_text("gates:\n  a: {}\n  b: {}\n", encoding="utf-8")
+
+    tool = tmp_path / "tool.py"
+    tool.write_text(TOOL.replace("VERSION", "v1"), encoding="utf-8")
+
+    return {
+        "root": tmp_path,
+        "schemas": schemas,
+        "policy": policy,
+        "registry": registry,
+        "tool": tool,
+        "socket": tmp_path / "d.sock",
+    }
+
+
+@pytest.fixture()
+def running(workspace: dict[str, Path]):
+    state = daemon_mod.WarmState(
+        yaml_files=(workspace["policy"], workspace["registry"]),
+        schema_dirs=(workspace["schemas"],),
+    )
+    daemon = daemon_mod.PulseDaemon(workspace["socket"], state=state)
+    ready = threading.Event()
+    thread = threading.Thread(target=lambda: asyncio.run(daemon.serve(ready)), daemon=True)
+    thread.start()
+    assert ready.wait(30)
+
+    yield daemon
+
+    if thread.is_alive():
+        client.request({"op": "shutdown"}, socket_path=workspace["socket"])
+        thread.join(30)
+    assert not workspace["socket"].exists()
+
+
+def _run(workspace: dict[str, Path], *, fallback: bool = True, **env: str) -> dict:
+    return client.run_tool(
+        str(workspace["tool"]),
+        ["x", "y"],
+        cwd=workspace["root"],
+        env={"PULSE_TEST_VALUE": "val", **env},
+        socket_path=workspace["socket"],
+        fallback=fallback,
+    )
+
+
+def test_daemon_runs_tools_and_reports_warm_state(workspace, running) -> None:
+    assert client.request({"op": "ping"}, socket_path=workspace["socket"])["ok"]
+    assert oct(workspace["socket"].stat().st_mode & 0o777) == oct(0o600)
+
+    result = _run(workspace, PULSE_TEST_RC="3")
+    assert result["ok"] and result["runner"] == "inprocess"
+    assert result["returncode"] == 3
+    assert result["stdout"] == "v1 x y val\n"
+    assert result["stderr"] == "warn\n"
+
+    stats = client.request({"op": "stats"}, socket_path=workspace["socket"])
+    assert stats["state"]["watched"] == 3
+    assert stats["state"]["errors"] == {}
+    assert stats["requests"] == 3
+
+    bad = client.request({"op": "nope"}, socket_path=workspace["socket"])
+    assert not bad["ok"] and "unknown op" in bad["error"]
+
+
+def test_daemon_reloads_changed_tools_and_refuses_broken_policy(workspace, running) -> None:
+    assert _run(workspace)["stdout"].startswith("v1 ")
+
+    workspace["tool"].write_text(TOOL.replace("VERSION", "v2"), encoding="utf-8")
+    assert _run(workspace)["stdout"].startswith("v2 ")
+    assert running.state.snapshot()["tool_reloads"] == 1
+
+    workspace["policy"].write_text("gates:\n  required: [a, a]\ngates: {}\n", encoding="utf-8")
+    refused = _run(workspace)
+    assert not refused["ok"]
+    assert list(refused["errors"]) == [str(workspace["policy"].resolve())]
+
+    workspace["policy"].write_text("gates:\n  required: [a]\n", encoding="utf-8")
+    assert _run(workspace)["ok"]
+
+
+def test_daemon_validates_against_compiled_schemas(workspace, running) -> None:
+    schema = workspace["schemas"] / "doc.schema.json"
+    good = workspace["root"] / "good.json"
+    good.write_text(json.dumps({"gate": "a"}), encoding="utf-8")
+    bad = workspace["root"] / "bad.json"
+    bad.write_text(json.dumps({"gate": 1}), encoding="utf-8")
+
+    ok = client.validate(schema, good, socket_path=workspace["socket"])
+    assert ok == {"ok": True, "valid": True, "errors": [], "runner": "daemon"}
+
+    failed = client.validate(schema, bad, socket_path=workspace["socket"])
+    assert failed["runner"] == "daemon" and not failed["valid"]
+    assert failed["errors"] == client.validate_local(schema, bad)["errors"]
+
+    schema.write_text(json.dumps({"type": 7}), encoding="utf-8")
+    client.request({"op": "ping"}, socket_path=workspace["socket"])
+    invalid = client.validate(schema, good, socket_path=workspace["socket"])
+    assert not invalid["valid"]
+    assert str(schema.resolve()) in running.state.snapshot()["errors"]
+
+
+def _run_request(workspace: dict[str, Path], mode: str, **extra) -> dict:
+    payload = {
+        "op": "run_tool",
+        "tool": str(workspace["tool"]),
+        "argv": ["x", "y"],
+        "cwd": str(workspace["root"]),
+        "env": {"PULSE_TEST_VALUE": "val", "PULSE_TEST_MODE": mode},
+        **extra,
+    }
+    return client.request(payload, socket_path=workspace["socket"])
+
+
+def test_daemon_survives_hung_and_exiting_tools(workspace, running) -> None:
+    assert _run(workspace)["ok"]
+    pid = client.request({"op": "stats"}, socket_path=workspace["socket"])["tool_worker"]["pid"]
+
+    started = time.monotonic()
+    hung = _run_request(workspace, "hang", timeout=0.5)
+    assert time.monotonic() - started < 30
+    assert hung == {"ok": False, "error": "tool timed out after 0.5 seconds"}
+
+    exited = _run_request(workspace, "exit")
+    assert exited["ok"] and exited["returncode"] == 5
+    assert "tool worker exited with code 5" in exited["stderr"]
+
+    assert client.request({"op": "ping"}, socket_path=workspace["socket"])["ok"]
+    after = _run(workspace)
+    assert after["ok"] and after["stdout"] == "v1 x y val\n"
+
+    worker = client.request({"op": "stats"}, socket_path=workspace["socket"])["tool_worker"]
+    assert worker["restarts"] == 2 and worker["pid"] not in (None, pid)
+
+    bad = _run_request(workspace, "", timeout="soon")
+    assert not bad["ok"] and "timeout" in bad["error"]
+
+
+def test_client_reports_a_daemon_timeout_cleanly(workspace, running, capsys, monkeypatch) -> None:
+    with pytest.raises(client.DaemonTimeout):
+        client.request(
+            {
+                "op": "run_tool",
+                "tool": str(workspace["tool"]),
+                "argv": [],
+                "cwd": str(workspace["root"]),
+                "env": {"PULSE_TEST_MODE": "hang"},
+                "timeout": 5,
+            },
+            socket_path=workspace["socket"],
+            timeout=0.5,
+        )
+
+    def slow_request(*args, **kwargs):
+        raise client.DaemonTimeout("PULSE daemon at d.sock did not answer within 600 seconds")
+
+    monkeypatch.setattr(client, "request", slow_request)
+    assert client.main(["--socket", str(workspace["socket"]), "run", str(workspace["tool"])]) == 2
+    assert "did not answer" in capsys.readouterr().err
+
+
+def test_client_refuses_sockets_it_does_not_own(workspace, running, monkeypatch) -> None:
+    sock = workspace["socket"]
+    assert client.request({"op": "ping"}, socket_path=sock)["ok"]
+
+    sock.chmod(0o666)
+    try:
+        with pytest.raises(client.DaemonUntrusted, match="not a private socket"):
+            _run(workspace)
+    finally:
+        sock.chmod(0o600)
+
+    workspace["root"].chmod(0o777)
+    try:
+        with pytest.raises(client.DaemonUntrusted, match="not writable by others"):
+            _run(workspace)
+    finally:
+        workspace["root"].chmod(0o755)
+
+    real_uid = client.os.getuid()
+    monkeypatch.setattr(client.os, "getuid", lambda: real_uid + 1)
+    with pytest.raises(client.DaemonUntrusted):
+        client.request({"op": "ping"}, socket_path=sock)
+    assert client.main(["--socket", str(sock), "run", str(workspace["tool"])]) == 2
+
+
+def test_daemon_refuses_a_shared_socket_directory(tmp_path) -> None:
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    assert daemon_mod.main(["--socket", str(shared / "d.sock"), "--schema-dir", str(tmp_path)]) == 1
+    assert not (shared / "d.sock").exists()
+
+    private = tmp_path / "new" / "sub"
+    daemon = daemon_mod.PulseDaemon(private / "d.sock", state=daemon_mod.WarmState(yaml_files=(), schema_dirs=()))
+    daemon._claim_socket()
+    assert oct(private.stat().st_mode & 0o777) == oct(0o700)
+
+
+def test_tools_only_see_allowlisted_environment(monkeypatch) -> None:
+    monkeypatch.setenv("PULSE_TEST_VALUE", "val")
+    monkeypatch.setenv("PULSE_API_TOKEN", "secret")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setenv("GITHUB_SHA", "abc")
+    monkeypatch.delenv(client.SOCKET_ENV, raising=False)
+
+    env = client.tool_environment()
+    assert env["PULSE_TEST_VALUE"] == "val" and env["GITHUB_SHA"] == "abc"
+    assert "PULSE_API_TOKEN" not in env and "AWS_SECRET_ACCESS_KEY" not in env
+    assert client.tool_environment(["AWS_SECRET_ACCESS_KEY"])["AWS_SECRET_ACCESS_KEY"] == "secret"
+
+    assert client.default_socket_path().parent.name.startswith("pulse_daemon_v0-")
+
+
+def test_client_falls_back_in_process_without_daemon(workspace, capsys) -> None:
+    result = _run(workspace)
+    assert result["runner"] == "inprocess"
+    assert result["stdout"] == "v1 x y val\n"
+
+    with pytest.raises(client.DaemonUnavailable):
+        _run(workspace, fallback=False)
+
+    argv = ["--socket", str(workspace["socket"])]
+    assert client.main([*argv, "run", str(workspace["tool"]), "--", "z"]) == 0
+    assert capsys.readouterr().out.startswith("v1 z ")
+    assert client.main([*argv, "run", str(workspace["tool"]), "--status", "s.json"]) == 0
+    assert capsys.readouterr().out.startswith("v1 --status s.json ")
+    assert client.main([*argv, "--no-fallback", "ping"]) == 2
+
+
+def test_stale_socket_is_replaced_and_live_daemon_is_kept(workspace) -> None:
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(workspace["socket"]))
+    stale.close()
+    assert workspace["socket"].exists()
+
+    daemon = daemon_mod.PulseDaemon(workspace["socket"], state=daemon_mod.WarmState(yaml_files=(), schema_dirs=()))
+    ready = threading.Event()
+    thread = threading.Thread(target=lambda: asyncio.run(daemon.serve(ready)), daemon=True)
+    thread.start()
+    assert ready.wait(30)
+
+    try:
+        assert client.request({"op": "ping"}, socket_path=workspace["socket"])["ok"]
+        assert daemon_mod.main(["--socket", str(workspace["socket"])]) == 1
+        assert client.request({"op": "ping"}, socket_path=workspace["socket"])["ok"]
+    finally:
+        client.request({"op": "shutdown"}, socket_path=workspace["socket"])
+        thread.join(30)
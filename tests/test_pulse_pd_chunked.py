@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Chunked / out-of-core PULSE-PD must match the in-memory pipeline."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pulse_pd.chunked import (  # noqa: E402
+    PD_RESULT_DTYPE,
+    chunk_seed,
+    chunked_percentile,
+    open_X_mmap,
+    robust_minmax_chunked,
+    run_pd_from_cuts_chunked,
+)
+from pulse_pd.cut_adapter import run_pd_from_cuts  # noqa: E402
+from pulse_pd.pd import _robust_minmax  # noqa: E402
+
+
+THETA = {
+    "k": 8.0,
+    "sigma": 0.05,
+    "cuts": [
+        {"feat": 0, "op": ">", "thr": 0.0},
+        {"feat": 1, "op": ">", "thr": 0.0, "scale": 2.0},
+    ],
+}
+
+QS = [0, 1, 5, 37.3, 50, 95, 99, 100]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.random.default_rng(1).normal(size=10001),
+        np.random.default_rng(2).exponential(size=7) * 1e-300,
+        np.r_[np.zeros(50), -0.0, 3.0, np.nan, np.inf, -5.0],
+        np.random.default_rng(3).integers(0, 3, size=999).astype(float),
+        np.array([2.5]),
+    ],
+)
+def test_chunked_percentile_is_exact(values: "np.ndarray") -> None:
+    expected = np.percentile(values[np.isfinite(values)], QS)
+
+    assert np.array_equal(chunked_percentile(values, QS, chunk_rows=97), expected)
+
+
+def test_chunked_percentile_without_finite_values() -> None:
+    assert chunked_percentile(np.array([np.nan, np.inf]), [5, 95]) is None
+
+
+@pytest.mark.parametrize("values", [np.arange(1000.0) ** 2, np.ones(10), np.array([np.nan])])
+def test_robust_minmax_chunked_matches_in_memory(values: "np.ndarray") -> None:
+    out = np.empty_like(values)
+
+    robust_minmax_chunked(values, out, chunk_rows=33)
+
+    assert np.array_equal(out, _robust_minmax(values))
+
+
+def _npy(tmp_path: Path, n: int = 20000) -> Path:
+    path = tmp_path / "X.npy"
+    np.save(path, np.random.default_rng(0).normal(size=(n, 2)))
+    return path
+
+
+def test_chunked_run_matches_in_memory_run(tmp_path: Path) -> None:
+    x_path = _npy(tmp_path)
+    X = open_X_mmap(str(x_path))
+
+    assert isinstance(X, np.memmap)
+
+    ref = run_pd_from_cuts(np.load(x_path), THETA, gf_method="finite_diff", seed=4)
+    res = run_pd_from_cuts_chunked(
+        X,
+        THETA,
+        out_path=str(tmp_path / "res.npy"),
+        chunk_rows=3000,
+        gf_method="finite_diff",
+        seed=4,
+    )
+
+    for key in ("ds", "mi", "gf", "pi"):
+        assert np.array_equal(res[key], ref[key]), key
+
+    on_disk = np.load(tmp_path / "res.npy")
+    assert on_disk.dtype == PD_RESULT_DTYPE
+    assert np.array_equal(on_disk["pi"], ref["pi"])
+
+
+def test_chunked_spsa_gf_uses_per_chunk_streams(tmp_path: Path) -> None:
+    X = open_X_mmap(str(_npy(tmp_path, 5000)))
+
+    def run(name: str) -> "np.ndarray":
+        return run_pd_from_cuts_chunked(
+            X, THETA, out_path=str(tmp_path / name), chunk_rows=1024, seed=7
+        )["gf"]
+
+    first = run("a.npy")
+
+    assert np.array_equal(first, run("b.npy"))
+    assert chunk_seed(7, 3).generate_state(4).tolist() == (
+        np.random.SeedSequence(7).spawn(5)[3].generate_state(4).tolist()
+    )
+
+
+def test_open_x_mmap_rejects_other_formats(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Only .npy"):
+        open_X_mmap(str(tmp_path / "X.csv"))
+
+
+@pytest.mark.parametrize("from_path", [True, False])
+def test_worker_count_does_not_change_results(tmp_path: Path, from_path: bool) -> None:
+    x_path = _npy(tmp_path, 6000)
+    source = str(x_path) if from_path else np.load(x_path)
+
+    def run(workers: int) -> "np.ndarray":
+        return np.array(
+            run_pd_from_cuts_chunked(
+                source,
+                THETA,
+                out_path=str(tmp_path / f"res_{workers}.npy"),
+                chunk_rows=1000,
+                workers=workers,
+                seed=11,
+            )
+        )
+
+    assert np.array_equal(run(1), run(3))
+
+
+def test_workers_must_be_positive(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="workers must be >= 1"):
+        run_pd_from_cuts_chunked(
+            np.zeros((4, 2)), THETA, out_path=str(tmp_path / "r.npy"), workers=0
+        )
+
+
+def test_demo_heatmap_helper_keeps_its_docstring() -> None:
+    from pulse_pd import demo_toy
+
+    # matplotlib is imported inside the helper, after its docstring.
+    assert "Mean PI over 2D feature space bins" in (demo_toy.pi_heatmap_plot.__doc__ or "")
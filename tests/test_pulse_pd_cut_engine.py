@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Batched cut DS engine and closed-form cut GF versus the generic paths."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pulse_pd.cut_adapter import (  # noqa: E402
+    CutProbEnsemble,
+    compute_ds_cuts,
+    decision_cut,
+    eps_sampler_cut,
+    make_cut_prob_ensemble,
+    perturb_theta_thresholds,
+    prob_cut,
+    run_pd_from_cuts,
+)
+from pulse_pd.pd import compute_ds, compute_gf, compute_mi  # noqa: E402
+
+
+THETA = {
+    "sigma": 0.3,
+    "feature_names": ["a", "b", "c"],
+    "cuts": [
+        {"feat": "a", "op": ">", "thr": 0.1},
+        {"feat": 1, "op": "<=", "thr": 0.5, "sigma": 0.2},
+        {"feat": 2, "op": ">=", "thr": -1.0},
+        {"feat": 0, "op": "<", "thr": 2.0, "sigma": 0.5},
+    ],
+}
+
+
+def _data(n: int = 4000) -> "np.ndarray":
+    return np.random.default_rng(5).normal(size=(n, 3))
+
+
+def _loop_ds(x: "np.ndarray", theta: dict, M: int, seed: int) -> "np.ndarray":
+    rng = np.random.default_rng(seed)
+    return compute_ds(
+        decision_fn=decision_cut,
+        X=x,
+        theta=theta,
+        eps_sampler=lambda th: eps_sampler_cut(th, rng=rng),
+        M=M,
+    )
+
+
+@pytest.mark.parametrize("M", [1, 7, 24])
+@pytest.mark.parametrize("block_elements", [16, 1 << 22])
+def test_batched_ds_is_identical_to_loop(M: int, block_elements: int) -> None:
+    x = _data()
+
+    expected = _loop_ds(x, THETA, M, seed=3)
+    got = compute_ds_cuts(
+        x,
+        THETA,
+        M,
+        rng=np.random.default_rng(3),
+        block_elements=block_elements,
+    )
+
+    assert got.dtype == expected.dtype
+    assert np.array_equal(got, expected)
+    assert np.array_equal(compute_ds_cuts(x, THETA, M, seed=3), expected)
+
+
+def test_run_pd_from_cuts_ds_matches_loop() -> None:
+    x = _data(2000)
+
+    res = run_pd_from_cuts(x, THETA, ds_M=12, mi_models=3, gf_K=2, seed=9)
+
+    assert np.array_equal(res["ds"], _loop_ds(x, THETA, 12, seed=9))
+
+
+@pytest.mark.parametrize(
+    ("theta", "message"),
+    [
+        ({"cuts": []}, "non-empty 'cuts'"),
+        ({"cuts": [{"feat": 0, "op": "!=", "thr": 0.0}]}, "Unsupported cut op"),
+        ({"cuts": [{"feat": 5, "op": ">", "thr": 0.0}]}, "out of bounds"),
+    ],
+)
+def test_batched_ds_rejects_invalid_theta(theta: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        compute_ds_cuts(_data(10), theta, 4)
+
+
+def test_batched_ds_rejects_non_positive_m() -> None:
+    with pytest.raises(ValueError, match="M must be >= 1"):
+        compute_ds_cuts(_data(10), THETA, 0)
+
+
+def test_analytic_gf_matches_fine_finite_differences() -> None:
+    x = _data()
+    theta = dict(THETA, k=8.0)
+    theta["cuts"] = [dict(cut, scale=s) for cut, s in zip(THETA["cuts"], (2.0, 1.0, 0.5, 1.0))]
+
+    analytic = compute_gf(prob_cut, x, theta, method="analytic")
+    numeric = compute_gf(prob_cut, x, theta, method="finite_diff", delta=1e-6)
+
+    # Away from kinks of the min over cuts the two agree to ~1e-6 relative.
+    close = np.isclose(analytic, numeric, rtol=1e-5, atol=1e-9)
+    assert close.mean() > 0.99
+    assert analytic.shape == (x.shape[0],)
+    assert np.all(np.isfinite(analytic))
+
+
+def test_analytic_gf_is_stable_far_from_the_boundary() -> None:
+    x = np.array([[1e6, 0.0, 0.0], [-1e6, 0.0, 0.0]])
+
+    gf = compute_gf(prob_cut, x, THETA, method="analytic")
+
+    assert np.all(np.isfinite(gf))
+    assert np.all(gf >= 0.0)
+
+
+def test_analytic_gf_falls_back_to_spsa_for_black_box_prob_fn() -> None:
+    x = _data(500)
+
+    def black_box(xx: "np.ndarray", _theta: object) -> "np.ndarray":
+        return prob_cut(xx, THETA)
+
+    assert np.array_equal(
+        compute_gf(black_box, x, None, method="analytic", seed=2),
+        compute_gf(black_box, x, None, method="spsa", seed=2),
+    )
+
+
+@pytest.mark.parametrize("n_models", [1, 7])
+@pytest.mark.parametrize("block_elements", [5, 1 << 22])
+def test_tensorized_mi_is_identical_to_model_loop(n_models: int, block_elements: int) -> None:
+    x = _data()
+    ensemble = make_cut_prob_ensemble(THETA, n_models, seed=4, sigma=0.05)
+
+    rng = np.random.default_rng(4)
+    thetas = [perturb_theta_thresholds(THETA, rng, sigma=0.05) for _ in range(n_models)]
+    closures = [lambda xx, _unused=None, th=th: prob_cut(xx, th) for th in thetas]
+
+    assert isinstance(ensemble, CutProbEnsemble) and len(ensemble) == n_models
+    assert np.array_equal(
+        ensemble.thresholds,
+        [[cut["thr"] for cut in th["cuts"]] for th in thetas],
+    )
+
+    expected = compute_mi(closures, x, None)
+    probs = ensemble.prob_matrix(x, block_elements=block_elements)
+
+    assert np.array_equal(probs, np.stack([fn(x) for fn in ensemble]))
+    assert np.array_equal(np.var(probs, axis=0), expected)
+    assert np.array_equal(compute_mi(ensemble, x, None), expected)
+    assert np.array_equal(ensemble.mi(x), expected)
+
+
+def test_tensorized_mi_rejects_mismatched_thresholds_and_features() -> None:
+    with pytest.raises(ValueError, match="n_models"):
+        CutProbEnsemble(THETA, np.zeros((3, 2)))
+
+    ensemble = make_cut_prob_ensemble(THETA, 3)
+    with pytest.raises(ValueError, match="out of bounds"):
+        ensemble.prob_matrix(np.zeros((4, 2)))
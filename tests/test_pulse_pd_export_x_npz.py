@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Streaming CSV -> X.npz / .npy directory export (pulse_pd.export_x_npz)."""
+
+from __future__ import annotations
+
+import csv
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pulse_pd.export_x_npz import (  # noqa: E402
+    _NpyAppender,
+    convert_csv,
+    read_csv_matrix,
+)
+
+
+def _write_csv(path: Path, n: int = 500) -> "np.ndarray":
+    rng = np.random.default_rng(7)
+    x = rng.normal(size=(n, 2))
+    x[3, 1] = np.nan  # written as an empty cell
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["run", "lumi", "event", " a ", "b", "weight", "event_id", ""])
+        for i in range(n):
+            b = "" if i == 3 else repr(float(x[i, 1]))
+            event_id = "id\n50" if i == 50 else f"id,{i}"
+            w.writerow([1, "10.0", 1000 + i, repr(float(x[i, 0])), b, 0.5, event_id, "junk"])
+            if i == 100:
+                f.write("\n")
+    return x
+
+
+@pytest.mark.parametrize("block_rows", [1, 7, 65_536])
+def test_streamed_export_matches_reference_values(tmp_path: Path, block_rows: int) -> None:
+    x = _write_csv(tmp_path / "in.csv")
+
+    summary = convert_csv(str(tmp_path / "in.csv"), str(tmp_path / "X.npz"), block_rows=block_rows)
+
+    assert summary["n"] == 500 and summary["d"] == 2
+    with np.load(tmp_path / "X.npz") as z:
+        assert sorted(z.keys()) == ["X", "event", "event_id", "feature_names", "lumi", "run", "weight"]
+        assert np.array_equal(z["X"], x, equal_nan=True)
+        assert z["feature_names"].tolist() == ["a", "b"]
+        assert z["run"].dtype == np.int64 and np.all(z["lumi"] == 10)
+        assert np.array_equal(z["event"], 1000 + np.arange(500))
+        assert z["event_id"][7] == "id,7" and z["event_id"].dtype == np.dtype("<U6")
+        assert z["event_id"][50] == "id\n50"
+        assert np.all(z["weight"] == 0.5)
+
+
+def test_npy_directory_is_memory_mappable_and_matches_npz(tmp_path: Path) -> None:
+    _write_csv(tmp_path / "in.csv")
+    kwargs = dict(
+        event_id_col=None,
+        exclude_cols=["event_id"],
+        make_event_id=True,
+        dtype="float32",
+        drop_nan_rows=True,
+        max_rows=200,
+    )
+
+    convert_csv(str(tmp_path / "in.csv"), str(tmp_path / "X.npz"), **kwargs)
+    summary = convert_csv(str(tmp_path / "in.csv"), str(tmp_path / "Xdir"), block_rows=16, **kwargs)
+
+    X = np.load(tmp_path / "Xdir" / "X.npy", mmap_mode="r")
+    assert isinstance(X, np.memmap) and X.shape == (199, 2) and X.dtype == np.float32
+    assert summary["keys"] == sorted(p.stem for p in (tmp_path / "Xdir").glob("*.npy"))
+
+    with np.load(tmp_path / "X.npz") as z:
+        for key in summary["keys"]:
+            assert np.array_equal(np.load(tmp_path / "Xdir" / f"{key}.npy"), z[key])
+        assert z["event_id"][0] == "1:10:1000"
+        assert "1:10:1003" not in z["event_id"]
+
+
+def test_invalid_int_and_missing_ids_fail(tmp_path: Path) -> None:
+    path = tmp_path / "bad.csv"
+    path.write_text("run,a\n1,0.5\n,0.7\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="empty int field"):
+        convert_csv(str(path), str(tmp_path / "X.npz"))
+
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="IDs required"):
+        convert_csv(str(path), str(tmp_path / "X.npz"), require_ids=True)
+
+
+def test_read_csv_matrix_and_appender(tmp_path: Path) -> None:
+    path = tmp_path / "m.csv"
+    path.write_text('a,b\n1,2\n"3",4\n\n5,\n', encoding="utf-8")
+
+    X, names = read_csv_matrix(str(path), block_rows=2)
+    assert names == ["a", "b"]
+    assert np.array_equal(X, [[1, 2], [3, 4], [5, np.nan]], equal_nan=True)
+
+    sink = _NpyAppender(str(tmp_path / "a.npy"), np.float32, (3,))
+    for _ in range(3):
+        sink.append(np.ones((2, 3)))
+    sink.close()
+    loaded = np.load(tmp_path / "a.npy", mmap_mode="r")
+    assert loaded.shape == (6, 3) and loaded.dtype == np.float32
+    assert loaded.offset % 64 == 0
+
+
+def test_run_cut_pd_chunked_reads_npy_directory(tmp_path: Path) -> None:
+    _write_csv(tmp_path / "in.csv")
+    convert_csv(str(tmp_path / "in.csv"), str(tmp_path / "Xdir"), exclude_cols=["event_id"])
+    np.save(tmp_path / "X.npy", np.load(tmp_path / "Xdir" / "X.npy"))
+
+    theta = ROOT / "pulse_pd" / "examples" / "theta_cuts_example.json"
+    common = ["--theta", str(theta), "--dims", "0", "1", "--chunk-size", "64", "--no-plots"]
+    common += ["--ds-M", "4", "--mi-models", "3", "--gf-K", "2"]
+    for x, out, extra in (("Xdir", "dir", ["--workers", "2"]), ("X.npy", "npy", [])):
+        cmd = [sys.executable, "-m", "pulse_pd.run_cut_pd", "--x", str(tmp_path / x), "--out", str(tmp_path / out)]
+        subprocess.run(cmd + common + extra, cwd=ROOT, check=True, capture_output=True)
+
+    got = np.load(tmp_path / "dir" / "pd_results.npy")
+    expected = np.load(tmp_path / "npy" / "pd_results.npy")
+    assert got.shape == (500,)
+    for name in expected.dtype.names:
+        assert np.array_equal(got[name], expected[name], equal_nan=True)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Indexed zone membership queries in pulse_pd.export_zone_events (ZoneIndex)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pulse_pd.export_zone_events import ZoneIndex  # noqa: E402
+
+
+def _mask_indices(x, jx, x0, x1, jy, y0, y1):
+    """The previous per-zone boolean mask over all events."""
+    xv, yv = x[:, jx], x[:, jy]
+    return np.where((xv >= x0) & (xv < x1) & (yv >= y0) & (yv < y1))[0]
+
+
+def test_zone_index_matches_full_mask() -> None:
+    rng = np.random.default_rng(5)
+    n = 5000
+    x = rng.normal(size=(n, 3))
+    x[:, 1] = np.round(x[:, 1], 1)  # duplicates exactly on zone edges
+    x[rng.random(n) < 0.02, 2] = np.nan
+    x[:5, 0] = [np.inf, -np.inf, 0.0, -0.0, 0.5]
+
+    rects = [tuple(np.sort(rng.normal(size=2)).round(1)) for _ in range(60)]
+    rects += [(-np.inf, 0.0), (0.0, np.inf), (-np.inf, np.inf), (0.3, 0.3), (0.5, -0.5), (np.nan, 1.0)]
+
+    index = ZoneIndex(x)
+    for k, (x0, x1) in enumerate(rects):
+        y0, y1 = rects[(7 * k + 3) % len(rects)]
+        for jx, jy in ((0, 1), (1, 2), (2, 0)):
+            got = index.query(jx, x0, x1, jy, y0, y1)
+            assert np.array_equal(got, _mask_indices(x, jx, x0, x1, jy, y0, y1))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Chunked ROOT export core (pulse_pd.hep.export_uproot_npz) without uproot."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pulse_pd.hep.export_uproot_npz import (  # noqa: E402
+    _build_X,
+    _compute_event_id,
+    estimate_output_bytes,
+    plan_chunks,
+    write_chunks_npy_dir,
+)
+
+
+def _branches(n: int = 1000) -> dict:
+    rng = np.random.default_rng(3)
+    return {
+        "pt": rng.exponential(size=n).astype(np.float32),
+        "eta": rng.normal(size=n),
+        "nJet": rng.integers(0, 9, size=n).astype(np.int32),
+        "run": np.full(n, 355_100, dtype=np.uint32),
+        "luminosityBlock": (np.arange(n) // 100).astype(np.uint32),
+        "event": np.arange(n, dtype=np.uint64) + 10**10,
+        "genWeight": rng.normal(size=n).astype(np.float32),
+    }
+
+
+def _chunks(arrs: dict, n: int, step: int):
+    for start, stop in plan_chunks(n, step):
+        yield start, stop, {k: v[start:stop] for k, v in arrs.items()}
+
+
+def _write(tmp_path: Path, arrs: dict, step: int, **kwargs) -> dict:
+    n = len(arrs["pt"])
+    return write_chunks_npy_dir(
+        _chunks(arrs, n, step),
+        num_entries=n,
+        out_dir=str(tmp_path / "X"),
+        feature_branches=["pt", "eta", "nJet"],
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("step", [1, 64, 5000])
+def test_chunked_export_matches_in_memory_build(tmp_path: Path, step: int) -> None:
+    arrs = _branches()
+
+    summary = _write(
+        tmp_path,
+        arrs,
+        step,
+        feature_names=["pt", "eta", "n_jet"],
+        run_branch="run",
+        lumi_branch="luminosityBlock",
+        event_branch="event",
+        weight_branch="genWeight",
+    )
+
+    out = tmp_path / "X"
+    assert summary == {
+        "n": 1000,
+        "d": 3,
+        "keys": ["X", "event", "event_id", "feature_names", "lumi", "run", "weight"],
+    }
+    X = np.load(out / "X.npy", mmap_mode="r")
+    assert isinstance(X, np.memmap) and X.dtype == np.float64
+    assert np.array_equal(X, _build_X(arrs, ["pt", "eta", "nJet"]))
+    assert np.load(out / "feature_names.npy").tolist() == ["pt", "eta", "n_jet"]
+    assert np.array_equal(np.load(out / "event.npy"), arrs["event"].astype(np.int64))
+    assert np.array_equal(np.load(out / "weight.npy"), arrs["genWeight"].astype(float))
+
+    event_id = np.load(out / "event_id.npy")
+    expected = _compute_event_id(arrs["run"], arrs["luminosityBlock"], arrs["event"])
+    assert event_id.dtype == expected.dtype and np.array_equal(event_id, expected)
+
+
+def test_chunks_are_validated(tmp_path: Path) -> None:
+    arrs = _branches(10)
+
+    jagged = dict(arrs, pt=np.array([np.zeros(2)] * 10, dtype=object))
+    with pytest.raises(ValueError, match="jagged"):
+        _write(tmp_path, jagged, 4)
+
+    def _drifting():
+        yield 0, 5, {k: v[:5] for k, v in arrs.items()}
+        yield 5, 10, {**{k: v[5:] for k, v in arrs.items()}, "eta": arrs["eta"][5:].astype(np.float32)}
+
+    with pytest.raises(ValueError, match="changed dtype"):
+        write_chunks_npy_dir(
+            _drifting(), num_entries=10, out_dir=str(tmp_path / "d"), feature_branches=["pt", "eta"]
+        )
+
+    short = ((0, 5, {k: v[:4] for k, v in arrs.items()}),)
+    with pytest.raises(ValueError, match="expected 5"):
+        write_chunks_npy_dir(short, num_entries=5, out_dir=str(tmp_path / "s"), feature_branches=["pt"])
+
+    gap = ((0, 4, {k: v[:4] for k, v in arrs.items()}),)
+    with pytest.raises(ValueError, match="cover 4 entries"):
+        write_chunks_npy_dir(gap, num_entries=10, out_dir=str(tmp_path / "g"), feature_branches=["pt"])
+
+
+def test_chunk_plan_and_size_estimate() -> None:
+    assert plan_chunks(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert plan_chunks(0, 4) == []
+    with pytest.raises(ValueError):
+        plan_chunks(10, 0)
+
+    assert estimate_output_bytes(1000, 3, n_id_branches=3, weight=True, event_id_itemsize=100) == 1000 * 156
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Single-pass binned PI statistics and the multi-pair zone scan (pulse_pd.zone_scan)."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pulse_pd.chunked import chunked_percentile, iter_chunks  # noqa: E402
+from pulse_pd.zone_scan import heatmap_stats, scan_zones, top_bins  # noqa: E402
+
+
+def _data(n: int = 20_000, d: int = 4):
+    rng = np.random.default_rng(11)
+    x = rng.normal(size=(n, d))
+    x[:, 2] = np.round(x[:, 2], 1)  # many values exactly on bin edges
+    pi = rng.random(n)
+    return x, pi
+
+
+def _histogram2d_stats(x, pi, jx, jy, bins, chunk_rows=None):
+    """The previous run_cut_pd.plot_pi_heatmap computation."""
+    x1, x2 = x[:, jx], x[:, jy]
+    if chunk_rows:
+        rng = [chunked_percentile(v, [1, 99], chunk_rows=chunk_rows) for v in (x1, x2)]
+        h_sum = np.zeros((bins, bins))
+        h_cnt = np.zeros((bins, bins))
+        for start, stop in iter_chunks(x.shape[0], chunk_rows):
+            c1, c2 = x1[start:stop], x2[start:stop]
+            s, xe, ye = np.histogram2d(c1, c2, bins=bins, range=rng, weights=pi[start:stop])
+            c, _, _ = np.histogram2d(c1, c2, bins=bins, range=rng)
+            h_sum += s
+            h_cnt += c
+    else:
+        rng = [np.percentile(x1, [1, 99]), np.percentile(x2, [1, 99])]
+        h_sum, xe, ye = np.histogram2d(x1, x2, bins=bins, range=rng, weights=pi)
+        h_cnt, _, _ = np.histogram2d(x1, x2, bins=bins, range=rng)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        h_mean = np.nan_to_num(h_sum / h_cnt, nan=0.0, posinf=0.0, neginf=0.0)
+    return h_mean, xe, ye, h_cnt
+
+
+def _sorted_top_bins(h_mean, h_cnt, xedges, yedges, topk, min_count):
+    """The previous run_cut_pd.top_pi_bins (nested loop + full stable sort)."""
+    cands = [
+        (float(h_mean[ix, iy]), ix, iy)
+        for ix in range(h_mean.shape[0])
+        for iy in range(h_mean.shape[1])
+        if int(h_cnt[ix, iy]) >= min_count
+    ]
+    cands.sort(key=lambda t: t[0], reverse=True)
+    return [
+        {
+            "mean_pi": v,
+            "count": int(h_cnt[ix, iy]),
+            "x_bin": ix,
+            "y_bin": iy,
+            "x_range": [float(xedges[ix]), float(xedges[ix + 1])],
+            "y_range": [float(yedges[iy]), float(yedges[iy + 1])],
+        }
+        for v, ix, iy in cands[:topk]
+    ]
+
+
+@pytest.mark.parametrize("chunk_rows", [None, 777])
+@pytest.mark.parametrize("pair", [(0, 1), (2, 3)])
+def test_heatmap_stats_match_histogram2d(chunk_rows, pair) -> None:
+    x, pi = _data()
+
+    got = heatmap_stats(x, pi, *pair, bins=30, chunk_rows=chunk_rows)
+    expected = _histogram2d_stats(x, pi, *pair, bins=30, chunk_rows=chunk_rows)
+
+    for a, b in zip(got, expected):
+        assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize("topk", [1, 5, 40, 10_000])
+def test_top_bins_match_stable_sort_with_ties(topk: int) -> None:
+    rng = np.random.default_rng(2)
+    h_mean = rng.integers(0, 4, size=(12, 12)).astype(float)  # heavy ties
+    h_cnt = rng.integers(0, 30, size=(12, 12)).astype(float)
+    edges = np.linspace(0.0, 1.0, 13)
+
+    assert top_bins(h_mean, h_cnt, edges, edges, topk=topk, min_count=10) == _sorted_top_bins(
+        h_mean, h_cnt, edges, edges, topk, 10
+    )
+
+
+def test_scan_zones_ranks_all_pairs_like_per_pair_heatmaps() -> None:
+    x, pi = _data(d=5)
+    pi[(x[:, 3] > 1.0) & (x[:, 4] < -1.0)] += 5.0  # a paradox zone in pair (3, 4)
+
+    zones = scan_zones(x, pi, bins=20, topk=15, min_count=5)
+    chunked = scan_zones(x, pi, bins=20, topk=15, min_count=5, chunk_rows=1000)
+
+    expected = []
+    for jx in range(5):
+        for jy in range(jx + 1, 5):
+            h_mean, xe, ye, h_cnt = _histogram2d_stats(x, pi, jx, jy, 20)
+            for b in _sorted_top_bins(h_mean, h_cnt, xe, ye, 15, 5):
+                expected.append(dict(b, x_dim=jx, y_dim=jy))
+    expected.sort(key=lambda b: b["mean_pi"], reverse=True)
+
+    assert zones == expected[:15]
+    assert (zones[0]["x_dim"], zones[0]["y_dim"]) == (3, 4)
+    assert [(z["x_dim"], z["y_dim"], z["x_bin"], z["y_bin"]) for z in chunked] == [
+        (z["x_dim"], z["y_dim"], z["x_bin"], z["y_bin"]) for z in zones
+    ]
+
+    subset = scan_zones(x, pi, dims=[4, 3], bins=20, topk=3, min_count=5)
+    assert len(subset) == 3 and all((z["x_dim"], z["y_dim"]) == (4, 3) for z in subset)
+
+    with pytest.raises(ValueError, match="Invalid feature pair"):
+        scan_zones(x, pi, pairs=[(0, 0)])
+
+
+def test_run_cut_pd_zone_scan_feeds_export_zone_events(tmp_path: Path) -> None:
+    x, _ = _data(n=3000, d=3)
+    np.savez(tmp_path / "X.npz", X=x, feature_names=np.asarray(["a", "b", "c"]))
+    theta = ROOT / "pulse_pd" / "examples" / "theta_cuts_example.json"
+    common = ["--theta", str(theta), "--ds-M", "4", "--mi-models", "3", "--gf-K", "2"]
+
+    run = [sys.executable, "-m", "pulse_pd.run_cut_pd", "--x", str(tmp_path / "X.npz"), "--dims", "0", "1"]
+    run += ["--zone-scan", "--no-plots", "--topk", "4", "--bins", "12", "--out", str(tmp_path / "run")]
+    subprocess.run(run + common, cwd=ROOT, check=True, capture_output=True)
+
+    zones = [json.loads(line) for line in (tmp_path / "run" / "pd_zones_v0.jsonl").read_text().splitlines()]
+    assert [z["rank"] for z in zones] == [1, 2, 3, 4]
+    assert all(z["source"] == "zone_scan" and z["schema"] == "pulse_pd/pd_zone_v0" for z in zones)
+    assert {z["dims"]["x_name"] for z in zones} <= {"a", "b", "c"}
+    assert not (tmp_path / "run" / "pi_heatmap.png").exists()
+    summary = json.loads((tmp_path / "run" / "pd_summary.json").read_text())
+    assert summary["zone_scan"] == {"dims": [0, 1, 2], "zones": 4}
+
+    export = [sys.executable, "-m", "pulse_pd.export_zone_events", "--x", str(tmp_path / "X.npz")]
+    export += ["--zones", str(tmp_path / "run" / "pd_zones_v0.jsonl"), "--out", str(tmp_path / "events.csv")]
+    subprocess.run(export + common, cwd=ROOT, check=True, capture_output=True)
+    assert (tmp_path / "events.csv").read_text().count("\n") > 1
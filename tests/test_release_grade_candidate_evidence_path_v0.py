@@ -46,6 +46,14 @@ CHAIN_FILES = [
     "PULSE_safe_pack_v0/tools/"
     "run_recorded_required_gate_evaluations_v0.py",
     "PULSE_safe_pack_v0/tools/"
+    "tool_runner_v0.py",
+    "PULSE_safe_pack_v0/tools/"
+    "file_digest_v0.py",
+    "PULSE_safe_pack_v0/tools/"
+    "strict_load_v0.py",
+    "PULSE_safe_pack_v0/tools/"
+    "schema_registry_v0.py",
+    "PULSE_safe_pack_v0/tools/"
     "evaluate_required_gate_v0.py",
     "PULSE_safe_pack_v0/tools/"
     "build_release_grade_candidate_status_v0.py",
@@ -1254,6 +1262,248 @@ def test_unimplemented_required_gate_fails_closed_with_recorded_result(
     )
 
 
+def test_required_evidence_producer_inprocess_runner_matches_subprocess(
+    tmp_path: Path,
+) -> None:
+    repo = _bootstrap_repo(tmp_path)
+
+    out = (
+        repo
+        / "PULSE_safe_pack_v0/artifacts/"
+        "required_gate_evidence_v0.json"
+    )
+
+    log_root = (
+        repo
+        / "PULSE_safe_pack_v0/artifacts/"
+        "required_gate_evidence_logs"
+    )
+
+    recorded: dict[str, Any] = {}
+
+    for runner in (
+        "subprocess",
+        "inprocess",
+    ):
+        result = _run_tool(
+            repo,
+            (
+                "PULSE_safe_pack_v0/tools/"
+                "run_recorded_required_gate_"
+                "evaluations_v0.py"
+            ),
+            "--repo-root",
+            str(repo),
+            "--run-key",
+            RUN_KEY,
+            "--tool-runner",
+            runner,
+        )
+
+        assert out.is_file(), result.stderr
+
+        recorded[runner] = (
+            result.returncode,
+            _read_json(out)["gates"],
+            {
+                path.name: path.read_bytes()
+                for path in sorted(
+                    log_root.iterdir()
+                )
+            },
+        )
+
+    assert recorded["inprocess"] == (
+        recorded["subprocess"]
+    )
+
+    returncode, gates, logs = recorded[
+        "inprocess"
+    ]
+
+    assert sorted(logs) == [
+        f"{REQUIRED_GATE}.stderr.txt",
+        f"{REQUIRED_GATE}.stdout.txt",
+    ]
+
+    assert (
+        gates[REQUIRED_GATE]["evaluation_id"]
+        == f"pulse.required.{REQUIRED_GATE}.v0"
+    )
+
+
+def test_required_evidence_producer_rejects_unknown_tool_runner(
+    tmp_path: Path,
+) -> None:
+    repo = _bootstrap_repo(tmp_path)
+
+    result = _run_tool(
+        repo,
+        (
+            "PULSE_safe_pack_v0/tools/"
+            "run_recorded_required_gate_"
+            "evaluations_v0.py"
+        ),
+        "--repo-root",
+        str(repo),
+        "--run-key",
+        RUN_KEY,
+        "--tool-runner",
+        "threads",
+    )
+
+    assert result.returncode != 0
+
+    assert (
+        "unsupported tool runner"
+        in result.stderr
+    )
+
+
+def test_required_evidence_producer_parallel_jobs_match_serial_run(
+    tmp_path: Path,
+) -> None:
+    repo = _bootstrap_repo(tmp_path)
+
+    gates = [
+        REQUIRED_GATE,
+        UNSUPPORTED_GATE,
+    ]
+
+    policy_text = _policy_text().replace(
+        f"  required:\n    - {REQUIRED_GATE}\n",
+        (
+            "  required:\n"
+            + "".join(
+                f"    - {gate}\n"
+                for gate in gates
+            )
+        ),
+    )
+
+    assert policy_text != _policy_text()
+
+    _write_text(
+        repo / "pulse_gate_policy_v0.yml",
+        policy_text,
+    )
+
+    _write_text(
+        repo / "pulse_gate_registry_v0.yml",
+        _registry_text()
+        + (
+            f"  {UNSUPPORTED_GATE}:\n"
+            "    category: test\n"
+            "    description: "
+            f"Test registry entry for {UNSUPPORTED_GATE}\n"
+        ),
+    )
+
+    plan = _plan_payload()
+    plan["evaluations"].update(
+        _plan_payload(
+            UNSUPPORTED_GATE
+        )["evaluations"]
+    )
+
+    _write_json(
+        repo
+        / "PULSE_safe_pack_v0/profiles/"
+        "required_gate_evaluations_v0.json",
+        plan,
+    )
+
+    out = (
+        repo
+        / "PULSE_safe_pack_v0/artifacts/"
+        "required_gate_evidence_v0.json"
+    )
+
+    artifacts = (
+        repo
+        / "PULSE_safe_pack_v0/artifacts"
+    )
+
+    recorded: dict[str, Any] = {}
+
+    for jobs in ("1", "2"):
+        result = _run_tool(
+            repo,
+            (
+                "PULSE_safe_pack_v0/tools/"
+                "run_recorded_required_gate_"
+                "evaluations_v0.py"
+            ),
+            "--repo-root",
+            str(repo),
+            "--run-key",
+            RUN_KEY,
+            "--jobs",
+            jobs,
+        )
+
+        assert out.is_file(), result.stderr
+
+        payload = _read_json(out)
+        payload.pop("created_utc")
+
+        recorded[jobs] = (
+            result.returncode,
+            result.stdout,
+            result.stderr,
+            payload,
+            {
+                path.relative_to(
+                    artifacts
+                ).as_posix(): path.read_bytes()
+                for directory in (
+                    "required_gate_inputs",
+                    "required_gate_evidence_logs",
+                )
+                for path in sorted(
+                    (artifacts / directory).rglob("*")
+                )
+                if path.is_file()
+            },
+        )
+
+    assert recorded["2"] == recorded["1"]
+
+    payload = recorded["2"][3]
+
+    assert list(payload["gates"]) == sorted(gates)
+    # one result artifact plus stdout/stderr logs per gate
+    assert len(recorded["2"][4]) == 3 * len(gates)
+
+
+def test_required_evidence_producer_rejects_non_positive_jobs(
+    tmp_path: Path,
+) -> None:
+    repo = _bootstrap_repo(tmp_path)
+
+    result = _run_tool(
+        repo,
+        (
+            "PULSE_safe_pack_v0/tools/"
+            "run_recorded_required_gate_"
+            "evaluations_v0.py"
+        ),
+        "--repo-root",
+        str(repo),
+        "--run-key",
+        RUN_KEY,
+        "--jobs",
+        "0",
+    )
+
+    assert result.returncode != 0
+
+    assert (
+        "jobs must be greater than zero"
+        in result.stderr
+    )
+
+
 def test_candidate_status_rejects_tampered_gate_result(
     tmp_path: Path,
 ) -> None:
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft202012Validator, FormatChecker
+from jsonschema.exceptions import SchemaError
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import schema_registry_v0 as registry  # noqa: E402
+
+
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["name", "when"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "when": {"type": "string", "format": "date-time"},
+        "items": {"type": "array", "items": {"type": "integer"}},
+    },
+    "additionalProperties": False,
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(registry.CACHE_ENV, raising=False)
+    registry.clear_cache()
+    yield
+    registry.clear_cache()
+
+
+def _legacy_errors(payload: object, schema: dict) -> list[str]:
+    validator = Draft202012Validator(schema, format_checker=FormatChecker())
+    out = []
+
+    for error in sorted(
+        validator.iter_errors(payload),
+        key=lambda item: list(item.absolute_path),
+    ):
+        location = ".".join(str(part) for part in error.absolute_path)
+        out.append((f"{location}: " if location else "") + error.message)
+
+    return out
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"name": "ok", "when": "2026-01-01T00:00:00Z"},
+        {"name": "", "when": "not-a-date", "items": [1, "x"], "extra": 1},
+        {},
+        [],
+    ],
+)
+def test_schema_errors_match_fresh_validator(payload: object) -> None:
+    assert registry.schema_errors(payload, SCHEMA) == _legacy_errors(payload, SCHEMA)
+
+
+def test_validator_is_compiled_once_per_schema_digest() -> None:
+    first = registry.compiled_validator(SCHEMA)
+    # Equal content in a different dict (and key order) shares the validator.
+    reordered = dict(reversed(list(SCHEMA.items())))
+    second = registry.compiled_validator(reordered)
+
+    assert first is second
+    assert registry.registry_stats() == {
+        "compiled": 1,
+        "checked": 1,
+        "cache_hits": 1,
+        "warm_hits": 0,
+        "validators": 1,
+    }
+
+
+def test_caller_mutation_does_not_change_cached_validator() -> None:
+    schema = json.loads(json.dumps(SCHEMA))
+    registry.compiled_validator(schema)
+    schema["required"].append("items")
+
+    assert registry.schema_errors(
+        {"name": "a", "when": "2026-01-01T00:00:00Z"},
+        SCHEMA,
+    ) == []
+
+
+def test_schema_errors_many_validates_batches() -> None:
+    payloads = [
+        {"name": "a", "when": "2026-01-01T00:00:00Z"},
+        {"name": "b"},
+    ]
+
+    assert registry.schema_errors_many(payloads, SCHEMA) == [
+        [],
+        ["'when' is a required property"],
+    ]
+    assert registry.registry_stats()["compiled"] == 1
+
+
+def test_invalid_schema_is_reported_not_raised() -> None:
+    bad = {"type": "object", "properties": {"a": {"type": 7}}}
+
+    errors = registry.schema_errors({}, bad)
+
+    assert len(errors) == 1
+    assert errors[0].startswith("schema is invalid: ")
+
+    with pytest.raises(SchemaError):
+        registry.compiled_validator(bad)
+
+
+def test_warm_cache_skips_meta_schema_check(tmp_path: Path) -> None:
+    cache = tmp_path / "schemas.json"
+    script = (
+        "import json, sys\n"
+        f"sys.path.insert(0, {str(REPO_ROOT)!r})\n"
+        "from PULSE_safe_pack_v0.tools import schema_registry_v0 as r\n"
+        "schema = json.loads(sys.argv[1])\n"
+        "errors = r.schema_errors({'name': 'x'}, schema)\n"
+        "print(json.dumps({'errors': errors, 'stats': r.registry_stats()}))\n"
+    )
+    env = dict(os.environ, **{registry.CACHE_ENV: str(cache)})
+
+    def run() -> dict:
+        proc = subprocess.run(
+            [sys.executable, "-c", script, json.dumps(SCHEMA)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(proc.stdout)
+
+    cold = run()
+    warm = run()
+
+    assert cold["errors"] == warm["errors"] == ["'when' is a required property"]
+    assert cold["stats"]["checked"] == 1
+    assert warm["stats"]["checked"] == 0
+    assert warm["stats"]["warm_hits"] == 1
+    assert json.loads(cache.read_text(encoding="utf-8"))["checked"] == {
+        registry.schema_digest(SCHEMA): SCHEMA
+    }
+
+
+def test_cache_entry_with_wrong_digest_is_ignored(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = tmp_path / "schemas.json"
+    digest = registry.schema_digest(SCHEMA)
+    swapped = {"type": "object"}
+
+    cache.write_text(
+        json.dumps(
+            {
+                "schema": registry.CACHE_SCHEMA,
+                "jsonschema": registry._jsonschema_version(),
+                "checked": {digest: swapped},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setenv(registry.CACHE_ENV, str(cache))
+    registry.clear_cache()
+
+    assert registry.schema_errors({}, SCHEMA) == [
+        "'name' is a required property",
+        "'when' is a required property",
+    ]
+    assert registry.registry_stats()["warm_hits"] == 0
+
+
+@pytest.mark.parametrize("content", [b"not json", b"\x80\x04\x95 pickle", b"[]"])
+def test_unreadable_cache_is_ignored_and_rewritten(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    content: bytes,
+) -> None:
+    cache = tmp_path / "schemas.json"
+    cache.write_bytes(content)
+    monkeypatch.setenv(registry.CACHE_ENV, str(cache))
+    registry.clear_cache()
+
+    assert registry.schema_errors({"name": "a", "when": "2026-01-01T00:00:00Z"}, SCHEMA) == []
+
+    registry.flush()
+    payload = json.loads(cache.read_text(encoding="utf-8"))
+    assert registry.schema_digest(SCHEMA) in payload["checked"]
+
+
+def test_builder_script_shares_the_package_registry_and_loader_modules() -> None:
+    builder = REPO_ROOT / "PULSE_safe_pack_v0" / "tools" / "build_recorded_release_candidates_v0.py"
+    script = (
+        "import runpy, sys\n"
+        f"sys.path.insert(0, {str(builder.parent)!r})\n"
+        f"runpy.run_path({str(builder)!r}, run_name='builder')\n"
+        "print(sorted(m for m in sys.modules if m.endswith('schema_registry_v0')))\n"
+        "print(sorted(m for m in sys.modules if m.endswith('strict_load_v0')))\n"
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=str(builder.parent),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert proc.stdout.splitlines() == [
+        "['PULSE_safe_pack_v0.tools.schema_registry_v0']",
+        "['PULSE_safe_pack_v0.tools.strict_load_v0']",
+    ]
+
+
+def test_recorded_evidence_producer_reuses_the_registry_validator() -> None:
+    from PULSE_safe_pack_v0.tools import (
+        run_recorded_required_gate_evaluations_v0 as producer,
+    )
+
+    schema_path = REPO_ROOT / producer.SCHEMA_PATH
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+
+    for payload in ({}, {"unexpected": True}):
+        assert producer._validate_schema(payload, schema_path) == _legacy_errors(
+            payload,
+            schema,
+        )
+
+    stats = registry.registry_stats()
+    assert stats["compiled"] == 1
+    assert stats["cache_hits"] == 1
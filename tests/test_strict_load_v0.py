@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import strict_load_v0 as strict  # noqa: E402
+from PULSE_safe_pack_v0.tools import (  # noqa: E402
+    build_recorded_release_candidates_v0 as recorded_candidates,
+    build_release_evidence_input_manifest_v0 as evidence_manifest,
+    evaluate_required_gate_v0 as required_gate,
+    run_recorded_required_gate_evaluations_v0 as recorded_evaluations,
+)
+
+
+# The tools that moved onto the strict loader used to accept JSON
+# overflow (1e999) and YAML .inf/.nan; they now fail closed on both.
+TOOL_LOADERS = [
+    (required_gate.load_json, required_gate.load_yaml),
+    (recorded_candidates.load_json, recorded_candidates.load_yaml),
+    (recorded_evaluations._load_json, recorded_evaluations._load_yaml),
+    (evidence_manifest._load_json, evidence_manifest._load_yaml),
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    strict.clear_cache()
+    yield
+    strict.clear_cache()
+
+
+def test_loads_json_accepts_valid_documents() -> None:
+    assert strict.loads_json('{"a": [1, 2.5, "x", null, true], "b": {}}') == {
+        "a": [1, 2.5, "x", None, True],
+        "b": {},
+    }
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ('{"a": 1, "a": 2}', "duplicate JSON key 'a'"),
+        ('{"outer": {"k": 1, "j": 2, "k": 3}}', "duplicate JSON key 'k'"),
+        ('{"a": NaN}', "non-finite JSON constant 'NaN'"),
+        ("[-Infinity]", "non-finite JSON constant '-Infinity'"),
+        ('{"a": 1e999}', "non-finite JSON number '1e999'"),
+    ],
+)
+def test_loads_json_rejects_in_single_pass(text: str, message: str) -> None:
+    with pytest.raises(strict.StrictLoadError, match=message):
+        strict.loads_json(text)
+
+
+def test_strict_load_error_is_a_value_error() -> None:
+    assert issubclass(strict.StrictLoadError, ValueError)
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("a: 1\na: 2\n", "duplicate YAML key 'a'"),
+        ("outer:\n  k: 1\n  k: 2\n", "duplicate YAML key 'k'"),
+        ("x: .inf\n", "non-finite YAML number"),
+        ("x: -.Inf\n", "non-finite YAML number"),
+        ("x: .nan\n", "non-finite YAML number"),
+    ],
+)
+def test_loads_yaml_rejects_duplicates_and_nonfinite(text: str, message: str) -> None:
+    with pytest.raises(strict.StrictLoadError, match=message):
+        strict.loads_yaml(text)
+
+
+def test_loads_yaml_keeps_safe_loader_types() -> None:
+    assert strict.loads_yaml("a: 1\nb: 1.5\nc: [x, true]\nd: null\n") == {
+        "a": 1,
+        "b": 1.5,
+        "c": ["x", True],
+        "d": None,
+    }
+
+
+def test_file_cache_is_keyed_by_content(tmp_path: Path) -> None:
+    first = tmp_path / "policy.yml"
+    second = tmp_path / "copy.yml"
+    first.write_text("gates:\n  required: [a, b]\n", encoding="utf-8")
+    second.write_text("gates:\n  required: [a, b]\n", encoding="utf-8")
+
+    one = strict.load_yaml_file(first)
+    two = strict.load_yaml_file(second)
+
+    assert one == two == {"gates": {"required": ["a", "b"]}}
+    assert strict.cache_stats() == {"parsed": 1, "cache_hits": 1, "entries": 1}
+
+    first.write_text("gates:\n  required: [c]\n", encoding="utf-8")
+    assert strict.load_yaml_file(first) == {"gates": {"required": ["c"]}}
+    assert strict.cache_stats()["parsed"] == 2
+
+
+def test_cached_documents_are_private_copies(tmp_path: Path) -> None:
+    path = tmp_path / "plan.json"
+    path.write_text('{"gates": [{"gate": "a"}]}', encoding="utf-8")
+
+    mutated = strict.load_json_file(path)
+    mutated["gates"][0]["gate"] = "changed"
+
+    assert strict.load_json_file(path) == {"gates": [{"gate": "a"}]}
+    assert strict.load_json_file(path, copy=False) is strict.load_json_file(
+        path,
+        copy=False,
+    )
+
+
+def test_invalid_documents_are_not_cached(tmp_path: Path) -> None:
+    path = tmp_path / "bad.json"
+    path.write_text('{"a": 1, "a": 2}', encoding="utf-8")
+
+    for _ in range(2):
+        with pytest.raises(strict.StrictLoadError):
+            strict.load_json_file(path)
+
+    assert strict.cache_stats()["entries"] == 0
+
+
+def test_json_and_yaml_caches_do_not_collide(tmp_path: Path) -> None:
+    path = tmp_path / "doc"
+    path.write_text('{"a": 1}', encoding="utf-8")
+
+    assert strict.load_json_file(path) == {"a": 1}
+    assert strict.load_yaml_file(path) == {"a": 1}
+    assert strict.cache_stats()["parsed"] == 2
+
+
+def test_invalid_utf8_raises_unicode_error(tmp_path: Path) -> None:
+    path = tmp_path / "bad.json"
+    path.write_bytes(b'{"a": "\xff"}')
+
+    with pytest.raises(UnicodeDecodeError):
+        strict.load_json_file(path)
+
+
+@pytest.mark.parametrize(("load_json", "load_yaml"), TOOL_LOADERS)
+def test_tool_loaders_reject_non_finite_numbers(
+    tmp_path: Path,
+    load_json,
+    load_yaml,
+) -> None:
+    json_path = tmp_path / "doc.json"
+    json_path.write_text('{"score": 1e999}', encoding="utf-8")
+    yaml_path = tmp_path / "doc.yaml"
+    yaml_path.write_text("score: .inf\nratio: .nan\n", encoding="utf-8")
+    errors: list[str] = []
+
+    assert load_json(json_path, "evidence", errors) is None
+    assert load_yaml(yaml_path, "policy", errors) is None
+    assert len(errors) == 2
+    assert "non-finite JSON number" in errors[0]
+    assert "non-finite YAML number" in errors[1]
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools import tool_runner_v0 as runner  # noqa: E402
+
+
+TOOL_WITH_MAIN = '''\
+import argparse
+import os
+import sys
+from pathlib import Path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--rc", type=int, default=0)
+    args = parser.parse_args(argv)
+    Path(args.out).write_text(os.environ.get("PULSE_TEST_VALUE", ""), encoding="utf-8")
+    print("cwd=" + Path.cwd().name)
+    print("argv0=" + Path(sys.argv[0]).name)
+    print("warn", file=sys.stderr)
+    return args.rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+'''
+
+TOOL_WITHOUT_MAIN = '''\
+import sys
+
+with open("runs.txt", "a", encoding="utf-8") as f:
+    f.write("run\\n")
+print("script-only " + " ".join(sys.argv[1:]))
+'''
+
+
+def _write_tool(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / "tools" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _env(**extra: str) -> dict[str, str]:
+    env = os.environ.copy()
+    env.update(extra)
+    return env
+
+
+@pytest.mark.parametrize("rc", [0, 3])
+def test_inprocess_matches_subprocess_output_and_returncode(
+    tmp_path: Path,
+    rc: int,
+) -> None:
+    work = tmp_path / "work"
+    work.mkdir()
+    _write_tool(tmp_path, "echo_tool.py", TOOL_WITH_MAIN)
+
+    results = {}
+
+    for mode in runner.SUPPORTED_RUNNERS:
+        out = work / f"{mode}.txt"
+        results[mode] = runner.run_tool(
+            [
+                sys.executable,
+                "../tools/echo_tool.py",
+                "--out",
+                out.name,
+                "--rc",
+                str(rc),
+            ],
+            cwd=work,
+            env=_env(PULSE_TEST_VALUE=f"value-{mode}"),
+            timeout=60,
+            runner=mode,
+        )
+        assert out.read_text(encoding="utf-8") == f"value-{mode}"
+
+    sub = results[runner.RUNNER_SUBPROCESS]
+    inproc = results[runner.RUNNER_INPROCESS]
+
+    assert inproc.runner == runner.RUNNER_INPROCESS
+    assert sub.runner == runner.RUNNER_SUBPROCESS
+    assert (inproc.returncode, inproc.stdout, inproc.stderr) == (
+        sub.returncode,
+        sub.stdout,
+        sub.stderr,
+    )
+    assert inproc.returncode == rc
+    assert "cwd=work" in inproc.stdout
+    assert "argv0=echo_tool.py" in inproc.stdout
+
+
+def test_inprocess_restores_process_state(tmp_path: Path) -> None:
+    work = tmp_path / "work"
+    work.mkdir()
+    tool = _write_tool(tmp_path, "echo_tool.py", TOOL_WITH_MAIN)
+
+    env_before = dict(os.environ)
+    cwd_before = os.getcwd()
+    argv_before = list(sys.argv)
+
+    result = runner.run_tool(
+        [sys.executable, str(tool), "--out", "x.txt"],
+        cwd=work,
+        env={"PULSE_TEST_VALUE": "isolated"},
+        runner=runner.RUNNER_INPROCESS,
+    )
+
+    assert result.returncode == 0
+    assert (work / "x.txt").read_text(encoding="utf-8") == "isolated"
+    assert dict(os.environ) == env_before
+    assert os.getcwd() == cwd_before
+    assert sys.argv == argv_before
+
+
+def test_argparse_error_maps_to_exit_code_two(tmp_path: Path) -> None:
+    tool = _write_tool(tmp_path, "echo_tool.py", TOOL_WITH_MAIN)
+
+    result = runner.run_tool(
+        [sys.executable, str(tool)],
+        cwd=tmp_path,
+        runner=runner.RUNNER_INPROCESS,
+    )
+
+    assert result.runner == runner.RUNNER_INPROCESS
+    assert result.returncode == 2
+    assert "--out" in result.stderr
+
+
+def test_uncaught_exception_fails_closed_with_traceback(tmp_path: Path) -> None:
+    tool = _write_tool(
+        tmp_path,
+        "boom_tool.py",
+        "def main(argv=None):\n    raise RuntimeError('boom')\n",
+    )
+
+    result = runner.run_tool(
+        [sys.executable, str(tool)],
+        cwd=tmp_path,
+        runner=runner.RUNNER_INPROCESS,
+    )
+
+    assert result.returncode == 1
+    assert "RuntimeError: boom" in result.stderr
+
+
+def test_tool_without_main_falls_back_to_subprocess(tmp_path: Path) -> None:
+    tool = _write_tool(tmp_path, "script_tool.py", TOOL_WITHOUT_MAIN)
+
+    result = runner.run_tool(
+        [sys.executable, str(tool), "a", "b"],
+        cwd=tmp_path,
+        runner=runner.RUNNER_INPROCESS,
+    )
+
+    assert result.runner == runner.RUNNER_SUBPROCESS
+    assert result.returncode == 0
+    assert result.stdout == "script-only a b\n"
+    # The source is checked, not imported: the script body ran only once.
+    assert (tmp_path / "runs.txt").read_text(encoding="utf-8") == "run\n"
+
+
+def test_first_run_imports_the_tool_inside_its_isolated_context(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    work = tmp_path / "work"
+    work.mkdir()
+    tool = _write_tool(
+        tmp_path,
+        "import_tool.py",
+        "import os\n"
+        "from pathlib import Path\n\n"
+        "print('imported in ' + Path.cwd().name + ' ' + os.environ.get('PULSE_TEST_VALUE', ''))\n\n\n"
+        "def main(argv=None):\n    print('main')\n",
+    )
+
+    first, second = (
+        runner.run_tool(
+            [sys.executable, str(tool)],
+            cwd=work,
+            env={"PULSE_TEST_VALUE": "isolated"},
+            runner=runner.RUNNER_INPROCESS,
+        )
+        for _ in range(2)
+    )
+
+    assert first.stdout == "imported in work isolated\nmain\n"
+    assert second.stdout == "main\n"
+    assert capsys.readouterr().out == ""
+
+
+def test_non_python_command_falls_back_to_subprocess(tmp_path: Path) -> None:
+    result = runner.run_tool(
+        [sys.executable, "-c", "print('inline')"],
+        cwd=tmp_path,
+        runner=runner.RUNNER_INPROCESS,
+    )
+
+    assert result.runner == runner.RUNNER_SUBPROCESS
+    assert result.stdout == "inline\n"
+
+
+def test_inprocess_timeout_kills_a_hung_tool(tmp_path: Path) -> None:
+    tool = _write_tool(
+        tmp_path,
+        "slow_tool.py",
+        "import time\n\n\ndef main(argv=None):\n    time.sleep(60)\n    return 0\n",
+    )
+
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run_tool(
+            [sys.executable, str(tool)],
+            cwd=tmp_path,
+            timeout=0.5,
+            runner=runner.RUNNER_INPROCESS,
+        )
+
+    assert time.monotonic() - started < 30
+
+
+def test_timed_run_survives_os_exit_in_main(tmp_path: Path) -> None:
+    tool = _write_tool(
+        tmp_path,
+        "exit_tool.py",
+        "import os\n\n\ndef main(argv=None):\n    os._exit(4)\n",
+    )
+
+    result = runner.run_tool(
+        [sys.executable, str(tool)],
+        cwd=tmp_path,
+        timeout=60,
+        runner=runner.RUNNER_INPROCESS,
+    )
+
+    expected = runner.RUNNER_INPROCESS if runner._can_fork() else runner.RUNNER_SUBPROCESS
+    assert (result.returncode, result.runner) == (4, expected)
+
+
+def test_timed_run_kills_a_tool_that_hangs_at_import(tmp_path: Path) -> None:
+    tool = _write_tool(
+        tmp_path,
+        "slow_import_tool.py",
+        "import time\n\ntime.sleep(60)\n\n\ndef main(argv=None):\n    return 0\n",
+    )
+
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run_tool(
+            [sys.executable, str(tool)],
+            cwd=tmp_path,
+            timeout=0.5,
+            runner=runner.RUNNER_INPROCESS,
+        )
+
+    assert time.monotonic() - started < 30
+    assert tool.resolve() not in runner._MAIN_CACHE
+
+
+def test_timed_runs_leave_no_module_state_behind(tmp_path: Path) -> None:
+    tool = _write_tool(
+        tmp_path,
+        "counter_tool.py",
+        "RUNS = []\n\n\ndef main(argv=None):\n    RUNS.append(1)\n    print(len(RUNS))\n    return 0\n",
+    )
+    cmd = [sys.executable, str(tool)]
+
+    timed = [runner.run_tool(cmd, cwd=tmp_path, timeout=60, runner=runner.RUNNER_INPROCESS) for _ in range(2)]
+    assert [r.stdout for r in timed] == ["1\n", "1\n"]
+    assert tool.resolve() not in runner._MAIN_CACHE
+
+    # Untimed runs import the tool once; its module globals persist.
+    untimed = [runner.run_tool(cmd, cwd=tmp_path, runner=runner.RUNNER_INPROCESS) for _ in range(2)]
+    assert [r.stdout for r in untimed] == ["1\n", "2\n"]
+    runner.forget_tool(tool)
+
+
+def test_resolve_runner_rejects_unknown_values() -> None:
+    assert runner.resolve_runner(None) == runner.RUNNER_SUBPROCESS
+    assert runner.resolve_runner(" InProcess ") == runner.RUNNER_INPROCESS
+
+    with pytest.raises(ValueError, match="unsupported tool runner"):
+        runner.resolve_runner("threads")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TOOLS = REPO_ROOT / "PULSE_safe_pack_v0" / "tools"
+
+HEAVY = ("yaml", "jsonschema", "numpy", "zipfile")
+
+PROBE = """\
+import importlib.util, json, sys
+spec = importlib.util.spec_from_file_location("_startup_probe", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(json.dumps(sorted(m for m in sys.modules if m.split(".")[0] in sys.argv[2:])))
+"""
+
+
+def _heavy_imports(tool: str, env: dict[str, str] | None = None) -> list[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE, str(TOOLS / tool), *HEAVY],
+        cwd=str(REPO_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+@pytest.mark.parametrize(
+    "tool",
+    [
+        "check_gates.py",
+        "status_to_summary.py",
+        "augment_status.py",
+        "render_quality_ledger.py",
+        "build_artifact_provenance_binding_v0.py",
+        "materialize_release_decision.py",
+        "pulse_client_v0.py",
+        "run_all.py",
+    ],
+)
+def test_tool_import_defers_heavy_modules(tool: str) -> None:
+    assert _heavy_imports(tool) == []
+
+
+def test_run_all_import_has_no_side_effects(tmp_path: Path) -> None:
+    art = tmp_path / "artifacts"
+    env = {"PATH": "/usr/bin:/bin", "PULSE_ARTIFACT_DIR": str(art), "PULSE_RUN_MODE": "bogus"}
+
+    # Neither argument parsing (an invalid PULSE_RUN_MODE would exit) nor the
+    # artifact directory creation happen at import time.
+    assert _heavy_imports("run_all.py", env=env) == []
+    assert not art.exists()
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import math
 import os
@@ -12,6 +11,15 @@ from html.parser import HTMLParser
 from pathlib import Path
 from typing import Any
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PULSE_safe_pack_v0.tools.file_digest_v0 import (  # noqa: E402
+    prefetch_inventory_digests,
+    sha256_file,
+)
+
 
 TOOL_NAME = "check_release_grade_package_complete_v1"
 SCHEMA_VERSION = "release_grade_package_completeness_v1"
@@ -313,13 +321,8 @@ def _sha256(path: Path) -> str:
     if path.is_symlink() or not path.is_file():
         raise CompletenessError(f"SHA-256 input must be a regular file: {path}")
 
-    digest = hashlib.sha256()
-
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(65536), b""):
-            digest.update(chunk)
-
-    return digest.hexdigest()
+    # Release-grade verification never trusts cached digests.
+    return sha256_file(path, strict=True)
 
 
 def _iter_package_files(package_dir: Path) -> list[Path]:
@@ -763,6 +766,7 @@ def _verify_digest_inventory(
 
     seen: dict[str, dict[str, Any]] = {}
     duplicate_seen = False
+    digests = prefetch_inventory_digests(package_dir, files, strict=True)
 
     for index, item in enumerate(files):
         if not isinstance(item, dict):
@@ -846,7 +850,7 @@ def _verify_digest_inventory(
             )
             continue
 
-        actual_digest = _sha256(path)
+        actual_digest = digests.get(path) or _sha256(path)
         actual_size = path.stat().st_size
 
         _check(